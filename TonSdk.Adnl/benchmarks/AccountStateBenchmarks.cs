@@ -0,0 +1,64 @@
+using System;
+using BenchmarkDotNet.Attributes;
+using TonSdk.Adnl.LiteClient.Protocol;
+using TonSdk.Adnl.LiteClient.Types;
+using TonSdk.Core.Addresses;
+using TonSdk.Core.Boc.Cells;
+using TonSdk.Core.Economics;
+
+namespace TonSdk.Adnl.Benchmarks;
+
+/// <summary>
+///     Parsing one account state BoC in full against reading only the root cell, as
+///     <see cref="LiteClient.AccountStatesOptions.SkipCodeAndData" /> does. <see cref="CodeCells" /> sizes the code
+///     tree the full parse has to build.
+/// </summary>
+[MemoryDiagnoser]
+public class AccountStateBenchmarks
+{
+    Address address;
+    LiteServerAccountState raw = null!;
+
+    [Params(8, 64)] public int CodeCells;
+
+    [GlobalSetup]
+    public void Setup()
+    {
+        address = new Address(0, new byte[32]);
+
+        Cell code = new CellBuilder().StoreUInt(0, 32).Build();
+        for (int i = 1; i < CodeCells; i++)
+            code = new CellBuilder().StoreUInt((ulong)i, 32).StoreBytes(new byte[96]).StoreRef(code).Build();
+        Cell data = new CellBuilder().StoreUInt(7, 32).StoreBytes(new byte[32]).Build();
+
+        Cell account = new CellBuilder()
+            .StoreBit(true)
+            .StoreAddress(address)
+            .StoreVarUInt(CodeCells + 1, 7).StoreVarUInt(CodeCells * 800, 7).StoreVarUInt(0, 7)
+            .StoreUInt(1_700_000_000, 32)
+            .StoreBit(false)
+            .StoreUInt(42_000_000_000UL, 64)
+            .StoreCoins(Coins.FromNano(1_234_567_890L))
+            .StoreBit(false)
+            .StoreBit(true)
+            .StoreBit(false).StoreBit(false)
+            .StoreBit(true).StoreRef(code)
+            .StoreBit(true).StoreRef(data)
+            .StoreBit(false)
+            .Build();
+
+        raw = new LiteServerAccountState { State = account.Serialize().ToBytes(), Proof = Array.Empty<byte>() };
+    }
+
+    [Benchmark(Baseline = true)]
+    public ClientAccountState FullParse()
+    {
+        return ClientAccountState.FromRaw(raw, address);
+    }
+
+    [Benchmark]
+    public ClientAccountState SkipCodeAndData()
+    {
+        return ClientAccountState.FromRaw(raw, address, true);
+    }
+}
@@ -0,0 +1,108 @@
+using System;
+using System.IO;
+using System.Net;
+using System.Net.Sockets;
+using System.Threading.Tasks;
+using BenchmarkDotNet.Attributes;
+using BenchmarkDotNet.Configs;
+using TonSdk.Adnl.Adnl;
+
+namespace TonSdk.Adnl.Benchmarks;
+
+/// <summary>
+///     Streams 100 MB of encrypted ADNL packets over a loopback socket through the client's receive path:
+///     socket reads into the pooled buffer, in-place decryption, packet parsing and hash verification.
+/// </summary>
+[MemoryDiagnoser]
+[SimpleJob(launchCount: 1, warmupCount: 2, iterationCount: 10)]
+[Config(typeof(AdnlReceiveConfig))]
+public class AdnlReceiveBenchmarks
+{
+    const int StreamSize = 100 * 1024 * 1024;
+
+    static readonly byte[] Key = new byte[32];
+    static readonly byte[] Iv = new byte[16];
+
+    NetworkStream receiver = null!;
+    Socket sender = null!;
+    byte[] stream = null!;
+
+    [Params(1_024, 65_536, 4 * 1024 * 1024)] public int PayloadSize;
+
+    [GlobalSetup]
+    public void Setup()
+    {
+        Random random = new(42);
+        byte[] payload = new byte[PayloadSize];
+        random.NextBytes(payload);
+        byte[] packet = new AdnlPacket(payload).Data;
+
+        byte[] packets = new byte[StreamBytes(PayloadSize)];
+        for (int offset = 0; offset < packets.Length; offset += packet.Length)
+            packet.CopyTo(packets, offset);
+        stream = CipherFactory.CreateCipheriv(Key, Iv).Update(packets);
+
+        TcpListener listener = new(IPAddress.Loopback, 0);
+        listener.Start();
+        TcpClient client = new() { ReceiveBufferSize = 1024 * 1024 };
+        client.Connect((IPEndPoint)listener.LocalEndpoint);
+        sender = listener.AcceptSocket();
+        sender.SendBufferSize = 1024 * 1024;
+        listener.Stop();
+        receiver = client.GetStream();
+    }
+
+    [GlobalCleanup]
+    public void Cleanup()
+    {
+        sender.Dispose();
+        receiver.Dispose();
+    }
+
+    [Benchmark]
+    public async Task<int> Receive()
+    {
+        Task<int> send = sender.SendAsync(stream.AsMemory(), SocketFlags.None).AsTask();
+
+        using AdnlFrameReader reader = new(CipherFactory.CreateDecipheriv(Key, Iv));
+        int packets = 0;
+        for (long received = 0; received < stream.Length;)
+        {
+            int bytesRead = await receiver.ReadAsync(reader.GetMemory()).ConfigureAwait(false);
+            if (bytesRead == 0) throw new EndOfStreamException();
+
+            received += bytesRead;
+            packets += reader.Advance(bytesRead, OnPayload);
+        }
+
+        await send.ConfigureAwait(false);
+        return packets;
+    }
+
+    /// <summary>
+    ///     Size of the packet stream for one payload size: as many whole packets as fit in 100 MB.
+    /// </summary>
+    public static long StreamBytes(int payloadSize)
+    {
+        int packetSize = AdnlPacket.packetMinSize + payloadSize;
+        return (long)(StreamSize / packetSize) * packetSize;
+    }
+
+    static void OnPayload(ReadOnlySpan<byte> payload)
+    {
+    }
+}
+
+/// <summary>
+///     Adds the MB/s column to <see cref="AdnlReceiveBenchmarks" />.
+/// </summary>
+public class AdnlReceiveConfig : ManualConfig
+{
+    public AdnlReceiveConfig()
+    {
+        AddColumn(new ThroughputColumn(benchmarkCase =>
+            benchmarkCase.Parameters["PayloadSize"] is int payloadSize
+                ? AdnlReceiveBenchmarks.StreamBytes(payloadSize)
+                : null));
+    }
+}
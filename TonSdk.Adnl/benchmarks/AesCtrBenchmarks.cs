@@ -0,0 +1,61 @@
+using BenchmarkDotNet.Attributes;
+using BenchmarkDotNet.Configs;
+using TonSdk.Adnl.Adnl;
+
+namespace TonSdk.Adnl.Benchmarks;
+
+/// <summary>
+///     Compares the batched <see cref="AesCtrKeystream" /> with the block-at-a-time <see cref="AesCtrMode" />
+///     on ADNL-sized messages, from a small query to a large block response.
+/// </summary>
+[MemoryDiagnoser]
+[Config(typeof(AesCtrConfig))]
+public class AesCtrBenchmarks
+{
+    AesCtrKeystream keystream = null!;
+    AesCtrMode mode = null!;
+    byte[] data = null!;
+
+    [Params(100, 4_096, 1_048_576)] public int Size;
+
+    [GlobalSetup]
+    public void Setup()
+    {
+        byte[] key = new byte[32];
+        byte[] iv = new byte[16];
+        mode = new AesCtrMode(key, new AesCounter((byte[])iv.Clone()));
+        keystream = new AesCtrKeystream(key, iv);
+        data = new byte[Size];
+    }
+
+    [GlobalCleanup]
+    public void Cleanup()
+    {
+        keystream.Dispose();
+    }
+
+    [Benchmark(Baseline = true)]
+    public byte[] BlockAtATime()
+    {
+        return mode.Encrypt(data);
+    }
+
+    [Benchmark]
+    public byte[] Batched()
+    {
+        keystream.Transform(data);
+        return data;
+    }
+}
+
+/// <summary>
+///     Adds the MB/s column to <see cref="AesCtrBenchmarks" />.
+/// </summary>
+public class AesCtrConfig : ManualConfig
+{
+    public AesCtrConfig()
+    {
+        AddColumn(new ThroughputColumn(benchmarkCase =>
+            benchmarkCase.Parameters["Size"] is int size ? size : null));
+    }
+}
@@ -0,0 +1,494 @@
+// Auto-generated by tools/generate_schema.py from lite_api.tl (golden seed 1)
+// DO NOT EDIT MANUALLY
+
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Linq;
+using BenchmarkDotNet.Attributes;
+using TonSdk.Adnl.LiteClient.Protocol;
+using TonSdk.Adnl.TL;
+
+namespace TonSdk.Adnl.Benchmarks;
+
+/// <summary>
+///     Per-type codec throughput over the golden corpus (TonSdk.Adnl/test/Golden/lite_api.golden).
+/// </summary>
+[MemoryDiagnoser]
+[Config(typeof(GoldenCorpusConfig))]
+public class GoldenCorpusBenchmarks
+{
+    static readonly Dictionary<string, byte[][]> corpus = LoadCorpus();
+
+    delegate int SampleWriter(object value, Span<byte> destination);
+
+    byte[][] samples = null!;
+    object[] values = null!;
+    SampleWriter write = null!;
+    byte[] scratch = null!;
+
+    [ParamsSource(nameof(Types))] public string Type = null!;
+
+    public static IEnumerable<string> Types => new[]
+    {
+        "tonNode.blockId",
+        "tonNode.blockIdExt",
+        "tonNode.zeroStateIdExt",
+        "liteServer.error",
+        "liteServer.accountId",
+        "liteServer.libraryEntry",
+        "liteServer.masterchainInfo",
+        "liteServer.masterchainInfoExt",
+        "liteServer.currentTime",
+        "liteServer.version",
+        "liteServer.blockData",
+        "liteServer.blockState",
+        "liteServer.blockHeader",
+        "liteServer.sendMsgStatus",
+        "liteServer.accountState",
+        "liteServer.runMethodResult",
+        "liteServer.shardInfo",
+        "liteServer.allShardsInfo",
+        "liteServer.transactionInfo",
+        "liteServer.transactionList",
+        "liteServer.transactionMetadata",
+        "liteServer.transactionId",
+        "liteServer.transactionId3",
+        "liteServer.blockTransactions",
+        "liteServer.blockTransactionsExt",
+        "liteServer.signature",
+        "liteServer.signatureSet",
+        "liteServer.blockLinkBack",
+        "liteServer.blockLinkForward",
+        "liteServer.partialBlockProof",
+        "liteServer.configInfo",
+        "liteServer.validatorStats",
+        "liteServer.libraryResult",
+        "liteServer.libraryResultWithProof",
+        "liteServer.shardBlockLink",
+        "liteServer.shardBlockProof",
+        "liteServer.lookupBlockResult",
+        "liteServer.outMsgQueueSize",
+        "liteServer.outMsgQueueSizes",
+        "liteServer.blockOutMsgQueueSize",
+        "liteServer.accountDispatchQueueInfo",
+        "liteServer.dispatchQueueInfo",
+        "liteServer.dispatchQueueMessage",
+        "liteServer.dispatchQueueMessages",
+        "liteServer.debug.verbosity",
+        "liteServer.nonfinal.candidateId",
+        "liteServer.nonfinal.candidate",
+        "liteServer.nonfinal.candidateInfo",
+        "liteServer.nonfinal.validatorGroupInfo",
+        "liteServer.nonfinal.validatorGroups",
+    };
+
+    /// <summary>
+    /// Serialized bytes one Read/Write operation processes for a type
+    /// </summary>
+    public static long BytesPerOperation(string type)
+    {
+        return corpus[type].Sum(sample => (long)sample.Length);
+    }
+
+    [GlobalSetup]
+    public void Setup()
+    {
+        samples = corpus[Type];
+        values = samples.Select(sample => TLSerializer.Read<object>(sample)).ToArray();
+        scratch = new byte[samples.Max(sample => sample.Length)];
+        write = Type switch
+        {
+            "tonNode.blockId" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0xB0683FE3);
+                ((TonNodeBlockId)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "tonNode.blockIdExt" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0x3DB0AD4C);
+                ((TonNodeBlockIdExt)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "tonNode.zeroStateIdExt" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0x527AFA73);
+                ((TonNodeZeroStateIdExt)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.error" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0x1BB566EA);
+                ((LiteServerError)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.accountId" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0x88729074);
+                ((LiteServerAccountId)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.libraryEntry" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0xFC3C1D28);
+                ((LiteServerLibraryEntry)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.masterchainInfo" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0xF9333637);
+                ((LiteServerMasterchainInfo)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.masterchainInfoExt" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0xAE76CCDA);
+                ((LiteServerMasterchainInfoExt)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.currentTime" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0x1D512914);
+                ((LiteServerCurrentTime)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.version" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0xB33314CF);
+                ((LiteServerVersion)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.blockData" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0x27A85F37);
+                ((LiteServerBlockData)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.blockState" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0x6A14E75E);
+                ((LiteServerBlockState)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.blockHeader" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0x071783EB);
+                ((LiteServerBlockHeader)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.sendMsgStatus" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0x0D5B50AB);
+                ((LiteServerSendMsgStatus)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.accountState" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0x7F151E0C);
+                ((LiteServerAccountState)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.runMethodResult" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0xB9CA2418);
+                ((LiteServerRunMethodResult)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.shardInfo" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0x8943A75D);
+                ((LiteServerShardInfo)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.allShardsInfo" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0x26DFD53B);
+                ((LiteServerAllShardsInfo)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.transactionInfo" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0x8BBF0C77);
+                ((LiteServerTransactionInfo)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.transactionList" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0xED0EC787);
+                ((LiteServerTransactionList)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.transactionMetadata" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0xFE240165);
+                ((LiteServerTransactionMetadata)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.transactionId" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0xE944EBD2);
+                ((LiteServerTransactionId)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.transactionId3" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0xAD4463EC);
+                ((LiteServerTransactionId3)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.blockTransactions" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0x01FB4F1A);
+                ((LiteServerBlockTransactions)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.blockTransactionsExt" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0xC495AF34);
+                ((LiteServerBlockTransactionsExt)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.signature" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0x78AB7D2A);
+                ((LiteServerSignature)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.signatureSet" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0x0DF0E11B);
+                ((LiteServerSignatureSet)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.blockLinkBack" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0x5353875B);
+                ((LiteServerBlockLinkBack)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.blockLinkForward" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0x775A5528);
+                ((LiteServerBlockLinkForward)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.partialBlockProof" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0xF3BB3510);
+                ((LiteServerPartialBlockProof)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.configInfo" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0xC87640D7);
+                ((LiteServerConfigInfo)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.validatorStats" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0xEBB8ABD9);
+                ((LiteServerValidatorStats)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.libraryResult" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0x6A34CEC1);
+                ((LiteServerLibraryResult)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.libraryResultWithProof" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0xEE983C56);
+                ((LiteServerLibraryResultWithProof)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.shardBlockLink" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0xDDD11B76);
+                ((LiteServerShardBlockLink)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.shardBlockProof" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0x330401A1);
+                ((LiteServerShardBlockProof)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.lookupBlockResult" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0x8850F75A);
+                ((LiteServerLookupBlockResult)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.outMsgQueueSize" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0xFE7CB74A);
+                ((LiteServerOutMsgQueueSize)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.outMsgQueueSizes" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0x2DE458AE);
+                ((LiteServerOutMsgQueueSizes)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.blockOutMsgQueueSize" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0xE9E602FB);
+                ((LiteServerBlockOutMsgQueueSize)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.accountDispatchQueueInfo" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0x3F213E07);
+                ((LiteServerAccountDispatchQueueInfo)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.dispatchQueueInfo" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0x569404CB);
+                ((LiteServerDispatchQueueInfo)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.dispatchQueueMessage" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0x2352C9EC);
+                ((LiteServerDispatchQueueMessage)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.dispatchQueueMessages" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0xF4486B0C);
+                ((LiteServerDispatchQueueMessages)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.debug.verbosity" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0xDC8427F8);
+                ((LiteServerDebugVerbosity)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.nonfinal.candidateId" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0x24EECDA9);
+                ((LiteServerNonfinalCandidateId)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.nonfinal.candidate" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0x87870AE4);
+                ((LiteServerNonfinalCandidate)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.nonfinal.candidateInfo" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0x95FDCCF3);
+                ((LiteServerNonfinalCandidateInfo)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.nonfinal.validatorGroupInfo" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0x928BCA39);
+                ((LiteServerNonfinalValidatorGroupInfo)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            "liteServer.nonfinal.validatorGroups" => (value, destination) =>
+            {
+                TLSpanWriter writer = new(destination);
+                writer.WriteUInt32(0xF982422F);
+                ((LiteServerNonfinalValidatorGroups)value).WriteTo(ref writer);
+                return writer.Written;
+            },
+            _ => throw new ArgumentException($"No golden samples for {Type}")
+        };
+    }
+
+    [Benchmark]
+    public int Read()
+    {
+        int read = 0;
+        foreach (byte[] sample in samples)
+        {
+            TLSpanReader reader = new(sample);
+            TLSerializer.ReadObject(ref reader);
+            read += reader.Position;
+        }
+        return read;
+    }
+
+    [Benchmark]
+    public int Write()
+    {
+        int written = 0;
+        foreach (object value in values) written += write(value, scratch);
+        return written;
+    }
+
+    static Dictionary<string, byte[][]> LoadCorpus()
+    {
+        byte[] data = File.ReadAllBytes(Path.Combine(AppContext.BaseDirectory, "Golden", "lite_api.golden"));
+        TLSpanReader reader = new(data);
+        Dictionary<string, List<byte[]>> samples = new();
+        uint count = reader.ReadUInt32();
+        for (uint i = 0; i < count; i++)
+        {
+            string name = reader.ReadString();
+            if (!samples.TryGetValue(name, out List<byte[]>? list)) samples[name] = list = new List<byte[]>();
+            list.Add(reader.ReadBuffer());
+        }
+
+        Dictionary<string, byte[][]> corpus = new();
+        foreach (KeyValuePair<string, List<byte[]>> entry in samples) corpus[entry.Key] = entry.Value.ToArray();
+        return corpus;
+    }
+}
@@ -0,0 +1,15 @@
+using BenchmarkDotNet.Configs;
+
+namespace TonSdk.Adnl.Benchmarks;
+
+/// <summary>
+///     Adds the MB/s column to <see cref="GoldenCorpusBenchmarks" />.
+/// </summary>
+public class GoldenCorpusConfig : ManualConfig
+{
+    public GoldenCorpusConfig()
+    {
+        AddColumn(new ThroughputColumn(benchmarkCase =>
+            benchmarkCase.Parameters["Type"] is string type ? GoldenCorpusBenchmarks.BytesPerOperation(type) : null));
+    }
+}
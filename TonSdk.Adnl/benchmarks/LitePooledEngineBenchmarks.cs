@@ -0,0 +1,79 @@
+using System;
+using System.Threading;
+using System.Threading.Tasks;
+using BenchmarkDotNet.Attributes;
+using BenchmarkDotNet.Configs;
+using TonSdk.Adnl.LiteClient.Engines;
+using TonSdk.Adnl.LiteClient.Protocol;
+using TonSdk.Adnl.Tests;
+
+namespace TonSdk.Adnl.Benchmarks;
+
+/// <summary>
+///     Query throughput of <see cref="LitePooledEngine" /> against a loopback lite server, by pool size.
+///     Many concurrent callers ask for block-sized responses, so a single connection is bound by its one
+///     decrypt-and-parse loop; more connections spread that work over more cores.
+/// </summary>
+[MemoryDiagnoser]
+[SimpleJob(launchCount: 1, warmupCount: 2, iterationCount: 10)]
+[Config(typeof(LitePooledEngineConfig))]
+public class LitePooledEngineBenchmarks
+{
+    public const int ResponseSize = 64 * 1024;
+    const int Queries = 4_096;
+    const int Callers = 256;
+
+    static readonly LiteServerGetTimeRequest Request = new();
+
+    LitePooledEngine engine = null!;
+    LoopbackLiteServer server = null!;
+
+    [Params(1, 2, 4, 8)] public int PoolSize;
+
+    [GlobalSetup]
+    public void Setup()
+    {
+        byte[] response = new byte[ResponseSize];
+        new Random(42).NextBytes(response);
+
+        server = new LoopbackLiteServer(response);
+        engine = new LitePooledEngine(server.Host, server.Port, server.PublicKey, PoolSize);
+
+        DateTime deadline = DateTime.UtcNow.AddSeconds(30);
+        while (engine.ReadyCount < PoolSize && DateTime.UtcNow < deadline)
+            Thread.Sleep(50);
+        if (engine.ReadyCount < PoolSize) throw new TimeoutException("Pool did not connect");
+    }
+
+    [GlobalCleanup]
+    public void Cleanup()
+    {
+        engine.Dispose();
+        server.Dispose();
+    }
+
+    [Benchmark(OperationsPerInvoke = Queries)]
+    public Task Query()
+    {
+        Task[] callers = new Task[Callers];
+        for (int c = 0; c < callers.Length; c++)
+            callers[c] = Task.Run(async () =>
+            {
+                for (int i = 0; i < Queries / Callers; i++)
+                    await engine.QueryAsync(Request).ConfigureAwait(false);
+            });
+
+        return Task.WhenAll(callers);
+    }
+}
+
+/// <summary>
+///     Adds the MB/s column to <see cref="LitePooledEngineBenchmarks" />.
+/// </summary>
+public class LitePooledEngineConfig : ManualConfig
+{
+    public LitePooledEngineConfig()
+    {
+        AddColumn(new ThroughputColumn(_ => LitePooledEngineBenchmarks.ResponseSize));
+    }
+}
@@ -0,0 +1,73 @@
+using System;
+using System.Threading;
+using System.Threading.Tasks;
+using BenchmarkDotNet.Attributes;
+using TonSdk.Adnl.LiteClient.Engines;
+using TonSdk.Adnl.TL;
+
+namespace TonSdk.Adnl.Benchmarks;
+
+/// <summary>
+///     Register/complete throughput of <see cref="QueryManager" /> with several threads issuing queries at once,
+///     on top of a standing population of pending queries like a busy indexer keeps.
+/// </summary>
+[MemoryDiagnoser]
+public class QueryManagerBenchmarks
+{
+    const int Queries = 65_536;
+    const int Standing = 10_000;
+
+    static readonly byte[] Packet = new byte[64];
+    static readonly byte[] Response = new byte[64];
+
+    TLInt256[] ids = null!;
+    QueryManager queries = null!;
+
+    [Params(1, 4, 16)] public int Threads;
+
+    [GlobalSetup]
+    public void Setup()
+    {
+        Random random = new(42);
+        byte[] bytes = new byte[TLInt256.Size];
+        ids = new TLInt256[Queries + Standing];
+        for (int i = 0; i < ids.Length; i++)
+        {
+            random.NextBytes(bytes);
+            ids[i] = new TLInt256(bytes);
+        }
+
+        queries = new QueryManager(Standing + Queries);
+        for (int i = 0; i < Standing; i++)
+            _ = queries.RegisterQueryAsync(ids[Queries + i], Packet, Timeout.Infinite, CancellationToken.None);
+    }
+
+    [GlobalCleanup]
+    public void Cleanup()
+    {
+        queries.Dispose();
+    }
+
+    [Benchmark(OperationsPerInvoke = Queries)]
+    public Task RegisterAndComplete()
+    {
+        Task[] workers = new Task[Threads];
+        int perThread = Queries / Threads;
+        for (int t = 0; t < workers.Length; t++)
+        {
+            int first = t * perThread;
+            workers[t] = Task.Run(async () =>
+            {
+                for (int i = first; i < first + perThread; i++)
+                {
+                    Task<byte[]> response = await queries.RegisterQueryAsync(ids[i], Packet, 30_000,
+                        CancellationToken.None);
+                    queries.CompleteQuery(ids[i], Response);
+                    await response;
+                }
+            });
+        }
+
+        return Task.WhenAll(workers);
+    }
+}
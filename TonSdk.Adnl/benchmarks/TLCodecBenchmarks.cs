@@ -0,0 +1,187 @@
+using System;
+using BenchmarkDotNet.Attributes;
+using BenchmarkDotNet.Configs;
+using TonSdk.Adnl.LiteClient.Protocol;
+using TonSdk.Adnl.TL;
+
+namespace TonSdk.Adnl.Benchmarks;
+
+/// <summary>
+///     Compares the stream-based TLReadBuffer/TLWriteBuffer codecs with the span-based
+///     TLSpanReader/TLSpanWriter codecs and the zero-copy views on typical lite-server responses.
+/// </summary>
+[MemoryDiagnoser]
+[GroupBenchmarksBy(BenchmarkLogicalGroupRule.ByCategory)]
+public class TLCodecBenchmarks
+{
+    LiteServerAccountState accountState = null!;
+    byte[] accountStateBytes = null!;
+    LiteServerBlockTransactions blockTransactions = null!;
+    byte[] blockTransactionsBytes = null!;
+    LiteServerMasterchainInfo masterchainInfo = null!;
+    byte[] masterchainInfoBytes = null!;
+    byte[] scratch = null!;
+
+    [Params(1_024, 65_536)] public int StateSize;
+
+    [Params(256)] public int TransactionCount;
+
+    [GlobalSetup]
+    public void Setup()
+    {
+        Random random = new(42);
+
+        masterchainInfo = new LiteServerMasterchainInfo
+        {
+            Last = RandomBlockId(random, -1),
+            StateRootHash = RandomHash(random),
+            Init = new TonNodeZeroStateIdExt(-1, RandomHash(random), RandomHash(random))
+        };
+
+        LiteServerTransactionId[] ids = new LiteServerTransactionId[TransactionCount];
+        for (int i = 0; i < ids.Length; i++)
+            ids[i] = new LiteServerTransactionId
+            {
+                Mode = 0b111,
+                Account = RandomHash(random),
+                Lt = 40_000_000_000_000 + i,
+                Hash = RandomHash(random)
+            };
+
+        blockTransactions = new LiteServerBlockTransactions
+        {
+            Id = RandomBlockId(random, 0),
+            ReqCount = (uint)TransactionCount,
+            Incomplete = false,
+            Ids = ids,
+            Proof = RandomBytes(random, 2_048)
+        };
+
+        accountState = new LiteServerAccountState
+        {
+            Id = RandomBlockId(random, -1),
+            Shardblk = RandomBlockId(random, 0),
+            ShardProof = RandomBytes(random, 1_024),
+            Proof = RandomBytes(random, 2_048),
+            State = RandomBytes(random, StateSize)
+        };
+
+        masterchainInfoBytes = Serialize(masterchainInfo.WriteTo);
+        blockTransactionsBytes = Serialize(blockTransactions.WriteTo);
+        accountStateBytes = Serialize(accountState.WriteTo);
+        scratch = new byte[accountStateBytes.Length + blockTransactionsBytes.Length + masterchainInfoBytes.Length];
+    }
+
+    static byte[] Serialize(Action<TLWriteBuffer> write)
+    {
+        TLWriteBuffer writer = new();
+        write(writer);
+        return writer.Build();
+    }
+
+    static byte[] RandomBytes(Random random, int length)
+    {
+        byte[] bytes = new byte[length];
+        random.NextBytes(bytes);
+        return bytes;
+    }
+
+    static TLInt256 RandomHash(Random random)
+    {
+        return new TLInt256(RandomBytes(random, TLInt256.Size));
+    }
+
+    static TonNodeBlockIdExt RandomBlockId(Random random, int workchain)
+    {
+        return new TonNodeBlockIdExt(workchain, long.MinValue, random.Next(), RandomHash(random), RandomHash(random));
+    }
+
+    [Benchmark(Baseline = true)]
+    [BenchmarkCategory("Read", "MasterchainInfo")]
+    public LiteServerMasterchainInfo ReadMasterchainInfo_TLReadBuffer()
+    {
+        return LiteServerMasterchainInfo.ReadFrom(new TLReadBuffer(masterchainInfoBytes));
+    }
+
+    [Benchmark]
+    [BenchmarkCategory("Read", "MasterchainInfo")]
+    public LiteServerMasterchainInfo ReadMasterchainInfo_TLSpanReader()
+    {
+        TLSpanReader reader = new(masterchainInfoBytes);
+        return LiteServerMasterchainInfo.ReadFrom(ref reader);
+    }
+
+    [Benchmark(Baseline = true)]
+    [BenchmarkCategory("Read", "BlockTransactions")]
+    public LiteServerBlockTransactions ReadBlockTransactions_TLReadBuffer()
+    {
+        return LiteServerBlockTransactions.ReadFrom(new TLReadBuffer(blockTransactionsBytes));
+    }
+
+    [Benchmark]
+    [BenchmarkCategory("Read", "BlockTransactions")]
+    public LiteServerBlockTransactions ReadBlockTransactions_TLSpanReader()
+    {
+        TLSpanReader reader = new(blockTransactionsBytes);
+        return LiteServerBlockTransactions.ReadFrom(ref reader);
+    }
+
+    [Benchmark(Baseline = true)]
+    [BenchmarkCategory("Read", "AccountState")]
+    public LiteServerAccountState ReadAccountState_TLReadBuffer()
+    {
+        return LiteServerAccountState.ReadFrom(new TLReadBuffer(accountStateBytes));
+    }
+
+    [Benchmark]
+    [BenchmarkCategory("Read", "AccountState")]
+    public LiteServerAccountState ReadAccountState_TLSpanReader()
+    {
+        TLSpanReader reader = new(accountStateBytes);
+        return LiteServerAccountState.ReadFrom(ref reader);
+    }
+
+    [Benchmark]
+    [BenchmarkCategory("Read", "AccountState")]
+    public int ReadAccountState_View()
+    {
+        LiteServerAccountStateView view = new(accountStateBytes);
+        return view.State.Length;
+    }
+
+    [Benchmark(Baseline = true)]
+    [BenchmarkCategory("Write", "BlockTransactions")]
+    public byte[] WriteBlockTransactions_TLWriteBuffer()
+    {
+        TLWriteBuffer writer = new();
+        blockTransactions.WriteTo(writer);
+        return writer.Build();
+    }
+
+    [Benchmark]
+    [BenchmarkCategory("Write", "BlockTransactions")]
+    public int WriteBlockTransactions_TLSpanWriter()
+    {
+        TLSpanWriter writer = new(scratch);
+        blockTransactions.WriteTo(ref writer);
+        return writer.Written;
+    }
+
+    [Benchmark(Baseline = true)]
+    [BenchmarkCategory("Write", "AccountState")]
+    public byte[] WriteAccountState_TLWriteBuffer()
+    {
+        TLWriteBuffer writer = new();
+        accountState.WriteTo(writer);
+        return writer.Build();
+    }
+
+    [Benchmark]
+    [BenchmarkCategory("Write", "AccountState")]
+    public int WriteAccountState_TLSpanWriter()
+    {
+        TLSpanWriter writer = new(scratch);
+        accountState.WriteTo(ref writer);
+        return writer.Written;
+    }
+}
@@ -0,0 +1,76 @@
+using System;
+using System.Collections.Generic;
+using BenchmarkDotNet.Attributes;
+using TonSdk.Adnl.LiteClient.Protocol;
+using TonSdk.Adnl.TL;
+
+namespace TonSdk.Adnl.Benchmarks;
+
+/// <summary>
+///     Cost of mapping a constructor id to its generated type, over every generated constructor:
+///     the switch-based registry against a dictionary lookup, plus a full boxed decode through TLSerializer.
+/// </summary>
+[MemoryDiagnoser]
+public class TLDispatchBenchmarks
+{
+    uint[] constructors = null!;
+    Dictionary<uint, Type> dictionary = null!;
+    byte[] masterchainInfoBytes = null!;
+
+    [GlobalSetup]
+    public void Setup()
+    {
+        constructors = new uint[TLSerializer.KnownConstructors.Count];
+        dictionary = new Dictionary<uint, Type>();
+        for (int i = 0; i < constructors.Length; i++)
+        {
+            constructors[i] = TLSerializer.KnownConstructors[i];
+            dictionary[constructors[i]] = TLSerializer.ResolveType(constructors[i])!;
+        }
+
+        // Shuffle so the branch predictor cannot learn the order
+        Random random = new(42);
+        for (int i = constructors.Length - 1; i > 0; i--)
+        {
+            int j = random.Next(i + 1);
+            (constructors[i], constructors[j]) = (constructors[j], constructors[i]);
+        }
+
+        LiteServerMasterchainInfo masterchainInfo = new()
+        {
+            Last = new TonNodeBlockIdExt(-1, long.MinValue, 1, TLInt256.Zero, TLInt256.Zero),
+            StateRootHash = TLInt256.Zero,
+            Init = new TonNodeZeroStateIdExt(-1, TLInt256.Zero, TLInt256.Zero)
+        };
+        TLWriteBuffer writer = new(4 + masterchainInfo.GetSerializedSize());
+        writer.WriteUInt32(LiteServerMasterchainInfo.Constructor);
+        masterchainInfo.WriteTo(writer);
+        masterchainInfoBytes = writer.Build();
+    }
+
+    [Benchmark(Baseline = true)]
+    public int Lookup_Dictionary()
+    {
+        int found = 0;
+        foreach (uint constructor in constructors)
+            if (dictionary.TryGetValue(constructor, out Type? _))
+                found++;
+        return found;
+    }
+
+    [Benchmark]
+    public int Lookup_Switch()
+    {
+        int found = 0;
+        foreach (uint constructor in constructors)
+            if (TLSerializer.ResolveType(constructor) != null)
+                found++;
+        return found;
+    }
+
+    [Benchmark]
+    public LiteServerMasterchainInfo Read_MasterchainInfo()
+    {
+        return TLSerializer.Read<LiteServerMasterchainInfo>(masterchainInfoBytes);
+    }
+}
@@ -0,0 +1,135 @@
+using System;
+using System.Diagnostics;
+using System.Diagnostics.Metrics;
+using System.Threading;
+using System.Threading.Tasks;
+using BenchmarkDotNet.Attributes;
+using TonSdk.Adnl.Diagnostics;
+using TonSdk.Adnl.LiteClient;
+using TonSdk.Adnl.LiteClient.Engines;
+using TonSdk.Adnl.LiteClient.Protocol;
+using TonSdk.Adnl.TL;
+
+namespace TonSdk.Adnl.Benchmarks;
+
+/// <summary>
+///     Cost of the built-in instrumentation on the query path, with and without a listener attached.
+///     The engine answers synchronously, so the numbers are the lite client's own overhead; without a listener
+///     <see cref="ClientQuery" /> should match the <see cref="EngineQuery" /> baseline.
+/// </summary>
+[MemoryDiagnoser]
+public class TelemetryBenchmarks
+{
+    static readonly LiteServerGetTimeRequest Request = new();
+    static readonly byte[] Packet = new byte[64];
+
+    ActivityListener? activityListener;
+    LiteClient.LiteClient client = null!;
+    CompletedEngine engine = null!;
+    TLInt256 id;
+    MeterListener? meterListener;
+    QueryManager queries = null!;
+
+    [Params(false, true)] public bool Listening;
+
+    [GlobalSetup]
+    public void Setup()
+    {
+        TLWriteBuffer writer = new(8);
+        writer.WriteUInt32(LiteServerCurrentTime.Constructor);
+        writer.WriteInt32(1_700_000_000);
+        engine = new CompletedEngine(writer.Build());
+        client = LiteClient.LiteClient.Create(engine);
+        queries = new QueryManager();
+        id = new TLInt256(new byte[TLInt256.Size]);
+
+        if (!Listening) return;
+
+        meterListener = new MeterListener
+        {
+            InstrumentPublished = (instrument, listener) =>
+            {
+                if (instrument.Meter.Name == AdnlTelemetry.MeterName) listener.EnableMeasurementEvents(instrument);
+            }
+        };
+        meterListener.SetMeasurementEventCallback<long>(static (_, _, _, _) => { });
+        meterListener.SetMeasurementEventCallback<double>(static (_, _, _, _) => { });
+        meterListener.Start();
+
+        activityListener = new ActivityListener
+        {
+            ShouldListenTo = source => source.Name == AdnlTelemetry.ActivitySourceName,
+            Sample = static (ref ActivityCreationOptions<ActivityContext> _) => ActivitySamplingResult.AllData
+        };
+        ActivitySource.AddActivityListener(activityListener);
+    }
+
+    [GlobalCleanup]
+    public void Cleanup()
+    {
+        meterListener?.Dispose();
+        activityListener?.Dispose();
+        queries.Dispose();
+        client.Dispose();
+    }
+
+    [Benchmark(Baseline = true)]
+    public Task<byte[]> EngineQuery()
+    {
+        return engine.QueryAsync(Request);
+    }
+
+    [Benchmark]
+    public Task<byte[]> ClientQuery()
+    {
+        return client.Query(Request);
+    }
+
+    [Benchmark]
+    public Task<LiteServerCurrentTime> ClientGetTime()
+    {
+        return client.GetTime();
+    }
+
+    [Benchmark]
+    public Task<byte[]> RegisterAndComplete()
+    {
+        Task<byte[]> response = queries.RegisterQueryAsync(id, Packet, 30_000, CancellationToken.None)
+            .GetAwaiter().GetResult();
+        queries.CompleteQuery(id, Packet);
+        return response;
+    }
+
+    sealed class CompletedEngine(byte[] response) : ILiteEngine
+    {
+        readonly Task<byte[]> completed = Task.FromResult(response);
+
+        public bool IsReady => true;
+        public bool IsClosed => false;
+
+        public event Action? Connected;
+        public event Action? Ready;
+        public event Action? Closed;
+        public event Action<Exception>? Error;
+
+        public Task<byte[]> QueryAsync(
+            Func<(byte[] queryId, byte[] data)> encoder,
+            int timeout = 30000,
+            CancellationToken cancellationToken = default)
+        {
+            return completed;
+        }
+
+        public Task<byte[]> QueryAsync(
+            ILiteServerRequest request,
+            int timeout = 30000,
+            CancellationToken cancellationToken = default)
+        {
+            return completed;
+        }
+
+        public void Dispose()
+        {
+        }
+    }
+}
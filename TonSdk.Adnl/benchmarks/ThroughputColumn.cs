@@ -0,0 +1,45 @@
+using System;
+using BenchmarkDotNet.Columns;
+using BenchmarkDotNet.Reports;
+using BenchmarkDotNet.Running;
+
+namespace TonSdk.Adnl.Benchmarks;
+
+/// <summary>
+///     Throughput of one benchmark operation in MB/s, given the number of bytes the operation processes.
+/// </summary>
+public class ThroughputColumn(Func<BenchmarkCase, long?> bytesPerOperation) : IColumn
+{
+    public string Id => nameof(ThroughputColumn);
+    public string ColumnName => "MB/s";
+    public bool AlwaysShow => true;
+    public ColumnCategory Category => ColumnCategory.Custom;
+    public int PriorityInCategory => 0;
+    public bool IsNumeric => true;
+    public UnitType UnitType => UnitType.Dimensionless;
+    public string Legend => "Megabytes processed per second";
+
+    public string GetValue(Summary summary, BenchmarkCase benchmarkCase)
+    {
+        return GetValue(summary, benchmarkCase, SummaryStyle.Default);
+    }
+
+    public string GetValue(Summary summary, BenchmarkCase benchmarkCase, SummaryStyle style)
+    {
+        double? meanNanoseconds = summary[benchmarkCase]?.ResultStatistics?.Mean;
+        long? bytes = bytesPerOperation(benchmarkCase);
+        if (meanNanoseconds is not > 0 || bytes is null) return "-";
+
+        return (bytes.Value / (meanNanoseconds.Value / 1e9) / (1024 * 1024)).ToString("N1", style.CultureInfo);
+    }
+
+    public bool IsAvailable(Summary summary)
+    {
+        return true;
+    }
+
+    public bool IsDefault(Summary summary, BenchmarkCase benchmarkCase)
+    {
+        return false;
+    }
+}
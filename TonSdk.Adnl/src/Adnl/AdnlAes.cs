@@ -1,4 +1,6 @@
 ﻿using System;
+using System.Buffers.Binary;
+using System.Numerics;
 using System.Security.Cryptography;
 
 namespace TonSdk.Adnl.Adnl;
@@ -60,13 +62,21 @@ public class AesCtrMode
     }
 
     public byte[] Encrypt(byte[] plaintext)
+    {
+        byte[] encrypted = (byte[])plaintext.Clone();
+        Transform(encrypted);
+        return encrypted;
+    }
+
+    /// <summary>
+    ///     Encrypt or decrypt <paramref name="data" /> in place, continuing the keystream of previous calls.
+    /// </summary>
+    public void Transform(Span<byte> data)
     {
         // Thread-safe encryption: lock to prevent concurrent modification of counter state
         lock (@lock)
         {
-            byte[] encrypted = new byte[plaintext.Length];
-
-            for (int i = 0; i < encrypted.Length; i++)
+            for (int i = 0; i < data.Length; i++)
             {
                 if (remainingCounterIndex == 16)
                 {
@@ -75,10 +85,8 @@ public class AesCtrMode
                     counter.Increment();
                 }
 
-                encrypted[i] = (byte)(plaintext[i] ^ remainingCounter[remainingCounterIndex++]);
+                data[i] ^= remainingCounter[remainingCounterIndex++];
             }
-
-            return encrypted;
         }
     }
 
@@ -92,4 +100,100 @@ public class AesCtrMode
     {
         return Encrypt(ciphertext); // Delegates to Encrypt, which is now thread-safe
     }
-}
\ No newline at end of file
+}
+
+/// <summary>
+///     AES-CTR producing the same keystream as <see cref="AesCtrMode" /> over <see cref="AesCounter" />
+///     (a 128-bit big-endian counter that wraps to zero), but many counter blocks at a time: one ECB
+///     transform encrypts a whole batch of counters and the keystream is XORed into the data in place.
+///     Owns the AES instance and its transform until disposed.
+/// </summary>
+internal sealed class AesCtrKeystream : IDisposable
+{
+    const int BatchBlocks = 256;
+    const int BlockSize = 16;
+
+    readonly Aes aes;
+    readonly ICryptoTransform encryptor;
+    readonly byte[] counterBlocks = new byte[BatchBlocks * BlockSize];
+    readonly byte[] keystream = new byte[BatchBlocks * BlockSize];
+    readonly object @lock = new();
+    ulong counterHigh;
+    ulong counterLow;
+    bool disposed;
+    int keystreamPosition;
+
+    internal AesCtrKeystream(byte[] key, byte[] iv)
+    {
+        if (iv.Length != BlockSize)
+            throw new ArgumentException("Invalid counter bytes size (must be 16 bytes)");
+
+        counterHigh = BinaryPrimitives.ReadUInt64BigEndian(iv);
+        counterLow = BinaryPrimitives.ReadUInt64BigEndian(iv.AsSpan(8));
+        keystreamPosition = keystream.Length;
+
+        aes = Aes.Create();
+        aes.Key = key;
+        aes.Mode = CipherMode.ECB;
+        aes.Padding = PaddingMode.None;
+        encryptor = aes.CreateEncryptor();
+    }
+
+    public void Dispose()
+    {
+        lock (@lock)
+        {
+            if (disposed) return;
+
+            disposed = true;
+            encryptor.Dispose();
+            aes.Dispose();
+        }
+    }
+
+    /// <summary>
+    ///     Encrypt or decrypt <paramref name="data" /> in place, continuing the keystream of previous calls.
+    /// </summary>
+    internal void Transform(Span<byte> data)
+    {
+        lock (@lock)
+        {
+            if (disposed) throw new ObjectDisposedException(nameof(AesCtrKeystream));
+
+            while (!data.IsEmpty)
+            {
+                if (keystreamPosition == keystream.Length) Refill();
+
+                int count = Math.Min(data.Length, keystream.Length - keystreamPosition);
+                Xor(data.Slice(0, count), keystream.AsSpan(keystreamPosition, count));
+                keystreamPosition += count;
+                data = data.Slice(count);
+            }
+        }
+    }
+
+    void Refill()
+    {
+        Span<byte> blocks = counterBlocks;
+        for (int offset = 0; offset < blocks.Length; offset += BlockSize)
+        {
+            BinaryPrimitives.WriteUInt64BigEndian(blocks.Slice(offset), counterHigh);
+            BinaryPrimitives.WriteUInt64BigEndian(blocks.Slice(offset + 8), counterLow);
+            if (++counterLow == 0) counterHigh++;
+        }
+
+        encryptor.TransformBlock(counterBlocks, 0, counterBlocks.Length, keystream, 0);
+        keystreamPosition = 0;
+    }
+
+    static void Xor(Span<byte> data, ReadOnlySpan<byte> keystream)
+    {
+        int i = 0;
+        if (Vector.IsHardwareAccelerated)
+            for (; i <= data.Length - Vector<byte>.Count; i += Vector<byte>.Count)
+                (new Vector<byte>(data.Slice(i)) ^ new Vector<byte>(keystream.Slice(i))).CopyTo(data.Slice(i));
+
+        for (; i < data.Length; i++)
+            data[i] ^= keystream[i];
+    }
+}
@@ -2,9 +2,9 @@
 
 namespace TonSdk.Adnl.Adnl;
 
-internal class Cipher
+internal class Cipher : IDisposable
 {
-    readonly AesCtrMode cipher;
+    readonly AesCtrKeystream cipher;
 
     internal Cipher(byte[] key, byte[] iv)
     {
@@ -14,18 +14,30 @@ internal class Cipher
         if (iv.Length != 16)
             throw new ArgumentException("Invalid IV length. IV must be 128 bits.");
 
-        cipher = new AesCtrMode(key, new AesCounter(iv));
+        cipher = new AesCtrKeystream(key, iv);
+    }
+
+    public void Dispose()
+    {
+        cipher.Dispose();
     }
 
     internal byte[] Update(byte[] data)
     {
-        return cipher.Encrypt(data);
+        byte[] encrypted = (byte[])data.Clone();
+        cipher.Transform(encrypted);
+        return encrypted;
+    }
+
+    internal void Update(Span<byte> data)
+    {
+        cipher.Transform(data);
     }
 }
 
-internal class Decipher
+internal class Decipher : IDisposable
 {
-    readonly AesCtrMode cipher;
+    readonly AesCtrKeystream cipher;
 
     internal Decipher(byte[] key, byte[] iv)
     {
@@ -35,12 +47,24 @@ internal class Decipher
         if (iv.Length != 16)
             throw new ArgumentException("Invalid IV length. IV must be 128 bits.");
 
-        cipher = new AesCtrMode(key, new AesCounter(iv));
+        cipher = new AesCtrKeystream(key, iv);
+    }
+
+    public void Dispose()
+    {
+        cipher.Dispose();
     }
 
     internal byte[] Update(byte[] data)
     {
-        return cipher.Decrypt(data);
+        byte[] decrypted = (byte[])data.Clone();
+        cipher.Transform(decrypted);
+        return decrypted;
+    }
+
+    internal void Update(Span<byte> data)
+    {
+        cipher.Transform(data);
     }
 }
 
@@ -1,7 +1,9 @@
 ﻿using System;
 using System.Linq;
 using System.Net.Sockets;
+using System.Threading;
 using System.Threading.Tasks;
+using TonSdk.Adnl.Diagnostics;
 
 namespace TonSdk.Adnl.Adnl;
 
@@ -13,17 +15,23 @@ public enum AdnlClientState
     Closed
 }
 
+/// <summary>
+///     Receives the payload of one ADNL packet. The span points into the connection's receive buffer
+///     and is only valid until the handler returns.
+/// </summary>
+public delegate void AdnlPayloadHandler(ReadOnlySpan<byte> payload);
+
 public class AdnlClientTcp
 {
     readonly AdnlAddress address;
     readonly string host;
     readonly int port;
     readonly TcpClient socket;
+    readonly SemaphoreSlim writeLock = new(1, 1);
 
-    // private List<byte> _buffer;
-    byte[] buffer;
     Cipher cipher;
     Decipher decipher;
+    AdnlFrameReader reader;
     AdnlKeys keys;
     NetworkStream networkStream;
     AdnlAesParams @params;
@@ -74,6 +82,11 @@ public class AdnlClientTcp
     public event Action Ready;
     public event Action Closed;
     public event Action<byte[]> DataReceived;
+
+    /// <summary>
+    ///     Like <see cref="DataReceived" />, without copying the payload out of the receive buffer.
+    /// </summary>
+    public event AdnlPayloadHandler PayloadReceived;
     public event Action<Exception> ErrorOccurred;
 
     async Task Handshake()
@@ -81,7 +94,7 @@ public class AdnlClientTcp
         byte[] key = keys.Shared.Take(16).Concat(@params.Hash.Skip(16).Take(16)).ToArray();
         byte[] nonce = @params.Hash.Take(4).Concat(keys.Shared.Skip(20).Take(12)).ToArray();
 
-        Cipher cipher = CipherFactory.CreateCipheriv(key, nonce);
+        using Cipher cipher = CipherFactory.CreateCipheriv(key, nonce);
 
         byte[] payload = cipher.Update(@params.Bytes).ToArray();
         byte[] packet = address.Hash.Concat(keys.Public).Concat(@params.Hash).Concat(payload).ToArray();
@@ -98,30 +111,26 @@ public class AdnlClientTcp
         @params = new AdnlAesParams();
         cipher = CipherFactory.CreateCipheriv(@params.TxKey, @params.TxNonce);
         decipher = CipherFactory.CreateDecipheriv(@params.RxKey, @params.RxNonce);
-        buffer = Array.Empty<byte>();
+        reader = new AdnlFrameReader(decipher);
         State = AdnlClientState.Connecting;
     }
 
     async Task ReadDataAsync()
     {
+        // A reconnect replaces the fields, so release what this connection used
+        AdnlFrameReader reader = this.reader;
+        Cipher cipher = this.cipher;
+        Decipher decipher = this.decipher;
         try
         {
-            byte[] buffer = new byte[1024 * 1024];
-
             while (socket.Connected)
             {
-                int bytesRead = await networkStream.ReadAsync(buffer, 0, buffer.Length).ConfigureAwait(false);
-                if (bytesRead > 0)
-                {
-                    byte[] receivedData = new byte[bytesRead];
-                    Array.Copy(buffer, receivedData, bytesRead);
-
-                    OnDataReceived(receivedData);
-                }
-                else if (bytesRead == 0)
-                {
-                    break;
-                }
+                int bytesRead = await networkStream.ReadAsync(reader.GetMemory()).ConfigureAwait(false);
+                if (bytesRead == 0) break;
+
+                int packets = reader.Advance(bytesRead, OnPacketReceived);
+                AdnlTelemetry.BytesReceived.Add(bytesRead);
+                AdnlTelemetry.PacketsReceived.Add(packets);
             }
         }
         catch (Exception ex)
@@ -130,6 +139,9 @@ public class AdnlClientTcp
         }
         finally
         {
+            reader.Dispose();
+            cipher.Dispose();
+            decipher.Dispose();
             OnClose();
         }
     }
@@ -146,44 +158,40 @@ public class AdnlClientTcp
         Closed?.Invoke();
     }
 
-    void OnDataReceived(byte[] data)
+    void OnPacketReceived(ReadOnlySpan<byte> payload)
     {
-        buffer = buffer.Concat(Decrypt(data)).ToArray();
-        while (buffer.Length >= AdnlPacket.packetMinSize)
+        if (State == AdnlClientState.Connecting)
         {
-            AdnlPacket? packet = AdnlPacket.Parse(buffer);
-            if (packet == null) break;
-
-            buffer = buffer.Skip(packet.Length).ToArray();
-
-            if (State == AdnlClientState.Connecting)
+            if (payload.Length != 0)
             {
-                if (packet.Payload.Length != 0)
-                {
-                    ErrorOccurred?.Invoke(new Exception("AdnlClient: Bad handshake."));
-                    End();
-                    State = AdnlClientState.Closed;
-                }
-                else
-                {
-                    OnReady();
-                }
-
-                break;
+                ErrorOccurred?.Invoke(new Exception("AdnlClient: Bad handshake."));
+                End();
+                State = AdnlClientState.Closed;
+            }
+            else
+            {
+                OnReady();
             }
 
-            DataReceived?.Invoke(packet.Payload);
+            return;
         }
+
+        if (State != AdnlClientState.Open) return;
+
+        PayloadReceived?.Invoke(payload);
+        DataReceived?.Invoke(payload.ToArray());
     }
 
     public async Task Connect()
     {
         OnBeforeConnect();
+        bool reading = false;
         try
         {
             await socket.ConnectAsync(host, port).ConfigureAwait(false);
             networkStream = socket.GetStream();
             Task.Run(async () => await ReadDataAsync().ConfigureAwait(false));
+            reading = true;
             Connected?.Invoke();
             await Handshake().ConfigureAwait(false);
         }
@@ -192,6 +200,14 @@ public class AdnlClientTcp
             ErrorOccurred?.Invoke(e);
             End();
             State = AdnlClientState.Closed;
+
+            // Once started, the read loop releases these when it ends
+            if (!reading)
+            {
+                reader.Dispose();
+                cipher.Dispose();
+                decipher.Dispose();
+            }
         }
     }
 
@@ -204,19 +220,24 @@ public class AdnlClientTcp
 
     public async Task Write(byte[] data)
     {
-        AdnlPacket packet = new(data);
-        byte[] encrypted = Encrypt(packet.Data);
-        await networkStream.WriteAsync(encrypted, 0, encrypted.Length).ConfigureAwait(false);
-    }
+        byte[] packet = new AdnlPacket(data).Data;
 
-    byte[] Encrypt(byte[] data)
-    {
-        return cipher.Update(data);
-    }
+        // The keystream is continuous, so packets must reach the socket in the order they were encrypted
+        await writeLock.WaitAsync().ConfigureAwait(false);
+        try
+        {
+            long started = AdnlTelemetry.StartTimer(AdnlTelemetry.CipherDuration);
+            cipher.Update(packet.AsSpan());
+            AdnlTelemetry.StopTimer(AdnlTelemetry.CipherDuration, started, AdnlTelemetry.Encrypt);
 
-    byte[] Decrypt(byte[] data)
-    {
-        return decipher.Update(data);
+            await networkStream.WriteAsync(packet).ConfigureAwait(false);
+            AdnlTelemetry.BytesSent.Add(packet.Length);
+            AdnlTelemetry.PacketsSent.Add(1);
+        }
+        finally
+        {
+            writeLock.Release();
+        }
     }
 
     static string ConvertToIpAddress(int number)
@@ -0,0 +1,113 @@
+﻿using System;
+using System.Buffers;
+using TonSdk.Adnl.Diagnostics;
+
+namespace TonSdk.Adnl.Adnl;
+
+/// <summary>
+///     Receive side of an ADNL TCP connection.
+///     Socket reads land in one pooled buffer and are decrypted in place; every complete packet is verified and
+///     its payload handed to the handler as a span over that buffer, so payloads are never copied on the way in.
+/// </summary>
+internal sealed class AdnlFrameReader : IDisposable
+{
+    internal const int MinimumReadSize = 64 * 1024;
+    const int InitialSize = 128 * 1024;
+    const int RetainedSize = 1024 * 1024;
+
+    readonly Decipher decipher;
+    byte[] buffer;
+    int start; // first byte not yet consumed
+    int end; // end of the received bytes
+
+    internal AdnlFrameReader(Decipher decipher)
+    {
+        this.decipher = decipher;
+        buffer = ArrayPool<byte>.Shared.Rent(InitialSize);
+    }
+
+    /// <summary>
+    ///     Received bytes that do not form a complete packet yet.
+    /// </summary>
+    internal int Buffered => end - start;
+
+    public void Dispose()
+    {
+        byte[] rented = buffer;
+        buffer = Array.Empty<byte>();
+        start = end = 0;
+        if (rented.Length != 0) ArrayPool<byte>.Shared.Return(rented);
+    }
+
+    /// <summary>
+    ///     Free space to read the next chunk from the socket into; at least <see cref="MinimumReadSize" /> bytes,
+    ///     or enough to complete the packet being received. Pass the number of bytes read to <see cref="Advance" />.
+    /// </summary>
+    internal Memory<byte> GetMemory()
+    {
+        int required = MinimumReadSize;
+        if (AdnlPacket.TryGetLength(buffer.AsSpan(start, end - start), out int length))
+            required = Math.Max(required, length - Buffered);
+
+        EnsureFree(required);
+        return buffer.AsMemory(end);
+    }
+
+    /// <summary>
+    ///     Decrypt <paramref name="bytesRead" /> bytes written into <see cref="GetMemory" /> and deliver every packet
+    ///     they complete. The payload span is only valid during the call to <paramref name="handler" />.
+    ///     Returns the number of packets delivered.
+    /// </summary>
+    internal int Advance(int bytesRead, AdnlPayloadHandler handler)
+    {
+        if ((uint)bytesRead > (uint)(buffer.Length - end)) throw new ArgumentOutOfRangeException(nameof(bytesRead));
+
+        long started = AdnlTelemetry.StartTimer(AdnlTelemetry.CipherDuration);
+        decipher.Update(buffer.AsSpan(end, bytesRead));
+        AdnlTelemetry.StopTimer(AdnlTelemetry.CipherDuration, started, AdnlTelemetry.Decrypt);
+        end += bytesRead;
+
+        int packets = 0;
+        while (AdnlPacket.TryParse(buffer.AsSpan(start, end - start), out ReadOnlySpan<byte> payload, out int length))
+        {
+            start += length;
+            packets++;
+            handler(payload);
+        }
+
+        if (start == end) Reset();
+        return packets;
+    }
+
+    void Reset()
+    {
+        start = end = 0;
+
+        // Give back the large buffer a multi-megabyte response needed once the connection is idle again
+        if (buffer.Length <= RetainedSize) return;
+        ArrayPool<byte>.Shared.Return(buffer);
+        buffer = ArrayPool<byte>.Shared.Rent(InitialSize);
+    }
+
+    void EnsureFree(int required)
+    {
+        if (buffer.Length - end >= required) return;
+
+        int buffered = end - start;
+        if (buffer.Length - buffered >= required)
+        {
+            // Only the unconsumed tail of the last packet moves, never data that was already delivered
+            buffer.AsSpan(start, buffered).CopyTo(buffer);
+        }
+        else
+        {
+            byte[] grown = ArrayPool<byte>.Shared.Rent(Math.Max(buffer.Length * 2, buffered + required));
+            buffer.AsSpan(start, buffered).CopyTo(grown);
+            ArrayPool<byte>.Shared.Return(buffer);
+            buffer = grown;
+        }
+
+        start = 0;
+        end = buffered;
+    }
+}
@@ -60,7 +60,11 @@ internal class Ed25519
         montgomeryU %= Ed25519P;
         if (montgomeryU < 0)
             montgomeryU += Ed25519P;
-        return montgomeryU.ToByteArray();
+
+        // Always 32 little-endian bytes: ToByteArray drops leading zeros, which X25519 keys cannot
+        byte[] u = new byte[32];
+        montgomeryU.TryWriteBytes(u, out _, true);
+        return u;
     }
 
     internal byte[] CalculateSharedSecret(byte[] otherPublicKey)
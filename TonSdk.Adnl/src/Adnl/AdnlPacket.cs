@@ -1,7 +1,6 @@
 ﻿using System;
-using System.Linq;
+using System.Buffers.Binary;
 using System.Security.Cryptography;
-using TonSdk.Core.Boc.bits;
 
 namespace TonSdk.Adnl.Adnl;
 
@@ -9,6 +8,10 @@ internal class AdnlPacket
 {
     internal const byte packetMinSize = 68; // 4 (size) + 32 (nonce) + 32 (hash)
 
+    // Largest size prefix accepted, the same limit the TON node puts on ext connections; a larger one is treated
+    // as a corrupt stream instead of a reason to buffer gigabytes
+    internal const int MaxPacketSize = 1 << 24;
+
     internal AdnlPacket(byte[] payload, byte[]? nonce = null)
     {
         Nonce = nonce ?? AdnlKeys.GenerateRandomBytes(32);
@@ -19,58 +22,58 @@ internal class AdnlPacket
 
     byte[] Nonce { get; }
 
-    byte[] Hash
-    {
-        get
-        {
-            using SHA256 sha256 = SHA256.Create();
-            byte[] sha256Hash = sha256.ComputeHash(Nonce.Concat(Payload).ToArray());
-            return sha256Hash;
-        }
-    }
-
-    byte[] Size
+    internal byte[] Data
     {
         get
         {
-            uint size = (uint)(32 + 32 + Payload.Length);
-            Bits builder = new BitsBuilder().StoreUInt32Le(size).Build();
-            return builder.ToBytes();
+            byte[] data = new byte[Length];
+            Span<byte> span = data;
+
+            BinaryPrimitives.WriteUInt32LittleEndian(span, (uint)(32 + 32 + Payload.Length));
+            Nonce.CopyTo(span.Slice(4));
+            Payload.CopyTo(span.Slice(4 + 32));
+            SHA256.HashData(span.Slice(4, 32 + Payload.Length), span.Slice(4 + 32 + Payload.Length));
+            return data;
         }
     }
 
-    internal byte[] Data => Size.Concat(Nonce).Concat(Payload).Concat(Hash).ToArray();
-
     internal int Length => packetMinSize + Payload.Length;
 
-    internal static AdnlPacket? Parse(byte[] data)
+    /// <summary>
+    ///     Parse the packet at the start of <paramref name="data" /> without copying it.
+    ///     Returns false until the whole packet is buffered; <paramref name="payload" /> is a slice of
+    ///     <paramref name="data" /> and <paramref name="length" /> the number of bytes the packet occupies.
+    /// </summary>
+    internal static bool TryParse(ReadOnlySpan<byte> data, out ReadOnlySpan<byte> payload, out int length)
     {
-        if (data.Length < 4) return null;
-        int cursor = 0;
-
-        BitsSlice slice = new Bits(data).Parse();
-
-        uint size = (uint)slice.LoadUInt32Le();
-        cursor += 4;
+        payload = default;
+        if (!TryGetLength(data, out length) || data.Length < length) return false;
 
-        if (data.Length - 4 < size) return null;
+        // The hash covers nonce and payload, which sit next to each other in the packet
+        ReadOnlySpan<byte> hashed = data.Slice(4, length - 4 - 32);
+        Span<byte> target = stackalloc byte[32];
+        SHA256.HashData(hashed, target);
 
-        byte[] nonce = new byte[32];
-        Array.Copy(data, cursor, nonce, 0, 32);
-        cursor += 32;
+        if (!target.SequenceEqual(data.Slice(length - 32, 32))) throw new Exception("ADNLPacket: Bad packet hash.");
 
-        byte[] payload = new byte[size - (32 + 32)];
-        Array.Copy(data, cursor, payload, 0, size - (32 + 32));
-        cursor += (int)size - (32 + 32);
-
-        byte[] hash = new byte[32];
-        Array.Copy(data, cursor, hash, 0, 32);
+        payload = hashed.Slice(32);
+        return true;
+    }
 
-        using SHA256 sha256 = SHA256.Create();
-        byte[] target = sha256.ComputeHash(nonce.Concat(payload).ToArray());
+    /// <summary>
+    ///     Read the total length of the packet starting at <paramref name="data" /> from its size prefix.
+    ///     Returns false while fewer than 4 bytes are available, and throws when the prefix is below the nonce and
+    ///     hash or above <see cref="MaxPacketSize" />.
+    /// </summary>
+    internal static bool TryGetLength(ReadOnlySpan<byte> data, out int length)
+    {
+        length = 0;
+        if (data.Length < 4) return false;
 
-        if (!hash.SequenceEqual(target)) throw new Exception("ADNLPacket: Bad packet hash.");
+        uint size = BinaryPrimitives.ReadUInt32LittleEndian(data);
+        if (size < 32 + 32 || size > MaxPacketSize) throw new Exception($"ADNLPacket: Bad packet size {size}.");
 
-        return new AdnlPacket(payload, nonce);
+        length = 4 + (int)size;
+        return true;
     }
 }
\ No newline at end of file
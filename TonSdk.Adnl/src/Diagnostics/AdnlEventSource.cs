@@ -0,0 +1,53 @@
+using System.Diagnostics.Tracing;
+
+namespace TonSdk.Adnl.Diagnostics;
+
+/// <summary>
+///     Query and connection lifecycle events for dotnet-trace, PerfView and other ETW/EventPipe consumers.
+///     Callers check <see cref="EventSource.IsEnabled()" /> first, so a session-less process pays one flag read.
+/// </summary>
+[EventSource(Name = "TonSdk-Adnl")]
+internal sealed class AdnlEventSource : EventSource
+{
+    public static readonly AdnlEventSource Log = new();
+
+    AdnlEventSource()
+    {
+    }
+
+    [Event(1, Level = EventLevel.Verbose, Message = "Query {0} started")]
+    public void QueryStart(string method)
+    {
+        WriteEvent(1, method);
+    }
+
+    [Event(2, Level = EventLevel.Verbose, Message = "Query {0} finished with {1} in {2} ms")]
+    public void QueryStop(string method, string status, double durationMs)
+    {
+        WriteEvent(2, method, status, durationMs);
+    }
+
+    [Event(3, Level = EventLevel.Warning, Message = "Query {0} failed: {1}")]
+    public void QueryFailed(string method, string error)
+    {
+        WriteEvent(3, method, error);
+    }
+
+    [Event(4, Level = EventLevel.Informational, Message = "Connected to {0}:{1}")]
+    public void ConnectionOpened(string host, int port)
+    {
+        WriteEvent(4, host, port);
+    }
+
+    [Event(5, Level = EventLevel.Informational, Message = "Connection to {0}:{1} closed")]
+    public void ConnectionClosed(string host, int port)
+    {
+        WriteEvent(5, host, port);
+    }
+
+    [Event(6, Level = EventLevel.Informational, Message = "Reconnecting to {0}:{1}")]
+    public void Reconnecting(string host, int port)
+    {
+        WriteEvent(6, host, port);
+    }
+}
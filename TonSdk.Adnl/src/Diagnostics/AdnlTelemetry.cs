@@ -0,0 +1,136 @@
+using System;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Diagnostics.Metrics;
+using System.Threading;
+
+namespace TonSdk.Adnl.Diagnostics;
+
+/// <summary>
+///     Metrics and traces of the ADNL transport and the lite client.
+///     Everything is published on the <see cref="MeterName" /> meter and the <see cref="ActivitySourceName" /> activity
+///     source, and lifecycle events on the "TonSdk-Adnl" event source, so OpenTelemetry, dotnet-counters or
+///     dotnet-trace pick them up by name. Nothing is measured while no listener is attached: timestamps are only taken
+///     for enabled instruments and queries skip the instrumented path entirely.
+/// </summary>
+public static class AdnlTelemetry
+{
+    public const string MeterName = "TonSdk.Adnl";
+    public const string ActivitySourceName = "TonSdk.Adnl";
+
+    internal static readonly Meter Meter = new(MeterName, "1.0.0");
+    internal static readonly ActivitySource ActivitySource = new(ActivitySourceName, "1.0.0");
+
+    /// <summary>
+    ///     Lite client query latency from the caller's point of view, tagged by method and status.
+    /// </summary>
+    internal static readonly Histogram<double> QueryDuration = Meter.CreateHistogram<double>(
+        "tonsdk.liteclient.query.duration", "ms", "Lite server query latency");
+
+    internal static readonly Histogram<double> DecodeDuration = Meter.CreateHistogram<double>(
+        "tonsdk.liteclient.decode.duration", "ms", "Time to decode a lite server response");
+
+    internal static readonly Counter<long> QueryTimeouts = Meter.CreateCounter<long>(
+        "tonsdk.adnl.queries.timeouts", "{query}", "Queries that timed out waiting for their response");
+
+    internal static readonly Counter<long> BytesSent = Meter.CreateCounter<long>(
+        "tonsdk.adnl.bytes.sent", "By", "ADNL bytes written, framing included");
+
+    internal static readonly Counter<long> BytesReceived = Meter.CreateCounter<long>(
+        "tonsdk.adnl.bytes.received", "By", "ADNL bytes read, framing included");
+
+    internal static readonly Counter<long> PacketsSent = Meter.CreateCounter<long>(
+        "tonsdk.adnl.packets.sent", "{packet}", "ADNL packets written");
+
+    internal static readonly Counter<long> PacketsReceived = Meter.CreateCounter<long>(
+        "tonsdk.adnl.packets.received", "{packet}", "ADNL packets read");
+
+    internal static readonly Histogram<double> CipherDuration = Meter.CreateHistogram<double>(
+        "tonsdk.adnl.cipher.duration", "ms", "AES-CTR time per socket write or read, tagged by direction");
+
+    internal static readonly Counter<long> ConnectionsOpened = Meter.CreateCounter<long>(
+        "tonsdk.adnl.connections.opened", "{connection}", "ADNL connections that completed the handshake");
+
+    internal static readonly Counter<long> ConnectionsClosed = Meter.CreateCounter<long>(
+        "tonsdk.adnl.connections.closed", "{connection}", "ADNL connections that were lost or closed");
+
+    internal static readonly Counter<long> Reconnects = Meter.CreateCounter<long>(
+        "tonsdk.adnl.reconnects", "{connection}", "Reconnection attempts after a lost connection");
+
+    internal static readonly Counter<long> BackendQueries = Meter.CreateCounter<long>(
+        "tonsdk.liteclient.backend.queries", "{query}", "Queries per round-robin backend, tagged by status");
+
+    internal static readonly Histogram<double> BackendDuration = Meter.CreateHistogram<double>(
+        "tonsdk.liteclient.backend.duration", "ms", "Query latency per round-robin backend");
+
+    internal static readonly KeyValuePair<string, object?> Encrypt = new("direction", "encrypt");
+    internal static readonly KeyValuePair<string, object?> Decrypt = new("direction", "decrypt");
+
+    static readonly ConcurrentDictionary<Type, string> MethodNames = new();
+
+    static long pendingQueries;
+    static long waitingQueries;
+
+    static AdnlTelemetry()
+    {
+        Meter.CreateObservableGauge("tonsdk.adnl.queries.pending", () => Interlocked.Read(ref pendingQueries),
+            "{query}", "Queries sent and awaiting their response");
+        Meter.CreateObservableGauge("tonsdk.adnl.queries.waiting", () => Interlocked.Read(ref waitingQueries),
+            "{query}", "Queries waiting for an in-flight slot");
+    }
+
+    /// <summary>
+    ///     Whether anyone listens to queries at all; when not, the lite client sends them uninstrumented.
+    /// </summary>
+    internal static bool IsQueryObserved =>
+        QueryDuration.Enabled || ActivitySource.HasListeners() || AdnlEventSource.Log.IsEnabled();
+
+    internal static void QueryPending(int delta)
+    {
+        Interlocked.Add(ref pendingQueries, delta);
+    }
+
+    internal static void QueryWaiting(int delta)
+    {
+        Interlocked.Add(ref waitingQueries, delta);
+    }
+
+    /// <summary>
+    ///     Start timing for <paramref name="instrument" />; zero when it is disabled.
+    /// </summary>
+    internal static long StartTimer(Instrument instrument)
+    {
+        return instrument.Enabled ? Stopwatch.GetTimestamp() : 0;
+    }
+
+    /// <summary>
+    ///     Record the time since <paramref name="started" /> unless timing was skipped.
+    /// </summary>
+    internal static void StopTimer(Histogram<double> histogram, long started, KeyValuePair<string, object?> tag)
+    {
+        if (started != 0) histogram.Record(ElapsedMs(started), tag);
+    }
+
+    internal static double ElapsedMs(long started)
+    {
+        return (Stopwatch.GetTimestamp() - started) * 1000.0 / Stopwatch.Frequency;
+    }
+
+    /// <summary>
+    ///     TL name of a generated request or response type: LiteServerGetBlockRequest becomes liteServer.getBlock.
+    /// </summary>
+    internal static string GetMethodName(Type type)
+    {
+        return MethodNames.GetOrAdd(type, static t =>
+        {
+            string name = t.Name;
+            if (name.EndsWith("Request", StringComparison.Ordinal)) name = name[..^"Request".Length];
+            if (!name.StartsWith("LiteServer", StringComparison.Ordinal) || name.Length == "LiteServer".Length)
+                return name;
+
+            name = name["LiteServer".Length..];
+            return "liteServer." + char.ToLowerInvariant(name[0]) + name[1..];
+        });
+    }
+}
@@ -0,0 +1,143 @@
+using System;
+using System.Collections.Generic;
+using System.Runtime.CompilerServices;
+using System.Threading;
+using System.Threading.Channels;
+using System.Threading.Tasks;
+using TonSdk.Adnl.LiteClient.Protocol;
+using TonSdk.Adnl.LiteClient.Types;
+using TonSdk.Adnl.TL;
+using TonSdk.Core.Addresses;
+
+namespace TonSdk.Adnl.LiteClient;
+
+/// <summary>
+///     Tuning for
+///     <see cref="LiteClient.GetAccountStates(TonNodeBlockIdExt, IEnumerable{Address}, AccountStatesOptions?, CancellationToken)" />.
+/// </summary>
+public class AccountStatesOptions
+{
+    /// <summary>
+    ///     liteServer.getAccountState queries kept in flight at once. Also bounds the results buffered ahead of the
+    ///     consumer.
+    /// </summary>
+    public int MaxConcurrency { get; init; } = 32;
+
+    /// <summary>
+    ///     Read only the balance, status and last transaction lt of every account, leaving
+    ///     <see cref="ClientAccountState.Code" /> and <see cref="ClientAccountState.Data" /> null.
+    /// </summary>
+    public bool SkipCodeAndData { get; init; }
+}
+
+/// <summary>
+///     Fetches the states of many accounts at one block. Queries are pipelined over the engine with at most
+///     <see cref="AccountStatesOptions.MaxConcurrency" /> in flight, state BoCs are parsed on the thread pool, and
+///     results come out as they complete. A failed query or parse becomes that address's result; only cancellation
+///     or a failing address sequence ends the batch.
+/// </summary>
+internal sealed class AccountStateBatch
+{
+    readonly LiteClient client;
+    readonly AccountStatesOptions options;
+
+    public AccountStateBatch(LiteClient client, AccountStatesOptions? options)
+    {
+        this.client = client;
+        this.options = options ?? new AccountStatesOptions();
+
+        if (this.options.MaxConcurrency < 1) throw new ArgumentOutOfRangeException(nameof(options.MaxConcurrency));
+    }
+
+    public async IAsyncEnumerable<AccountStateResult> RunAsync(
+        TonNodeBlockIdExt id,
+        IEnumerable<Address> addresses,
+        [EnumeratorCancellation] CancellationToken cancellationToken)
+    {
+        // Stops the queries in flight when the consumer leaves early
+        using CancellationTokenSource batch = CancellationTokenSource.CreateLinkedTokenSource(cancellationToken);
+        Channel<AccountStateResult> results = Channel.CreateBounded<AccountStateResult>(
+            new BoundedChannelOptions(options.MaxConcurrency) { SingleReader = true });
+        Task producer = Task.Run(() => ProduceAsync(id, addresses, results.Writer, batch.Token), CancellationToken.None);
+
+        try
+        {
+            await foreach (AccountStateResult result in results.Reader.ReadAllAsync(cancellationToken)
+                               .ConfigureAwait(false))
+                yield return result;
+        }
+        finally
+        {
+            batch.Cancel();
+            await producer.ConfigureAwait(false);
+        }
+    }
+
+    async Task ProduceAsync(
+        TonNodeBlockIdExt id,
+        IEnumerable<Address> addresses,
+        ChannelWriter<AccountStateResult> writer,
+        CancellationToken token)
+    {
+        SemaphoreSlim slots = new(options.MaxConcurrency, options.MaxConcurrency);
+        Exception? failure = null;
+        try
+        {
+            foreach (Address address in addresses)
+            {
+                await slots.WaitAsync(token).ConfigureAwait(false);
+                _ = FetchAsync(id, address, writer, slots, token);
+            }
+        }
+        catch (Exception e)
+        {
+            failure = e;
+        }
+
+        // Taking every slot back waits for the fetches still running
+        for (int i = 0; i < options.MaxConcurrency; i++)
+            await slots.WaitAsync(CancellationToken.None).ConfigureAwait(false);
+
+        writer.TryComplete(failure);
+    }
+
+    async Task FetchAsync(
+        TonNodeBlockIdExt id,
+        Address address,
+        ChannelWriter<AccountStateResult> writer,
+        SemaphoreSlim slots,
+        CancellationToken token)
+    {
+        try
+        {
+            AccountStateResult result;
+            try
+            {
+                LiteServerAccountId account = new() { Workchain = address.Workchain, Id = new TLInt256(address.Hash) };
+                byte[] response = await client.Query(new LiteServerGetAccountStateRequest
+                {
+                    Id = id,
+                    Account = account
+                }, token).ConfigureAwait(false);
+
+                ClientAccountState state = await Task.Run(() => ClientAccountState.FromRaw(
+                    Decoder.DecodeAccountState(response), address, options.SkipCodeAndData), token).ConfigureAwait(false);
+                result = new AccountStateResult(address, state, null);
+            }
+            catch (Exception e) when (!token.IsCancellationRequested)
+            {
+                result = new AccountStateResult(address, null, e);
+            }
+
+            await writer.WriteAsync(result, token).ConfigureAwait(false);
+        }
+        catch (Exception) when (token.IsCancellationRequested)
+        {
+            // The batch is over; nobody reads this result
+        }
+        finally
+        {
+            slots.Release();
+        }
+    }
+}
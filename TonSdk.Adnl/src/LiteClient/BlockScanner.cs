@@ -0,0 +1,304 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Runtime.CompilerServices;
+using System.Threading;
+using System.Threading.Tasks;
+using TonSdk.Adnl.LiteClient.Protocol;
+using TonSdk.Adnl.LiteClient.Types;
+using TonSdk.Adnl.TL;
+
+namespace TonSdk.Adnl.LiteClient;
+
+/// <summary>
+///     Tuning for <see cref="LiteClient.ScanBlocks(int, int?, BlockScannerOptions?, CancellationToken)" />.
+/// </summary>
+public class BlockScannerOptions
+{
+    /// <summary>
+    ///     Masterchain blocks fetched ahead of the one being consumed. Bounds memory: every prefetched masterchain
+    ///     block holds its shard blocks' transactions until they are yielded.
+    /// </summary>
+    public int PrefetchDepth { get; init; } = 4;
+
+    /// <summary>
+    ///     Lite server queries the scanner keeps in flight at once, across all prefetched blocks.
+    /// </summary>
+    public int MaxParallelism { get; init; } = 8;
+
+    /// <summary>
+    ///     Transactions requested per liteServer.listBlockTransactions page.
+    /// </summary>
+    public uint PageSize { get; init; } = 256;
+
+    /// <summary>
+    ///     How often to ask for the masterchain head once the scan has caught up with it.
+    /// </summary>
+    public int PollIntervalMs { get; init; } = 1000;
+}
+
+/// <summary>
+///     Walks masterchain blocks in order and, for each, every shard block it commits, listing all of their
+///     transactions. Up to <see cref="BlockScannerOptions.PrefetchDepth" /> masterchain blocks are fetched ahead with
+///     at most <see cref="BlockScannerOptions.MaxParallelism" /> queries in flight, yet blocks come out in chain
+///     order: a masterchain block's shard blocks (by workchain, seqno and shard), then the masterchain block itself.
+///     Prefetching only advances as the consumer takes blocks, so a slow consumer slows the scan down.
+/// </summary>
+/// <remarks>
+///     The shard blocks committed by masterchain block N are those after the shard tops of block N - 1 up to the tops
+///     of block N. They are looked up by seqno, and after a split both children find their parent's last blocks, which
+///     are listed once. A merged shard's seqnos don't tell its parents' blocks apart, so from a merged top the scanner
+///     follows the previous-block links of each parent back to its old top instead.
+/// </remarks>
+internal sealed class BlockScanner
+{
+    const long MasterchainShard = unchecked((long)0x8000000000000000);
+
+    readonly LiteClient client;
+    readonly BlockScannerOptions options;
+    readonly SemaphoreSlim queries;
+
+    public BlockScanner(LiteClient client, BlockScannerOptions? options)
+    {
+        this.client = client;
+        this.options = options ?? new BlockScannerOptions();
+
+        if (this.options.PrefetchDepth < 1) throw new ArgumentOutOfRangeException(nameof(options.PrefetchDepth));
+        if (this.options.MaxParallelism < 1) throw new ArgumentOutOfRangeException(nameof(options.MaxParallelism));
+        if (this.options.PageSize < 1) throw new ArgumentOutOfRangeException(nameof(options.PageSize));
+
+        queries = new SemaphoreSlim(this.options.MaxParallelism, this.options.MaxParallelism);
+    }
+
+    /// <summary>
+    ///     Scan masterchain blocks <paramref name="fromSeqno" /> to <paramref name="toSeqno" /> inclusive, or without
+    ///     end when it is null. When <paramref name="checkpoint" /> is given it must be masterchain block
+    ///     <paramref name="fromSeqno" /> - 1, and the scan fails if the chain disagrees with it.
+    /// </summary>
+    public async IAsyncEnumerable<ScannedBlock> ScanAsync(
+        int fromSeqno,
+        int? toSeqno,
+        TonNodeBlockIdExt? checkpoint,
+        [EnumeratorCancellation] CancellationToken cancellationToken)
+    {
+        if (fromSeqno < 1) throw new ArgumentOutOfRangeException(nameof(fromSeqno));
+
+        // Stops the prefetched work when the consumer leaves early
+        using CancellationTokenSource prefetch = CancellationTokenSource.CreateLinkedTokenSource(cancellationToken);
+        CancellationToken token = prefetch.Token;
+        Queue<Task<ScannedBlock[]>> window = new();
+
+        try
+        {
+            Task<ShardTop[]> previousTops = GetPreviousTopsAsync(fromSeqno - 1, checkpoint, token);
+            int head = await GetHeadSeqnoAsync(token).ConfigureAwait(false);
+            int next = fromSeqno;
+
+            while (toSeqno == null || next <= toSeqno || window.Count > 0)
+            {
+                while (window.Count < options.PrefetchDepth && next <= head && (toSeqno == null || next <= toSeqno))
+                {
+                    TaskCompletionSource<ShardTop[]> tops = new(TaskCreationOptions.RunContinuationsAsynchronously);
+                    window.Enqueue(FetchMasterchainBlockAsync(next++, previousTops, tops, token));
+                    previousTops = tops.Task;
+                }
+
+                if (window.Count == 0)
+                {
+                    // Caught up with the chain
+                    await Task.Delay(options.PollIntervalMs, token).ConfigureAwait(false);
+                    head = await GetHeadSeqnoAsync(token).ConfigureAwait(false);
+                    continue;
+                }
+
+                ScannedBlock[] blocks = await window.Dequeue().ConfigureAwait(false);
+                foreach (ScannedBlock block in blocks)
+                    yield return block;
+            }
+        }
+        finally
+        {
+            prefetch.Cancel();
+            foreach (Task<ScannedBlock[]> abandoned in window)
+                _ = abandoned.ContinueWith(static t => _ = t.Exception, CancellationToken.None,
+                    TaskContinuationOptions.OnlyOnFaulted, TaskScheduler.Default);
+        }
+    }
+
+    async Task<ShardTop[]> GetPreviousTopsAsync(int seqno, TonNodeBlockIdExt? checkpoint, CancellationToken token)
+    {
+        // Block 0 is the zero state, which commits no shard blocks
+        if (seqno == 0) return Array.Empty<ShardTop>();
+
+        TonNodeBlockIdExt id = await LookupMasterchainAsync(seqno, token).ConfigureAwait(false);
+        if (checkpoint is { } expected && (expected.Workchain != -1 || expected.Seqno != seqno ||
+                                           expected.RootHash != id.RootHash))
+            throw new InvalidOperationException(
+                $"Checkpoint does not match masterchain block {seqno} ({id.RootHash}); the lite server is on another chain");
+
+        return await GetShardTopsAsync(id, token).ConfigureAwait(false);
+    }
+
+    async Task<ScannedBlock[]> FetchMasterchainBlockAsync(
+        int seqno,
+        Task<ShardTop[]> previousTops,
+        TaskCompletionSource<ShardTop[]> tops,
+        CancellationToken token)
+    {
+        ShardTop[] current;
+        TonNodeBlockIdExt masterchainBlock;
+        try
+        {
+            masterchainBlock = await LookupMasterchainAsync(seqno, token).ConfigureAwait(false);
+            current = await GetShardTopsAsync(masterchainBlock, token).ConfigureAwait(false);
+            tops.TrySetResult(current);
+        }
+        catch (Exception e)
+        {
+            tops.TrySetException(e);
+            throw;
+        }
+
+        ShardTop[] previous = await previousTops.ConfigureAwait(false);
+        TonNodeBlockIdExt[] shardBlocks = await ResolveShardBlocksAsync(previous, current, token).ConfigureAwait(false);
+
+        Task<ScannedBlock>[] blocks = new Task<ScannedBlock>[shardBlocks.Length + 1];
+        for (int i = 0; i < shardBlocks.Length; i++)
+            blocks[i] = ListBlockAsync(masterchainBlock, shardBlocks[i], token);
+        blocks[^1] = ListBlockAsync(masterchainBlock, masterchainBlock, token);
+
+        return await Task.WhenAll(blocks).ConfigureAwait(false);
+    }
+
+    /// <summary>
+    ///     Ids of the shard blocks between the previous and the current tops, in workchain, seqno and shard order.
+    /// </summary>
+    async Task<TonNodeBlockIdExt[]> ResolveShardBlocksAsync(
+        ShardTop[] previous,
+        ShardTop[] current,
+        CancellationToken token)
+    {
+        List<Task<TonNodeBlockIdExt>> lookups = new();
+        List<Task<List<TonNodeBlockIdExt>>> merges = new();
+        foreach (ShardTop top in current)
+        {
+            ShardTop[] overlapping = previous
+                .Where(p => p.Workchain == top.Workchain && ShardTop.Intersects(p.Shard, top.Shard))
+                .ToArray();
+
+            // A previous top narrower than the current one was merged into it
+            if (overlapping.Any(p => ShardTop.IsAncestor(top.Shard, p.Shard)))
+            {
+                merges.Add(WalkBackAsync(top, overlapping, token));
+                continue;
+            }
+
+            int after = overlapping.Select(p => p.Seqno).DefaultIfEmpty(top.Seqno - 1).Max();
+            for (int seqno = after + 1; seqno < top.Seqno; seqno++)
+                lookups.Add(LookupAsync(top.Workchain, top.Shard, seqno, token));
+            if (top.Seqno > after)
+                lookups.Add(Task.FromResult(top.BlockIdExt));
+        }
+
+        TonNodeBlockIdExt[] ids = await Task.WhenAll(lookups).ConfigureAwait(false);
+        List<TonNodeBlockIdExt>[] merged = await Task.WhenAll(merges).ConfigureAwait(false);
+
+        // After a split both children look up the parent's last blocks
+        return ids
+            .Concat(merged.SelectMany(blocks => blocks))
+            .GroupBy(id => (id.Workchain, id.Shard, id.Seqno))
+            .Select(group => group.First())
+            .OrderBy(id => id.Workchain)
+            .ThenBy(id => id.Seqno)
+            .ThenBy(id => (ulong)id.Shard)
+            .ToArray();
+    }
+
+    /// <summary>
+    ///     Blocks from <paramref name="top" /> back to the <paramref name="previous" /> tops, following the
+    ///     previous-block links of each block's header.
+    /// </summary>
+    async Task<List<TonNodeBlockIdExt>> WalkBackAsync(ShardTop top, ShardTop[] previous, CancellationToken token)
+    {
+        List<TonNodeBlockIdExt> blocks = new();
+        Stack<TonNodeBlockIdExt> pending = new();
+        pending.Push(top.BlockIdExt);
+        while (pending.Count > 0)
+        {
+            TonNodeBlockIdExt block = pending.Pop();
+            blocks.Add(block);
+
+            LiteServerBlockHeader header = await RunAsync(() => client.GetBlockHeader(block,
+                cancellationToken: token), token).ConfigureAwait(false);
+            foreach (TonNodeBlockIdExt prev in PrevBlocks.Parse(block, header.HeaderProof))
+            {
+                // Up to a previous top, the shard's blocks were committed by an earlier masterchain block
+                if (!previous.Any(p => ShardTop.Intersects(p.Shard, prev.Shard) && prev.Seqno <= p.Seqno))
+                    pending.Push(prev);
+            }
+        }
+
+        return blocks;
+    }
+
+    async Task<ScannedBlock> ListBlockAsync(
+        TonNodeBlockIdExt masterchainBlock,
+        TonNodeBlockIdExt block,
+        CancellationToken token)
+    {
+        List<BlockTransaction> transactions = new();
+        LiteServerTransactionId3? after = null;
+        while (true)
+        {
+            BlockTransactionsList page = await RunAsync(() => client.ListBlockTransactions(block, options.PageSize,
+                after, cancellationToken: token), token).ConfigureAwait(false);
+            transactions.AddRange(page.Transactions);
+
+            if (!page.Incomplete || page.Transactions.Length == 0) break;
+
+            BlockTransaction last = page.Transactions[^1];
+            after = new LiteServerTransactionId3 { Account = new TLInt256(last.Account.Hash), Lt = last.Lt };
+        }
+
+        return new ScannedBlock(masterchainBlock, block, transactions.ToArray());
+    }
+
+    async Task<int> GetHeadSeqnoAsync(CancellationToken token)
+    {
+        LiteServerMasterchainInfo info = await RunAsync(() => client.GetMasterchainInfo(token), token)
+            .ConfigureAwait(false);
+        return info.Last.Seqno;
+    }
+
+    Task<TonNodeBlockIdExt> LookupMasterchainAsync(int seqno, CancellationToken token)
+    {
+        return LookupAsync(-1, MasterchainShard, seqno, token);
+    }
+
+    async Task<TonNodeBlockIdExt> LookupAsync(int workchain, long shard, int seqno, CancellationToken token)
+    {
+        LiteServerBlockHeader header = await RunAsync(() => client.LookupBlock(workchain, shard, seqno,
+            cancellationToken: token), token).ConfigureAwait(false);
+        return header.Id;
+    }
+
+    async Task<ShardTop[]> GetShardTopsAsync(TonNodeBlockIdExt masterchainBlock, CancellationToken token)
+    {
+        LiteServerAllShardsInfo shards = await RunAsync(() => client.GetAllShardsInfo(masterchainBlock, token), token)
+            .ConfigureAwait(false);
+        return ShardTop.Parse(shards.Data);
+    }
+
+    async Task<T> RunAsync<T>(Func<Task<T>> query, CancellationToken token)
+    {
+        await queries.WaitAsync(token).ConfigureAwait(false);
+        try
+        {
+            return await query().ConfigureAwait(false);
+        }
+        finally
+        {
+            queries.Release();
+        }
+    }
+}
@@ -0,0 +1,121 @@
+using System;
+using System.Collections.Generic;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace TonSdk.Adnl.LiteClient.Engines;
+
+/// <summary>
+///     Concurrency limit tuned by additive increase, multiplicative decrease (AIMD), as TCP tunes its window.
+///     Each successful query raises the limit by 1/limit, so about one per limit's worth of queries; an overloaded
+///     query multiplies it by the backoff ratio. Queries that were already in flight when the limit was cut do not
+///     cut it again, so one overload episode backs off once. Callers over the limit wait first-in, first-out.
+/// </summary>
+internal sealed class AdaptiveConcurrencyLimit
+{
+    readonly double backoffRatio;
+    readonly object limitLock = new();
+    readonly double maxLimit;
+    readonly double minLimit;
+    readonly Queue<TaskCompletionSource<long>> waiters = new();
+    long issued;
+    long lastDecreaseAt;
+    double limit;
+    int inFlight;
+
+    public AdaptiveConcurrencyLimit(int initialLimit, int minLimit, int maxLimit, double backoffRatio)
+    {
+        if (minLimit < 1) throw new ArgumentOutOfRangeException(nameof(minLimit));
+        if (maxLimit < minLimit) throw new ArgumentOutOfRangeException(nameof(maxLimit));
+        if (initialLimit < minLimit || initialLimit > maxLimit) throw new ArgumentOutOfRangeException(nameof(initialLimit));
+        if (backoffRatio is <= 0 or >= 1) throw new ArgumentOutOfRangeException(nameof(backoffRatio));
+
+        limit = initialLimit;
+        this.minLimit = minLimit;
+        this.maxLimit = maxLimit;
+        this.backoffRatio = backoffRatio;
+    }
+
+    /// <summary>
+    ///     Current limit, rounded down to whole queries.
+    /// </summary>
+    public int Limit
+    {
+        get
+        {
+            lock (limitLock) return (int)limit;
+        }
+    }
+
+    public int InFlight
+    {
+        get
+        {
+            lock (limitLock) return inFlight;
+        }
+    }
+
+    /// <summary>
+    ///     Wait for a slot. Returns the ticket to hand back to <see cref="Release" />.
+    /// </summary>
+    public ValueTask<long> AcquireAsync(CancellationToken cancellationToken)
+    {
+        TaskCompletionSource<long> waiter;
+        lock (limitLock)
+        {
+            if (waiters.Count == 0 && inFlight < (int)limit)
+            {
+                inFlight++;
+                return new ValueTask<long>(++issued);
+            }
+
+            cancellationToken.ThrowIfCancellationRequested();
+            waiter = new TaskCompletionSource<long>(TaskCreationOptions.RunContinuationsAsynchronously);
+            waiters.Enqueue(waiter);
+        }
+
+        return new ValueTask<long>(WaitAsync(waiter, cancellationToken));
+    }
+
+    /// <summary>
+    ///     Give the slot of <paramref name="ticket" /> back and adjust the limit: up on success, down on overload,
+    ///     unchanged when the query failed for another reason.
+    /// </summary>
+    public void Release(long ticket, bool? overloaded)
+    {
+        lock (limitLock)
+        {
+            inFlight--;
+
+            if (overloaded == false)
+            {
+                limit = Math.Min(maxLimit, limit + 1 / limit);
+            }
+            else if (overloaded == true && ticket > lastDecreaseAt)
+            {
+                limit = Math.Max(minLimit, limit * backoffRatio);
+                lastDecreaseAt = issued;
+            }
+
+            // Waiters run their continuations asynchronously, so completing them under the lock is safe.
+            // Cancelled waiters stay queued until they come up here and are skipped.
+            while (inFlight < (int)limit && waiters.TryDequeue(out TaskCompletionSource<long>? waiter))
+            {
+                if (waiter.TrySetResult(issued + 1))
+                {
+                    issued++;
+                    inFlight++;
+                }
+            }
+        }
+    }
+
+    async Task<long> WaitAsync(TaskCompletionSource<long> waiter, CancellationToken cancellationToken)
+    {
+        if (!cancellationToken.CanBeCanceled) return await waiter.Task.ConfigureAwait(false);
+
+        using CancellationTokenRegistration registration = cancellationToken.UnsafeRegister(
+            static (state, token) => ((TaskCompletionSource<long>)state!).TrySetCanceled(token), waiter);
+        return await waiter.Task.ConfigureAwait(false);
+    }
+}
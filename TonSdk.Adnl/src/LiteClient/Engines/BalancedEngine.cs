@@ -0,0 +1,442 @@
+using System;
+using System.Diagnostics;
+using System.Linq;
+using System.Threading;
+using System.Threading.Tasks;
+using TonSdk.Adnl.LiteClient.Protocol;
+
+namespace TonSdk.Adnl.LiteClient.Engines;
+
+/// <summary>
+///     Tuning for <see cref="BalancedEngine" />.
+/// </summary>
+public class BalancedEngineOptions
+{
+    /// <summary>
+    ///     Weight of the newest sample in each backend's latency average.
+    /// </summary>
+    public double LatencyDecay { get; init; } = 0.3;
+
+    /// <summary>
+    ///     Send a duplicate of a slow query to a second backend and keep whichever answers first.
+    /// </summary>
+    public bool Hedging { get; init; }
+
+    /// <summary>
+    ///     Latency percentile, over recent queries on all backends, after which a query is hedged.
+    /// </summary>
+    public double HedgePercentile { get; init; } = 0.95;
+
+    /// <summary>
+    ///     Lower bound for the hedge delay, so a fast cluster is not flooded with duplicates.
+    /// </summary>
+    public int MinHedgeDelayMs { get; init; } = 20;
+
+    /// <summary>
+    ///     Consecutive failures after which a backend is ejected.
+    /// </summary>
+    public int FailureThreshold { get; init; } = 5;
+
+    /// <summary>
+    ///     How long a backend stays ejected the first time; doubles on every failed probe.
+    /// </summary>
+    public int EjectionMs { get; init; } = 5000;
+
+    /// <summary>
+    ///     Upper bound for the ejection time.
+    /// </summary>
+    public int MaxEjectionMs { get; init; } = 60000;
+}
+
+/// <summary>
+///     Load and latency snapshot of one backend of a <see cref="BalancedEngine" />.
+/// </summary>
+public readonly record struct BalancedBackendStats(double LatencyMs, int Outstanding, bool Ejected);
+
+/// <summary>
+///     Latency-aware engine that distributes queries across multiple engines.
+///     Each query goes to the better of two randomly picked backends, scored by their average latency and the number
+///     of queries they have outstanding. Backends that keep failing are ejected for a while and then probed with a
+///     single query before taking traffic again. With <see cref="BalancedEngineOptions.Hedging" />, a typed request
+///     that is slower than the recent latency percentile is also sent to a second backend; the loser is cancelled.
+///     Failed queries are retried on another backend, as in <see cref="RoundRobinEngine" />.
+/// </summary>
+public class BalancedEngine : ILiteEngine
+{
+    const int NoProbe = 0;
+    const int Probing = 1;
+
+    readonly Backend[] backends;
+    readonly LatencyWindow latencies = new();
+    readonly BalancedEngineOptions options;
+    long hedges;
+
+    public BalancedEngine(params ILiteEngine[] engines) : this(new BalancedEngineOptions(), engines)
+    {
+    }
+
+    public BalancedEngine(BalancedEngineOptions options, params ILiteEngine[] engines)
+    {
+        if (engines.Length == 0)
+            throw new ArgumentException("At least one engine is required", nameof(engines));
+        if (options.LatencyDecay is <= 0 or > 1)
+            throw new ArgumentOutOfRangeException(nameof(options), "LatencyDecay must be in (0, 1]");
+        if (options.HedgePercentile is <= 0 or > 1)
+            throw new ArgumentOutOfRangeException(nameof(options), "HedgePercentile must be in (0, 1]");
+
+        this.options = options;
+        backends = engines.Select(e => new Backend(e)).ToArray();
+
+        foreach (ILiteEngine engine in engines)
+        {
+            engine.Connected += () => Connected?.Invoke();
+            engine.Ready += () => Ready?.Invoke();
+            engine.Closed += () => Closed?.Invoke();
+            engine.Error += e => Error?.Invoke(e);
+        }
+    }
+
+    public bool IsReady => backends.Any(b => b.Engine.IsReady);
+    public bool IsClosed => backends.All(b => b.Engine.IsClosed);
+
+    /// <summary>
+    ///     Number of queries that were duplicated to a second backend.
+    /// </summary>
+    public long Hedges => Interlocked.Read(ref hedges);
+
+    public event Action? Connected;
+    public event Action? Ready;
+    public event Action? Closed;
+    public event Action<Exception>? Error;
+
+    /// <summary>
+    ///     Pre-encoded queries are balanced and retried but never hedged: the engine cannot tell whether they are safe
+    ///     to send twice.
+    /// </summary>
+    public Task<byte[]> QueryAsync(
+        Func<(byte[] queryId, byte[] data)> encoder,
+        int timeout = 30000,
+        CancellationToken cancellationToken = default)
+    {
+        return QueryBalancedAsync((engine, token) => engine.QueryAsync(encoder, timeout, token), false,
+            cancellationToken);
+    }
+
+    public Task<byte[]> QueryAsync(
+        ILiteServerRequest request,
+        int timeout = 30000,
+        CancellationToken cancellationToken = default)
+    {
+        return QueryBalancedAsync((engine, token) => engine.QueryAsync(request, timeout, token),
+            options.Hedging && CanHedge(request), cancellationToken);
+    }
+
+    /// <summary>
+    ///     Per-backend latency and load, in the order the engines were passed in.
+    /// </summary>
+    public BalancedBackendStats[] GetBackendStats()
+    {
+        long now = Environment.TickCount64;
+        return backends.Select(b => new BalancedBackendStats(b.LatencyMs, b.Outstanding, !b.CanAccept(now)))
+            .ToArray();
+    }
+
+    public void Dispose()
+    {
+        foreach (Backend backend in backends)
+            backend.Engine.Dispose();
+    }
+
+    /// <summary>
+    ///     Whether a duplicate of <paramref name="request" /> may be sent. Everything except sending messages is a read.
+    /// </summary>
+    protected virtual bool CanHedge(ILiteServerRequest request)
+    {
+        return request is not LiteServerSendMessageRequest;
+    }
+
+    async Task<byte[]> QueryBalancedAsync(
+        Func<ILiteEngine, CancellationToken, Task<byte[]>> query,
+        bool hedge,
+        CancellationToken cancellationToken)
+    {
+        Exception? lastException = null;
+        Backend? previous = null;
+
+        for (int attempt = 0; attempt < backends.Length; attempt++)
+        {
+            Backend? backend = Select(previous);
+            if (backend == null) break;
+
+            try
+            {
+                return hedge
+                    ? await QueryHedgedAsync(backend, query, cancellationToken)
+                    : await QueryBackendAsync(backend, query, cancellationToken);
+            }
+            catch (Exception ex) when (!cancellationToken.IsCancellationRequested)
+            {
+                lastException = ex;
+                previous = backend;
+            }
+        }
+
+        throw lastException ?? new InvalidOperationException("No engines available");
+    }
+
+    async Task<byte[]> QueryHedgedAsync(
+        Backend primary,
+        Func<ILiteEngine, CancellationToken, Task<byte[]>> query,
+        CancellationToken cancellationToken)
+    {
+        int delayMs = latencies.Percentile(options.HedgePercentile);
+        if (delayMs < 0) return await QueryBackendAsync(primary, query, cancellationToken);
+
+        using CancellationTokenSource primaryCancellation =
+            CancellationTokenSource.CreateLinkedTokenSource(cancellationToken);
+        Task<byte[]> first = QueryBackendAsync(primary, query, primaryCancellation.Token);
+        try
+        {
+            return await first.WaitAsync(TimeSpan.FromMilliseconds(Math.Max(delayMs, options.MinHedgeDelayMs)),
+                cancellationToken);
+        }
+        catch (TimeoutException) when (!first.IsCompleted)
+        {
+        }
+
+        Backend? secondary = Select(primary, true);
+        if (secondary == null) return await first;
+
+        Interlocked.Increment(ref hedges);
+        using CancellationTokenSource secondaryCancellation =
+            CancellationTokenSource.CreateLinkedTokenSource(cancellationToken);
+        Task<byte[]> second = QueryBackendAsync(secondary, query, secondaryCancellation.Token);
+
+        Task<byte[]> winner = await Task.WhenAny(first, second);
+        Task<byte[]> loser = winner == first ? second : first;
+        if (winner.IsCompletedSuccessfully)
+        {
+            (loser == first ? primaryCancellation : secondaryCancellation).Cancel();
+            _ = loser.ContinueWith(static t => t.Exception, TaskContinuationOptions.OnlyOnFaulted);
+            return winner.Result;
+        }
+
+        // The first to finish failed; the other one may still succeed
+        return await loser;
+    }
+
+    async Task<byte[]> QueryBackendAsync(
+        Backend backend,
+        Func<ILiteEngine, CancellationToken, Task<byte[]>> query,
+        CancellationToken cancellationToken)
+    {
+        long started = Stopwatch.GetTimestamp();
+        Interlocked.Increment(ref backend.Outstanding);
+        try
+        {
+            byte[] response = await query(backend.Engine, cancellationToken);
+            double elapsedMs = ElapsedMs(started);
+            backend.OnSuccess(elapsedMs, options.LatencyDecay);
+            latencies.Add(elapsedMs);
+            return response;
+        }
+        catch (Exception) when (!cancellationToken.IsCancellationRequested)
+        {
+            backend.OnFailure(ElapsedMs(started), options);
+            throw;
+        }
+        catch (Exception)
+        {
+            // Cancelled by the caller or as a losing hedge: says nothing about the backend
+            backend.ReleaseProbe();
+            throw;
+        }
+        finally
+        {
+            Interlocked.Decrement(ref backend.Outstanding);
+        }
+    }
+
+    /// <summary>
+    ///     Power of two choices: pick two random usable backends and take the one with the lower score.
+    ///     Falls back to the best usable backend when the random picks are not usable.
+    /// </summary>
+    Backend? Select(Backend? avoid, bool strict = false)
+    {
+        long now = Environment.TickCount64;
+        Backend? chosen = null;
+
+        if (backends.Length > 1)
+        {
+            int i = Random.Shared.Next(backends.Length);
+            int j = Random.Shared.Next(backends.Length - 1);
+            if (j >= i) j++;
+            chosen = Better(Usable(backends[i], avoid, now), Usable(backends[j], avoid, now));
+        }
+
+        if (chosen == null)
+        {
+            foreach (Backend backend in backends)
+                chosen = Better(chosen, Usable(backend, avoid, now));
+        }
+
+        // Every other backend is down: retrying on the one that just failed beats failing outright
+        if (chosen == null && avoid != null && !strict && Usable(avoid, null, now) != null)
+            chosen = avoid;
+
+        if (chosen != null && !chosen.TryAcquire(now)) return strict ? null : Select(chosen, true);
+
+        return chosen;
+    }
+
+    static double ElapsedMs(long started)
+    {
+        return (Stopwatch.GetTimestamp() - started) * 1000.0 / Stopwatch.Frequency;
+    }
+
+    static Backend? Usable(Backend backend, Backend? avoid, long now)
+    {
+        if (backend == avoid || !backend.Engine.IsReady || backend.Engine.IsClosed || !backend.CanAccept(now))
+            return null;
+        return backend;
+    }
+
+    static Backend? Better(Backend? a, Backend? b)
+    {
+        if (a == null) return b;
+        if (b == null) return a;
+        return b.Score < a.Score ? b : a;
+    }
+
+    sealed class Backend(ILiteEngine engine)
+    {
+        readonly object stateLock = new();
+        int consecutiveFailures;
+        int ejectionMs;
+        double latencyMs;
+        long ejectedUntil;
+        int probe;
+
+        public readonly ILiteEngine Engine = engine;
+        public int Outstanding;
+
+        public double LatencyMs
+        {
+            get
+            {
+                lock (stateLock) return latencyMs;
+            }
+        }
+
+        // Unknown backends score as the fastest so they get sampled
+        public double Score => (LatencyMs + 1) * (Volatile.Read(ref Outstanding) + 1);
+
+        /// <summary>
+        ///     Closed circuit, or an ejection that has run out and is waiting for its probe.
+        /// </summary>
+        public bool CanAccept(long now)
+        {
+            long until = Volatile.Read(ref ejectedUntil);
+            return until == 0 || (now >= until && Volatile.Read(ref probe) == NoProbe);
+        }
+
+        /// <summary>
+        ///     Claim the backend for a query. After an ejection only one probe query is let through.
+        /// </summary>
+        public bool TryAcquire(long now)
+        {
+            long until = Volatile.Read(ref ejectedUntil);
+            if (until == 0) return true;
+            if (now < until) return false;
+            return Interlocked.CompareExchange(ref probe, Probing, NoProbe) == NoProbe;
+        }
+
+        public void ReleaseProbe()
+        {
+            Volatile.Write(ref probe, NoProbe);
+        }
+
+        public void OnSuccess(double elapsedMs, double decay)
+        {
+            lock (stateLock)
+            {
+                latencyMs = latencyMs == 0 ? elapsedMs : latencyMs + decay * (elapsedMs - latencyMs);
+                consecutiveFailures = 0;
+                ejectionMs = 0;
+                Volatile.Write(ref ejectedUntil, 0);
+                Volatile.Write(ref probe, NoProbe);
+            }
+        }
+
+        public void OnFailure(double elapsedMs, BalancedEngineOptions options)
+        {
+            lock (stateLock)
+            {
+                // Fast failures must not make a broken backend look like the quickest one
+                latencyMs = Math.Max(latencyMs * 2, elapsedMs);
+                consecutiveFailures++;
+
+                bool probeFailed = Volatile.Read(ref probe) == Probing;
+                if (probeFailed || consecutiveFailures >= options.FailureThreshold)
+                {
+                    ejectionMs = ejectionMs == 0
+                        ? options.EjectionMs
+                        : Math.Min(ejectionMs * 2, options.MaxEjectionMs);
+                    Volatile.Write(ref ejectedUntil, Environment.TickCount64 + ejectionMs);
+                }
+
+                Volatile.Write(ref probe, NoProbe);
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Recent query latencies across all backends. The percentile is recomputed every few samples rather than on
+    ///     every query, which is plenty for picking a hedge delay.
+    /// </summary>
+    sealed class LatencyWindow
+    {
+        const int Size = 512;
+        const int MinSamples = 32;
+        const int RecomputeEvery = 64;
+
+        readonly object windowLock = new();
+        readonly double[] samples = new double[Size];
+        readonly double[] sorted = new double[Size];
+        double cachedPercentile = -1;
+        int count;
+        int next;
+        int sinceRecompute = RecomputeEvery;
+
+        public void Add(double latencyMs)
+        {
+            lock (windowLock)
+            {
+                samples[next] = latencyMs;
+                next = (next + 1) % Size;
+                if (count < Size) count++;
+                sinceRecompute++;
+            }
+        }
+
+        /// <summary>
+        ///     Latency at <paramref name="percentile" /> in whole milliseconds, or -1 while there are too few samples.
+        /// </summary>
+        public int Percentile(double percentile)
+        {
+            lock (windowLock)
+            {
+                if (count < MinSamples) return -1;
+                if (sinceRecompute >= RecomputeEvery)
+                {
+                    Array.Copy(samples, sorted, count);
+                    Array.Sort(sorted, 0, count);
+                    cachedPercentile = sorted[Math.Min(count - 1, (int)(percentile * count))];
+                    sinceRecompute = 0;
+                }
+
+                return (int)Math.Ceiling(cachedPercentile);
+            }
+        }
+    }
+}
@@ -0,0 +1,330 @@
+using System;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+using System.Threading;
+using System.Threading.Tasks;
+using TonSdk.Adnl.LiteClient.Protocol;
+using TonSdk.Adnl.TL;
+
+namespace TonSdk.Adnl.LiteClient.Engines;
+
+/// <summary>
+///     How <see cref="CachingEngine" /> treats the response to a request.
+/// </summary>
+public enum LiteCacheMode
+{
+    /// <summary>
+    ///     Always ask the lite server; concurrent identical requests are not merged either.
+    /// </summary>
+    None,
+
+    /// <summary>
+    ///     The answer is fixed by the request itself (it names a block, a transaction or a hash), so it is cached
+    ///     until evicted by size.
+    /// </summary>
+    Immutable,
+
+    /// <summary>
+    ///     The answer follows the chain head; it is cached for the engine's short-lived TTL only.
+    /// </summary>
+    ShortLived
+}
+
+/// <summary>
+///     Caching engine decorator.
+///     Answers repeated typed requests from a size-bounded LRU cache and merges identical requests that are in flight
+///     into a single lite server query. Requests are keyed by their serialized bytes, so only typed requests
+///     (<see cref="ILiteEngine.QueryAsync(ILiteServerRequest, int, CancellationToken)" />) are cached; pre-encoded
+///     queries pass straight through. liteServer.error responses are never cached.
+///     Cached responses are shared between callers and must not be modified.
+/// </summary>
+public class CachingEngine : LiteEngineDecorator
+{
+    public const long DefaultMaxCacheBytes = 64L * 1024 * 1024;
+    public const int DefaultShortLivedTtlMs = 1000;
+
+    // Rough per-entry bookkeeping (node, entry, dictionary slot) counted against the size limit
+    const int EntryOverhead = 128;
+
+    readonly object cacheLock = new();
+    readonly Dictionary<CacheKey, LinkedListNode<CacheEntry>> entries = new();
+    readonly ConcurrentDictionary<CacheKey, Task<byte[]>> inFlight = new();
+    readonly LinkedList<CacheEntry> lru = new();
+    readonly long maxCacheBytes;
+    readonly int shortLivedTtlMs;
+
+    long cachedBytes;
+    long coalesced;
+    long evictions;
+    long hits;
+    long misses;
+
+    public CachingEngine(
+        ILiteEngine innerEngine,
+        long maxCacheBytes = DefaultMaxCacheBytes,
+        int shortLivedTtlMs = DefaultShortLivedTtlMs) : base(innerEngine)
+    {
+        if (maxCacheBytes <= 0) throw new ArgumentOutOfRangeException(nameof(maxCacheBytes));
+        if (shortLivedTtlMs < 0) throw new ArgumentOutOfRangeException(nameof(shortLivedTtlMs));
+
+        this.maxCacheBytes = maxCacheBytes;
+        this.shortLivedTtlMs = shortLivedTtlMs;
+    }
+
+    /// <summary>
+    ///     Requests answered from the cache.
+    /// </summary>
+    public long Hits => Interlocked.Read(ref hits);
+
+    /// <summary>
+    ///     Cacheable requests that went to the lite server.
+    /// </summary>
+    public long Misses => Interlocked.Read(ref misses);
+
+    /// <summary>
+    ///     Requests that joined an identical request already in flight.
+    /// </summary>
+    public long Coalesced => Interlocked.Read(ref coalesced);
+
+    /// <summary>
+    ///     Entries dropped to stay under the size limit.
+    /// </summary>
+    public long Evictions => Interlocked.Read(ref evictions);
+
+    /// <summary>
+    ///     Bytes held by the cache, including per-entry overhead.
+    /// </summary>
+    public long CachedBytes
+    {
+        get
+        {
+            lock (cacheLock) return cachedBytes;
+        }
+    }
+
+    /// <summary>
+    ///     Number of cached responses.
+    /// </summary>
+    public int Count
+    {
+        get
+        {
+            lock (cacheLock) return entries.Count;
+        }
+    }
+
+    /// <summary>
+    ///     The shared lite server query runs without the callers' cancellation token, so one caller giving up does not
+    ///     fail the others; each caller stops waiting on its own token, while the query itself ends with its timeout.
+    /// </summary>
+    public override Task<byte[]> QueryAsync(
+        ILiteServerRequest request,
+        int timeout = 30000,
+        CancellationToken cancellationToken = default)
+    {
+        LiteCacheMode mode = GetCacheMode(request);
+        if (mode == LiteCacheMode.None)
+            return innerEngine.QueryAsync(request, timeout, cancellationToken);
+
+        CacheKey key = CacheKey.From(request);
+        if (TryGetCached(key, out byte[] cached))
+        {
+            Interlocked.Increment(ref hits);
+            return Task.FromResult(cached);
+        }
+
+        TaskCompletionSource<byte[]> tcs = new(TaskCreationOptions.RunContinuationsAsynchronously);
+        Task<byte[]> pending = inFlight.GetOrAdd(key, tcs.Task);
+        if (pending != tcs.Task)
+        {
+            Interlocked.Increment(ref coalesced);
+            return pending.WaitAsync(cancellationToken);
+        }
+
+        // A query for the same key may have completed between the lookup and taking the in-flight slot
+        if (TryGetCached(key, out cached))
+        {
+            inFlight.TryRemove(new KeyValuePair<CacheKey, Task<byte[]>>(key, tcs.Task));
+            tcs.TrySetResult(cached);
+            Interlocked.Increment(ref hits);
+            return tcs.Task;
+        }
+
+        Interlocked.Increment(ref misses);
+        _ = FetchAsync(request, key, mode, timeout, tcs);
+        return tcs.Task.WaitAsync(cancellationToken);
+    }
+
+    /// <summary>
+    ///     Drop every cached response. Requests in flight are not affected.
+    /// </summary>
+    public void Clear()
+    {
+        lock (cacheLock)
+        {
+            entries.Clear();
+            lru.Clear();
+            cachedBytes = 0;
+        }
+    }
+
+    /// <summary>
+    ///     Decide how the response to <paramref name="request" /> is cached. Requests bound to a block id, a transaction
+    ///     or a hash are immutable, masterchain info and block proofs up to the last block are short-lived, and
+    ///     everything else (sending messages, time, version, non-final data) is never cached. Override to adjust.
+    /// </summary>
+    protected virtual LiteCacheMode GetCacheMode(ILiteServerRequest request)
+    {
+        switch (request)
+        {
+            case LiteServerGetBlockRequest:
+            case LiteServerGetStateRequest:
+            case LiteServerGetBlockHeaderRequest:
+            case LiteServerGetAccountStateRequest:
+            case LiteServerGetAccountStatePrunnedRequest:
+            case LiteServerRunSmcMethodRequest:
+            case LiteServerGetShardInfoRequest:
+            case LiteServerGetAllShardsInfoRequest:
+            case LiteServerGetOneTransactionRequest:
+            case LiteServerGetTransactionsRequest:
+            case LiteServerLookupBlockRequest:
+            case LiteServerListBlockTransactionsRequest:
+            case LiteServerListBlockTransactionsExtRequest:
+            case LiteServerGetConfigAllRequest:
+            case LiteServerGetConfigParamsRequest:
+            case LiteServerGetLibrariesRequest:
+            case LiteServerGetShardBlockProofRequest:
+                return LiteCacheMode.Immutable;
+            case LiteServerGetBlockProofRequest proof:
+                // Without target_block (mode bit 0) the server proves up to its last block, which moves on
+                return (proof.Mode & 1) != 0 ? LiteCacheMode.Immutable : LiteCacheMode.ShortLived;
+            case LiteServerGetMasterchainInfoRequest:
+            case LiteServerGetMasterchainInfoExtRequest:
+                return LiteCacheMode.ShortLived;
+            default:
+                return LiteCacheMode.None;
+        }
+    }
+
+    async Task FetchAsync(
+        ILiteServerRequest request,
+        CacheKey key,
+        LiteCacheMode mode,
+        int timeout,
+        TaskCompletionSource<byte[]> tcs)
+    {
+        try
+        {
+            byte[] response = await innerEngine.QueryAsync(request, timeout, CancellationToken.None)
+                .ConfigureAwait(false);
+            if (!ResponseParser.IsError(response)) Store(key, response, mode);
+            tcs.TrySetResult(response);
+        }
+        catch (Exception e)
+        {
+            tcs.TrySetException(e);
+        }
+        finally
+        {
+            // Only after storing, so a caller arriving now finds either the cache entry or the in-flight task
+            inFlight.TryRemove(new KeyValuePair<CacheKey, Task<byte[]>>(key, tcs.Task));
+        }
+    }
+
+    bool TryGetCached(CacheKey key, out byte[] response)
+    {
+        lock (cacheLock)
+        {
+            if (entries.TryGetValue(key, out LinkedListNode<CacheEntry>? node))
+            {
+                if (node.Value.ExpiresAt > Environment.TickCount64)
+                {
+                    lru.Remove(node);
+                    lru.AddFirst(node);
+                    response = node.Value.Response;
+                    return true;
+                }
+
+                Remove(node);
+            }
+        }
+
+        response = null!;
+        return false;
+    }
+
+    void Store(CacheKey key, byte[] response, LiteCacheMode mode)
+    {
+        long size = key.Bytes.Length + response.Length + EntryOverhead;
+        if (size > maxCacheBytes) return;
+
+        long expiresAt = mode == LiteCacheMode.ShortLived
+            ? Environment.TickCount64 + shortLivedTtlMs
+            : long.MaxValue;
+
+        lock (cacheLock)
+        {
+            if (entries.TryGetValue(key, out LinkedListNode<CacheEntry>? existing))
+                Remove(existing);
+
+            LinkedListNode<CacheEntry> node = lru.AddFirst(new CacheEntry(key, response, size, expiresAt));
+            entries[key] = node;
+            cachedBytes += size;
+
+            while (cachedBytes > maxCacheBytes && lru.Last != null)
+            {
+                Remove(lru.Last);
+                evictions++;
+            }
+        }
+    }
+
+    void Remove(LinkedListNode<CacheEntry> node)
+    {
+        entries.Remove(node.Value.Key);
+        lru.Remove(node);
+        cachedBytes -= node.Value.Size;
+    }
+
+    sealed record CacheEntry(CacheKey Key, byte[] Response, long Size, long ExpiresAt);
+
+    /// <summary>
+    ///     Serialized request with its hash computed once.
+    /// </summary>
+    readonly struct CacheKey : IEquatable<CacheKey>
+    {
+        readonly int hash;
+
+        CacheKey(byte[] bytes)
+        {
+            Bytes = bytes;
+            HashCode hashCode = new();
+            hashCode.AddBytes(bytes);
+            hash = hashCode.ToHashCode();
+        }
+
+        public byte[] Bytes { get; }
+
+        public static CacheKey From(ILiteServerRequest request)
+        {
+            TLWriteBuffer writer = new(request.GetSerializedSize());
+            request.WriteTo(writer);
+            return new CacheKey(writer.Build());
+        }
+
+        public bool Equals(CacheKey other)
+        {
+            return hash == other.hash && Bytes.AsSpan().SequenceEqual(other.Bytes);
+        }
+
+        public override bool Equals(object? obj)
+        {
+            return obj is CacheKey other && Equals(other);
+        }
+
+        public override int GetHashCode()
+        {
+            return hash;
+        }
+    }
+}
@@ -1,7 +1,9 @@
 using System;
+using System.Collections.Generic;
 using System.Threading;
 using System.Threading.Tasks;
 using TonSdk.Adnl.Adnl;
+using TonSdk.Adnl.Diagnostics;
 
 namespace TonSdk.Adnl.LiteClient.Engines;
 
@@ -12,6 +14,8 @@ namespace TonSdk.Adnl.LiteClient.Engines;
 internal class ConnectionManager(string host, int port, byte[] publicKey, int reconnectDelayMs = 10000)
 {
     readonly SemaphoreSlim connectionLock = new(1, 1);
+    readonly KeyValuePair<string, object?> serverAddress = new("server.address", host);
+    readonly KeyValuePair<string, object?> serverPort = new("server.port", port);
 
     volatile bool isClosed;
     volatile bool isConnecting;
@@ -24,7 +28,7 @@ internal class ConnectionManager(string host, int port, byte[] publicKey, int re
     public event Action? Connected;
     public event Action? Ready;
     public event Action? Closed;
-    public event Action<byte[]>? DataReceived;
+    public event AdnlPayloadHandler? PayloadReceived;
 
     public async Task ConnectAsync(CancellationToken cancellationToken = default)
     {
@@ -41,14 +45,14 @@ internal class ConnectionManager(string host, int port, byte[] publicKey, int re
             // Cleanup old client
             if (CurrentClient != null)
             {
-                CurrentClient.DataReceived -= OnDataReceived;
+                CurrentClient.PayloadReceived -= OnPayloadReceived;
                 CurrentClient.Closed -= OnClientClosed;
                 CurrentClient.End();
             }
 
             // Create and connect new client
             AdnlClientTcp client = new(host, port, publicKey);
-            client.DataReceived += OnDataReceived;
+            client.PayloadReceived += OnPayloadReceived;
             client.Closed += OnClientClosed;
 
             await client.Connect();
@@ -57,6 +61,9 @@ internal class ConnectionManager(string host, int port, byte[] publicKey, int re
             CurrentClient = client;
             isReady = true;
 
+            AdnlTelemetry.ConnectionsOpened.Add(1, serverAddress, serverPort);
+            if (AdnlEventSource.Log.IsEnabled()) AdnlEventSource.Log.ConnectionOpened(host, port);
+
             Connected?.Invoke();
             Ready?.Invoke();
         }
@@ -101,22 +108,27 @@ internal class ConnectionManager(string host, int port, byte[] publicKey, int re
         connectionLock.Dispose();
     }
 
-    void OnDataReceived(byte[] data)
+    void OnPayloadReceived(ReadOnlySpan<byte> payload)
     {
-        DataReceived?.Invoke(data);
+        PayloadReceived?.Invoke(payload);
     }
 
     void OnClientClosed()
     {
         isReady = false;
+        AdnlTelemetry.ConnectionsClosed.Add(1, serverAddress, serverPort);
+        if (AdnlEventSource.Log.IsEnabled()) AdnlEventSource.Log.ConnectionClosed(host, port);
         Closed?.Invoke();
 
         if (!isClosed)
             _ = Task.Run(async () =>
             {
                 await Task.Delay(reconnectDelayMs);
-                if (!isClosed)
-                    await ConnectAsync();
+                if (isClosed) return;
+
+                AdnlTelemetry.Reconnects.Add(1, serverAddress, serverPort);
+                if (AdnlEventSource.Log.IsEnabled()) AdnlEventSource.Log.Reconnecting(host, port);
+                await ConnectAsync();
             });
     }
 
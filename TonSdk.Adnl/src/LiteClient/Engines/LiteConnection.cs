@@ -0,0 +1,108 @@
+using System;
+using System.Threading;
+using System.Threading.Tasks;
+using TonSdk.Adnl.TL;
+
+namespace TonSdk.Adnl.LiteClient.Engines;
+
+/// <summary>
+///     One ADNL connection to a lite server together with the queries pending on it.
+///     Reconnects on its own and resends its pending queries once it is ready again.
+///     Engines build on this: <see cref="LiteSingleEngine" /> owns one, <see cref="LitePooledEngine" /> several.
+/// </summary>
+internal sealed class LiteConnection : IDisposable
+{
+    readonly ConnectionManager connection;
+    readonly QueryManager queries;
+
+    public LiteConnection(string host, int port, byte[] publicKey, int reconnectTimeoutMs, int maxInFlight)
+    {
+        connection = new ConnectionManager(host, port, publicKey, reconnectTimeoutMs);
+        queries = new QueryManager(maxInFlight);
+
+        connection.Connected += () => Connected?.Invoke();
+        connection.Ready += OnReady;
+        connection.Closed += OnClosed;
+        connection.PayloadReceived += OnPayloadReceived;
+    }
+
+    public event Action? Connected;
+    public event Action? Ready;
+    public event Action? Closed;
+
+    public bool IsReady => connection.IsReady;
+    public bool IsClosed => connection.IsClosed;
+    public int PendingCount => queries.PendingCount;
+
+    /// <summary>
+    ///     Start connecting in the background.
+    /// </summary>
+    public void Start()
+    {
+        _ = Task.Run(async () => await connection.ConnectAsync());
+    }
+
+    public async Task<byte[]> QueryAsync(
+        Func<(byte[] queryId, byte[] data)> encoder,
+        int timeout,
+        CancellationToken cancellationToken)
+    {
+        await connection.EnsureConnectedAsync(cancellationToken);
+
+        (byte[] queryId, byte[] packet) = encoder();
+        TLInt256 id = new(queryId);
+        Task<byte[]> queryTask = await queries.RegisterQueryAsync(id, packet, timeout, cancellationToken);
+
+        try
+        {
+            await connection.WriteAsync(packet);
+        }
+        catch (Exception e)
+        {
+            // Give the in-flight slot back now rather than when the query times out
+            queries.FailQuery(id, e);
+            throw;
+        }
+
+        return await queryTask;
+    }
+
+    public void Dispose()
+    {
+        queries.FailAllQueries(new ObjectDisposedException(nameof(LiteConnection)));
+        queries.Dispose();
+        connection.Close();
+    }
+
+    /// <summary>
+    ///     Drop the socket as if the server had closed it; the connection reconnects as usual.
+    /// </summary>
+    internal void Disconnect()
+    {
+        connection.CurrentClient?.End();
+    }
+
+    void OnReady()
+    {
+        Ready?.Invoke();
+
+        // Resend pending queries after reconnection
+        foreach (byte[] packet in queries.GetAllPendingPackets())
+            _ = connection.WriteAsync(packet);
+    }
+
+    void OnPayloadReceived(ReadOnlySpan<byte> payload)
+    {
+        (TLInt256 queryId, byte[] response)? parsed = ResponseParser.Parse(payload);
+        if (!parsed.HasValue) return;
+
+        (TLInt256 queryId, byte[] response) = parsed.Value;
+        queries.CompleteQuery(queryId, response);
+    }
+
+    void OnClosed()
+    {
+        Closed?.Invoke();
+        queries.FailAllQueries(new InvalidOperationException("Connection closed"));
+    }
+}
@@ -1,6 +1,7 @@
 using System;
 using System.Threading;
 using System.Threading.Tasks;
+using TonSdk.Adnl.LiteClient.Protocol;
 
 namespace TonSdk.Adnl.LiteClient.Engines;
 
@@ -38,6 +39,18 @@ public abstract class LiteEngineDecorator : ILiteEngine
         return innerEngine.QueryAsync(encoder, timeout, cancellationToken);
     }
 
+    /// <summary>
+    ///     By default a typed request is encoded and goes through the encoder overload, so decorators that only
+    ///     override that overload still see every query. Override to forward the request itself to the inner engine.
+    /// </summary>
+    public virtual Task<byte[]> QueryAsync(
+        ILiteServerRequest request,
+        int timeout = 30000,
+        CancellationToken cancellationToken = default)
+    {
+        return QueryAsync(() => Encoder.EncodeRequest(request), timeout, cancellationToken);
+    }
+
     public virtual void Dispose()
     {
         innerEngine.Dispose();
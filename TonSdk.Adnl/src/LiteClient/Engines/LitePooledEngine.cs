@@ -0,0 +1,116 @@
+using System;
+using System.Linq;
+using System.Threading;
+using System.Threading.Tasks;
+using TonSdk.Adnl.LiteClient.Protocol;
+
+namespace TonSdk.Adnl.LiteClient.Engines;
+
+/// <summary>
+///     Lite engine that keeps several ADNL connections to the same lite server.
+///     A single connection encrypts, decrypts and reads every query through one stream; with a pool, each connection
+///     has its own ciphers, read loop and pending queries, so they run in parallel. Queries go to the ready connection
+///     with the fewest pending queries. Connections are opened together and reconnect independently, each resending
+///     its own pending queries when it is ready again.
+/// </summary>
+public class LitePooledEngine : ILiteEngine
+{
+    readonly LiteConnection[] connections;
+    int nextIndex;
+
+    public LitePooledEngine(string host, int port, byte[] publicKey, int poolSize = 4, int reconnectTimeoutMs = 10000,
+        int maxInFlightPerConnection = QueryManager.DefaultMaxInFlight)
+    {
+        if (poolSize <= 0) throw new ArgumentOutOfRangeException(nameof(poolSize));
+
+        connections = new LiteConnection[poolSize];
+        for (int i = 0; i < poolSize; i++)
+        {
+            LiteConnection connection = new(host, port, publicKey, reconnectTimeoutMs, maxInFlightPerConnection);
+            connection.Connected += () => Connected?.Invoke();
+            connection.Ready += () => Ready?.Invoke();
+            connection.Closed += () => Closed?.Invoke();
+            connections[i] = connection;
+        }
+
+        foreach (LiteConnection connection in connections)
+            connection.Start();
+    }
+
+    public event Action? Connected;
+    public event Action? Ready;
+    public event Action? Closed;
+    public event Action<Exception>? Error;
+
+    public bool IsReady => connections.Any(c => c.IsReady);
+    public bool IsClosed => connections.All(c => c.IsClosed);
+
+    /// <summary>
+    ///     Number of connections in the pool.
+    /// </summary>
+    public int PoolSize => connections.Length;
+
+    /// <summary>
+    ///     Number of connections that are ready for queries.
+    /// </summary>
+    public int ReadyCount => connections.Count(c => c.IsReady);
+
+    public async Task<byte[]> QueryAsync(
+        Func<(byte[] queryId, byte[] data)> encoder,
+        int timeout = 30000,
+        CancellationToken cancellationToken = default)
+    {
+        if (IsClosed)
+            throw new ObjectDisposedException(nameof(LitePooledEngine));
+
+        return await Select().QueryAsync(encoder, timeout, cancellationToken);
+    }
+
+    public Task<byte[]> QueryAsync(
+        ILiteServerRequest request,
+        int timeout = 30000,
+        CancellationToken cancellationToken = default)
+    {
+        return QueryAsync(() => Encoder.EncodeRequest(request), timeout, cancellationToken);
+    }
+
+    public void Dispose()
+    {
+        foreach (LiteConnection connection in connections)
+            connection.Dispose();
+    }
+
+    /// <summary>
+    ///     Drop one connection's socket, as if the server had closed it. Exposed so tests can exercise reconnection.
+    /// </summary>
+    internal void Disconnect(int index)
+    {
+        connections[index].Disconnect();
+    }
+
+    /// <summary>
+    ///     The ready connection with the fewest pending queries. The scan starts at a rotating index so that ties are
+    ///     spread over the pool. When nothing is ready, the least loaded connection waits for its reconnect.
+    /// </summary>
+    LiteConnection Select()
+    {
+        int start = (int)((uint)Interlocked.Increment(ref nextIndex) % (uint)connections.Length);
+        LiteConnection? best = null;
+        LiteConnection? fallback = null;
+
+        for (int i = 0; i < connections.Length; i++)
+        {
+            LiteConnection connection = connections[(start + i) % connections.Length];
+            if (connection.IsReady)
+            {
+                if (best == null || connection.PendingCount < best.PendingCount) best = connection;
+            }
+            else if (fallback == null || connection.PendingCount < fallback.PendingCount)
+            {
+                fallback = connection;
+            }
+        }
+
+        return best ?? fallback!;
+    }
+}
@@ -1,6 +1,7 @@
 using System;
 using System.Threading;
 using System.Threading.Tasks;
+using TonSdk.Adnl.LiteClient.Protocol;
 
 namespace TonSdk.Adnl.LiteClient.Engines;
 
@@ -10,20 +11,18 @@ namespace TonSdk.Adnl.LiteClient.Engines;
 /// </summary>
 public class LiteSingleEngine : ILiteEngine
 {
-    readonly ConnectionManager connection;
-    readonly QueryManager queries;
+    readonly LiteConnection connection;
 
-    public LiteSingleEngine(string host, int port, byte[] publicKey, int reconnectTimeoutMs = 10000)
+    public LiteSingleEngine(string host, int port, byte[] publicKey, int reconnectTimeoutMs = 10000,
+        int maxInFlight = QueryManager.DefaultMaxInFlight)
     {
-        connection = new ConnectionManager(host, port, publicKey, reconnectTimeoutMs);
-        queries = new QueryManager();
+        connection = new LiteConnection(host, port, publicKey, reconnectTimeoutMs, maxInFlight);
 
         connection.Connected += () => Connected?.Invoke();
-        connection.Ready += OnReady;
-        connection.Closed += OnClosed;
-        connection.DataReceived += OnDataReceived;
+        connection.Ready += () => Ready?.Invoke();
+        connection.Closed += () => Closed?.Invoke();
 
-        _ = Task.Run(async () => await connection.ConnectAsync());
+        connection.Start();
     }
 
     public event Action? Connected;
@@ -42,42 +41,19 @@ public class LiteSingleEngine : ILiteEngine
         if (connection.IsClosed)
             throw new ObjectDisposedException(nameof(LiteSingleEngine));
 
-        await connection.EnsureConnectedAsync(cancellationToken);
-
-        (byte[] queryId, byte[] packet) = encoder();
-        Task<byte[]> queryTask = queries.RegisterQuery(queryId, packet, timeout, cancellationToken);
-
-        await connection.WriteAsync(packet);
-        return await queryTask;
-    }
-
-    public void Dispose()
-    {
-        queries.FailAllQueries(new ObjectDisposedException(nameof(LiteSingleEngine)));
-        connection.Close();
-    }
-
-    void OnReady()
-    {
-        Ready?.Invoke();
-
-        // Resend pending queries after reconnection
-        foreach (byte[] packet in queries.GetAllPendingPackets())
-            _ = connection.WriteAsync(packet);
+        return await connection.QueryAsync(encoder, timeout, cancellationToken);
     }
 
-    void OnDataReceived(byte[] data)
+    public Task<byte[]> QueryAsync(
+        ILiteServerRequest request,
+        int timeout = 30000,
+        CancellationToken cancellationToken = default)
     {
-        (byte[] queryId, byte[] response)? parsed = ResponseParser.Parse(data);
-        if (!parsed.HasValue) return;
-
-        (byte[] queryId, byte[] response) = parsed.Value;
-        queries.CompleteQuery(queryId, response);
+        return QueryAsync(() => Encoder.EncodeRequest(request), timeout, cancellationToken);
     }
 
-    void OnClosed()
+    public void Dispose()
     {
-        Closed?.Invoke();
-        queries.FailAllQueries(new InvalidOperationException("Connection closed"));
+        connection.Dispose();
     }
-}
\ No newline at end of file
+}
@@ -3,6 +3,7 @@ using System.Diagnostics;
 using System.Threading;
 using System.Threading.Tasks;
 using Microsoft.Extensions.Logging;
+using TonSdk.Adnl.LiteClient.Protocol;
 using TonSdk.Core.Cryptography;
 
 namespace TonSdk.Adnl.LiteClient.Engines;
@@ -42,4 +43,33 @@ public class LoggingEngine(ILiteEngine innerEngine, ILogger<LoggingEngine> logge
             throw;
         }
     }
+
+    public override async Task<byte[]> QueryAsync(
+        ILiteServerRequest request,
+        int timeout = 30000,
+        CancellationToken cancellationToken = default)
+    {
+        string requestType = request.GetType().Name;
+
+        logger.LogDebug("Request {RequestType} starting, timeout={Timeout}ms, requestSize={RequestSize}",
+            requestType, timeout, request.GetSerializedSize());
+
+        Stopwatch sw = Stopwatch.StartNew();
+        try
+        {
+            byte[] result = await innerEngine.QueryAsync(request, timeout, cancellationToken);
+            sw.Stop();
+
+            logger.LogDebug("Request {RequestType} completed in {ElapsedMs}ms, responseSize={ResponseSize}",
+                requestType, sw.ElapsedMilliseconds, result.Length);
+
+            return result;
+        }
+        catch (Exception ex)
+        {
+            sw.Stop();
+            logger.LogError(ex, "Request {RequestType} failed after {ElapsedMs}ms", requestType, sw.ElapsedMilliseconds);
+            throw;
+        }
+    }
 }
\ No newline at end of file
@@ -3,89 +3,176 @@ using System.Collections.Concurrent;
 using System.Collections.Generic;
 using System.Threading;
 using System.Threading.Tasks;
-using TonSdk.Core.Cryptography;
+using TonSdk.Adnl.Diagnostics;
+using TonSdk.Adnl.TL;
 
 namespace TonSdk.Adnl.LiteClient.Engines;
 
 /// <summary>
 ///     Manages pending queries, timeouts, and response matching.
-///     Thread-safe for concurrent query operations.
+///     Thread-safe for concurrent query operations. Queries are keyed by their 256-bit id as a value,
+///     timeouts share one <see cref="TimerWheel" />, and at most <see cref="MaxInFlight" /> queries are pending:
+///     further registrations wait for a slot.
 /// </summary>
-internal class QueryManager
+internal class QueryManager : IDisposable
 {
-    readonly ConcurrentDictionary<string, QueryContext> pendingQueries = new();
+    public const int DefaultMaxInFlight = 4096;
 
-    public int PendingCount => pendingQueries.Count;
+    readonly SemaphoreSlim inFlight;
+    readonly ConcurrentDictionary<TLInt256, PendingQuery> pendingQueries = new();
+    readonly TimerWheel timeouts;
 
-    public Task<byte[]> RegisterQuery(byte[] queryId, byte[] packet, int timeoutMs, CancellationToken cancellationToken)
+    public QueryManager(int maxInFlight = DefaultMaxInFlight, int timerTickMs = TimerWheel.DefaultTickMs)
     {
-        string id = Utils.BytesToHex(queryId);
-        TaskCompletionSource<byte[]> tcs = new();
-        CancellationTokenSource cts = CancellationTokenSource.CreateLinkedTokenSource(cancellationToken);
-        cts.CancelAfter(timeoutMs);
+        if (maxInFlight <= 0) throw new ArgumentOutOfRangeException(nameof(maxInFlight));
 
-        QueryContext context = new()
-        {
-            Tcs = tcs,
-            Packet = packet,
-            Registration = cts.Token.Register(() => tcs.TrySetCanceled(cancellationToken))
-        };
+        MaxInFlight = maxInFlight;
+        inFlight = new SemaphoreSlim(maxInFlight, maxInFlight);
+        timeouts = new TimerWheel(timerTickMs);
+    }
 
-        pendingQueries.TryAdd(id, context);
-        return tcs.Task;
+    public int MaxInFlight { get; }
+    public int PendingCount => pendingQueries.Count;
+
+    public void Dispose()
+    {
+        FailAllQueries(new ObjectDisposedException(nameof(QueryManager)));
+        timeouts.Dispose();
     }
 
-    public bool CompleteQuery(byte[] queryId, byte[] responseData)
+    /// <summary>
+    ///     Register a query once an in-flight slot is free.
+    ///     Returns the task of the response, which fails with <see cref="TaskCanceledException" /> on timeout
+    ///     or cancellation; the slot is freed when that task completes.
+    /// </summary>
+    public async ValueTask<Task<byte[]>> RegisterQueryAsync(TLInt256 queryId, byte[] packet, int timeoutMs,
+        CancellationToken cancellationToken)
     {
-        string id = Utils.BytesToHex(queryId);
+        cancellationToken.ThrowIfCancellationRequested();
+        if (!inFlight.Wait(0))
+        {
+            AdnlTelemetry.QueryWaiting(1);
+            try
+            {
+                await inFlight.WaitAsync(cancellationToken).ConfigureAwait(false);
+            }
+            finally
+            {
+                AdnlTelemetry.QueryWaiting(-1);
+            }
+        }
 
-        if (pendingQueries.TryRemove(id, out QueryContext? context))
+        PendingQuery query = new(this, queryId, packet);
+        if (!pendingQueries.TryAdd(queryId, query))
         {
-            context.Registration.Dispose();
-            context.Tcs.TrySetResult(responseData);
-            return true;
+            inFlight.Release();
+            throw new InvalidOperationException($"Query {queryId} is already pending");
         }
 
-        return false;
+        AdnlTelemetry.QueryPending(1);
+
+        // Register before scheduling: the wheel expires the query right away when its slot was already swept
+        if (cancellationToken.CanBeCanceled)
+            query.SetRegistration(cancellationToken.UnsafeRegister(
+                static (state, token) => ((PendingQuery)state!).Cancel(token), query));
+        if (timeoutMs != Timeout.Infinite && !query.Response.IsCompleted)
+            timeouts.Schedule(query, timeoutMs);
+
+        return query.Response;
     }
 
-    public bool FailQuery(byte[] queryId, Exception exception)
+    public bool CompleteQuery(TLInt256 queryId, byte[] responseData)
     {
-        string id = Utils.BytesToHex(queryId);
-
-        if (pendingQueries.TryRemove(id, out QueryContext? context))
-        {
-            context.Registration.Dispose();
-            context.Tcs.TrySetException(exception);
-            return true;
-        }
+        return pendingQueries.TryGetValue(queryId, out PendingQuery? query) && query.TrySetResult(responseData);
+    }
 
-        return false;
+    public bool FailQuery(TLInt256 queryId, Exception exception)
+    {
+        return pendingQueries.TryGetValue(queryId, out PendingQuery? query) && query.TrySetException(exception);
     }
 
     public byte[][] GetAllPendingPackets()
     {
-        byte[][] packets = new byte[pendingQueries.Count][];
-        int i = 0;
-        foreach (KeyValuePair<string, QueryContext> kvp in pendingQueries)
-            packets[i++] = kvp.Value.Packet;
-        return packets;
+        List<byte[]> packets = new(pendingQueries.Count);
+        foreach (KeyValuePair<TLInt256, PendingQuery> kvp in pendingQueries)
+            packets.Add(kvp.Value.Packet);
+        return packets.ToArray();
     }
 
     public void FailAllQueries(Exception exception)
     {
-        foreach (KeyValuePair<string, QueryContext> kvp in pendingQueries.ToArray())
-            if (pendingQueries.TryRemove(kvp.Key, out QueryContext? context))
-            {
-                context.Registration.Dispose();
-                context.Tcs.TrySetException(exception);
-            }
+        foreach (KeyValuePair<TLInt256, PendingQuery> kvp in pendingQueries)
+            kvp.Value.TrySetException(exception);
+    }
+
+    /// <summary>
+    ///     Remove a query that is about to complete. Only the first caller wins, so the timer, the cancellation
+    ///     registration and the in-flight slot are released exactly once.
+    /// </summary>
+    bool TryRemove(PendingQuery query)
+    {
+        if (!pendingQueries.TryRemove(new KeyValuePair<TLInt256, PendingQuery>(query.Id, query)))
+            return false;
+
+        timeouts.Cancel(query);
+        query.ReleaseRegistration();
+        inFlight.Release();
+        AdnlTelemetry.QueryPending(-1);
+        return true;
     }
 
-    class QueryContext
+    sealed class PendingQuery(QueryManager owner, TLInt256 id, byte[] packet) : TimerWheelEntry
     {
-        public TaskCompletionSource<byte[]> Tcs { get; init; } = null!;
-        public byte[] Packet { get; init; } = null!;
-        public CancellationTokenRegistration Registration { get; init; }
+        // Continuations run off the receive loop, which must not wait for callers' code
+        readonly TaskCompletionSource<byte[]> tcs = new(TaskCreationOptions.RunContinuationsAsynchronously);
+
+        CancellationTokenRegistration registration;
+
+        // 0 until the registration is set, 1 once it is, 2 once the query is removed; whichever of the two comes
+        // second unregisters
+        int registrationState;
+
+        public TLInt256 Id { get; } = id;
+        public byte[] Packet { get; } = packet;
+        public Task<byte[]> Response => tcs.Task;
+
+        public void SetRegistration(CancellationTokenRegistration value)
+        {
+            registration = value;
+            if (Interlocked.CompareExchange(ref registrationState, 1, 0) == 2) value.Unregister();
+        }
+
+        public void ReleaseRegistration()
+        {
+            if (Interlocked.Exchange(ref registrationState, 2) == 1) registration.Unregister();
+        }
+
+        public bool TrySetResult(byte[] response)
+        {
+            if (!owner.TryRemove(this)) return false;
+            tcs.TrySetResult(response);
+            return true;
+        }
+
+        public bool TrySetException(Exception exception)
+        {
+            if (!owner.TryRemove(this)) return false;
+            tcs.TrySetException(exception);
+            return true;
+        }
+
+        public void Cancel(CancellationToken cancellationToken)
+        {
+            if (owner.TryRemove(this)) tcs.TrySetCanceled(cancellationToken);
+        }
+
+        protected internal override void OnExpired()
+        {
+            if (owner.TryRemove(this))
+            {
+                AdnlTelemetry.QueryTimeouts.Add(1);
+                tcs.TrySetCanceled();
+            }
+        }
     }
-}
\ No newline at end of file
+}
@@ -1,25 +1,34 @@
+using System;
+using System.Buffers.Binary;
 using TonSdk.Adnl.LiteClient.Protocol;
+using TonSdk.Adnl.TL;
 
 namespace TonSdk.Adnl.LiteClient.Engines;
 
 /// <summary>
 ///     Parses raw ADNL responses into lite server data.
-///     Handles protocol unwrapping and error checking.
+///     Handles protocol unwrapping; lite server errors are detected when the response is decoded.
 /// </summary>
 internal static class ResponseParser
 {
-    public static (byte[] queryId, byte[] response)? Parse(byte[] data)
+    public static (TLInt256 queryId, byte[] response)? Parse(ReadOnlySpan<byte> data)
     {
         // Unwrap ADNL protocol layers
-        (byte[] queryId, byte[] response)? unwrapped = AdnlProtocol.UnwrapResponse(data);
-        if (!unwrapped.HasValue)
+        if (!AdnlProtocol.TryUnwrapResponse(data, out TLInt256 queryId, out ReadOnlySpan<byte> liteServerResponse))
             return null; // Pong message, ignore
 
-        (byte[] queryId, byte[] liteServerResponse) = unwrapped.Value;
-
-        // Validate and extract actual response (checks for errors)
-        byte[] responseData = AdnlProtocol.ValidateAndExtractResponse(liteServerResponse);
+        // The boxed response (constructor included) goes to the caller as is; TLSerializer checks the
+        // constructor and raises liteServer.error while decoding, so errors fail the query that caused them.
+        // Unwrapping only slices the receive buffer, so the payload is copied exactly once, here.
+        return (queryId, liteServerResponse.ToArray());
+    }
 
-        return (queryId, responseData);
+    /// <summary>
+    ///     Whether a boxed response is a liteServer.error rather than the requested value.
+    /// </summary>
+    public static bool IsError(ReadOnlySpan<byte> response)
+    {
+        return response.Length >= 4 &&
+               BinaryPrimitives.ReadUInt32LittleEndian(response) == LiteServerError.Constructor;
     }
 }
\ No newline at end of file
@@ -1,16 +1,24 @@
 using System;
+using System.Collections.Generic;
 using System.Linq;
 using System.Threading;
 using System.Threading.Tasks;
+using TonSdk.Adnl.Diagnostics;
+using TonSdk.Adnl.LiteClient.Protocol;
 
 namespace TonSdk.Adnl.LiteClient.Engines;
 
 /// <summary>
 ///     Round-robin engine that distributes queries across multiple engines.
 ///     Provides load balancing and failover.
+///     Per-backend query counts and latencies go to <see cref="AdnlTelemetry" />, tagged by the backend's index.
 /// </summary>
 public class RoundRobinEngine : ILiteEngine
 {
+    static readonly KeyValuePair<string, object?> Ok = new("status", "ok");
+    static readonly KeyValuePair<string, object?> Failed = new("status", "error");
+
+    readonly KeyValuePair<string, object?>[] backendTags;
     readonly ILiteEngine[] engines;
     int currentIndex;
 
@@ -20,6 +28,9 @@ public class RoundRobinEngine : ILiteEngine
             throw new ArgumentException("At least one engine is required", nameof(engines));
 
         this.engines = engines;
+        backendTags = new KeyValuePair<string, object?>[engines.Length];
+        for (int i = 0; i < engines.Length; i++)
+            backendTags[i] = new KeyValuePair<string, object?>("backend", i);
 
         foreach (ILiteEngine engine in engines)
         {
@@ -38,10 +49,29 @@ public class RoundRobinEngine : ILiteEngine
     public event Action? Closed;
     public event Action<Exception>? Error;
 
-    public async Task<byte[]> QueryAsync(
+    public Task<byte[]> QueryAsync(
         Func<(byte[] queryId, byte[] data)> encoder,
         int timeout = 30000,
         CancellationToken cancellationToken = default)
+    {
+        return QueryNextAsync(engine => engine.QueryAsync(encoder, timeout, cancellationToken));
+    }
+
+    public Task<byte[]> QueryAsync(
+        ILiteServerRequest request,
+        int timeout = 30000,
+        CancellationToken cancellationToken = default)
+    {
+        return QueryNextAsync(engine => engine.QueryAsync(request, timeout, cancellationToken));
+    }
+
+    public void Dispose()
+    {
+        foreach (ILiteEngine engine in engines)
+            engine.Dispose();
+    }
+
+    async Task<byte[]> QueryNextAsync(Func<ILiteEngine, Task<byte[]>> query)
     {
         int attempts = 0;
         Exception? lastException = null;
@@ -57,23 +87,25 @@ public class RoundRobinEngine : ILiteEngine
                 continue;
             }
 
+            long started = AdnlTelemetry.StartTimer(AdnlTelemetry.BackendDuration);
             try
             {
-                return await engine.QueryAsync(encoder, timeout, cancellationToken);
+                byte[] response = await query(engine);
+                AdnlTelemetry.BackendQueries.Add(1, backendTags[index], Ok);
+                return response;
             }
             catch (Exception ex)
             {
+                AdnlTelemetry.BackendQueries.Add(1, backendTags[index], Failed);
                 lastException = ex;
                 attempts++;
             }
+            finally
+            {
+                AdnlTelemetry.StopTimer(AdnlTelemetry.BackendDuration, started, backendTags[index]);
+            }
         }
 
         throw lastException ?? new InvalidOperationException("No engines available");
     }
-
-    public void Dispose()
-    {
-        foreach (ILiteEngine engine in engines)
-            engine.Dispose();
-    }
 }
\ No newline at end of file
@@ -0,0 +1,167 @@
+using System;
+using System.Collections.Generic;
+using System.Threading;
+
+namespace TonSdk.Adnl.LiteClient.Engines;
+
+/// <summary>
+///     Entry that can be scheduled on a <see cref="TimerWheel" />.
+///     The wheel links entries into its slots directly, so scheduling and cancelling allocate nothing.
+/// </summary>
+internal abstract class TimerWheelEntry
+{
+    internal long DeadlineTick;
+    internal TimerWheelEntry? Next;
+    internal TimerWheelEntry? Previous;
+    internal int Slot = -1;
+
+    /// <summary>
+    ///     Called on the wheel's timer thread once the entry's deadline has passed.
+    /// </summary>
+    protected internal abstract void OnExpired();
+}
+
+/// <summary>
+///     Hashed timer wheel: one timer for any number of timeouts.
+///     Deadlines are rounded up to whole ticks and entries live in the slot of their deadline tick, so scheduling
+///     and cancelling are O(1) and each tick only looks at one slot. Timeouts fire up to one tick late.
+/// </summary>
+internal sealed class TimerWheel : IDisposable
+{
+    public const int DefaultTickMs = 100;
+    const int SlotCount = 512;
+
+    readonly TimerWheelEntry?[] slots = new TimerWheelEntry?[SlotCount];
+    readonly object[] slotLocks = new object[SlotCount];
+    readonly long startedAt = Environment.TickCount64;
+    readonly object tickLock = new();
+    readonly int tickMs;
+    readonly Timer timer;
+    long processedTick;
+    int count;
+
+    public TimerWheel(int tickMs = DefaultTickMs)
+    {
+        if (tickMs <= 0) throw new ArgumentOutOfRangeException(nameof(tickMs));
+
+        this.tickMs = tickMs;
+        for (int i = 0; i < slotLocks.Length; i++)
+            slotLocks[i] = new object();
+        timer = new Timer(_ => Advance(), null, tickMs, tickMs);
+    }
+
+    /// <summary>
+    ///     Number of scheduled entries.
+    /// </summary>
+    public int Count => Volatile.Read(ref count);
+
+    public void Dispose()
+    {
+        timer.Dispose();
+    }
+
+    /// <summary>
+    ///     Schedule <paramref name="entry" /> to expire after <paramref name="delayMs" />.
+    ///     An entry can be on the wheel only once at a time.
+    /// </summary>
+    public void Schedule(TimerWheelEntry entry, int delayMs)
+    {
+        if (entry.Slot >= 0) throw new InvalidOperationException("Entry is already scheduled");
+
+        long deadline = CurrentTick() + Math.Max(1, (delayMs + tickMs - 1) / tickMs);
+        int slot = (int)(deadline % SlotCount);
+
+        lock (slotLocks[slot])
+        {
+            // The timer may already have swept this slot for the tick; expire right away instead of a full turn later
+            if (deadline > Volatile.Read(ref processedTick))
+            {
+                entry.DeadlineTick = deadline;
+                entry.Slot = slot;
+                entry.Previous = null;
+                entry.Next = slots[slot];
+                if (entry.Next != null) entry.Next.Previous = entry;
+                slots[slot] = entry;
+                Interlocked.Increment(ref count);
+                return;
+            }
+        }
+
+        entry.OnExpired();
+    }
+
+    /// <summary>
+    ///     Remove <paramref name="entry" /> from the wheel. Returns false if it was not scheduled or already expired.
+    /// </summary>
+    public bool Cancel(TimerWheelEntry entry)
+    {
+        int slot = Volatile.Read(ref entry.Slot);
+        if (slot < 0) return false;
+
+        lock (slotLocks[slot])
+        {
+            if (entry.Slot != slot) return false;
+
+            Unlink(entry, slot);
+            return true;
+        }
+    }
+
+    /// <summary>
+    ///     Expire everything due up to now. Runs on the timer; exposed so tests can drive the wheel.
+    /// </summary>
+    internal void Advance()
+    {
+        if (!Monitor.TryEnter(tickLock)) return; // a slow previous tick is still sweeping
+
+        try
+        {
+            List<TimerWheelEntry>? expired = null;
+            long now = CurrentTick();
+            for (long tick = processedTick + 1; tick <= now; tick++)
+            {
+                int slot = (int)(tick % SlotCount);
+                lock (slotLocks[slot])
+                {
+                    Volatile.Write(ref processedTick, tick);
+                    for (TimerWheelEntry? entry = slots[slot]; entry != null;)
+                    {
+                        TimerWheelEntry? next = entry.Next;
+                        if (entry.DeadlineTick <= tick)
+                        {
+                            Unlink(entry, slot);
+                            (expired ??= new List<TimerWheelEntry>()).Add(entry);
+                        }
+
+                        entry = next;
+                    }
+                }
+            }
+
+            if (expired == null) return;
+            foreach (TimerWheelEntry entry in expired)
+                entry.OnExpired();
+        }
+        finally
+        {
+            Monitor.Exit(tickLock);
+        }
+    }
+
+    void Unlink(TimerWheelEntry entry, int slot)
+    {
+        if (entry.Previous != null) entry.Previous.Next = entry.Next;
+        else slots[slot] = entry.Next;
+        if (entry.Next != null) entry.Next.Previous = entry.Previous;
+
+        entry.Next = null;
+        entry.Previous = null;
+        Volatile.Write(ref entry.Slot, -1);
+        Interlocked.Decrement(ref count);
+    }
+
+    long CurrentTick()
+    {
+        return (Environment.TickCount64 - startedAt) / tickMs;
+    }
+}
@@ -0,0 +1,185 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace TonSdk.Adnl.LiteClient.Engines;
+
+/// <summary>
+///     Token bucket on the monotonic clock with first-in, first-out async waiters.
+///     Tokens accrue continuously at <see cref="TokensPerSecond" /> up to the burst size. A caller whose cost is not
+///     covered, or who arrives while others are queued, waits its turn; one timer wakes the head of the queue when
+///     enough tokens have accrued, so a large request is not starved by a stream of small ones.
+/// </summary>
+internal sealed class TokenBucket : IDisposable
+{
+    readonly double burstSize;
+    readonly object bucketLock = new();
+    readonly LinkedList<Waiter> queue = new();
+    readonly Timer timer;
+    long lastRefill = Stopwatch.GetTimestamp();
+    double tokens;
+
+    public TokenBucket(double tokensPerSecond, double burstSize)
+    {
+        if (tokensPerSecond <= 0) throw new ArgumentOutOfRangeException(nameof(tokensPerSecond));
+        if (burstSize < 1) throw new ArgumentOutOfRangeException(nameof(burstSize));
+
+        TokensPerSecond = tokensPerSecond;
+        this.burstSize = burstSize;
+        tokens = burstSize;
+        timer = new Timer(_ => Drain(), null, Timeout.Infinite, Timeout.Infinite);
+    }
+
+    public double TokensPerSecond { get; }
+
+    /// <summary>
+    ///     Tokens available right now.
+    /// </summary>
+    public double AvailableTokens
+    {
+        get
+        {
+            lock (bucketLock)
+            {
+                Refill();
+                return tokens;
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Callers waiting for tokens.
+    /// </summary>
+    public int QueueLength
+    {
+        get
+        {
+            lock (bucketLock) return queue.Count;
+        }
+    }
+
+    public void Dispose()
+    {
+        timer.Dispose();
+
+        List<Waiter> waiters;
+        lock (bucketLock)
+        {
+            waiters = new List<Waiter>(queue);
+            queue.Clear();
+        }
+
+        foreach (Waiter waiter in waiters)
+            waiter.Tcs.TrySetException(new ObjectDisposedException(nameof(TokenBucket)));
+    }
+
+    /// <summary>
+    ///     Take <paramref name="cost" /> tokens, waiting behind earlier callers if needed.
+    ///     Costs above the burst size are charged as the burst size, as they could never be covered otherwise.
+    /// </summary>
+    public ValueTask AcquireAsync(double cost, CancellationToken cancellationToken = default)
+    {
+        if (cost < 0) throw new ArgumentOutOfRangeException(nameof(cost));
+        cost = Math.Min(cost, burstSize);
+
+        Waiter waiter;
+        lock (bucketLock)
+        {
+            Refill();
+            if (queue.Count == 0 && tokens >= cost)
+            {
+                tokens -= cost;
+                return default;
+            }
+
+            cancellationToken.ThrowIfCancellationRequested();
+
+            waiter = new Waiter(this, cost);
+            waiter.Node = queue.AddLast(waiter);
+            if (queue.Count == 1) ScheduleHead();
+
+            if (cancellationToken.CanBeCanceled)
+                waiter.Registration = cancellationToken.UnsafeRegister(
+                    static (state, token) => ((Waiter)state!).Cancel(token), waiter);
+        }
+
+        return new ValueTask(waiter.Tcs.Task);
+    }
+
+    void Cancel(Waiter waiter, CancellationToken cancellationToken)
+    {
+        lock (bucketLock)
+        {
+            if (waiter.Node?.List == null) return;
+
+            bool wasHead = queue.First == waiter.Node;
+            queue.Remove(waiter.Node);
+            // A cheaper waiter may now be at the head
+            if (wasHead && queue.Count > 0) ScheduleHead();
+        }
+
+        waiter.Tcs.TrySetCanceled(cancellationToken);
+    }
+
+    void Drain()
+    {
+        List<Waiter>? ready = null;
+        lock (bucketLock)
+        {
+            Refill();
+            while (queue.First is { } head && tokens >= head.Value.Cost)
+            {
+                tokens -= head.Value.Cost;
+                queue.RemoveFirst();
+                (ready ??= new List<Waiter>()).Add(head.Value);
+            }
+
+            if (queue.Count > 0) ScheduleHead();
+        }
+
+        if (ready == null) return;
+        foreach (Waiter waiter in ready)
+        {
+            waiter.Registration.Unregister();
+            waiter.Tcs.TrySetResult();
+        }
+    }
+
+    /// <summary>
+    ///     Arm the timer for when the head of the queue can be served. Called under the lock.
+    /// </summary>
+    void ScheduleHead()
+    {
+        double missing = queue.First!.Value.Cost - tokens;
+        long dueMs = missing <= 0 ? 0 : Math.Max(1, (long)Math.Ceiling(missing / TokensPerSecond * 1000));
+        timer.Change(dueMs, Timeout.Infinite);
+    }
+
+    /// <summary>
+    ///     Add the tokens accrued since the last refill. Called under the lock.
+    /// </summary>
+    void Refill()
+    {
+        long now = Stopwatch.GetTimestamp();
+        double elapsedSeconds = (double)(now - lastRefill) / Stopwatch.Frequency;
+        lastRefill = now;
+        tokens = Math.Min(burstSize, tokens + elapsedSeconds * TokensPerSecond);
+    }
+
+    sealed class Waiter(TokenBucket owner, double cost)
+    {
+        // Continuations run off the timer thread, which must not wait for callers' code
+        public readonly TaskCompletionSource Tcs = new(TaskCreationOptions.RunContinuationsAsynchronously);
+
+        public double Cost { get; } = cost;
+        public LinkedListNode<Waiter>? Node;
+        public CancellationTokenRegistration Registration;
+
+        public void Cancel(CancellationToken cancellationToken)
+        {
+            owner.Cancel(this, cancellationToken);
+        }
+    }
+}
@@ -0,0 +1,154 @@
+using System;
+using System.Threading;
+using System.Threading.Tasks;
+using TonSdk.Adnl.LiteClient.Protocol;
+
+namespace TonSdk.Adnl.LiteClient.Engines;
+
+/// <summary>
+///     Tuning for <see cref="TokenBucketEngine" />.
+/// </summary>
+public class TokenBucketEngineOptions
+{
+    /// <summary>
+    ///     Sustained rate in tokens per second; fractions are allowed. A plain request costs one token.
+    /// </summary>
+    public double TokensPerSecond { get; init; } = 10;
+
+    /// <summary>
+    ///     Tokens that can be spent at once after an idle period. Defaults to one second's worth.
+    /// </summary>
+    public double? BurstSize { get; init; }
+
+    /// <summary>
+    ///     Also cap the number of queries in flight, backing off on timeouts and liteServer.error responses and ramping
+    ///     up again on success.
+    /// </summary>
+    public bool AdaptiveConcurrency { get; init; }
+
+    public int InitialConcurrency { get; init; } = 16;
+    public int MinConcurrency { get; init; } = 1;
+    public int MaxConcurrency { get; init; } = 256;
+
+    /// <summary>
+    ///     Factor the concurrency limit is multiplied by on overload.
+    /// </summary>
+    public double ConcurrencyBackoff { get; init; } = 0.5;
+}
+
+/// <summary>
+///     Rate-limiting engine decorator built on a token bucket.
+///     Tokens accrue continuously on the monotonic clock, so traffic is smooth instead of bunching at second
+///     boundaries; waiters are served first-in, first-out; and each request is charged by its weight
+///     (<see cref="GetCost" />), so fetching a whole block counts for more than asking the time. Optionally an AIMD
+///     concurrency limit sits behind the bucket to stay under a provider's quota without knowing it exactly.
+/// </summary>
+public class TokenBucketEngine : LiteEngineDecorator
+{
+    readonly TokenBucket bucket;
+    readonly AdaptiveConcurrencyLimit? concurrency;
+
+    public TokenBucketEngine(ILiteEngine innerEngine, TokenBucketEngineOptions options) : base(innerEngine)
+    {
+        bucket = new TokenBucket(options.TokensPerSecond,
+            options.BurstSize ?? Math.Max(1, options.TokensPerSecond));
+
+        if (options.AdaptiveConcurrency)
+            concurrency = new AdaptiveConcurrencyLimit(options.InitialConcurrency, options.MinConcurrency,
+                options.MaxConcurrency, options.ConcurrencyBackoff);
+    }
+
+    /// <summary>
+    ///     Tokens available right now.
+    /// </summary>
+    public double AvailableTokens => bucket.AvailableTokens;
+
+    /// <summary>
+    ///     Requests waiting for tokens.
+    /// </summary>
+    public int QueuedRequests => bucket.QueueLength;
+
+    /// <summary>
+    ///     Current adaptive concurrency limit, or null when it is off.
+    /// </summary>
+    public int? ConcurrencyLimit => concurrency?.Limit;
+
+    /// <summary>
+    ///     Pre-encoded queries cost one token each.
+    /// </summary>
+    public override Task<byte[]> QueryAsync(
+        Func<(byte[] queryId, byte[] data)> encoder,
+        int timeout = 30000,
+        CancellationToken cancellationToken = default)
+    {
+        return QueryLimitedAsync(1, token => innerEngine.QueryAsync(encoder, timeout, token), cancellationToken);
+    }
+
+    public override Task<byte[]> QueryAsync(
+        ILiteServerRequest request,
+        int timeout = 30000,
+        CancellationToken cancellationToken = default)
+    {
+        return QueryLimitedAsync(GetCost(request), token => innerEngine.QueryAsync(request, timeout, token),
+            cancellationToken);
+    }
+
+    public override void Dispose()
+    {
+        bucket.Dispose();
+        base.Dispose();
+    }
+
+    /// <summary>
+    ///     Tokens charged for <paramref name="request" />. Block bodies, states and full configs are the heaviest
+    ///     answers a lite server gives, transaction lists and proofs come next, and everything else costs one.
+    ///     Override to match a provider's own weights.
+    /// </summary>
+    protected virtual double GetCost(ILiteServerRequest request)
+    {
+        switch (request)
+        {
+            case LiteServerGetBlockRequest:
+            case LiteServerGetStateRequest:
+            case LiteServerGetConfigAllRequest:
+                return 5;
+            case LiteServerListBlockTransactionsRequest:
+            case LiteServerListBlockTransactionsExtRequest:
+            case LiteServerGetBlockProofRequest:
+            case LiteServerGetShardBlockProofRequest:
+            case LiteServerGetLibrariesWithProofRequest:
+                return 2;
+            default:
+                return 1;
+        }
+    }
+
+    async Task<byte[]> QueryLimitedAsync(
+        double cost,
+        Func<CancellationToken, Task<byte[]>> query,
+        CancellationToken cancellationToken)
+    {
+        await bucket.AcquireAsync(cost, cancellationToken);
+        if (concurrency == null) return await query(cancellationToken);
+
+        long ticket = await concurrency.AcquireAsync(cancellationToken);
+        bool? overloaded = null;
+        try
+        {
+            byte[] response = await query(cancellationToken);
+            overloaded = ResponseParser.IsError(response);
+            return response;
+        }
+        catch (Exception ex) when (!cancellationToken.IsCancellationRequested &&
+                                   ex is OperationCanceledException or TimeoutException)
+        {
+            // Timed out: the server is not keeping up
+            overloaded = true;
+            throw;
+        }
+        finally
+        {
+            concurrency.Release(ticket, overloaded);
+        }
+    }
+}
@@ -1,6 +1,7 @@
 using System;
 using System.Threading;
 using System.Threading.Tasks;
+using TonSdk.Adnl.LiteClient.Protocol;
 
 namespace TonSdk.Adnl.LiteClient;
 
@@ -33,6 +34,23 @@ public interface ILiteEngine : IDisposable
         int timeout = 30000,
         CancellationToken cancellationToken = default);
 
+    /// <summary>
+    ///     Execute a typed lite server request.
+    ///     Unlike the encoder overload, the request stays visible to decorators, so they can key on what is asked
+    ///     (caching, coalescing); engines that do not care can rely on this default, which encodes it.
+    /// </summary>
+    /// <param name="request">Lite server request</param>
+    /// <param name="timeout">Query timeout in milliseconds</param>
+    /// <param name="cancellationToken">Cancellation token</param>
+    /// <returns>Raw response buffer</returns>
+    Task<byte[]> QueryAsync(
+        ILiteServerRequest request,
+        int timeout = 30000,
+        CancellationToken cancellationToken = default)
+    {
+        return QueryAsync(() => Encoder.EncodeRequest(request), timeout, cancellationToken);
+    }
+
     /// <summary>
     ///     Event fired when connection is established.
     /// </summary>
@@ -1,9 +1,13 @@
 using System;
+using System.Collections.Generic;
+using System.Diagnostics;
 using System.Threading;
 using System.Threading.Tasks;
+using TonSdk.Adnl.Diagnostics;
 using TonSdk.Adnl.LiteClient.Engines;
 using TonSdk.Adnl.LiteClient.Protocol;
 using TonSdk.Adnl.LiteClient.Types;
+using TonSdk.Adnl.TL;
 using TonSdk.Core.Addresses;
 using TonSdk.Core.Cryptography;
 
@@ -69,9 +73,7 @@ public class LiteClient : IDisposable
     public async Task<LiteServerMasterchainInfo> GetMasterchainInfo(
         CancellationToken cancellationToken = default)
     {
-        byte[] response = await Engine.QueryAsync(
-            Encoder.EncodeMasterchainInfo,
-            cancellationToken: cancellationToken);
+        byte[] response = await Query(new LiteServerGetMasterchainInfoRequest(), cancellationToken);
 
         return Decoder.DecodeMasterchainInfo(response);
     }
@@ -83,9 +85,7 @@ public class LiteClient : IDisposable
         uint mode = 0,
         CancellationToken cancellationToken = default)
     {
-        byte[] response = await Engine.QueryAsync(
-            () => Encoder.EncodeMasterchainInfoExt(mode),
-            cancellationToken: cancellationToken);
+        byte[] response = await Query(new LiteServerGetMasterchainInfoExtRequest { Mode = mode }, cancellationToken);
 
         return Decoder.DecodeMasterchainInfoExt(response);
     }
@@ -96,9 +96,7 @@ public class LiteClient : IDisposable
     public async Task<LiteServerCurrentTime> GetTime(
         CancellationToken cancellationToken = default)
     {
-        byte[] response = await Engine.QueryAsync(
-            Encoder.EncodeTime,
-            cancellationToken: cancellationToken);
+        byte[] response = await Query(new LiteServerGetTimeRequest(), cancellationToken);
 
         return Decoder.DecodeTime(response);
     }
@@ -109,9 +107,7 @@ public class LiteClient : IDisposable
     public async Task<LiteServerVersion> GetVersion(
         CancellationToken cancellationToken = default)
     {
-        byte[] response = await Engine.QueryAsync(
-            Encoder.EncodeVersion,
-            cancellationToken: cancellationToken);
+        byte[] response = await Query(new LiteServerGetVersionRequest(), cancellationToken);
 
         return Decoder.DecodeVersion(response);
     }
@@ -123,13 +119,24 @@ public class LiteClient : IDisposable
         TonNodeBlockIdExt id,
         CancellationToken cancellationToken = default)
     {
-        byte[] response = await Engine.QueryAsync(
-            () => Encoder.EncodeBlock(id),
-            cancellationToken: cancellationToken);
+        byte[] response = await Query(new LiteServerGetBlockRequest { Id = id }, cancellationToken);
 
         return Decoder.DecodeBlock(response);
     }
 
+    /// <summary>
+    ///     Get block data as a zero-copy view: the block BoC is a slice of the response buffer.
+    ///     Use Materialize() when an owning LiteServerBlockData is needed.
+    /// </summary>
+    public async Task<LiteServerBlockDataView> GetBlockView(
+        TonNodeBlockIdExt id,
+        CancellationToken cancellationToken = default)
+    {
+        byte[] response = await Query(new LiteServerGetBlockRequest { Id = id }, cancellationToken);
+
+        return Decoder.DecodeBlockView(response);
+    }
+
     /// <summary>
     ///     Get block header
     /// </summary>
@@ -138,9 +145,7 @@ public class LiteClient : IDisposable
         uint mode = 0,
         CancellationToken cancellationToken = default)
     {
-        byte[] response = await Engine.QueryAsync(
-            () => Encoder.EncodeBlockHeader(id, mode),
-            cancellationToken: cancellationToken);
+        byte[] response = await Query(new LiteServerGetBlockHeaderRequest { Id = id, Mode = mode }, cancellationToken);
 
         return Decoder.DecodeBlockHeader(response);
     }
@@ -152,9 +157,7 @@ public class LiteClient : IDisposable
         TonNodeBlockIdExt id,
         CancellationToken cancellationToken = default)
     {
-        byte[] response = await Engine.QueryAsync(
-            () => Encoder.EncodeAllShardsInfo(id),
-            cancellationToken: cancellationToken);
+        byte[] response = await Query(new LiteServerGetAllShardsInfoRequest { Id = id }, cancellationToken);
 
         return Decoder.DecodeAllShardsInfo(response);
     }
@@ -170,16 +173,21 @@ public class LiteClient : IDisposable
         uint? utime = null,
         CancellationToken cancellationToken = default)
     {
+        // Only announce the optional fields that are actually present
         uint mode = 0;
         if (seqno.HasValue) mode |= 1;
         if (lt.HasValue) mode |= 2;
         if (utime.HasValue) mode |= 4;
 
-        TonNodeBlockId blockId = new(workchain, shard, seqno ?? 0);
+        LiteServerLookupBlockRequest request = new()
+        {
+            Mode = mode,
+            Id = new TonNodeBlockId(workchain, shard, seqno ?? 0),
+            Lt = lt ?? 0,
+            Utime = (int)(utime ?? 0)
+        };
 
-        byte[] response = await Engine.QueryAsync(
-            () => Encoder.EncodeLookupBlock(blockId, mode, lt, utime),
-            cancellationToken: cancellationToken);
+        byte[] response = await Query(request, cancellationToken);
 
         return Decoder.DecodeBlockHeader(response);
     }
@@ -196,19 +204,82 @@ public class LiteClient : IDisposable
         bool wantProof = false,
         CancellationToken cancellationToken = default)
     {
-        uint mode = 0;
+        uint mode = 7; // account, lt and hash of every transaction
         if (wantProof) mode |= 32; // bit 5
         if (reverseOrder) mode |= 64; // bit 6
         if (after != null) mode |= 128; // bit 7
 
-        byte[] response = await Engine.QueryAsync(
-            () => Encoder.EncodeListBlockTransactions(id, count, mode, after),
-            cancellationToken: cancellationToken);
+        LiteServerListBlockTransactionsRequest request = new()
+        {
+            Id = id,
+            Mode = mode,
+            Count = count,
+            After = after
+        };
+
+        byte[] response = await Query(request, cancellationToken);
 
         LiteServerBlockTransactions raw = Decoder.DecodeBlockTransactions(response);
         return BlockTransactionsList.FromRaw(raw);
     }
 
+    /// <summary>
+    ///     Stream every block from masterchain block <paramref name="fromSeqno" /> on, with all of its transactions:
+    ///     the shard blocks each masterchain block commits, then the masterchain block itself. The scan ends after
+    ///     <paramref name="toSeqno" />, or follows the chain head when it is null.
+    ///     Blocks are prefetched in parallel (see <see cref="BlockScannerOptions" />) but yielded in order, so the
+    ///     <see cref="ScannedBlock.MasterchainBlock" /> of a yielded masterchain block is a safe checkpoint to resume from.
+    /// </summary>
+    public IAsyncEnumerable<ScannedBlock> ScanBlocks(
+        int fromSeqno,
+        int? toSeqno = null,
+        BlockScannerOptions? options = null,
+        CancellationToken cancellationToken = default)
+    {
+        return new BlockScanner(this, options).ScanAsync(fromSeqno, toSeqno, null, cancellationToken);
+    }
+
+    /// <summary>
+    ///     Resume a scan after the masterchain block <paramref name="checkpoint" />, checking that the lite server
+    ///     still has that exact block.
+    /// </summary>
+    public IAsyncEnumerable<ScannedBlock> ScanBlocks(
+        TonNodeBlockIdExt checkpoint,
+        int? toSeqno = null,
+        BlockScannerOptions? options = null,
+        CancellationToken cancellationToken = default)
+    {
+        if (checkpoint.Workchain != -1)
+            throw new ArgumentException("Checkpoint must be a masterchain block", nameof(checkpoint));
+
+        return new BlockScanner(this, options).ScanAsync(checkpoint.Seqno + 1, toSeqno, checkpoint, cancellationToken);
+    }
+
+    /// <summary>
+    ///     Like <see cref="ScanBlocks(int, int?, BlockScannerOptions?, CancellationToken)" />, one transaction at a time.
+    /// </summary>
+    public IAsyncEnumerable<ScannedTransaction> ScanTransactions(
+        int fromSeqno,
+        int? toSeqno = null,
+        BlockScannerOptions? options = null,
+        CancellationToken cancellationToken = default)
+    {
+        return Flatten(ScanBlocks(fromSeqno, toSeqno, options, cancellationToken));
+    }
+
+    /// <summary>
+    ///     Like <see cref="ScanBlocks(TonNodeBlockIdExt, int?, BlockScannerOptions?, CancellationToken)" />, one
+    ///     transaction at a time.
+    /// </summary>
+    public IAsyncEnumerable<ScannedTransaction> ScanTransactions(
+        TonNodeBlockIdExt checkpoint,
+        int? toSeqno = null,
+        BlockScannerOptions? options = null,
+        CancellationToken cancellationToken = default)
+    {
+        return Flatten(ScanBlocks(checkpoint, toSeqno, options, cancellationToken));
+    }
+
     /// <summary>
     ///     Get account state with parsed balance, code, and data.
     ///     Returns user-friendly ClientAccountState with typed Coins and Cell objects.
@@ -221,17 +292,45 @@ public class LiteClient : IDisposable
         LiteServerAccountId accountId = new()
         {
             Workchain = address.Workchain,
-            Id = address.Hash
+            Id = new TLInt256(address.Hash)
         };
 
-        byte[] response = await Engine.QueryAsync(
-            () => Encoder.EncodeAccountState(id, accountId),
-            cancellationToken: cancellationToken);
+        byte[] response = await Query(new LiteServerGetAccountStateRequest { Id = id, Account = accountId },
+            cancellationToken);
 
         LiteServerAccountState raw = Decoder.DecodeAccountState(response);
         return ClientAccountState.FromRaw(raw, address);
     }
 
+    /// <summary>
+    ///     Get the states of many accounts at one block, streamed in the order their queries complete.
+    ///     Queries are pipelined with bounded concurrency (see <see cref="AccountStatesOptions" />) and parsed on the
+    ///     thread pool. An address whose query or parse fails yields a result carrying the error; the batch goes on.
+    /// </summary>
+    public IAsyncEnumerable<AccountStateResult> GetAccountStates(
+        TonNodeBlockIdExt id,
+        IEnumerable<Address> addresses,
+        AccountStatesOptions? options = null,
+        CancellationToken cancellationToken = default)
+    {
+        return new AccountStateBatch(this, options).RunAsync(id, addresses, cancellationToken);
+    }
+
+    /// <summary>
+    ///     Get the raw account state as a zero-copy view over the response buffer,
+    ///     for callers that only need the block ids or want to parse the proofs and state BoC themselves.
+    /// </summary>
+    public async Task<LiteServerAccountStateView> GetAccountStateView(
+        TonNodeBlockIdExt id,
+        LiteServerAccountId account,
+        CancellationToken cancellationToken = default)
+    {
+        byte[] response = await Query(new LiteServerGetAccountStateRequest { Id = id, Account = account },
+            cancellationToken);
+
+        return Decoder.DecodeAccountStateView(response);
+    }
+
     /// <summary>
     ///     Get transactions for an account
     /// </summary>
@@ -242,9 +341,15 @@ public class LiteClient : IDisposable
         byte[] hash,
         CancellationToken cancellationToken = default)
     {
-        byte[] response = await Engine.QueryAsync(
-            () => Encoder.EncodeTransactions(count, account, lt, hash),
-            cancellationToken: cancellationToken);
+        LiteServerGetTransactionsRequest request = new()
+        {
+            Count = count,
+            Account = account,
+            Lt = lt,
+            Hash = new TLInt256(hash)
+        };
+
+        byte[] response = await Query(request, cancellationToken);
 
         return Decoder.DecodeTransactions(response);
     }
@@ -256,8 +361,149 @@ public class LiteClient : IDisposable
         byte[] body,
         CancellationToken cancellationToken = default)
     {
-        return await Engine.QueryAsync(
-            () => Encoder.EncodeSendMessage(body),
-            cancellationToken: cancellationToken);
+        byte[] response = await Query(new LiteServerSendMessageRequest { Body = body }, cancellationToken);
+
+        return TLSerializer.ReadPayload(response, LiteServerSendMsgStatus.Constructor).ToArray();
+    }
+
+    /// <summary>
+    ///     Run a get-method of a smart contract.
+    ///     Mode 4 requests only the result stack; see liteServer.runSmcMethod for the proof bits.
+    /// </summary>
+    public async Task<LiteServerRunMethodResult> RunSmcMethod(
+        TonNodeBlockIdExt id,
+        Address address,
+        long methodId,
+        byte[] parameters,
+        uint mode = 4,
+        CancellationToken cancellationToken = default)
+    {
+        LiteServerRunSmcMethodRequest request = new()
+        {
+            Mode = mode,
+            Id = id,
+            Account = new LiteServerAccountId { Workchain = address.Workchain, Id = new TLInt256(address.Hash) },
+            MethodId = methodId,
+            Params = parameters
+        };
+
+        byte[] response = await Query(request, cancellationToken);
+        return Decoder.DecodeRunMethodResult(response);
+    }
+
+    /// <summary>
+    ///     Get selected configuration parameters
+    /// </summary>
+    public async Task<LiteServerConfigInfo> GetConfigParams(
+        TonNodeBlockIdExt id,
+        int[] paramList,
+        uint mode = 0,
+        CancellationToken cancellationToken = default)
+    {
+        LiteServerGetConfigParamsRequest request = new() { Mode = mode, Id = id, ParamList = paramList };
+
+        byte[] response = await Query(request, cancellationToken);
+        return Decoder.DecodeConfigInfo(response);
+    }
+
+    /// <summary>
+    ///     Get shard info for a workchain and shard in a given masterchain block
+    /// </summary>
+    public async Task<LiteServerShardInfo> GetShardInfo(
+        TonNodeBlockIdExt id,
+        int workchain,
+        long shard,
+        bool exact = false,
+        CancellationToken cancellationToken = default)
+    {
+        LiteServerGetShardInfoRequest request = new()
+        {
+            Id = id,
+            Workchain = workchain,
+            Shard = shard,
+            Exact = exact
+        };
+
+        byte[] response = await Query(request, cancellationToken);
+        return Decoder.DecodeShardInfo(response);
+    }
+
+    /// <summary>
+    ///     Get libraries by their 32-byte hashes
+    /// </summary>
+    public async Task<LiteServerLibraryResult> GetLibraries(
+        byte[][] libraryList,
+        CancellationToken cancellationToken = default)
+    {
+        TLInt256[] libraries = new TLInt256[libraryList.Length];
+        for (int i = 0; i < libraryList.Length; i++) libraries[i] = new TLInt256(libraryList[i]);
+
+        LiteServerGetLibrariesRequest request = new() { LibraryList = libraries };
+
+        byte[] response = await Query(request, cancellationToken);
+        return Decoder.DecodeLibraryResult(response);
+    }
+
+    /// <summary>
+    ///     Send any generated lite server request (see the *Request types in LiteClient.Protocol).
+    ///     Returns the boxed response (constructor included); decode it with TLSerializer.Read&lt;T&gt;.
+    ///     The request reaches the engine as is, so decorators such as <see cref="CachingEngine" /> can key on it.
+    ///     Each query is traced and timed through <see cref="AdnlTelemetry" /> when a listener is attached.
+    /// </summary>
+    public Task<byte[]> Query(
+        ILiteServerRequest request,
+        CancellationToken cancellationToken = default)
+    {
+        if (!AdnlTelemetry.IsQueryObserved)
+            return Engine.QueryAsync(request, cancellationToken: cancellationToken);
+
+        return QueryObservedAsync(request, cancellationToken);
+    }
+
+    static async IAsyncEnumerable<ScannedTransaction> Flatten(IAsyncEnumerable<ScannedBlock> blocks)
+    {
+        await foreach (ScannedBlock block in blocks.ConfigureAwait(false))
+        foreach (BlockTransaction transaction in block.Transactions)
+            yield return new ScannedTransaction(block.MasterchainBlock, block.Block, transaction);
+    }
+
+    async Task<byte[]> QueryObservedAsync(ILiteServerRequest request, CancellationToken cancellationToken)
+    {
+        string method = AdnlTelemetry.GetMethodName(request.GetType());
+        using Activity? activity = AdnlTelemetry.ActivitySource.StartActivity(method, ActivityKind.Client);
+        activity?.SetTag("rpc.system", "ton_liteserver");
+        activity?.SetTag("rpc.method", method);
+
+        AdnlEventSource log = AdnlEventSource.Log;
+        if (log.IsEnabled()) log.QueryStart(method);
+
+        long started = Stopwatch.GetTimestamp();
+        string status = "error";
+        try
+        {
+            byte[] response = await Engine.QueryAsync(request, cancellationToken: cancellationToken)
+                .ConfigureAwait(false);
+            status = ResponseParser.IsError(response) ? "server_error" : "ok";
+            if (status != "ok") activity?.SetStatus(ActivityStatusCode.Error, "liteServer.error");
+            return response;
+        }
+        catch (Exception e)
+        {
+            if (e is OperationCanceledException or TimeoutException)
+                status = cancellationToken.IsCancellationRequested ? "cancelled" : "timeout";
+
+            activity?.SetStatus(ActivityStatusCode.Error, e.Message);
+            if (log.IsEnabled()) log.QueryFailed(method, e.Message);
+            throw;
+        }
+        finally
+        {
+            double elapsedMs = AdnlTelemetry.ElapsedMs(started);
+            activity?.SetTag("tonsdk.status", status);
+            if (AdnlTelemetry.QueryDuration.Enabled)
+                AdnlTelemetry.QueryDuration.Record(elapsedMs, new KeyValuePair<string, object?>("method", method),
+                    new KeyValuePair<string, object?>("status", status));
+            if (log.IsEnabled()) log.QueryStop(method, status, elapsedMs);
+        }
     }
 }
\ No newline at end of file
@@ -25,67 +25,49 @@ internal static class AdnlProtocol
         byte[] queryId = AdnlKeys.GenerateRandomBytes(32);
 
         // Wrap in liteServer.query
-        TLWriteBuffer liteQueryWriter = new();
+        TLWriteBuffer liteQueryWriter = new(4 + TLWriteBuffer.GetBufferSize(liteServerQuery.Length));
         liteQueryWriter.WriteUInt32(LiteServerQuery);
         liteQueryWriter.WriteBuffer(liteServerQuery);
 
         // Wrap in adnl.message.query
-        TLWriteBuffer adnlWriter = new();
+        byte[] liteQuery = liteQueryWriter.Build();
+        TLWriteBuffer adnlWriter = new(4 + 32 + TLWriteBuffer.GetBufferSize(liteQuery.Length));
         adnlWriter.WriteUInt32(AdnlMessageQuery);
         adnlWriter.WriteInt256(new BigInteger(queryId));
-        adnlWriter.WriteBuffer(liteQueryWriter.Build());
+        adnlWriter.WriteBuffer(liteQuery);
 
         return (queryId, adnlWriter.Build());
     }
 
     /// <summary>
     ///     Unwrap ADNL response and extract query ID and lite server response.
-    ///     Returns (queryId, liteServerResponse) or null if it's a pong message.
+    ///     Returns false if it's a pong message.
+    ///     The response is a slice of <paramref name="data" />, not a copy.
     /// </summary>
-    public static (byte[] queryId, byte[] response)? UnwrapResponse(byte[] data)
+    public static bool TryUnwrapResponse(ReadOnlySpan<byte> data, out TLInt256 queryId, out ReadOnlySpan<byte> response)
     {
-        TLReadBuffer reader = new(data);
+        TLSpanReader reader = new(data);
+        queryId = TLInt256.Zero;
+        response = default;
 
         // Read ADNL message type
         uint messageType = reader.ReadUInt32();
 
         // Handle pong messages (heartbeat responses)
         if (messageType == TcpPong)
-            return null;
+            return false;
 
         // Verify it's an answer message
         if (messageType != AdnlMessageAnswer)
             throw new Exception($"Unexpected ADNL message type: 0x{messageType:X8}");
 
         // Read query ID (32 bytes)
-        byte[] queryId = reader.ReadBytes(32);
+        queryId = reader.ReadInt256();
 
-        // Read lite server response (length-prefixed)
-        byte[] liteServerResponse = reader.ReadBuffer();
+        // Locate lite server response (length-prefixed)
+        int offset = reader.SkipBuffer(out int length);
 
-        return (queryId, liteServerResponse);
+        response = data.Slice(offset, length);
+        return true;
     }
-
-    /// <summary>
-    ///     Check if response data is a lite server error.
-    ///     If it is, throws an exception with the error details.
-    ///     Otherwise returns the response data after the constructor.
-    /// </summary>
-    public static byte[] ValidateAndExtractResponse(byte[] liteServerResponse)
-    {
-        TLReadBuffer reader = new(liteServerResponse);
-
-        // Read response constructor
-        uint responseCode = reader.ReadUInt32();
-
-        // Check for liteServer.error
-        if (responseCode == LiteServerError.Constructor)
-        {
-            LiteServerError? error = LiteServerError.ReadFrom(reader);
-            throw new Exception($"LiteServer error {error.Code}: {error.Message}");
-        }
-
-        // Return remaining data (the actual response)
-        return reader.ReadObject();
-    }
-}
\ No newline at end of file
+}
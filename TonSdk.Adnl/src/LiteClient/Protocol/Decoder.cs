@@ -1,82 +1,108 @@
-using TonSdk.Adnl.TL;
+using System.Collections.Generic;
+using TonSdk.Adnl.Diagnostics;
 
 namespace TonSdk.Adnl.LiteClient.Protocol;
 
 /// <summary>
 ///     Decodes responses from the lite server protocol
-///     Uses auto-generated schema types from Schema.Generated.cs
+///     Uses auto-generated schema types from Schema.Generated.cs, dispatched through TLSerializer:
+///     the response constructor is checked once and liteServer.error surfaces as LiteServerException.
+///     Decode time is recorded per response type while the decode duration histogram has a listener.
 /// </summary>
 internal static class Decoder
 {
     public static LiteServerMasterchainInfo DecodeMasterchainInfo(byte[] data)
     {
-        TLReadBuffer reader = new(data);
-        return LiteServerMasterchainInfo.ReadFrom(reader);
+        return Read<LiteServerMasterchainInfo>(data);
     }
 
     public static LiteServerMasterchainInfoExt DecodeMasterchainInfoExt(byte[] data)
     {
-        TLReadBuffer reader = new(data);
-        return LiteServerMasterchainInfoExt.ReadFrom(reader);
+        return Read<LiteServerMasterchainInfoExt>(data);
     }
 
     public static LiteServerCurrentTime DecodeTime(byte[] data)
     {
-        TLReadBuffer reader = new(data);
-        return LiteServerCurrentTime.ReadFrom(reader);
+        return Read<LiteServerCurrentTime>(data);
     }
 
     public static LiteServerVersion DecodeVersion(byte[] data)
     {
-        TLReadBuffer reader = new(data);
-        return LiteServerVersion.ReadFrom(reader);
+        return Read<LiteServerVersion>(data);
     }
 
     public static LiteServerBlockData DecodeBlock(byte[] data)
     {
-        TLReadBuffer reader = new(data);
-        return LiteServerBlockData.ReadFrom(reader);
+        return Read<LiteServerBlockData>(data);
+    }
+
+    public static LiteServerBlockDataView DecodeBlockView(byte[] data)
+    {
+        return new LiteServerBlockDataView(TLSerializer.ReadPayload(data, LiteServerBlockData.Constructor));
     }
 
     public static LiteServerBlockHeader DecodeBlockHeader(byte[] data)
     {
-        TLReadBuffer reader = new(data);
-        return LiteServerBlockHeader.ReadFrom(reader);
+        return Read<LiteServerBlockHeader>(data);
     }
 
     public static LiteServerAllShardsInfo DecodeAllShardsInfo(byte[] data)
     {
-        TLReadBuffer reader = new(data);
-        return LiteServerAllShardsInfo.ReadFrom(reader);
+        return Read<LiteServerAllShardsInfo>(data);
     }
 
     public static LiteServerBlockTransactions DecodeBlockTransactions(byte[] data)
     {
-        TLReadBuffer reader = new(data);
-        return LiteServerBlockTransactions.ReadFrom(reader);
+        return Read<LiteServerBlockTransactions>(data);
     }
 
     public static LiteServerAccountState DecodeAccountState(byte[] data)
     {
-        TLReadBuffer reader = new(data);
-        return LiteServerAccountState.ReadFrom(reader);
+        return Read<LiteServerAccountState>(data);
+    }
+
+    public static LiteServerAccountStateView DecodeAccountStateView(byte[] data)
+    {
+        return new LiteServerAccountStateView(TLSerializer.ReadPayload(data, LiteServerAccountState.Constructor));
     }
 
     public static LiteServerTransactionList DecodeTransactions(byte[] data)
     {
-        TLReadBuffer reader = new(data);
-        return LiteServerTransactionList.ReadFrom(reader);
+        return Read<LiteServerTransactionList>(data);
     }
 
     public static LiteServerTransactionInfo DecodeTransactionInfo(byte[] data)
     {
-        TLReadBuffer reader = new(data);
-        return LiteServerTransactionInfo.ReadFrom(reader);
+        return Read<LiteServerTransactionInfo>(data);
     }
 
     public static LiteServerConfigInfo DecodeConfigInfo(byte[] data)
     {
-        TLReadBuffer reader = new(data);
-        return LiteServerConfigInfo.ReadFrom(reader);
+        return Read<LiteServerConfigInfo>(data);
+    }
+
+    public static LiteServerRunMethodResult DecodeRunMethodResult(byte[] data)
+    {
+        return Read<LiteServerRunMethodResult>(data);
+    }
+
+    public static LiteServerShardInfo DecodeShardInfo(byte[] data)
+    {
+        return Read<LiteServerShardInfo>(data);
+    }
+
+    public static LiteServerLibraryResult DecodeLibraryResult(byte[] data)
+    {
+        return Read<LiteServerLibraryResult>(data);
+    }
+
+    static T Read<T>(byte[] data)
+    {
+        long started = AdnlTelemetry.StartTimer(AdnlTelemetry.DecodeDuration);
+        T result = TLSerializer.Read<T>(data);
+        if (started != 0)
+            AdnlTelemetry.DecodeDuration.Record(AdnlTelemetry.ElapsedMs(started),
+                new KeyValuePair<string, object?>("type", AdnlTelemetry.GetMethodName(typeof(T))));
+        return result;
     }
-}
\ No newline at end of file
+}
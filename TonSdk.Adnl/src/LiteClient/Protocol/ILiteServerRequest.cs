@@ -0,0 +1,17 @@
+using TonSdk.Adnl.TL;
+
+namespace TonSdk.Adnl.LiteClient.Protocol;
+
+/// <summary>
+///     A lite server function call, implemented by the generated *Request types in Schema.Generated.cs.
+///     WriteTo emits the function constructor followed by its arguments.
+/// </summary>
+public interface ILiteServerRequest
+{
+    /// <summary>
+    ///     Exact number of bytes written by <see cref="WriteTo" />.
+    /// </summary>
+    int GetSerializedSize();
+
+    void WriteTo(TLWriteBuffer writer);
+}
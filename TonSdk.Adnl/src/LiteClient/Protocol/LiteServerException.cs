@@ -0,0 +1,22 @@
+using System;
+
+namespace TonSdk.Adnl.LiteClient.Protocol;
+
+/// <summary>
+///     A liteServer.error returned by the lite server in place of the requested result.
+/// </summary>
+public class LiteServerException : Exception
+{
+    public LiteServerException(int code, string message) : base($"LiteServer error {code}: {message}")
+    {
+        Code = code;
+        ServerMessage = message;
+    }
+
+    public int Code { get; }
+
+    /// <summary>
+    ///     Error message as sent by the server, without the code prefix.
+    /// </summary>
+    public string ServerMessage { get; }
+}
@@ -3,10 +3,12 @@
 // This is the protocol layer - raw TL types matching lite_api.tl exactly
 // For user-facing APIs, create domain models and map in LiteClient
 // Union types: Bool, adnl.Message, liteServer.BlockLink
+// Span codecs: ReadFrom(ref TLSpanReader) / WriteTo(ref TLSpanWriter)
 
 #nullable disable
 
 using System;
+using System.Collections.Generic;
 using TonSdk.Adnl.TL;
 
 namespace TonSdk.Adnl.LiteClient.Protocol
@@ -22,6 +24,7 @@ namespace TonSdk.Adnl.LiteClient.Protocol
     public abstract class LiteServerBlockLink
     {
         public abstract uint Constructor { get; }
+        public abstract int GetSerializedSize();
         public abstract void WriteTo(TLWriteBuffer writer);
 
         public static LiteServerBlockLink ReadFrom(TLReadBuffer reader)
@@ -37,6 +40,44 @@ namespace TonSdk.Adnl.LiteClient.Protocol
                     throw new Exception($"Unknown constructor 0x{constructor:X8} for liteServer.BlockLink");
             }
         }
+
+        public abstract void WriteTo(ref TLSpanWriter writer);
+
+        public static LiteServerBlockLink ReadFrom(ref TLSpanReader reader)
+        {
+            uint constructor = reader.ReadUInt32();
+            switch (constructor)
+            {
+                case 0x5353875B:
+                    return LiteServerBlockLinkBack.ReadFrom(ref reader);
+                case 0x775A5528:
+                    return LiteServerBlockLinkForward.ReadFrom(ref reader);
+                default:
+                    throw new Exception($"Unknown constructor 0x{constructor:X8} for liteServer.BlockLink");
+            }
+        }
+
+        public void WriteBoxedTo(TLWriteBuffer writer)
+        {
+            writer.WriteUInt32(Constructor);
+            WriteTo(writer);
+        }
+
+        public static LiteServerBlockLink ReadBoxedFrom(TLReadBuffer reader)
+        {
+            return ReadFrom(reader);
+        }
+
+        public void WriteBoxedTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32(Constructor);
+            WriteTo(ref writer);
+        }
+
+        public static LiteServerBlockLink ReadBoxedFrom(ref TLSpanReader reader)
+        {
+            return ReadFrom(ref reader);
+        }
     }
 
     // ============================================================================
@@ -59,6 +100,8 @@ namespace TonSdk.Adnl.LiteClient.Protocol
             Seqno = seqno;
         }
 
+        public int GetSerializedSize() => 16;
+
         public  void WriteTo(TLWriteBuffer writer)
         {
             writer.WriteInt32(Workchain);
@@ -74,6 +117,22 @@ namespace TonSdk.Adnl.LiteClient.Protocol
                 reader.ReadInt32()
             );
         }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteInt32(Workchain);
+            writer.WriteInt64(Shard);
+            writer.WriteInt32(Seqno);
+        }
+
+        public static TonNodeBlockId ReadFrom(ref TLSpanReader reader)
+        {
+            return new TonNodeBlockId(
+                reader.ReadInt32(),
+                reader.ReadInt64(),
+                reader.ReadInt32()
+            );
+        }
     }
 
     /// <summary>
@@ -84,10 +143,10 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         public readonly int Workchain;
         public readonly long Shard;
         public readonly int Seqno;
-        public readonly byte[] RootHash;
-        public readonly byte[] FileHash;
+        public readonly TLInt256 RootHash;
+        public readonly TLInt256 FileHash;
 
-        public TonNodeBlockIdExt(int workchain, long shard, int seqno, byte[] rootHash, byte[] fileHash)
+        public TonNodeBlockIdExt(int workchain, long shard, int seqno, TLInt256 rootHash, TLInt256 fileHash)
         {
             Workchain = workchain;
             Shard = shard;
@@ -96,13 +155,15 @@ namespace TonSdk.Adnl.LiteClient.Protocol
             FileHash = fileHash;
         }
 
+        public int GetSerializedSize() => 80;
+
         public  void WriteTo(TLWriteBuffer writer)
         {
             writer.WriteInt32(Workchain);
             writer.WriteInt64(Shard);
             writer.WriteInt32(Seqno);
-            writer.WriteBytes(RootHash, 32);
-            writer.WriteBytes(FileHash, 32);
+            writer.WriteInt256(RootHash);
+            writer.WriteInt256(FileHash);
         }
 
         public static TonNodeBlockIdExt ReadFrom(TLReadBuffer reader)
@@ -115,6 +176,26 @@ namespace TonSdk.Adnl.LiteClient.Protocol
                 reader.ReadInt256()
             );
         }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteInt32(Workchain);
+            writer.WriteInt64(Shard);
+            writer.WriteInt32(Seqno);
+            writer.WriteInt256(RootHash);
+            writer.WriteInt256(FileHash);
+        }
+
+        public static TonNodeBlockIdExt ReadFrom(ref TLSpanReader reader)
+        {
+            return new TonNodeBlockIdExt(
+                reader.ReadInt32(),
+                reader.ReadInt64(),
+                reader.ReadInt32(),
+                reader.ReadInt256(),
+                reader.ReadInt256()
+            );
+        }
     }
 
     /// <summary>
@@ -123,21 +204,23 @@ namespace TonSdk.Adnl.LiteClient.Protocol
     public readonly struct TonNodeZeroStateIdExt
     {
         public readonly int Workchain;
-        public readonly byte[] RootHash;
-        public readonly byte[] FileHash;
+        public readonly TLInt256 RootHash;
+        public readonly TLInt256 FileHash;
 
-        public TonNodeZeroStateIdExt(int workchain, byte[] rootHash, byte[] fileHash)
+        public TonNodeZeroStateIdExt(int workchain, TLInt256 rootHash, TLInt256 fileHash)
         {
             Workchain = workchain;
             RootHash = rootHash;
             FileHash = fileHash;
         }
 
+        public int GetSerializedSize() => 68;
+
         public  void WriteTo(TLWriteBuffer writer)
         {
             writer.WriteInt32(Workchain);
-            writer.WriteBytes(RootHash, 32);
-            writer.WriteBytes(FileHash, 32);
+            writer.WriteInt256(RootHash);
+            writer.WriteInt256(FileHash);
         }
 
         public static TonNodeZeroStateIdExt ReadFrom(TLReadBuffer reader)
@@ -148,6 +231,22 @@ namespace TonSdk.Adnl.LiteClient.Protocol
                 reader.ReadInt256()
             );
         }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteInt32(Workchain);
+            writer.WriteInt256(RootHash);
+            writer.WriteInt256(FileHash);
+        }
+
+        public static TonNodeZeroStateIdExt ReadFrom(ref TLSpanReader reader)
+        {
+            return new TonNodeZeroStateIdExt(
+                reader.ReadInt32(),
+                reader.ReadInt256(),
+                reader.ReadInt256()
+            );
+        }
     }
 
     // ============================================================================
@@ -164,6 +263,13 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         public int Code { get; set; }
         public string Message { get; set; } = string.Empty;
 
+        public int GetSerializedSize()
+        {
+            int size = 4;
+            size += TLWriteBuffer.GetStringSize(Message);
+            return size;
+        }
+
         public  void WriteTo(TLWriteBuffer writer)
         {
             writer.WriteInt32(Code);
@@ -178,6 +284,21 @@ namespace TonSdk.Adnl.LiteClient.Protocol
                 Message = reader.ReadString(),
             };
         }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteInt32(Code);
+            writer.WriteString(Message);
+        }
+
+        public static LiteServerError ReadFrom(ref TLSpanReader reader)
+        {
+            return new LiteServerError
+            {
+                Code = reader.ReadInt32(),
+                Message = reader.ReadString(),
+            };
+        }
     }
 
     /// <summary>
@@ -188,12 +309,14 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         public const uint Constructor = 0x88729074;
 
         public int Workchain { get; set; }
-        public byte[] Id { get; set; } = Array.Empty<byte>();
+        public TLInt256 Id { get; set; }
+
+        public int GetSerializedSize() => 36;
 
         public  void WriteTo(TLWriteBuffer writer)
         {
             writer.WriteInt32(Workchain);
-            writer.WriteBytes(Id, 32);
+            writer.WriteInt256(Id);
         }
 
         public static LiteServerAccountId ReadFrom(TLReadBuffer reader)
@@ -204,6 +327,21 @@ namespace TonSdk.Adnl.LiteClient.Protocol
                 Id = reader.ReadInt256(),
             };
         }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteInt32(Workchain);
+            writer.WriteInt256(Id);
+        }
+
+        public static LiteServerAccountId ReadFrom(ref TLSpanReader reader)
+        {
+            return new LiteServerAccountId
+            {
+                Workchain = reader.ReadInt32(),
+                Id = reader.ReadInt256(),
+            };
+        }
     }
 
     /// <summary>
@@ -213,12 +351,19 @@ namespace TonSdk.Adnl.LiteClient.Protocol
     {
         public const uint Constructor = 0xFC3C1D28;
 
-        public byte[] Hash { get; set; } = Array.Empty<byte>();
+        public TLInt256 Hash { get; set; }
         public byte[] Data { get; set; } = Array.Empty<byte>();
 
+        public int GetSerializedSize()
+        {
+            int size = 32;
+            size += TLWriteBuffer.GetBufferSize(Data.Length);
+            return size;
+        }
+
         public  void WriteTo(TLWriteBuffer writer)
         {
-            writer.WriteBytes(Hash, 32);
+            writer.WriteInt256(Hash);
             writer.WriteBuffer(Data);
         }
 
@@ -230,6 +375,21 @@ namespace TonSdk.Adnl.LiteClient.Protocol
                 Data = reader.ReadBuffer(),
             };
         }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteInt256(Hash);
+            writer.WriteBuffer(Data);
+        }
+
+        public static LiteServerLibraryEntry ReadFrom(ref TLSpanReader reader)
+        {
+            return new LiteServerLibraryEntry
+            {
+                Hash = reader.ReadInt256(),
+                Data = reader.ReadBuffer(),
+            };
+        }
     }
 
     /// <summary>
@@ -240,13 +400,15 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         public const uint Constructor = 0xF9333637;
 
         public TonNodeBlockIdExt Last { get; set; }
-        public byte[] StateRootHash { get; set; } = Array.Empty<byte>();
+        public TLInt256 StateRootHash { get; set; }
         public TonNodeZeroStateIdExt Init { get; set; }
 
+        public int GetSerializedSize() => 180;
+
         public  void WriteTo(TLWriteBuffer writer)
         {
             Last.WriteTo(writer);
-            writer.WriteBytes(StateRootHash, 32);
+            writer.WriteInt256(StateRootHash);
             Init.WriteTo(writer);
         }
 
@@ -259,6 +421,23 @@ namespace TonSdk.Adnl.LiteClient.Protocol
                 Init = TonNodeZeroStateIdExt.ReadFrom(reader),
             };
         }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            Last.WriteTo(ref writer);
+            writer.WriteInt256(StateRootHash);
+            Init.WriteTo(ref writer);
+        }
+
+        public static LiteServerMasterchainInfo ReadFrom(ref TLSpanReader reader)
+        {
+            return new LiteServerMasterchainInfo
+            {
+                Last = TonNodeBlockIdExt.ReadFrom(ref reader),
+                StateRootHash = reader.ReadInt256(),
+                Init = TonNodeZeroStateIdExt.ReadFrom(ref reader),
+            };
+        }
     }
 
     /// <summary>
@@ -274,9 +453,11 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         public TonNodeBlockIdExt Last { get; set; }
         public int LastUtime { get; set; }
         public int Now { get; set; }
-        public byte[] StateRootHash { get; set; } = Array.Empty<byte>();
+        public TLInt256 StateRootHash { get; set; }
         public TonNodeZeroStateIdExt Init { get; set; }
 
+        public int GetSerializedSize() => 204;
+
         public  void WriteTo(TLWriteBuffer writer)
         {
             writer.WriteUInt32(Mode);
@@ -285,7 +466,7 @@ namespace TonSdk.Adnl.LiteClient.Protocol
             Last.WriteTo(writer);
             writer.WriteInt32(LastUtime);
             writer.WriteInt32(Now);
-            writer.WriteBytes(StateRootHash, 32);
+            writer.WriteInt256(StateRootHash);
             Init.WriteTo(writer);
         }
 
@@ -303,6 +484,33 @@ namespace TonSdk.Adnl.LiteClient.Protocol
                 Init = TonNodeZeroStateIdExt.ReadFrom(reader),
             };
         }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32(Mode);
+            writer.WriteInt32(Version);
+            writer.WriteInt64(Capabilities);
+            Last.WriteTo(ref writer);
+            writer.WriteInt32(LastUtime);
+            writer.WriteInt32(Now);
+            writer.WriteInt256(StateRootHash);
+            Init.WriteTo(ref writer);
+        }
+
+        public static LiteServerMasterchainInfoExt ReadFrom(ref TLSpanReader reader)
+        {
+            return new LiteServerMasterchainInfoExt
+            {
+                Mode = reader.ReadUInt32(),
+                Version = reader.ReadInt32(),
+                Capabilities = reader.ReadInt64(),
+                Last = TonNodeBlockIdExt.ReadFrom(ref reader),
+                LastUtime = reader.ReadInt32(),
+                Now = reader.ReadInt32(),
+                StateRootHash = reader.ReadInt256(),
+                Init = TonNodeZeroStateIdExt.ReadFrom(ref reader),
+            };
+        }
     }
 
     /// <summary>
@@ -314,6 +522,8 @@ namespace TonSdk.Adnl.LiteClient.Protocol
 
         public int Now { get; set; }
 
+        public int GetSerializedSize() => 4;
+
         public  void WriteTo(TLWriteBuffer writer)
         {
             writer.WriteInt32(Now);
@@ -326,6 +536,19 @@ namespace TonSdk.Adnl.LiteClient.Protocol
                 Now = reader.ReadInt32(),
             };
         }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteInt32(Now);
+        }
+
+        public static LiteServerCurrentTime ReadFrom(ref TLSpanReader reader)
+        {
+            return new LiteServerCurrentTime
+            {
+                Now = reader.ReadInt32(),
+            };
+        }
     }
 
     /// <summary>
@@ -340,6 +563,8 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         public long Capabilities { get; set; }
         public int Now { get; set; }
 
+        public int GetSerializedSize() => 20;
+
         public  void WriteTo(TLWriteBuffer writer)
         {
             writer.WriteUInt32(Mode);
@@ -358,6 +583,25 @@ namespace TonSdk.Adnl.LiteClient.Protocol
                 Now = reader.ReadInt32(),
             };
         }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32(Mode);
+            writer.WriteInt32(Version);
+            writer.WriteInt64(Capabilities);
+            writer.WriteInt32(Now);
+        }
+
+        public static LiteServerVersion ReadFrom(ref TLSpanReader reader)
+        {
+            return new LiteServerVersion
+            {
+                Mode = reader.ReadUInt32(),
+                Version = reader.ReadInt32(),
+                Capabilities = reader.ReadInt64(),
+                Now = reader.ReadInt32(),
+            };
+        }
     }
 
     /// <summary>
@@ -370,6 +614,13 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         public TonNodeBlockIdExt Id { get; set; }
         public byte[] Data { get; set; } = Array.Empty<byte>();
 
+        public int GetSerializedSize()
+        {
+            int size = 80;
+            size += TLWriteBuffer.GetBufferSize(Data.Length);
+            return size;
+        }
+
         public  void WriteTo(TLWriteBuffer writer)
         {
             Id.WriteTo(writer);
@@ -384,6 +635,21 @@ namespace TonSdk.Adnl.LiteClient.Protocol
                 Data = reader.ReadBuffer(),
             };
         }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            Id.WriteTo(ref writer);
+            writer.WriteBuffer(Data);
+        }
+
+        public static LiteServerBlockData ReadFrom(ref TLSpanReader reader)
+        {
+            return new LiteServerBlockData
+            {
+                Id = TonNodeBlockIdExt.ReadFrom(ref reader),
+                Data = reader.ReadBuffer(),
+            };
+        }
     }
 
     /// <summary>
@@ -394,15 +660,22 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         public const uint Constructor = 0x6A14E75E;
 
         public TonNodeBlockIdExt Id { get; set; }
-        public byte[] RootHash { get; set; } = Array.Empty<byte>();
-        public byte[] FileHash { get; set; } = Array.Empty<byte>();
+        public TLInt256 RootHash { get; set; }
+        public TLInt256 FileHash { get; set; }
         public byte[] Data { get; set; } = Array.Empty<byte>();
 
+        public int GetSerializedSize()
+        {
+            int size = 144;
+            size += TLWriteBuffer.GetBufferSize(Data.Length);
+            return size;
+        }
+
         public  void WriteTo(TLWriteBuffer writer)
         {
             Id.WriteTo(writer);
-            writer.WriteBytes(RootHash, 32);
-            writer.WriteBytes(FileHash, 32);
+            writer.WriteInt256(RootHash);
+            writer.WriteInt256(FileHash);
             writer.WriteBuffer(Data);
         }
 
@@ -416,6 +689,25 @@ namespace TonSdk.Adnl.LiteClient.Protocol
                 Data = reader.ReadBuffer(),
             };
         }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            Id.WriteTo(ref writer);
+            writer.WriteInt256(RootHash);
+            writer.WriteInt256(FileHash);
+            writer.WriteBuffer(Data);
+        }
+
+        public static LiteServerBlockState ReadFrom(ref TLSpanReader reader)
+        {
+            return new LiteServerBlockState
+            {
+                Id = TonNodeBlockIdExt.ReadFrom(ref reader),
+                RootHash = reader.ReadInt256(),
+                FileHash = reader.ReadInt256(),
+                Data = reader.ReadBuffer(),
+            };
+        }
     }
 
     /// <summary>
@@ -429,6 +721,13 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         public uint Mode { get; set; }
         public byte[] HeaderProof { get; set; } = Array.Empty<byte>();
 
+        public int GetSerializedSize()
+        {
+            int size = 84;
+            size += TLWriteBuffer.GetBufferSize(HeaderProof.Length);
+            return size;
+        }
+
         public  void WriteTo(TLWriteBuffer writer)
         {
             Id.WriteTo(writer);
@@ -445,6 +744,23 @@ namespace TonSdk.Adnl.LiteClient.Protocol
                 HeaderProof = reader.ReadBuffer(),
             };
         }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            Id.WriteTo(ref writer);
+            writer.WriteUInt32(Mode);
+            writer.WriteBuffer(HeaderProof);
+        }
+
+        public static LiteServerBlockHeader ReadFrom(ref TLSpanReader reader)
+        {
+            return new LiteServerBlockHeader
+            {
+                Id = TonNodeBlockIdExt.ReadFrom(ref reader),
+                Mode = reader.ReadUInt32(),
+                HeaderProof = reader.ReadBuffer(),
+            };
+        }
     }
 
     /// <summary>
@@ -456,6 +772,8 @@ namespace TonSdk.Adnl.LiteClient.Protocol
 
         public int Status { get; set; }
 
+        public int GetSerializedSize() => 4;
+
         public  void WriteTo(TLWriteBuffer writer)
         {
             writer.WriteInt32(Status);
@@ -468,6 +786,19 @@ namespace TonSdk.Adnl.LiteClient.Protocol
                 Status = reader.ReadInt32(),
             };
         }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteInt32(Status);
+        }
+
+        public static LiteServerSendMsgStatus ReadFrom(ref TLSpanReader reader)
+        {
+            return new LiteServerSendMsgStatus
+            {
+                Status = reader.ReadInt32(),
+            };
+        }
     }
 
     /// <summary>
@@ -483,6 +814,15 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         public byte[] Proof { get; set; } = Array.Empty<byte>();
         public byte[] State { get; set; } = Array.Empty<byte>();
 
+        public int GetSerializedSize()
+        {
+            int size = 160;
+            size += TLWriteBuffer.GetBufferSize(ShardProof.Length);
+            size += TLWriteBuffer.GetBufferSize(Proof.Length);
+            size += TLWriteBuffer.GetBufferSize(State.Length);
+            return size;
+        }
+
         public  void WriteTo(TLWriteBuffer writer)
         {
             Id.WriteTo(writer);
@@ -503,6 +843,27 @@ namespace TonSdk.Adnl.LiteClient.Protocol
                 State = reader.ReadBuffer(),
             };
         }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            Id.WriteTo(ref writer);
+            Shardblk.WriteTo(ref writer);
+            writer.WriteBuffer(ShardProof);
+            writer.WriteBuffer(Proof);
+            writer.WriteBuffer(State);
+        }
+
+        public static LiteServerAccountState ReadFrom(ref TLSpanReader reader)
+        {
+            return new LiteServerAccountState
+            {
+                Id = TonNodeBlockIdExt.ReadFrom(ref reader),
+                Shardblk = TonNodeBlockIdExt.ReadFrom(ref reader),
+                ShardProof = reader.ReadBuffer(),
+                Proof = reader.ReadBuffer(),
+                State = reader.ReadBuffer(),
+            };
+        }
     }
 
     /// <summary>
@@ -523,14 +884,44 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         public int ExitCode { get; set; }
         public byte[] Result { get; set; } = Array.Empty<byte>();
 
-        public  void WriteTo(TLWriteBuffer writer)
+        public int GetSerializedSize()
         {
-            writer.WriteUInt32(Mode);
-            Id.WriteTo(writer);
-            Shardblk.WriteTo(writer);
+            int size = 168;
             if ((Mode & (1u << 0)) != 0)
             {
-                writer.WriteBuffer(ShardProof);
+                size += TLWriteBuffer.GetBufferSize(ShardProof.Length);
+            }
+            if ((Mode & (1u << 0)) != 0)
+            {
+                size += TLWriteBuffer.GetBufferSize(Proof.Length);
+            }
+            if ((Mode & (1u << 1)) != 0)
+            {
+                size += TLWriteBuffer.GetBufferSize(StateProof.Length);
+            }
+            if ((Mode & (1u << 3)) != 0)
+            {
+                size += TLWriteBuffer.GetBufferSize(InitC7.Length);
+            }
+            if ((Mode & (1u << 4)) != 0)
+            {
+                size += TLWriteBuffer.GetBufferSize(LibExtras.Length);
+            }
+            if ((Mode & (1u << 2)) != 0)
+            {
+                size += TLWriteBuffer.GetBufferSize(Result.Length);
+            }
+            return size;
+        }
+
+        public  void WriteTo(TLWriteBuffer writer)
+        {
+            writer.WriteUInt32(Mode);
+            Id.WriteTo(writer);
+            Shardblk.WriteTo(writer);
+            if ((Mode & (1u << 0)) != 0)
+            {
+                writer.WriteBuffer(ShardProof);
             }
             if ((Mode & (1u << 0)) != 0)
             {
@@ -576,6 +967,60 @@ namespace TonSdk.Adnl.LiteClient.Protocol
                 result.Result = reader.ReadBuffer();
             return result;
         }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32(Mode);
+            Id.WriteTo(ref writer);
+            Shardblk.WriteTo(ref writer);
+            if ((Mode & (1u << 0)) != 0)
+            {
+                writer.WriteBuffer(ShardProof);
+            }
+            if ((Mode & (1u << 0)) != 0)
+            {
+                writer.WriteBuffer(Proof);
+            }
+            if ((Mode & (1u << 1)) != 0)
+            {
+                writer.WriteBuffer(StateProof);
+            }
+            if ((Mode & (1u << 3)) != 0)
+            {
+                writer.WriteBuffer(InitC7);
+            }
+            if ((Mode & (1u << 4)) != 0)
+            {
+                writer.WriteBuffer(LibExtras);
+            }
+            writer.WriteInt32(ExitCode);
+            if ((Mode & (1u << 2)) != 0)
+            {
+                writer.WriteBuffer(Result);
+            }
+        }
+
+        public static LiteServerRunMethodResult ReadFrom(ref TLSpanReader reader)
+        {
+            var result = new LiteServerRunMethodResult();
+            result.Mode = reader.ReadUInt32();
+            result.Id = TonNodeBlockIdExt.ReadFrom(ref reader);
+            result.Shardblk = TonNodeBlockIdExt.ReadFrom(ref reader);
+            if ((result.Mode & (1u << 0)) != 0)
+                result.ShardProof = reader.ReadBuffer();
+            if ((result.Mode & (1u << 0)) != 0)
+                result.Proof = reader.ReadBuffer();
+            if ((result.Mode & (1u << 1)) != 0)
+                result.StateProof = reader.ReadBuffer();
+            if ((result.Mode & (1u << 3)) != 0)
+                result.InitC7 = reader.ReadBuffer();
+            if ((result.Mode & (1u << 4)) != 0)
+                result.LibExtras = reader.ReadBuffer();
+            result.ExitCode = reader.ReadInt32();
+            if ((result.Mode & (1u << 2)) != 0)
+                result.Result = reader.ReadBuffer();
+            return result;
+        }
     }
 
     /// <summary>
@@ -590,6 +1035,14 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         public byte[] ShardProof { get; set; } = Array.Empty<byte>();
         public byte[] ShardDescr { get; set; } = Array.Empty<byte>();
 
+        public int GetSerializedSize()
+        {
+            int size = 160;
+            size += TLWriteBuffer.GetBufferSize(ShardProof.Length);
+            size += TLWriteBuffer.GetBufferSize(ShardDescr.Length);
+            return size;
+        }
+
         public  void WriteTo(TLWriteBuffer writer)
         {
             Id.WriteTo(writer);
@@ -608,6 +1061,25 @@ namespace TonSdk.Adnl.LiteClient.Protocol
                 ShardDescr = reader.ReadBuffer(),
             };
         }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            Id.WriteTo(ref writer);
+            Shardblk.WriteTo(ref writer);
+            writer.WriteBuffer(ShardProof);
+            writer.WriteBuffer(ShardDescr);
+        }
+
+        public static LiteServerShardInfo ReadFrom(ref TLSpanReader reader)
+        {
+            return new LiteServerShardInfo
+            {
+                Id = TonNodeBlockIdExt.ReadFrom(ref reader),
+                Shardblk = TonNodeBlockIdExt.ReadFrom(ref reader),
+                ShardProof = reader.ReadBuffer(),
+                ShardDescr = reader.ReadBuffer(),
+            };
+        }
     }
 
     /// <summary>
@@ -621,6 +1093,14 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         public byte[] Proof { get; set; } = Array.Empty<byte>();
         public byte[] Data { get; set; } = Array.Empty<byte>();
 
+        public int GetSerializedSize()
+        {
+            int size = 80;
+            size += TLWriteBuffer.GetBufferSize(Proof.Length);
+            size += TLWriteBuffer.GetBufferSize(Data.Length);
+            return size;
+        }
+
         public  void WriteTo(TLWriteBuffer writer)
         {
             Id.WriteTo(writer);
@@ -637,6 +1117,23 @@ namespace TonSdk.Adnl.LiteClient.Protocol
                 Data = reader.ReadBuffer(),
             };
         }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            Id.WriteTo(ref writer);
+            writer.WriteBuffer(Proof);
+            writer.WriteBuffer(Data);
+        }
+
+        public static LiteServerAllShardsInfo ReadFrom(ref TLSpanReader reader)
+        {
+            return new LiteServerAllShardsInfo
+            {
+                Id = TonNodeBlockIdExt.ReadFrom(ref reader),
+                Proof = reader.ReadBuffer(),
+                Data = reader.ReadBuffer(),
+            };
+        }
     }
 
     /// <summary>
@@ -650,6 +1147,14 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         public byte[] Proof { get; set; } = Array.Empty<byte>();
         public byte[] Transaction { get; set; } = Array.Empty<byte>();
 
+        public int GetSerializedSize()
+        {
+            int size = 80;
+            size += TLWriteBuffer.GetBufferSize(Proof.Length);
+            size += TLWriteBuffer.GetBufferSize(Transaction.Length);
+            return size;
+        }
+
         public  void WriteTo(TLWriteBuffer writer)
         {
             Id.WriteTo(writer);
@@ -666,6 +1171,23 @@ namespace TonSdk.Adnl.LiteClient.Protocol
                 Transaction = reader.ReadBuffer(),
             };
         }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            Id.WriteTo(ref writer);
+            writer.WriteBuffer(Proof);
+            writer.WriteBuffer(Transaction);
+        }
+
+        public static LiteServerTransactionInfo ReadFrom(ref TLSpanReader reader)
+        {
+            return new LiteServerTransactionInfo
+            {
+                Id = TonNodeBlockIdExt.ReadFrom(ref reader),
+                Proof = reader.ReadBuffer(),
+                Transaction = reader.ReadBuffer(),
+            };
+        }
     }
 
     /// <summary>
@@ -678,6 +1200,14 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         public TonNodeBlockIdExt[] Ids { get; set; } = Array.Empty<TonNodeBlockIdExt>();
         public byte[] Transactions { get; set; } = Array.Empty<byte>();
 
+        public int GetSerializedSize()
+        {
+            int size = 4;
+            size += Ids.Length * 80;
+            size += TLWriteBuffer.GetBufferSize(Transactions.Length);
+            return size;
+        }
+
         public  void WriteTo(TLWriteBuffer writer)
         {
             writer.WriteUInt32((uint)Ids.Length);
@@ -691,7 +1221,7 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         public static LiteServerTransactionList ReadFrom(TLReadBuffer reader)
         {
             var result = new LiteServerTransactionList();
-            uint idsCount = reader.ReadUInt32();
+            int idsCount = reader.ReadVectorCount(80);
             result.Ids = new TonNodeBlockIdExt[idsCount];
             for (int i = 0; i < idsCount; i++)
             {
@@ -700,6 +1230,29 @@ namespace TonSdk.Adnl.LiteClient.Protocol
             result.Transactions = reader.ReadBuffer();
             return result;
         }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32((uint)Ids.Length);
+                foreach (var item in Ids)
+                {
+                    item.WriteTo(ref writer);
+                }
+            writer.WriteBuffer(Transactions);
+        }
+
+        public static LiteServerTransactionList ReadFrom(ref TLSpanReader reader)
+        {
+            var result = new LiteServerTransactionList();
+            int idsCount = reader.ReadVectorCount(80);
+            result.Ids = new TonNodeBlockIdExt[idsCount];
+            for (int i = 0; i < idsCount; i++)
+            {
+                result.Ids[i] = TonNodeBlockIdExt.ReadFrom(ref reader);
+            }
+            result.Transactions = reader.ReadBuffer();
+            return result;
+        }
     }
 
     /// <summary>
@@ -714,6 +1267,8 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         public LiteServerAccountId Initiator { get; set; }
         public long InitiatorLt { get; set; }
 
+        public int GetSerializedSize() => 52;
+
         public  void WriteTo(TLWriteBuffer writer)
         {
             writer.WriteUInt32(Mode);
@@ -732,6 +1287,25 @@ namespace TonSdk.Adnl.LiteClient.Protocol
                 InitiatorLt = reader.ReadInt64(),
             };
         }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32(Mode);
+            writer.WriteInt32(Depth);
+            Initiator.WriteTo(ref writer);
+            writer.WriteInt64(InitiatorLt);
+        }
+
+        public static LiteServerTransactionMetadata ReadFrom(ref TLSpanReader reader)
+        {
+            return new LiteServerTransactionMetadata
+            {
+                Mode = reader.ReadUInt32(),
+                Depth = reader.ReadInt32(),
+                Initiator = LiteServerAccountId.ReadFrom(ref reader),
+                InitiatorLt = reader.ReadInt64(),
+            };
+        }
     }
 
     /// <summary>
@@ -742,17 +1316,39 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         public const uint Constructor = 0xE944EBD2;
 
         public uint Mode { get; set; }
-        public byte[] Account { get; set; } = Array.Empty<byte>();
+        public TLInt256 Account { get; set; }
         public long Lt { get; set; }
-        public byte[] Hash { get; set; } = Array.Empty<byte>();
+        public TLInt256 Hash { get; set; }
         public LiteServerTransactionMetadata Metadata { get; set; }
 
+        public int GetSerializedSize()
+        {
+            int size = 4;
+            if ((Mode & (1u << 0)) != 0)
+            {
+                size += 32;
+            }
+            if ((Mode & (1u << 1)) != 0)
+            {
+                size += 8;
+            }
+            if ((Mode & (1u << 2)) != 0)
+            {
+                size += 32;
+            }
+            if ((Mode & (1u << 8)) != 0)
+            {
+                size += 52;
+            }
+            return size;
+        }
+
         public  void WriteTo(TLWriteBuffer writer)
         {
             writer.WriteUInt32(Mode);
             if ((Mode & (1u << 0)) != 0)
             {
-                writer.WriteBytes(Account, 32);
+                writer.WriteInt256(Account);
             }
             if ((Mode & (1u << 1)) != 0)
             {
@@ -760,7 +1356,7 @@ namespace TonSdk.Adnl.LiteClient.Protocol
             }
             if ((Mode & (1u << 2)) != 0)
             {
-                writer.WriteBytes(Hash, 32);
+                writer.WriteInt256(Hash);
             }
             if ((Mode & (1u << 8)) != 0)
             {
@@ -782,6 +1378,42 @@ namespace TonSdk.Adnl.LiteClient.Protocol
                 result.Metadata = LiteServerTransactionMetadata.ReadFrom(reader);
             return result;
         }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32(Mode);
+            if ((Mode & (1u << 0)) != 0)
+            {
+                writer.WriteInt256(Account);
+            }
+            if ((Mode & (1u << 1)) != 0)
+            {
+                writer.WriteInt64(Lt);
+            }
+            if ((Mode & (1u << 2)) != 0)
+            {
+                writer.WriteInt256(Hash);
+            }
+            if ((Mode & (1u << 8)) != 0)
+            {
+                Metadata.WriteTo(ref writer);
+            }
+        }
+
+        public static LiteServerTransactionId ReadFrom(ref TLSpanReader reader)
+        {
+            var result = new LiteServerTransactionId();
+            result.Mode = reader.ReadUInt32();
+            if ((result.Mode & (1u << 0)) != 0)
+                result.Account = reader.ReadInt256();
+            if ((result.Mode & (1u << 1)) != 0)
+                result.Lt = reader.ReadInt64();
+            if ((result.Mode & (1u << 2)) != 0)
+                result.Hash = reader.ReadInt256();
+            if ((result.Mode & (1u << 8)) != 0)
+                result.Metadata = LiteServerTransactionMetadata.ReadFrom(ref reader);
+            return result;
+        }
     }
 
     /// <summary>
@@ -791,12 +1423,14 @@ namespace TonSdk.Adnl.LiteClient.Protocol
     {
         public const uint Constructor = 0xAD4463EC;
 
-        public byte[] Account { get; set; } = Array.Empty<byte>();
+        public TLInt256 Account { get; set; }
         public long Lt { get; set; }
 
+        public int GetSerializedSize() => 40;
+
         public  void WriteTo(TLWriteBuffer writer)
         {
-            writer.WriteBytes(Account, 32);
+            writer.WriteInt256(Account);
             writer.WriteInt64(Lt);
         }
 
@@ -808,6 +1442,21 @@ namespace TonSdk.Adnl.LiteClient.Protocol
                 Lt = reader.ReadInt64(),
             };
         }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteInt256(Account);
+            writer.WriteInt64(Lt);
+        }
+
+        public static LiteServerTransactionId3 ReadFrom(ref TLSpanReader reader)
+        {
+            return new LiteServerTransactionId3
+            {
+                Account = reader.ReadInt256(),
+                Lt = reader.ReadInt64(),
+            };
+        }
     }
 
     /// <summary>
@@ -823,6 +1472,15 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         public LiteServerTransactionId[] Ids { get; set; } = Array.Empty<LiteServerTransactionId>();
         public byte[] Proof { get; set; } = Array.Empty<byte>();
 
+        public int GetSerializedSize()
+        {
+            int size = 92;
+            foreach (var item in Ids)
+                size += item.GetSerializedSize();
+            size += TLWriteBuffer.GetBufferSize(Proof.Length);
+            return size;
+        }
+
         public  void WriteTo(TLWriteBuffer writer)
         {
             Id.WriteTo(writer);
@@ -842,7 +1500,7 @@ namespace TonSdk.Adnl.LiteClient.Protocol
             result.Id = TonNodeBlockIdExt.ReadFrom(reader);
             result.ReqCount = reader.ReadUInt32();
             result.Incomplete = reader.ReadBool();
-            uint idsCount = reader.ReadUInt32();
+            int idsCount = reader.ReadVectorCount(4);
             result.Ids = new LiteServerTransactionId[idsCount];
             for (int i = 0; i < idsCount; i++)
             {
@@ -851,6 +1509,35 @@ namespace TonSdk.Adnl.LiteClient.Protocol
             result.Proof = reader.ReadBuffer();
             return result;
         }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            Id.WriteTo(ref writer);
+            writer.WriteUInt32(ReqCount);
+            writer.WriteBool(Incomplete);
+            writer.WriteUInt32((uint)Ids.Length);
+                foreach (var item in Ids)
+                {
+                    item.WriteTo(ref writer);
+                }
+            writer.WriteBuffer(Proof);
+        }
+
+        public static LiteServerBlockTransactions ReadFrom(ref TLSpanReader reader)
+        {
+            var result = new LiteServerBlockTransactions();
+            result.Id = TonNodeBlockIdExt.ReadFrom(ref reader);
+            result.ReqCount = reader.ReadUInt32();
+            result.Incomplete = reader.ReadBool();
+            int idsCount = reader.ReadVectorCount(4);
+            result.Ids = new LiteServerTransactionId[idsCount];
+            for (int i = 0; i < idsCount; i++)
+            {
+                result.Ids[i] = LiteServerTransactionId.ReadFrom(ref reader);
+            }
+            result.Proof = reader.ReadBuffer();
+            return result;
+        }
     }
 
     /// <summary>
@@ -866,6 +1553,14 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         public byte[] Transactions { get; set; } = Array.Empty<byte>();
         public byte[] Proof { get; set; } = Array.Empty<byte>();
 
+        public int GetSerializedSize()
+        {
+            int size = 88;
+            size += TLWriteBuffer.GetBufferSize(Transactions.Length);
+            size += TLWriteBuffer.GetBufferSize(Proof.Length);
+            return size;
+        }
+
         public  void WriteTo(TLWriteBuffer writer)
         {
             Id.WriteTo(writer);
@@ -886,21 +1581,49 @@ namespace TonSdk.Adnl.LiteClient.Protocol
                 Proof = reader.ReadBuffer(),
             };
         }
-    }
-
-    /// <summary>
-    /// liteServer.signature = liteServer.Signature
-    /// </summary>
-    public class LiteServerSignature
-    {
-        public const uint Constructor = 0x78AB7D2A;
-
-        public byte[] NodeIdShort { get; set; } = Array.Empty<byte>();
-        public byte[] Signature { get; set; } = Array.Empty<byte>();
 
-        public  void WriteTo(TLWriteBuffer writer)
+        public  void WriteTo(ref TLSpanWriter writer)
         {
-            writer.WriteBuffer(NodeIdShort);
+            Id.WriteTo(ref writer);
+            writer.WriteUInt32(ReqCount);
+            writer.WriteBool(Incomplete);
+            writer.WriteBuffer(Transactions);
+            writer.WriteBuffer(Proof);
+        }
+
+        public static LiteServerBlockTransactionsExt ReadFrom(ref TLSpanReader reader)
+        {
+            return new LiteServerBlockTransactionsExt
+            {
+                Id = TonNodeBlockIdExt.ReadFrom(ref reader),
+                ReqCount = reader.ReadUInt32(),
+                Incomplete = reader.ReadBool(),
+                Transactions = reader.ReadBuffer(),
+                Proof = reader.ReadBuffer(),
+            };
+        }
+    }
+
+    /// <summary>
+    /// liteServer.signature = liteServer.Signature
+    /// </summary>
+    public class LiteServerSignature
+    {
+        public const uint Constructor = 0x78AB7D2A;
+
+        public TLInt256 NodeIdShort { get; set; }
+        public byte[] Signature { get; set; } = Array.Empty<byte>();
+
+        public int GetSerializedSize()
+        {
+            int size = 32;
+            size += TLWriteBuffer.GetBufferSize(Signature.Length);
+            return size;
+        }
+
+        public  void WriteTo(TLWriteBuffer writer)
+        {
+            writer.WriteInt256(NodeIdShort);
             writer.WriteBuffer(Signature);
         }
 
@@ -908,7 +1631,22 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         {
             return new LiteServerSignature
             {
-                NodeIdShort = reader.ReadBuffer(),
+                NodeIdShort = reader.ReadInt256(),
+                Signature = reader.ReadBuffer(),
+            };
+        }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteInt256(NodeIdShort);
+            writer.WriteBuffer(Signature);
+        }
+
+        public static LiteServerSignature ReadFrom(ref TLSpanReader reader)
+        {
+            return new LiteServerSignature
+            {
+                NodeIdShort = reader.ReadInt256(),
                 Signature = reader.ReadBuffer(),
             };
         }
@@ -925,6 +1663,14 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         public int CatchainSeqno { get; set; }
         public LiteServerSignature[] Signatures { get; set; } = Array.Empty<LiteServerSignature>();
 
+        public int GetSerializedSize()
+        {
+            int size = 12;
+            foreach (var item in Signatures)
+                size += item.GetSerializedSize();
+            return size;
+        }
+
         public  void WriteTo(TLWriteBuffer writer)
         {
             writer.WriteInt32(ValidatorSetHash);
@@ -941,7 +1687,7 @@ namespace TonSdk.Adnl.LiteClient.Protocol
             var result = new LiteServerSignatureSet();
             result.ValidatorSetHash = reader.ReadInt32();
             result.CatchainSeqno = reader.ReadInt32();
-            uint signaturesCount = reader.ReadUInt32();
+            int signaturesCount = reader.ReadVectorCount(36);
             result.Signatures = new LiteServerSignature[signaturesCount];
             for (int i = 0; i < signaturesCount; i++)
             {
@@ -949,6 +1695,59 @@ namespace TonSdk.Adnl.LiteClient.Protocol
             }
             return result;
         }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteInt32(ValidatorSetHash);
+            writer.WriteInt32(CatchainSeqno);
+            writer.WriteUInt32((uint)Signatures.Length);
+                foreach (var item in Signatures)
+                {
+                    item.WriteTo(ref writer);
+                }
+        }
+
+        public static LiteServerSignatureSet ReadFrom(ref TLSpanReader reader)
+        {
+            var result = new LiteServerSignatureSet();
+            result.ValidatorSetHash = reader.ReadInt32();
+            result.CatchainSeqno = reader.ReadInt32();
+            int signaturesCount = reader.ReadVectorCount(36);
+            result.Signatures = new LiteServerSignature[signaturesCount];
+            for (int i = 0; i < signaturesCount; i++)
+            {
+                result.Signatures[i] = LiteServerSignature.ReadFrom(ref reader);
+            }
+            return result;
+        }
+
+        public void WriteBoxedTo(TLWriteBuffer writer)
+        {
+            writer.WriteUInt32(Constructor);
+            WriteTo(writer);
+        }
+
+        public static LiteServerSignatureSet ReadBoxedFrom(TLReadBuffer reader)
+        {
+            uint constructor = reader.ReadUInt32();
+            if (constructor != Constructor)
+                throw new Exception($"Unknown constructor 0x{constructor:X8} for liteServer.SignatureSet");
+            return ReadFrom(reader);
+        }
+
+        public void WriteBoxedTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32(Constructor);
+            WriteTo(ref writer);
+        }
+
+        public static LiteServerSignatureSet ReadBoxedFrom(ref TLSpanReader reader)
+        {
+            uint constructor = reader.ReadUInt32();
+            if (constructor != Constructor)
+                throw new Exception($"Unknown constructor 0x{constructor:X8} for liteServer.SignatureSet");
+            return ReadFrom(ref reader);
+        }
     }
 
     /// <summary>
@@ -966,6 +1765,15 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         public byte[] Proof { get; set; } = Array.Empty<byte>();
         public byte[] StateProof { get; set; } = Array.Empty<byte>();
 
+        public override int GetSerializedSize()
+        {
+            int size = 164;
+            size += TLWriteBuffer.GetBufferSize(DestProof.Length);
+            size += TLWriteBuffer.GetBufferSize(Proof.Length);
+            size += TLWriteBuffer.GetBufferSize(StateProof.Length);
+            return size;
+        }
+
         public override void WriteTo(TLWriteBuffer writer)
         {
             writer.WriteBool(ToKeyBlock);
@@ -988,6 +1796,29 @@ namespace TonSdk.Adnl.LiteClient.Protocol
                 StateProof = reader.ReadBuffer(),
             };
         }
+
+        public override void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteBool(ToKeyBlock);
+            From.WriteTo(ref writer);
+            To.WriteTo(ref writer);
+            writer.WriteBuffer(DestProof);
+            writer.WriteBuffer(Proof);
+            writer.WriteBuffer(StateProof);
+        }
+
+        public static LiteServerBlockLinkBack ReadFrom(ref TLSpanReader reader)
+        {
+            return new LiteServerBlockLinkBack
+            {
+                ToKeyBlock = reader.ReadBool(),
+                From = TonNodeBlockIdExt.ReadFrom(ref reader),
+                To = TonNodeBlockIdExt.ReadFrom(ref reader),
+                DestProof = reader.ReadBuffer(),
+                Proof = reader.ReadBuffer(),
+                StateProof = reader.ReadBuffer(),
+            };
+        }
     }
 
     /// <summary>
@@ -1005,6 +1836,15 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         public byte[] ConfigProof { get; set; } = Array.Empty<byte>();
         public LiteServerSignatureSet Signatures { get; set; }
 
+        public override int GetSerializedSize()
+        {
+            int size = 168;
+            size += TLWriteBuffer.GetBufferSize(DestProof.Length);
+            size += TLWriteBuffer.GetBufferSize(ConfigProof.Length);
+            size += Signatures.GetSerializedSize();
+            return size;
+        }
+
         public override void WriteTo(TLWriteBuffer writer)
         {
             writer.WriteBool(ToKeyBlock);
@@ -1012,7 +1852,7 @@ namespace TonSdk.Adnl.LiteClient.Protocol
             To.WriteTo(writer);
             writer.WriteBuffer(DestProof);
             writer.WriteBuffer(ConfigProof);
-            Signatures.WriteTo(writer);
+            Signatures.WriteBoxedTo(writer);
         }
 
         public static LiteServerBlockLinkForward ReadFrom(TLReadBuffer reader)
@@ -1024,7 +1864,30 @@ namespace TonSdk.Adnl.LiteClient.Protocol
                 To = TonNodeBlockIdExt.ReadFrom(reader),
                 DestProof = reader.ReadBuffer(),
                 ConfigProof = reader.ReadBuffer(),
-                Signatures = LiteServerSignatureSet.ReadFrom(reader),
+                Signatures = LiteServerSignatureSet.ReadBoxedFrom(reader),
+            };
+        }
+
+        public override void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteBool(ToKeyBlock);
+            From.WriteTo(ref writer);
+            To.WriteTo(ref writer);
+            writer.WriteBuffer(DestProof);
+            writer.WriteBuffer(ConfigProof);
+            Signatures.WriteBoxedTo(ref writer);
+        }
+
+        public static LiteServerBlockLinkForward ReadFrom(ref TLSpanReader reader)
+        {
+            return new LiteServerBlockLinkForward
+            {
+                ToKeyBlock = reader.ReadBool(),
+                From = TonNodeBlockIdExt.ReadFrom(ref reader),
+                To = TonNodeBlockIdExt.ReadFrom(ref reader),
+                DestProof = reader.ReadBuffer(),
+                ConfigProof = reader.ReadBuffer(),
+                Signatures = LiteServerSignatureSet.ReadBoxedFrom(ref reader),
             };
         }
     }
@@ -1041,6 +1904,14 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         public TonNodeBlockIdExt To { get; set; }
         public LiteServerBlockLink[] Steps { get; set; } = Array.Empty<LiteServerBlockLink>();
 
+        public int GetSerializedSize()
+        {
+            int size = 168;
+            foreach (var item in Steps)
+                size += 4 + item.GetSerializedSize();
+            return size;
+        }
+
         public  void WriteTo(TLWriteBuffer writer)
         {
             writer.WriteBool(Complete);
@@ -1049,7 +1920,7 @@ namespace TonSdk.Adnl.LiteClient.Protocol
             writer.WriteUInt32((uint)Steps.Length);
                 foreach (var item in Steps)
                 {
-                    item.WriteTo(writer);
+                    item.WriteBoxedTo(writer);
                 }
         }
 
@@ -1059,11 +1930,38 @@ namespace TonSdk.Adnl.LiteClient.Protocol
             result.Complete = reader.ReadBool();
             result.From = TonNodeBlockIdExt.ReadFrom(reader);
             result.To = TonNodeBlockIdExt.ReadFrom(reader);
-            uint stepsCount = reader.ReadUInt32();
+            int stepsCount = reader.ReadVectorCount(180);
+            result.Steps = new LiteServerBlockLink[stepsCount];
+            for (int i = 0; i < stepsCount; i++)
+            {
+                result.Steps[i] = LiteServerBlockLink.ReadBoxedFrom(reader);
+            }
+            return result;
+        }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteBool(Complete);
+            From.WriteTo(ref writer);
+            To.WriteTo(ref writer);
+            writer.WriteUInt32((uint)Steps.Length);
+                foreach (var item in Steps)
+                {
+                    item.WriteBoxedTo(ref writer);
+                }
+        }
+
+        public static LiteServerPartialBlockProof ReadFrom(ref TLSpanReader reader)
+        {
+            var result = new LiteServerPartialBlockProof();
+            result.Complete = reader.ReadBool();
+            result.From = TonNodeBlockIdExt.ReadFrom(ref reader);
+            result.To = TonNodeBlockIdExt.ReadFrom(ref reader);
+            int stepsCount = reader.ReadVectorCount(180);
             result.Steps = new LiteServerBlockLink[stepsCount];
             for (int i = 0; i < stepsCount; i++)
             {
-                result.Steps[i] = LiteServerBlockLink.ReadFrom(reader);
+                result.Steps[i] = LiteServerBlockLink.ReadBoxedFrom(ref reader);
             }
             return result;
         }
@@ -1081,6 +1979,14 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         public byte[] StateProof { get; set; } = Array.Empty<byte>();
         public byte[] ConfigProof { get; set; } = Array.Empty<byte>();
 
+        public int GetSerializedSize()
+        {
+            int size = 84;
+            size += TLWriteBuffer.GetBufferSize(StateProof.Length);
+            size += TLWriteBuffer.GetBufferSize(ConfigProof.Length);
+            return size;
+        }
+
         public  void WriteTo(TLWriteBuffer writer)
         {
             writer.WriteUInt32(Mode);
@@ -1099,6 +2005,25 @@ namespace TonSdk.Adnl.LiteClient.Protocol
                 ConfigProof = reader.ReadBuffer(),
             };
         }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32(Mode);
+            Id.WriteTo(ref writer);
+            writer.WriteBuffer(StateProof);
+            writer.WriteBuffer(ConfigProof);
+        }
+
+        public static LiteServerConfigInfo ReadFrom(ref TLSpanReader reader)
+        {
+            return new LiteServerConfigInfo
+            {
+                Mode = reader.ReadUInt32(),
+                Id = TonNodeBlockIdExt.ReadFrom(ref reader),
+                StateProof = reader.ReadBuffer(),
+                ConfigProof = reader.ReadBuffer(),
+            };
+        }
     }
 
     /// <summary>
@@ -1115,6 +2040,14 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         public byte[] StateProof { get; set; } = Array.Empty<byte>();
         public byte[] DataProof { get; set; } = Array.Empty<byte>();
 
+        public int GetSerializedSize()
+        {
+            int size = 92;
+            size += TLWriteBuffer.GetBufferSize(StateProof.Length);
+            size += TLWriteBuffer.GetBufferSize(DataProof.Length);
+            return size;
+        }
+
         public  void WriteTo(TLWriteBuffer writer)
         {
             writer.WriteUInt32(Mode);
@@ -1137,6 +2070,29 @@ namespace TonSdk.Adnl.LiteClient.Protocol
                 DataProof = reader.ReadBuffer(),
             };
         }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32(Mode);
+            Id.WriteTo(ref writer);
+            writer.WriteInt32(Count);
+            writer.WriteBool(Complete);
+            writer.WriteBuffer(StateProof);
+            writer.WriteBuffer(DataProof);
+        }
+
+        public static LiteServerValidatorStats ReadFrom(ref TLSpanReader reader)
+        {
+            return new LiteServerValidatorStats
+            {
+                Mode = reader.ReadUInt32(),
+                Id = TonNodeBlockIdExt.ReadFrom(ref reader),
+                Count = reader.ReadInt32(),
+                Complete = reader.ReadBool(),
+                StateProof = reader.ReadBuffer(),
+                DataProof = reader.ReadBuffer(),
+            };
+        }
     }
 
     /// <summary>
@@ -1148,6 +2104,14 @@ namespace TonSdk.Adnl.LiteClient.Protocol
 
         public LiteServerLibraryEntry[] Result { get; set; } = Array.Empty<LiteServerLibraryEntry>();
 
+        public int GetSerializedSize()
+        {
+            int size = 4;
+            foreach (var item in Result)
+                size += item.GetSerializedSize();
+            return size;
+        }
+
         public  void WriteTo(TLWriteBuffer writer)
         {
             writer.WriteUInt32((uint)Result.Length);
@@ -1160,7 +2124,7 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         public static LiteServerLibraryResult ReadFrom(TLReadBuffer reader)
         {
             var result = new LiteServerLibraryResult();
-            uint resultCount = reader.ReadUInt32();
+            int resultCount = reader.ReadVectorCount(36);
             result.Result = new LiteServerLibraryEntry[resultCount];
             for (int i = 0; i < resultCount; i++)
             {
@@ -1168,6 +2132,27 @@ namespace TonSdk.Adnl.LiteClient.Protocol
             }
             return result;
         }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32((uint)Result.Length);
+                foreach (var item in Result)
+                {
+                    item.WriteTo(ref writer);
+                }
+        }
+
+        public static LiteServerLibraryResult ReadFrom(ref TLSpanReader reader)
+        {
+            var result = new LiteServerLibraryResult();
+            int resultCount = reader.ReadVectorCount(36);
+            result.Result = new LiteServerLibraryEntry[resultCount];
+            for (int i = 0; i < resultCount; i++)
+            {
+                result.Result[i] = LiteServerLibraryEntry.ReadFrom(ref reader);
+            }
+            return result;
+        }
     }
 
     /// <summary>
@@ -1183,6 +2168,16 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         public byte[] StateProof { get; set; } = Array.Empty<byte>();
         public byte[] DataProof { get; set; } = Array.Empty<byte>();
 
+        public int GetSerializedSize()
+        {
+            int size = 88;
+            foreach (var item in Result)
+                size += item.GetSerializedSize();
+            size += TLWriteBuffer.GetBufferSize(StateProof.Length);
+            size += TLWriteBuffer.GetBufferSize(DataProof.Length);
+            return size;
+        }
+
         public  void WriteTo(TLWriteBuffer writer)
         {
             Id.WriteTo(writer);
@@ -1201,7 +2196,7 @@ namespace TonSdk.Adnl.LiteClient.Protocol
             var result = new LiteServerLibraryResultWithProof();
             result.Id = TonNodeBlockIdExt.ReadFrom(reader);
             result.Mode = reader.ReadUInt32();
-            uint resultCount = reader.ReadUInt32();
+            int resultCount = reader.ReadVectorCount(36);
             result.Result = new LiteServerLibraryEntry[resultCount];
             for (int i = 0; i < resultCount; i++)
             {
@@ -1211,6 +2206,35 @@ namespace TonSdk.Adnl.LiteClient.Protocol
             result.DataProof = reader.ReadBuffer();
             return result;
         }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            Id.WriteTo(ref writer);
+            writer.WriteUInt32(Mode);
+            writer.WriteUInt32((uint)Result.Length);
+                foreach (var item in Result)
+                {
+                    item.WriteTo(ref writer);
+                }
+            writer.WriteBuffer(StateProof);
+            writer.WriteBuffer(DataProof);
+        }
+
+        public static LiteServerLibraryResultWithProof ReadFrom(ref TLSpanReader reader)
+        {
+            var result = new LiteServerLibraryResultWithProof();
+            result.Id = TonNodeBlockIdExt.ReadFrom(ref reader);
+            result.Mode = reader.ReadUInt32();
+            int resultCount = reader.ReadVectorCount(36);
+            result.Result = new LiteServerLibraryEntry[resultCount];
+            for (int i = 0; i < resultCount; i++)
+            {
+                result.Result[i] = LiteServerLibraryEntry.ReadFrom(ref reader);
+            }
+            result.StateProof = reader.ReadBuffer();
+            result.DataProof = reader.ReadBuffer();
+            return result;
+        }
     }
 
     /// <summary>
@@ -1223,6 +2247,13 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         public TonNodeBlockIdExt Id { get; set; }
         public byte[] Proof { get; set; } = Array.Empty<byte>();
 
+        public int GetSerializedSize()
+        {
+            int size = 80;
+            size += TLWriteBuffer.GetBufferSize(Proof.Length);
+            return size;
+        }
+
         public  void WriteTo(TLWriteBuffer writer)
         {
             Id.WriteTo(writer);
@@ -1237,6 +2268,21 @@ namespace TonSdk.Adnl.LiteClient.Protocol
                 Proof = reader.ReadBuffer(),
             };
         }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            Id.WriteTo(ref writer);
+            writer.WriteBuffer(Proof);
+        }
+
+        public static LiteServerShardBlockLink ReadFrom(ref TLSpanReader reader)
+        {
+            return new LiteServerShardBlockLink
+            {
+                Id = TonNodeBlockIdExt.ReadFrom(ref reader),
+                Proof = reader.ReadBuffer(),
+            };
+        }
     }
 
     /// <summary>
@@ -1249,6 +2295,14 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         public TonNodeBlockIdExt MasterchainId { get; set; }
         public LiteServerShardBlockLink[] Links { get; set; } = Array.Empty<LiteServerShardBlockLink>();
 
+        public int GetSerializedSize()
+        {
+            int size = 84;
+            foreach (var item in Links)
+                size += item.GetSerializedSize();
+            return size;
+        }
+
         public  void WriteTo(TLWriteBuffer writer)
         {
             MasterchainId.WriteTo(writer);
@@ -1263,7 +2317,7 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         {
             var result = new LiteServerShardBlockProof();
             result.MasterchainId = TonNodeBlockIdExt.ReadFrom(reader);
-            uint linksCount = reader.ReadUInt32();
+            int linksCount = reader.ReadVectorCount(84);
             result.Links = new LiteServerShardBlockLink[linksCount];
             for (int i = 0; i < linksCount; i++)
             {
@@ -1271,6 +2325,29 @@ namespace TonSdk.Adnl.LiteClient.Protocol
             }
             return result;
         }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            MasterchainId.WriteTo(ref writer);
+            writer.WriteUInt32((uint)Links.Length);
+                foreach (var item in Links)
+                {
+                    item.WriteTo(ref writer);
+                }
+        }
+
+        public static LiteServerShardBlockProof ReadFrom(ref TLSpanReader reader)
+        {
+            var result = new LiteServerShardBlockProof();
+            result.MasterchainId = TonNodeBlockIdExt.ReadFrom(ref reader);
+            int linksCount = reader.ReadVectorCount(84);
+            result.Links = new LiteServerShardBlockLink[linksCount];
+            for (int i = 0; i < linksCount; i++)
+            {
+                result.Links[i] = LiteServerShardBlockLink.ReadFrom(ref reader);
+            }
+            return result;
+        }
     }
 
     /// <summary>
@@ -1289,6 +2366,18 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         public byte[] Header { get; set; } = Array.Empty<byte>();
         public byte[] PrevHeader { get; set; } = Array.Empty<byte>();
 
+        public int GetSerializedSize()
+        {
+            int size = 168;
+            size += TLWriteBuffer.GetBufferSize(ClientMcStateProof.Length);
+            size += TLWriteBuffer.GetBufferSize(McBlockProof.Length);
+            foreach (var item in ShardLinks)
+                size += item.GetSerializedSize();
+            size += TLWriteBuffer.GetBufferSize(Header.Length);
+            size += TLWriteBuffer.GetBufferSize(PrevHeader.Length);
+            return size;
+        }
+
         public  void WriteTo(TLWriteBuffer writer)
         {
             Id.WriteTo(writer);
@@ -1313,9 +2402,9 @@ namespace TonSdk.Adnl.LiteClient.Protocol
             result.McBlockId = TonNodeBlockIdExt.ReadFrom(reader);
             result.ClientMcStateProof = reader.ReadBuffer();
             result.McBlockProof = reader.ReadBuffer();
-            uint shardlinksCount = reader.ReadUInt32();
-            result.ShardLinks = new LiteServerShardBlockLink[shardlinksCount];
-            for (int i = 0; i < shardlinksCount; i++)
+            int shardLinksCount = reader.ReadVectorCount(84);
+            result.ShardLinks = new LiteServerShardBlockLink[shardLinksCount];
+            for (int i = 0; i < shardLinksCount; i++)
             {
                 result.ShardLinks[i] = LiteServerShardBlockLink.ReadFrom(reader);
             }
@@ -1323,6 +2412,41 @@ namespace TonSdk.Adnl.LiteClient.Protocol
             result.PrevHeader = reader.ReadBuffer();
             return result;
         }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            Id.WriteTo(ref writer);
+            writer.WriteUInt32(Mode);
+            McBlockId.WriteTo(ref writer);
+            writer.WriteBuffer(ClientMcStateProof);
+            writer.WriteBuffer(McBlockProof);
+            writer.WriteUInt32((uint)ShardLinks.Length);
+                foreach (var item in ShardLinks)
+                {
+                    item.WriteTo(ref writer);
+                }
+            writer.WriteBuffer(Header);
+            writer.WriteBuffer(PrevHeader);
+        }
+
+        public static LiteServerLookupBlockResult ReadFrom(ref TLSpanReader reader)
+        {
+            var result = new LiteServerLookupBlockResult();
+            result.Id = TonNodeBlockIdExt.ReadFrom(ref reader);
+            result.Mode = reader.ReadUInt32();
+            result.McBlockId = TonNodeBlockIdExt.ReadFrom(ref reader);
+            result.ClientMcStateProof = reader.ReadBuffer();
+            result.McBlockProof = reader.ReadBuffer();
+            int shardLinksCount = reader.ReadVectorCount(84);
+            result.ShardLinks = new LiteServerShardBlockLink[shardLinksCount];
+            for (int i = 0; i < shardLinksCount; i++)
+            {
+                result.ShardLinks[i] = LiteServerShardBlockLink.ReadFrom(ref reader);
+            }
+            result.Header = reader.ReadBuffer();
+            result.PrevHeader = reader.ReadBuffer();
+            return result;
+        }
     }
 
     /// <summary>
@@ -1335,6 +2459,8 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         public TonNodeBlockIdExt Id { get; set; }
         public int Size { get; set; }
 
+        public int GetSerializedSize() => 84;
+
         public  void WriteTo(TLWriteBuffer writer)
         {
             Id.WriteTo(writer);
@@ -1349,6 +2475,21 @@ namespace TonSdk.Adnl.LiteClient.Protocol
                 Size = reader.ReadInt32(),
             };
         }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            Id.WriteTo(ref writer);
+            writer.WriteInt32(Size);
+        }
+
+        public static LiteServerOutMsgQueueSize ReadFrom(ref TLSpanReader reader)
+        {
+            return new LiteServerOutMsgQueueSize
+            {
+                Id = TonNodeBlockIdExt.ReadFrom(ref reader),
+                Size = reader.ReadInt32(),
+            };
+        }
     }
 
     /// <summary>
@@ -1361,6 +2502,13 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         public LiteServerOutMsgQueueSize[] Shards { get; set; } = Array.Empty<LiteServerOutMsgQueueSize>();
         public int ExtMsgQueueSizeLimit { get; set; }
 
+        public int GetSerializedSize()
+        {
+            int size = 8;
+            size += Shards.Length * 84;
+            return size;
+        }
+
         public  void WriteTo(TLWriteBuffer writer)
         {
             writer.WriteUInt32((uint)Shards.Length);
@@ -1374,7 +2522,7 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         public static LiteServerOutMsgQueueSizes ReadFrom(TLReadBuffer reader)
         {
             var result = new LiteServerOutMsgQueueSizes();
-            uint shardsCount = reader.ReadUInt32();
+            int shardsCount = reader.ReadVectorCount(84);
             result.Shards = new LiteServerOutMsgQueueSize[shardsCount];
             for (int i = 0; i < shardsCount; i++)
             {
@@ -1383,6 +2531,29 @@ namespace TonSdk.Adnl.LiteClient.Protocol
             result.ExtMsgQueueSizeLimit = reader.ReadInt32();
             return result;
         }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32((uint)Shards.Length);
+                foreach (var item in Shards)
+                {
+                    item.WriteTo(ref writer);
+                }
+            writer.WriteInt32(ExtMsgQueueSizeLimit);
+        }
+
+        public static LiteServerOutMsgQueueSizes ReadFrom(ref TLSpanReader reader)
+        {
+            var result = new LiteServerOutMsgQueueSizes();
+            int shardsCount = reader.ReadVectorCount(84);
+            result.Shards = new LiteServerOutMsgQueueSize[shardsCount];
+            for (int i = 0; i < shardsCount; i++)
+            {
+                result.Shards[i] = LiteServerOutMsgQueueSize.ReadFrom(ref reader);
+            }
+            result.ExtMsgQueueSizeLimit = reader.ReadInt32();
+            return result;
+        }
     }
 
     /// <summary>
@@ -1397,6 +2568,16 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         public long Size { get; set; }
         public byte[] Proof { get; set; } = Array.Empty<byte>();
 
+        public int GetSerializedSize()
+        {
+            int size = 92;
+            if ((Mode & (1u << 0)) != 0)
+            {
+                size += TLWriteBuffer.GetBufferSize(Proof.Length);
+            }
+            return size;
+        }
+
         public  void WriteTo(TLWriteBuffer writer)
         {
             writer.WriteUInt32(Mode);
@@ -1418,6 +2599,28 @@ namespace TonSdk.Adnl.LiteClient.Protocol
                 result.Proof = reader.ReadBuffer();
             return result;
         }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32(Mode);
+            Id.WriteTo(ref writer);
+            writer.WriteInt64(Size);
+            if ((Mode & (1u << 0)) != 0)
+            {
+                writer.WriteBuffer(Proof);
+            }
+        }
+
+        public static LiteServerBlockOutMsgQueueSize ReadFrom(ref TLSpanReader reader)
+        {
+            var result = new LiteServerBlockOutMsgQueueSize();
+            result.Mode = reader.ReadUInt32();
+            result.Id = TonNodeBlockIdExt.ReadFrom(ref reader);
+            result.Size = reader.ReadInt64();
+            if ((result.Mode & (1u << 0)) != 0)
+                result.Proof = reader.ReadBuffer();
+            return result;
+        }
     }
 
     /// <summary>
@@ -1427,14 +2630,16 @@ namespace TonSdk.Adnl.LiteClient.Protocol
     {
         public const uint Constructor = 0x3F213E07;
 
-        public byte[] Addr { get; set; } = Array.Empty<byte>();
+        public TLInt256 Addr { get; set; }
         public long Size { get; set; }
         public long MinLt { get; set; }
         public long MaxLt { get; set; }
 
+        public int GetSerializedSize() => 56;
+
         public  void WriteTo(TLWriteBuffer writer)
         {
-            writer.WriteBuffer(Addr);
+            writer.WriteInt256(Addr);
             writer.WriteInt64(Size);
             writer.WriteInt64(MinLt);
             writer.WriteInt64(MaxLt);
@@ -1444,7 +2649,26 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         {
             return new LiteServerAccountDispatchQueueInfo
             {
-                Addr = reader.ReadBuffer(),
+                Addr = reader.ReadInt256(),
+                Size = reader.ReadInt64(),
+                MinLt = reader.ReadInt64(),
+                MaxLt = reader.ReadInt64(),
+            };
+        }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteInt256(Addr);
+            writer.WriteInt64(Size);
+            writer.WriteInt64(MinLt);
+            writer.WriteInt64(MaxLt);
+        }
+
+        public static LiteServerAccountDispatchQueueInfo ReadFrom(ref TLSpanReader reader)
+        {
+            return new LiteServerAccountDispatchQueueInfo
+            {
+                Addr = reader.ReadInt256(),
                 Size = reader.ReadInt64(),
                 MinLt = reader.ReadInt64(),
                 MaxLt = reader.ReadInt64(),
@@ -1465,6 +2689,17 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         public bool Complete { get; set; }
         public byte[] Proof { get; set; } = Array.Empty<byte>();
 
+        public int GetSerializedSize()
+        {
+            int size = 92;
+            size += AccountDispatchQueues.Length * 56;
+            if ((Mode & (1u << 0)) != 0)
+            {
+                size += TLWriteBuffer.GetBufferSize(Proof.Length);
+            }
+            return size;
+        }
+
         public  void WriteTo(TLWriteBuffer writer)
         {
             writer.WriteUInt32(Mode);
@@ -1486,7 +2721,45 @@ namespace TonSdk.Adnl.LiteClient.Protocol
             var result = new LiteServerDispatchQueueInfo();
             result.Mode = reader.ReadUInt32();
             result.Id = TonNodeBlockIdExt.ReadFrom(reader);
-            result.AccountDispatchQueues = Array.Empty<LiteServerAccountDispatchQueueInfo>();
+            int accountDispatchQueuesCount = reader.ReadVectorCount(56);
+            result.AccountDispatchQueues = new LiteServerAccountDispatchQueueInfo[accountDispatchQueuesCount];
+            for (int i = 0; i < accountDispatchQueuesCount; i++)
+            {
+                result.AccountDispatchQueues[i] = LiteServerAccountDispatchQueueInfo.ReadFrom(reader);
+            }
+            result.Complete = reader.ReadBool();
+            if ((result.Mode & (1u << 0)) != 0)
+                result.Proof = reader.ReadBuffer();
+            return result;
+        }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32(Mode);
+            Id.WriteTo(ref writer);
+            writer.WriteUInt32((uint)AccountDispatchQueues.Length);
+                foreach (var item in AccountDispatchQueues)
+                {
+                    item.WriteTo(ref writer);
+                }
+            writer.WriteBool(Complete);
+            if ((Mode & (1u << 0)) != 0)
+            {
+                writer.WriteBuffer(Proof);
+            }
+        }
+
+        public static LiteServerDispatchQueueInfo ReadFrom(ref TLSpanReader reader)
+        {
+            var result = new LiteServerDispatchQueueInfo();
+            result.Mode = reader.ReadUInt32();
+            result.Id = TonNodeBlockIdExt.ReadFrom(ref reader);
+            int accountDispatchQueuesCount = reader.ReadVectorCount(56);
+            result.AccountDispatchQueues = new LiteServerAccountDispatchQueueInfo[accountDispatchQueuesCount];
+            for (int i = 0; i < accountDispatchQueuesCount; i++)
+            {
+                result.AccountDispatchQueues[i] = LiteServerAccountDispatchQueueInfo.ReadFrom(ref reader);
+            }
             result.Complete = reader.ReadBool();
             if ((result.Mode & (1u << 0)) != 0)
                 result.Proof = reader.ReadBuffer();
@@ -1501,16 +2774,18 @@ namespace TonSdk.Adnl.LiteClient.Protocol
     {
         public const uint Constructor = 0x2352C9EC;
 
-        public byte[] Addr { get; set; } = Array.Empty<byte>();
+        public TLInt256 Addr { get; set; }
         public long Lt { get; set; }
-        public byte[] Hash { get; set; } = Array.Empty<byte>();
+        public TLInt256 Hash { get; set; }
         public LiteServerTransactionMetadata Metadata { get; set; }
 
+        public int GetSerializedSize() => 124;
+
         public  void WriteTo(TLWriteBuffer writer)
         {
-            writer.WriteBuffer(Addr);
+            writer.WriteInt256(Addr);
             writer.WriteInt64(Lt);
-            writer.WriteBytes(Hash, 32);
+            writer.WriteInt256(Hash);
             Metadata.WriteTo(writer);
         }
 
@@ -1518,12 +2793,139 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         {
             return new LiteServerDispatchQueueMessage
             {
-                Addr = reader.ReadBuffer(),
+                Addr = reader.ReadInt256(),
                 Lt = reader.ReadInt64(),
                 Hash = reader.ReadInt256(),
                 Metadata = LiteServerTransactionMetadata.ReadFrom(reader),
             };
         }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteInt256(Addr);
+            writer.WriteInt64(Lt);
+            writer.WriteInt256(Hash);
+            Metadata.WriteTo(ref writer);
+        }
+
+        public static LiteServerDispatchQueueMessage ReadFrom(ref TLSpanReader reader)
+        {
+            return new LiteServerDispatchQueueMessage
+            {
+                Addr = reader.ReadInt256(),
+                Lt = reader.ReadInt64(),
+                Hash = reader.ReadInt256(),
+                Metadata = LiteServerTransactionMetadata.ReadFrom(ref reader),
+            };
+        }
+    }
+
+    /// <summary>
+    /// liteServer.dispatchQueueMessages = liteServer.DispatchQueueMessages
+    /// </summary>
+    public class LiteServerDispatchQueueMessages
+    {
+        public const uint Constructor = 0xF4486B0C;
+
+        public uint Mode { get; set; }
+        public TonNodeBlockIdExt Id { get; set; }
+        public LiteServerDispatchQueueMessage[] Messages { get; set; } = Array.Empty<LiteServerDispatchQueueMessage>();
+        public bool Complete { get; set; }
+        public byte[] Proof { get; set; } = Array.Empty<byte>();
+        public byte[] MessagesBoc { get; set; } = Array.Empty<byte>();
+
+        public int GetSerializedSize()
+        {
+            int size = 92;
+            size += Messages.Length * 124;
+            if ((Mode & (1u << 0)) != 0)
+            {
+                size += TLWriteBuffer.GetBufferSize(Proof.Length);
+            }
+            if ((Mode & (1u << 2)) != 0)
+            {
+                size += TLWriteBuffer.GetBufferSize(MessagesBoc.Length);
+            }
+            return size;
+        }
+
+        public  void WriteTo(TLWriteBuffer writer)
+        {
+            writer.WriteUInt32(Mode);
+            Id.WriteTo(writer);
+            writer.WriteUInt32((uint)Messages.Length);
+                foreach (var item in Messages)
+                {
+                    item.WriteTo(writer);
+                }
+            writer.WriteBool(Complete);
+            if ((Mode & (1u << 0)) != 0)
+            {
+                writer.WriteBuffer(Proof);
+            }
+            if ((Mode & (1u << 2)) != 0)
+            {
+                writer.WriteBuffer(MessagesBoc);
+            }
+        }
+
+        public static LiteServerDispatchQueueMessages ReadFrom(TLReadBuffer reader)
+        {
+            var result = new LiteServerDispatchQueueMessages();
+            result.Mode = reader.ReadUInt32();
+            result.Id = TonNodeBlockIdExt.ReadFrom(reader);
+            int messagesCount = reader.ReadVectorCount(124);
+            result.Messages = new LiteServerDispatchQueueMessage[messagesCount];
+            for (int i = 0; i < messagesCount; i++)
+            {
+                result.Messages[i] = LiteServerDispatchQueueMessage.ReadFrom(reader);
+            }
+            result.Complete = reader.ReadBool();
+            if ((result.Mode & (1u << 0)) != 0)
+                result.Proof = reader.ReadBuffer();
+            if ((result.Mode & (1u << 2)) != 0)
+                result.MessagesBoc = reader.ReadBuffer();
+            return result;
+        }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32(Mode);
+            Id.WriteTo(ref writer);
+            writer.WriteUInt32((uint)Messages.Length);
+                foreach (var item in Messages)
+                {
+                    item.WriteTo(ref writer);
+                }
+            writer.WriteBool(Complete);
+            if ((Mode & (1u << 0)) != 0)
+            {
+                writer.WriteBuffer(Proof);
+            }
+            if ((Mode & (1u << 2)) != 0)
+            {
+                writer.WriteBuffer(MessagesBoc);
+            }
+        }
+
+        public static LiteServerDispatchQueueMessages ReadFrom(ref TLSpanReader reader)
+        {
+            var result = new LiteServerDispatchQueueMessages();
+            result.Mode = reader.ReadUInt32();
+            result.Id = TonNodeBlockIdExt.ReadFrom(ref reader);
+            int messagesCount = reader.ReadVectorCount(124);
+            result.Messages = new LiteServerDispatchQueueMessage[messagesCount];
+            for (int i = 0; i < messagesCount; i++)
+            {
+                result.Messages[i] = LiteServerDispatchQueueMessage.ReadFrom(ref reader);
+            }
+            result.Complete = reader.ReadBool();
+            if ((result.Mode & (1u << 0)) != 0)
+                result.Proof = reader.ReadBuffer();
+            if ((result.Mode & (1u << 2)) != 0)
+                result.MessagesBoc = reader.ReadBuffer();
+            return result;
+        }
     }
 
     /// <summary>
@@ -1535,6 +2937,8 @@ namespace TonSdk.Adnl.LiteClient.Protocol
 
         public int Value { get; set; }
 
+        public int GetSerializedSize() => 4;
+
         public  void WriteTo(TLWriteBuffer writer)
         {
             writer.WriteInt32(Value);
@@ -1547,6 +2951,19 @@ namespace TonSdk.Adnl.LiteClient.Protocol
                 Value = reader.ReadInt32(),
             };
         }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteInt32(Value);
+        }
+
+        public static LiteServerDebugVerbosity ReadFrom(ref TLSpanReader reader)
+        {
+            return new LiteServerDebugVerbosity
+            {
+                Value = reader.ReadInt32(),
+            };
+        }
     }
 
     /// <summary>
@@ -1557,14 +2974,16 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         public const uint Constructor = 0x24EECDA9;
 
         public TonNodeBlockIdExt BlockId { get; set; }
-        public byte[] Creator { get; set; } = Array.Empty<byte>();
-        public byte[] CollatedDataHash { get; set; } = Array.Empty<byte>();
+        public TLInt256 Creator { get; set; }
+        public TLInt256 CollatedDataHash { get; set; }
+
+        public int GetSerializedSize() => 144;
 
         public  void WriteTo(TLWriteBuffer writer)
         {
             BlockId.WriteTo(writer);
-            writer.WriteBuffer(Creator);
-            writer.WriteBytes(CollatedDataHash, 32);
+            writer.WriteInt256(Creator);
+            writer.WriteInt256(CollatedDataHash);
         }
 
         public static LiteServerNonfinalCandidateId ReadFrom(TLReadBuffer reader)
@@ -1572,7 +2991,24 @@ namespace TonSdk.Adnl.LiteClient.Protocol
             return new LiteServerNonfinalCandidateId
             {
                 BlockId = TonNodeBlockIdExt.ReadFrom(reader),
-                Creator = reader.ReadBuffer(),
+                Creator = reader.ReadInt256(),
+                CollatedDataHash = reader.ReadInt256(),
+            };
+        }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            BlockId.WriteTo(ref writer);
+            writer.WriteInt256(Creator);
+            writer.WriteInt256(CollatedDataHash);
+        }
+
+        public static LiteServerNonfinalCandidateId ReadFrom(ref TLSpanReader reader)
+        {
+            return new LiteServerNonfinalCandidateId
+            {
+                BlockId = TonNodeBlockIdExt.ReadFrom(ref reader),
+                Creator = reader.ReadInt256(),
                 CollatedDataHash = reader.ReadInt256(),
             };
         }
@@ -1589,6 +3025,14 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         public byte[] Data { get; set; } = Array.Empty<byte>();
         public byte[] CollatedData { get; set; } = Array.Empty<byte>();
 
+        public int GetSerializedSize()
+        {
+            int size = 144;
+            size += TLWriteBuffer.GetBufferSize(Data.Length);
+            size += TLWriteBuffer.GetBufferSize(CollatedData.Length);
+            return size;
+        }
+
         public  void WriteTo(TLWriteBuffer writer)
         {
             Id.WriteTo(writer);
@@ -1605,21 +3049,40 @@ namespace TonSdk.Adnl.LiteClient.Protocol
                 CollatedData = reader.ReadBuffer(),
             };
         }
-    }
 
-    /// <summary>
-    /// liteServer.nonfinal.candidateInfo = liteServer.nonfinal.CandidateInfo
-    /// </summary>
-    public class LiteServerNonfinalCandidateInfo
-    {
-        public const uint Constructor = 0x95FDCCF3;
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            Id.WriteTo(ref writer);
+            writer.WriteBuffer(Data);
+            writer.WriteBuffer(CollatedData);
+        }
 
-        public LiteServerNonfinalCandidateId Id { get; set; }
+        public static LiteServerNonfinalCandidate ReadFrom(ref TLSpanReader reader)
+        {
+            return new LiteServerNonfinalCandidate
+            {
+                Id = LiteServerNonfinalCandidateId.ReadFrom(ref reader),
+                Data = reader.ReadBuffer(),
+                CollatedData = reader.ReadBuffer(),
+            };
+        }
+    }
+
+    /// <summary>
+    /// liteServer.nonfinal.candidateInfo = liteServer.nonfinal.CandidateInfo
+    /// </summary>
+    public class LiteServerNonfinalCandidateInfo
+    {
+        public const uint Constructor = 0x95FDCCF3;
+
+        public LiteServerNonfinalCandidateId Id { get; set; }
         public bool Available { get; set; }
         public long ApprovedWeight { get; set; }
         public long SignedWeight { get; set; }
         public long TotalWeight { get; set; }
 
+        public int GetSerializedSize() => 172;
+
         public  void WriteTo(TLWriteBuffer writer)
         {
             Id.WriteTo(writer);
@@ -1640,6 +3103,27 @@ namespace TonSdk.Adnl.LiteClient.Protocol
                 TotalWeight = reader.ReadInt64(),
             };
         }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            Id.WriteTo(ref writer);
+            writer.WriteBool(Available);
+            writer.WriteInt64(ApprovedWeight);
+            writer.WriteInt64(SignedWeight);
+            writer.WriteInt64(TotalWeight);
+        }
+
+        public static LiteServerNonfinalCandidateInfo ReadFrom(ref TLSpanReader reader)
+        {
+            return new LiteServerNonfinalCandidateInfo
+            {
+                Id = LiteServerNonfinalCandidateId.ReadFrom(ref reader),
+                Available = reader.ReadBool(),
+                ApprovedWeight = reader.ReadInt64(),
+                SignedWeight = reader.ReadInt64(),
+                TotalWeight = reader.ReadInt64(),
+            };
+        }
     }
 
     /// <summary>
@@ -1654,6 +3138,14 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         public TonNodeBlockIdExt[] Prev { get; set; } = Array.Empty<TonNodeBlockIdExt>();
         public LiteServerNonfinalCandidateInfo[] Candidates { get; set; } = Array.Empty<LiteServerNonfinalCandidateInfo>();
 
+        public int GetSerializedSize()
+        {
+            int size = 28;
+            size += Prev.Length * 80;
+            size += Candidates.Length * 172;
+            return size;
+        }
+
         public  void WriteTo(TLWriteBuffer writer)
         {
             NextBlockId.WriteTo(writer);
@@ -1675,13 +3167,13 @@ namespace TonSdk.Adnl.LiteClient.Protocol
             var result = new LiteServerNonfinalValidatorGroupInfo();
             result.NextBlockId = TonNodeBlockId.ReadFrom(reader);
             result.CcSeqno = reader.ReadInt32();
-            uint prevCount = reader.ReadUInt32();
+            int prevCount = reader.ReadVectorCount(80);
             result.Prev = new TonNodeBlockIdExt[prevCount];
             for (int i = 0; i < prevCount; i++)
             {
                 result.Prev[i] = TonNodeBlockIdExt.ReadFrom(reader);
             }
-            uint candidatesCount = reader.ReadUInt32();
+            int candidatesCount = reader.ReadVectorCount(172);
             result.Candidates = new LiteServerNonfinalCandidateInfo[candidatesCount];
             for (int i = 0; i < candidatesCount; i++)
             {
@@ -1689,6 +3181,42 @@ namespace TonSdk.Adnl.LiteClient.Protocol
             }
             return result;
         }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            NextBlockId.WriteTo(ref writer);
+            writer.WriteInt32(CcSeqno);
+            writer.WriteUInt32((uint)Prev.Length);
+                foreach (var item in Prev)
+                {
+                    item.WriteTo(ref writer);
+                }
+            writer.WriteUInt32((uint)Candidates.Length);
+                foreach (var item in Candidates)
+                {
+                    item.WriteTo(ref writer);
+                }
+        }
+
+        public static LiteServerNonfinalValidatorGroupInfo ReadFrom(ref TLSpanReader reader)
+        {
+            var result = new LiteServerNonfinalValidatorGroupInfo();
+            result.NextBlockId = TonNodeBlockId.ReadFrom(ref reader);
+            result.CcSeqno = reader.ReadInt32();
+            int prevCount = reader.ReadVectorCount(80);
+            result.Prev = new TonNodeBlockIdExt[prevCount];
+            for (int i = 0; i < prevCount; i++)
+            {
+                result.Prev[i] = TonNodeBlockIdExt.ReadFrom(ref reader);
+            }
+            int candidatesCount = reader.ReadVectorCount(172);
+            result.Candidates = new LiteServerNonfinalCandidateInfo[candidatesCount];
+            for (int i = 0; i < candidatesCount; i++)
+            {
+                result.Candidates[i] = LiteServerNonfinalCandidateInfo.ReadFrom(ref reader);
+            }
+            return result;
+        }
     }
 
     /// <summary>
@@ -1700,6 +3228,14 @@ namespace TonSdk.Adnl.LiteClient.Protocol
 
         public LiteServerNonfinalValidatorGroupInfo[] Groups { get; set; } = Array.Empty<LiteServerNonfinalValidatorGroupInfo>();
 
+        public int GetSerializedSize()
+        {
+            int size = 4;
+            foreach (var item in Groups)
+                size += item.GetSerializedSize();
+            return size;
+        }
+
         public  void WriteTo(TLWriteBuffer writer)
         {
             writer.WriteUInt32((uint)Groups.Length);
@@ -1712,7 +3248,7 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         public static LiteServerNonfinalValidatorGroups ReadFrom(TLReadBuffer reader)
         {
             var result = new LiteServerNonfinalValidatorGroups();
-            uint groupsCount = reader.ReadUInt32();
+            int groupsCount = reader.ReadVectorCount(28);
             result.Groups = new LiteServerNonfinalValidatorGroupInfo[groupsCount];
             for (int i = 0; i < groupsCount; i++)
             {
@@ -1720,13 +3256,2170 @@ namespace TonSdk.Adnl.LiteClient.Protocol
             }
             return result;
         }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32((uint)Groups.Length);
+                foreach (var item in Groups)
+                {
+                    item.WriteTo(ref writer);
+                }
+        }
+
+        public static LiteServerNonfinalValidatorGroups ReadFrom(ref TLSpanReader reader)
+        {
+            var result = new LiteServerNonfinalValidatorGroups();
+            int groupsCount = reader.ReadVectorCount(28);
+            result.Groups = new LiteServerNonfinalValidatorGroupInfo[groupsCount];
+            for (int i = 0; i < groupsCount; i++)
+            {
+                result.Groups[i] = LiteServerNonfinalValidatorGroupInfo.ReadFrom(ref reader);
+            }
+            return result;
+        }
+    }
+
+    // ============================================================================
+    // Views (zero-copy readers over serialized responses)
+    // ============================================================================
+
+    /// <summary>
+    /// View over liteServer.blockData = liteServer.BlockData
+    /// bytes fields are slices of the underlying buffer; Materialize() returns an owning LiteServerBlockData
+    /// </summary>
+    public readonly struct LiteServerBlockDataView
+    {
+        readonly ReadOnlyMemory<byte> buffer;
+        readonly int dataOffset;
+        readonly int dataLength;
+
+        public LiteServerBlockDataView(ReadOnlyMemory<byte> buffer)
+        {
+            this.buffer = buffer;
+            TLSpanReader reader = new(buffer.Span);
+            reader.Skip(80);
+            dataOffset = reader.SkipBuffer(out dataLength);
+        }
+
+        /// <summary>
+        /// The serialized bytes this view was parsed from
+        /// </summary>
+        public ReadOnlyMemory<byte> Buffer => buffer;
+
+        public TonNodeBlockIdExt Id
+        {
+            get
+            {
+                TLSpanReader reader = At(0);
+                return TonNodeBlockIdExt.ReadFrom(ref reader);
+            }
+        }
+
+        public ReadOnlyMemory<byte> Data => buffer.Slice(dataOffset, dataLength);
+
+        TLSpanReader At(int offset) => new(buffer.Span.Slice(offset));
+
+        public LiteServerBlockData Materialize()
+        {
+            return new LiteServerBlockData
+            {
+                Id = Id,
+                Data = Data.ToArray(),
+            };
+        }
+    }
+
+    /// <summary>
+    /// View over liteServer.blockState = liteServer.BlockState
+    /// bytes fields are slices of the underlying buffer; Materialize() returns an owning LiteServerBlockState
+    /// </summary>
+    public readonly struct LiteServerBlockStateView
+    {
+        readonly ReadOnlyMemory<byte> buffer;
+        readonly int dataOffset;
+        readonly int dataLength;
+
+        public LiteServerBlockStateView(ReadOnlyMemory<byte> buffer)
+        {
+            this.buffer = buffer;
+            TLSpanReader reader = new(buffer.Span);
+            reader.Skip(80);
+            reader.Skip(32);
+            reader.Skip(32);
+            dataOffset = reader.SkipBuffer(out dataLength);
+        }
+
+        /// <summary>
+        /// The serialized bytes this view was parsed from
+        /// </summary>
+        public ReadOnlyMemory<byte> Buffer => buffer;
+
+        public TonNodeBlockIdExt Id
+        {
+            get
+            {
+                TLSpanReader reader = At(0);
+                return TonNodeBlockIdExt.ReadFrom(ref reader);
+            }
+        }
+
+        public TLInt256 RootHash => At(80).ReadInt256();
+
+        public TLInt256 FileHash => At(112).ReadInt256();
+
+        public ReadOnlyMemory<byte> Data => buffer.Slice(dataOffset, dataLength);
+
+        TLSpanReader At(int offset) => new(buffer.Span.Slice(offset));
+
+        public LiteServerBlockState Materialize()
+        {
+            return new LiteServerBlockState
+            {
+                Id = Id,
+                RootHash = RootHash,
+                FileHash = FileHash,
+                Data = Data.ToArray(),
+            };
+        }
+    }
+
+    /// <summary>
+    /// View over liteServer.blockHeader = liteServer.BlockHeader
+    /// bytes fields are slices of the underlying buffer; Materialize() returns an owning LiteServerBlockHeader
+    /// </summary>
+    public readonly struct LiteServerBlockHeaderView
+    {
+        readonly ReadOnlyMemory<byte> buffer;
+        readonly int headerProofOffset;
+        readonly int headerProofLength;
+
+        public LiteServerBlockHeaderView(ReadOnlyMemory<byte> buffer)
+        {
+            this.buffer = buffer;
+            TLSpanReader reader = new(buffer.Span);
+            reader.Skip(80);
+            reader.Skip(4);
+            headerProofOffset = reader.SkipBuffer(out headerProofLength);
+        }
+
+        /// <summary>
+        /// The serialized bytes this view was parsed from
+        /// </summary>
+        public ReadOnlyMemory<byte> Buffer => buffer;
+
+        public TonNodeBlockIdExt Id
+        {
+            get
+            {
+                TLSpanReader reader = At(0);
+                return TonNodeBlockIdExt.ReadFrom(ref reader);
+            }
+        }
+
+        public uint Mode => At(80).ReadUInt32();
+
+        public ReadOnlyMemory<byte> HeaderProof => buffer.Slice(headerProofOffset, headerProofLength);
+
+        TLSpanReader At(int offset) => new(buffer.Span.Slice(offset));
+
+        public LiteServerBlockHeader Materialize()
+        {
+            return new LiteServerBlockHeader
+            {
+                Id = Id,
+                Mode = Mode,
+                HeaderProof = HeaderProof.ToArray(),
+            };
+        }
+    }
+
+    /// <summary>
+    /// View over liteServer.accountState = liteServer.AccountState
+    /// bytes fields are slices of the underlying buffer; Materialize() returns an owning LiteServerAccountState
+    /// </summary>
+    public readonly struct LiteServerAccountStateView
+    {
+        readonly ReadOnlyMemory<byte> buffer;
+        readonly int shardProofOffset;
+        readonly int shardProofLength;
+        readonly int proofOffset;
+        readonly int proofLength;
+        readonly int stateOffset;
+        readonly int stateLength;
+
+        public LiteServerAccountStateView(ReadOnlyMemory<byte> buffer)
+        {
+            this.buffer = buffer;
+            TLSpanReader reader = new(buffer.Span);
+            reader.Skip(80);
+            reader.Skip(80);
+            shardProofOffset = reader.SkipBuffer(out shardProofLength);
+            proofOffset = reader.SkipBuffer(out proofLength);
+            stateOffset = reader.SkipBuffer(out stateLength);
+        }
+
+        /// <summary>
+        /// The serialized bytes this view was parsed from
+        /// </summary>
+        public ReadOnlyMemory<byte> Buffer => buffer;
+
+        public TonNodeBlockIdExt Id
+        {
+            get
+            {
+                TLSpanReader reader = At(0);
+                return TonNodeBlockIdExt.ReadFrom(ref reader);
+            }
+        }
+
+        public TonNodeBlockIdExt Shardblk
+        {
+            get
+            {
+                TLSpanReader reader = At(80);
+                return TonNodeBlockIdExt.ReadFrom(ref reader);
+            }
+        }
+
+        public ReadOnlyMemory<byte> ShardProof => buffer.Slice(shardProofOffset, shardProofLength);
+
+        public ReadOnlyMemory<byte> Proof => buffer.Slice(proofOffset, proofLength);
+
+        public ReadOnlyMemory<byte> State => buffer.Slice(stateOffset, stateLength);
+
+        TLSpanReader At(int offset) => new(buffer.Span.Slice(offset));
+
+        public LiteServerAccountState Materialize()
+        {
+            return new LiteServerAccountState
+            {
+                Id = Id,
+                Shardblk = Shardblk,
+                ShardProof = ShardProof.ToArray(),
+                Proof = Proof.ToArray(),
+                State = State.ToArray(),
+            };
+        }
+    }
+
+    /// <summary>
+    /// View over liteServer.runMethodResult = liteServer.RunMethodResult
+    /// bytes fields are slices of the underlying buffer; Materialize() returns an owning LiteServerRunMethodResult
+    /// </summary>
+    public readonly struct LiteServerRunMethodResultView
+    {
+        readonly ReadOnlyMemory<byte> buffer;
+        readonly int shardProofOffset;
+        readonly int shardProofLength;
+        readonly int proofOffset;
+        readonly int proofLength;
+        readonly int stateProofOffset;
+        readonly int stateProofLength;
+        readonly int initC7Offset;
+        readonly int initC7Length;
+        readonly int libExtrasOffset;
+        readonly int libExtrasLength;
+        readonly int exitCodeOffset;
+        readonly int resultOffset;
+        readonly int resultLength;
+
+        public LiteServerRunMethodResultView(ReadOnlyMemory<byte> buffer)
+        {
+            this.buffer = buffer;
+            TLSpanReader reader = new(buffer.Span);
+            uint mode = reader.ReadUInt32();
+            reader.Skip(80);
+            reader.Skip(80);
+            if ((mode & (1u << 0)) != 0)
+                shardProofOffset = reader.SkipBuffer(out shardProofLength);
+            if ((mode & (1u << 0)) != 0)
+                proofOffset = reader.SkipBuffer(out proofLength);
+            if ((mode & (1u << 1)) != 0)
+                stateProofOffset = reader.SkipBuffer(out stateProofLength);
+            if ((mode & (1u << 3)) != 0)
+                initC7Offset = reader.SkipBuffer(out initC7Length);
+            if ((mode & (1u << 4)) != 0)
+                libExtrasOffset = reader.SkipBuffer(out libExtrasLength);
+            exitCodeOffset = reader.Position;
+            reader.Skip(4);
+            if ((mode & (1u << 2)) != 0)
+                resultOffset = reader.SkipBuffer(out resultLength);
+        }
+
+        /// <summary>
+        /// The serialized bytes this view was parsed from
+        /// </summary>
+        public ReadOnlyMemory<byte> Buffer => buffer;
+
+        public uint Mode => At(0).ReadUInt32();
+
+        public TonNodeBlockIdExt Id
+        {
+            get
+            {
+                TLSpanReader reader = At(4);
+                return TonNodeBlockIdExt.ReadFrom(ref reader);
+            }
+        }
+
+        public TonNodeBlockIdExt Shardblk
+        {
+            get
+            {
+                TLSpanReader reader = At(84);
+                return TonNodeBlockIdExt.ReadFrom(ref reader);
+            }
+        }
+
+        public ReadOnlyMemory<byte> ShardProof => buffer.Slice(shardProofOffset, shardProofLength);
+
+        public ReadOnlyMemory<byte> Proof => buffer.Slice(proofOffset, proofLength);
+
+        public ReadOnlyMemory<byte> StateProof => buffer.Slice(stateProofOffset, stateProofLength);
+
+        public ReadOnlyMemory<byte> InitC7 => buffer.Slice(initC7Offset, initC7Length);
+
+        public ReadOnlyMemory<byte> LibExtras => buffer.Slice(libExtrasOffset, libExtrasLength);
+
+        public int ExitCode => At(exitCodeOffset).ReadInt32();
+
+        public ReadOnlyMemory<byte> Result => buffer.Slice(resultOffset, resultLength);
+
+        TLSpanReader At(int offset) => new(buffer.Span.Slice(offset));
+
+        public LiteServerRunMethodResult Materialize()
+        {
+            return new LiteServerRunMethodResult
+            {
+                Mode = Mode,
+                Id = Id,
+                Shardblk = Shardblk,
+                ShardProof = ShardProof.ToArray(),
+                Proof = Proof.ToArray(),
+                StateProof = StateProof.ToArray(),
+                InitC7 = InitC7.ToArray(),
+                LibExtras = LibExtras.ToArray(),
+                ExitCode = ExitCode,
+                Result = Result.ToArray(),
+            };
+        }
+    }
+
+    /// <summary>
+    /// View over liteServer.shardInfo = liteServer.ShardInfo
+    /// bytes fields are slices of the underlying buffer; Materialize() returns an owning LiteServerShardInfo
+    /// </summary>
+    public readonly struct LiteServerShardInfoView
+    {
+        readonly ReadOnlyMemory<byte> buffer;
+        readonly int shardProofOffset;
+        readonly int shardProofLength;
+        readonly int shardDescrOffset;
+        readonly int shardDescrLength;
+
+        public LiteServerShardInfoView(ReadOnlyMemory<byte> buffer)
+        {
+            this.buffer = buffer;
+            TLSpanReader reader = new(buffer.Span);
+            reader.Skip(80);
+            reader.Skip(80);
+            shardProofOffset = reader.SkipBuffer(out shardProofLength);
+            shardDescrOffset = reader.SkipBuffer(out shardDescrLength);
+        }
+
+        /// <summary>
+        /// The serialized bytes this view was parsed from
+        /// </summary>
+        public ReadOnlyMemory<byte> Buffer => buffer;
+
+        public TonNodeBlockIdExt Id
+        {
+            get
+            {
+                TLSpanReader reader = At(0);
+                return TonNodeBlockIdExt.ReadFrom(ref reader);
+            }
+        }
+
+        public TonNodeBlockIdExt Shardblk
+        {
+            get
+            {
+                TLSpanReader reader = At(80);
+                return TonNodeBlockIdExt.ReadFrom(ref reader);
+            }
+        }
+
+        public ReadOnlyMemory<byte> ShardProof => buffer.Slice(shardProofOffset, shardProofLength);
+
+        public ReadOnlyMemory<byte> ShardDescr => buffer.Slice(shardDescrOffset, shardDescrLength);
+
+        TLSpanReader At(int offset) => new(buffer.Span.Slice(offset));
+
+        public LiteServerShardInfo Materialize()
+        {
+            return new LiteServerShardInfo
+            {
+                Id = Id,
+                Shardblk = Shardblk,
+                ShardProof = ShardProof.ToArray(),
+                ShardDescr = ShardDescr.ToArray(),
+            };
+        }
+    }
+
+    /// <summary>
+    /// View over liteServer.allShardsInfo = liteServer.AllShardsInfo
+    /// bytes fields are slices of the underlying buffer; Materialize() returns an owning LiteServerAllShardsInfo
+    /// </summary>
+    public readonly struct LiteServerAllShardsInfoView
+    {
+        readonly ReadOnlyMemory<byte> buffer;
+        readonly int proofOffset;
+        readonly int proofLength;
+        readonly int dataOffset;
+        readonly int dataLength;
+
+        public LiteServerAllShardsInfoView(ReadOnlyMemory<byte> buffer)
+        {
+            this.buffer = buffer;
+            TLSpanReader reader = new(buffer.Span);
+            reader.Skip(80);
+            proofOffset = reader.SkipBuffer(out proofLength);
+            dataOffset = reader.SkipBuffer(out dataLength);
+        }
+
+        /// <summary>
+        /// The serialized bytes this view was parsed from
+        /// </summary>
+        public ReadOnlyMemory<byte> Buffer => buffer;
+
+        public TonNodeBlockIdExt Id
+        {
+            get
+            {
+                TLSpanReader reader = At(0);
+                return TonNodeBlockIdExt.ReadFrom(ref reader);
+            }
+        }
+
+        public ReadOnlyMemory<byte> Proof => buffer.Slice(proofOffset, proofLength);
+
+        public ReadOnlyMemory<byte> Data => buffer.Slice(dataOffset, dataLength);
+
+        TLSpanReader At(int offset) => new(buffer.Span.Slice(offset));
+
+        public LiteServerAllShardsInfo Materialize()
+        {
+            return new LiteServerAllShardsInfo
+            {
+                Id = Id,
+                Proof = Proof.ToArray(),
+                Data = Data.ToArray(),
+            };
+        }
+    }
+
+    /// <summary>
+    /// View over liteServer.transactionInfo = liteServer.TransactionInfo
+    /// bytes fields are slices of the underlying buffer; Materialize() returns an owning LiteServerTransactionInfo
+    /// </summary>
+    public readonly struct LiteServerTransactionInfoView
+    {
+        readonly ReadOnlyMemory<byte> buffer;
+        readonly int proofOffset;
+        readonly int proofLength;
+        readonly int transactionOffset;
+        readonly int transactionLength;
+
+        public LiteServerTransactionInfoView(ReadOnlyMemory<byte> buffer)
+        {
+            this.buffer = buffer;
+            TLSpanReader reader = new(buffer.Span);
+            reader.Skip(80);
+            proofOffset = reader.SkipBuffer(out proofLength);
+            transactionOffset = reader.SkipBuffer(out transactionLength);
+        }
+
+        /// <summary>
+        /// The serialized bytes this view was parsed from
+        /// </summary>
+        public ReadOnlyMemory<byte> Buffer => buffer;
+
+        public TonNodeBlockIdExt Id
+        {
+            get
+            {
+                TLSpanReader reader = At(0);
+                return TonNodeBlockIdExt.ReadFrom(ref reader);
+            }
+        }
+
+        public ReadOnlyMemory<byte> Proof => buffer.Slice(proofOffset, proofLength);
+
+        public ReadOnlyMemory<byte> Transaction => buffer.Slice(transactionOffset, transactionLength);
+
+        TLSpanReader At(int offset) => new(buffer.Span.Slice(offset));
+
+        public LiteServerTransactionInfo Materialize()
+        {
+            return new LiteServerTransactionInfo
+            {
+                Id = Id,
+                Proof = Proof.ToArray(),
+                Transaction = Transaction.ToArray(),
+            };
+        }
+    }
+
+    /// <summary>
+    /// View over liteServer.blockTransactionsExt = liteServer.BlockTransactionsExt
+    /// bytes fields are slices of the underlying buffer; Materialize() returns an owning LiteServerBlockTransactionsExt
+    /// </summary>
+    public readonly struct LiteServerBlockTransactionsExtView
+    {
+        readonly ReadOnlyMemory<byte> buffer;
+        readonly int transactionsOffset;
+        readonly int transactionsLength;
+        readonly int proofOffset;
+        readonly int proofLength;
+
+        public LiteServerBlockTransactionsExtView(ReadOnlyMemory<byte> buffer)
+        {
+            this.buffer = buffer;
+            TLSpanReader reader = new(buffer.Span);
+            reader.Skip(80);
+            reader.Skip(4);
+            reader.Skip(4);
+            transactionsOffset = reader.SkipBuffer(out transactionsLength);
+            proofOffset = reader.SkipBuffer(out proofLength);
+        }
+
+        /// <summary>
+        /// The serialized bytes this view was parsed from
+        /// </summary>
+        public ReadOnlyMemory<byte> Buffer => buffer;
+
+        public TonNodeBlockIdExt Id
+        {
+            get
+            {
+                TLSpanReader reader = At(0);
+                return TonNodeBlockIdExt.ReadFrom(ref reader);
+            }
+        }
+
+        public uint ReqCount => At(80).ReadUInt32();
+
+        public bool Incomplete => At(84).ReadBool();
+
+        public ReadOnlyMemory<byte> Transactions => buffer.Slice(transactionsOffset, transactionsLength);
+
+        public ReadOnlyMemory<byte> Proof => buffer.Slice(proofOffset, proofLength);
+
+        TLSpanReader At(int offset) => new(buffer.Span.Slice(offset));
+
+        public LiteServerBlockTransactionsExt Materialize()
+        {
+            return new LiteServerBlockTransactionsExt
+            {
+                Id = Id,
+                ReqCount = ReqCount,
+                Incomplete = Incomplete,
+                Transactions = Transactions.ToArray(),
+                Proof = Proof.ToArray(),
+            };
+        }
+    }
+
+    /// <summary>
+    /// View over liteServer.configInfo = liteServer.ConfigInfo
+    /// bytes fields are slices of the underlying buffer; Materialize() returns an owning LiteServerConfigInfo
+    /// </summary>
+    public readonly struct LiteServerConfigInfoView
+    {
+        readonly ReadOnlyMemory<byte> buffer;
+        readonly int stateProofOffset;
+        readonly int stateProofLength;
+        readonly int configProofOffset;
+        readonly int configProofLength;
+
+        public LiteServerConfigInfoView(ReadOnlyMemory<byte> buffer)
+        {
+            this.buffer = buffer;
+            TLSpanReader reader = new(buffer.Span);
+            reader.Skip(4);
+            reader.Skip(80);
+            stateProofOffset = reader.SkipBuffer(out stateProofLength);
+            configProofOffset = reader.SkipBuffer(out configProofLength);
+        }
+
+        /// <summary>
+        /// The serialized bytes this view was parsed from
+        /// </summary>
+        public ReadOnlyMemory<byte> Buffer => buffer;
+
+        public uint Mode => At(0).ReadUInt32();
+
+        public TonNodeBlockIdExt Id
+        {
+            get
+            {
+                TLSpanReader reader = At(4);
+                return TonNodeBlockIdExt.ReadFrom(ref reader);
+            }
+        }
+
+        public ReadOnlyMemory<byte> StateProof => buffer.Slice(stateProofOffset, stateProofLength);
+
+        public ReadOnlyMemory<byte> ConfigProof => buffer.Slice(configProofOffset, configProofLength);
+
+        TLSpanReader At(int offset) => new(buffer.Span.Slice(offset));
+
+        public LiteServerConfigInfo Materialize()
+        {
+            return new LiteServerConfigInfo
+            {
+                Mode = Mode,
+                Id = Id,
+                StateProof = StateProof.ToArray(),
+                ConfigProof = ConfigProof.ToArray(),
+            };
+        }
+    }
+
+    /// <summary>
+    /// View over liteServer.validatorStats = liteServer.ValidatorStats
+    /// bytes fields are slices of the underlying buffer; Materialize() returns an owning LiteServerValidatorStats
+    /// </summary>
+    public readonly struct LiteServerValidatorStatsView
+    {
+        readonly ReadOnlyMemory<byte> buffer;
+        readonly int stateProofOffset;
+        readonly int stateProofLength;
+        readonly int dataProofOffset;
+        readonly int dataProofLength;
+
+        public LiteServerValidatorStatsView(ReadOnlyMemory<byte> buffer)
+        {
+            this.buffer = buffer;
+            TLSpanReader reader = new(buffer.Span);
+            reader.Skip(4);
+            reader.Skip(80);
+            reader.Skip(4);
+            reader.Skip(4);
+            stateProofOffset = reader.SkipBuffer(out stateProofLength);
+            dataProofOffset = reader.SkipBuffer(out dataProofLength);
+        }
+
+        /// <summary>
+        /// The serialized bytes this view was parsed from
+        /// </summary>
+        public ReadOnlyMemory<byte> Buffer => buffer;
+
+        public uint Mode => At(0).ReadUInt32();
+
+        public TonNodeBlockIdExt Id
+        {
+            get
+            {
+                TLSpanReader reader = At(4);
+                return TonNodeBlockIdExt.ReadFrom(ref reader);
+            }
+        }
+
+        public int Count => At(84).ReadInt32();
+
+        public bool Complete => At(88).ReadBool();
+
+        public ReadOnlyMemory<byte> StateProof => buffer.Slice(stateProofOffset, stateProofLength);
+
+        public ReadOnlyMemory<byte> DataProof => buffer.Slice(dataProofOffset, dataProofLength);
+
+        TLSpanReader At(int offset) => new(buffer.Span.Slice(offset));
+
+        public LiteServerValidatorStats Materialize()
+        {
+            return new LiteServerValidatorStats
+            {
+                Mode = Mode,
+                Id = Id,
+                Count = Count,
+                Complete = Complete,
+                StateProof = StateProof.ToArray(),
+                DataProof = DataProof.ToArray(),
+            };
+        }
+    }
+
+    /// <summary>
+    /// View over liteServer.blockOutMsgQueueSize = liteServer.BlockOutMsgQueueSize
+    /// bytes fields are slices of the underlying buffer; Materialize() returns an owning LiteServerBlockOutMsgQueueSize
+    /// </summary>
+    public readonly struct LiteServerBlockOutMsgQueueSizeView
+    {
+        readonly ReadOnlyMemory<byte> buffer;
+        readonly int proofOffset;
+        readonly int proofLength;
+
+        public LiteServerBlockOutMsgQueueSizeView(ReadOnlyMemory<byte> buffer)
+        {
+            this.buffer = buffer;
+            TLSpanReader reader = new(buffer.Span);
+            uint mode = reader.ReadUInt32();
+            reader.Skip(80);
+            reader.Skip(8);
+            if ((mode & (1u << 0)) != 0)
+                proofOffset = reader.SkipBuffer(out proofLength);
+        }
+
+        /// <summary>
+        /// The serialized bytes this view was parsed from
+        /// </summary>
+        public ReadOnlyMemory<byte> Buffer => buffer;
+
+        public uint Mode => At(0).ReadUInt32();
+
+        public TonNodeBlockIdExt Id
+        {
+            get
+            {
+                TLSpanReader reader = At(4);
+                return TonNodeBlockIdExt.ReadFrom(ref reader);
+            }
+        }
+
+        public long Size => At(84).ReadInt64();
+
+        public ReadOnlyMemory<byte> Proof => buffer.Slice(proofOffset, proofLength);
+
+        TLSpanReader At(int offset) => new(buffer.Span.Slice(offset));
+
+        public LiteServerBlockOutMsgQueueSize Materialize()
+        {
+            return new LiteServerBlockOutMsgQueueSize
+            {
+                Mode = Mode,
+                Id = Id,
+                Size = Size,
+                Proof = Proof.ToArray(),
+            };
+        }
+    }
+
+    /// <summary>
+    /// View over liteServer.nonfinal.candidate = liteServer.nonfinal.Candidate
+    /// bytes fields are slices of the underlying buffer; Materialize() returns an owning LiteServerNonfinalCandidate
+    /// </summary>
+    public readonly struct LiteServerNonfinalCandidateView
+    {
+        readonly ReadOnlyMemory<byte> buffer;
+        readonly int dataOffset;
+        readonly int dataLength;
+        readonly int collatedDataOffset;
+        readonly int collatedDataLength;
+
+        public LiteServerNonfinalCandidateView(ReadOnlyMemory<byte> buffer)
+        {
+            this.buffer = buffer;
+            TLSpanReader reader = new(buffer.Span);
+            reader.Skip(144);
+            dataOffset = reader.SkipBuffer(out dataLength);
+            collatedDataOffset = reader.SkipBuffer(out collatedDataLength);
+        }
+
+        /// <summary>
+        /// The serialized bytes this view was parsed from
+        /// </summary>
+        public ReadOnlyMemory<byte> Buffer => buffer;
+
+        public LiteServerNonfinalCandidateId Id
+        {
+            get
+            {
+                TLSpanReader reader = At(0);
+                return LiteServerNonfinalCandidateId.ReadFrom(ref reader);
+            }
+        }
+
+        public ReadOnlyMemory<byte> Data => buffer.Slice(dataOffset, dataLength);
+
+        public ReadOnlyMemory<byte> CollatedData => buffer.Slice(collatedDataOffset, collatedDataLength);
+
+        TLSpanReader At(int offset) => new(buffer.Span.Slice(offset));
+
+        public LiteServerNonfinalCandidate Materialize()
+        {
+            return new LiteServerNonfinalCandidate
+            {
+                Id = Id,
+                Data = Data.ToArray(),
+                CollatedData = CollatedData.ToArray(),
+            };
+        }
+    }
+
+    // ============================================================================
+    // Requests (liteServer.* functions)
+    // ============================================================================
+
+    /// <summary>
+    /// liteServer.getMasterchainInfo = liteServer.MasterchainInfo
+    /// </summary>
+    public class LiteServerGetMasterchainInfoRequest : ILiteServerRequest
+    {
+        public const uint Constructor = 0xBF56BE80;
+
+        public int GetSerializedSize() => 4;
+
+        public  void WriteTo(TLWriteBuffer writer)
+        {
+            writer.WriteUInt32(Constructor);
+        }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32(Constructor);
+        }
+    }
+
+    /// <summary>
+    /// liteServer.getMasterchainInfoExt = liteServer.MasterchainInfoExt
+    /// </summary>
+    public class LiteServerGetMasterchainInfoExtRequest : ILiteServerRequest
+    {
+        public const uint Constructor = 0x75156F9D;
+
+        public uint Mode { get; set; }
+
+        public int GetSerializedSize() => 8;
+
+        public  void WriteTo(TLWriteBuffer writer)
+        {
+            writer.WriteUInt32(Constructor);
+            writer.WriteUInt32(Mode);
+        }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32(Constructor);
+            writer.WriteUInt32(Mode);
+        }
+    }
+
+    /// <summary>
+    /// liteServer.getTime = liteServer.CurrentTime
+    /// </summary>
+    public class LiteServerGetTimeRequest : ILiteServerRequest
+    {
+        public const uint Constructor = 0x42AB5F46;
+
+        public int GetSerializedSize() => 4;
+
+        public  void WriteTo(TLWriteBuffer writer)
+        {
+            writer.WriteUInt32(Constructor);
+        }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32(Constructor);
+        }
+    }
+
+    /// <summary>
+    /// liteServer.getVersion = liteServer.Version
+    /// </summary>
+    public class LiteServerGetVersionRequest : ILiteServerRequest
+    {
+        public const uint Constructor = 0xF4F8F4B5;
+
+        public int GetSerializedSize() => 4;
+
+        public  void WriteTo(TLWriteBuffer writer)
+        {
+            writer.WriteUInt32(Constructor);
+        }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32(Constructor);
+        }
+    }
+
+    /// <summary>
+    /// liteServer.getBlock = liteServer.BlockData
+    /// </summary>
+    public class LiteServerGetBlockRequest : ILiteServerRequest
+    {
+        public const uint Constructor = 0x1DDB0DDB;
+
+        public TonNodeBlockIdExt Id { get; set; }
+
+        public int GetSerializedSize() => 84;
+
+        public  void WriteTo(TLWriteBuffer writer)
+        {
+            writer.WriteUInt32(Constructor);
+            Id.WriteTo(writer);
+        }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32(Constructor);
+            Id.WriteTo(ref writer);
+        }
+    }
+
+    /// <summary>
+    /// liteServer.getState = liteServer.BlockState
+    /// </summary>
+    public class LiteServerGetStateRequest : ILiteServerRequest
+    {
+        public const uint Constructor = 0x41B17E3E;
+
+        public TonNodeBlockIdExt Id { get; set; }
+
+        public int GetSerializedSize() => 84;
+
+        public  void WriteTo(TLWriteBuffer writer)
+        {
+            writer.WriteUInt32(Constructor);
+            Id.WriteTo(writer);
+        }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32(Constructor);
+            Id.WriteTo(ref writer);
+        }
+    }
+
+    /// <summary>
+    /// liteServer.getBlockHeader = liteServer.BlockHeader
+    /// </summary>
+    public class LiteServerGetBlockHeaderRequest : ILiteServerRequest
+    {
+        public const uint Constructor = 0x749F54EC;
+
+        public TonNodeBlockIdExt Id { get; set; }
+        public uint Mode { get; set; }
+
+        public int GetSerializedSize() => 88;
+
+        public  void WriteTo(TLWriteBuffer writer)
+        {
+            writer.WriteUInt32(Constructor);
+            Id.WriteTo(writer);
+            writer.WriteUInt32(Mode);
+        }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32(Constructor);
+            Id.WriteTo(ref writer);
+            writer.WriteUInt32(Mode);
+        }
+    }
+
+    /// <summary>
+    /// liteServer.sendMessage = liteServer.SendMsgStatus
+    /// </summary>
+    public class LiteServerSendMessageRequest : ILiteServerRequest
+    {
+        public const uint Constructor = 0x60D6EE71;
+
+        public byte[] Body { get; set; } = Array.Empty<byte>();
+
+        public int GetSerializedSize()
+        {
+            int size = 4;
+            size += TLWriteBuffer.GetBufferSize(Body.Length);
+            return size;
+        }
+
+        public  void WriteTo(TLWriteBuffer writer)
+        {
+            writer.WriteUInt32(Constructor);
+            writer.WriteBuffer(Body);
+        }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32(Constructor);
+            writer.WriteBuffer(Body);
+        }
+    }
+
+    /// <summary>
+    /// liteServer.getAccountState = liteServer.AccountState
+    /// </summary>
+    public class LiteServerGetAccountStateRequest : ILiteServerRequest
+    {
+        public const uint Constructor = 0x28665BE0;
+
+        public TonNodeBlockIdExt Id { get; set; }
+        public LiteServerAccountId Account { get; set; }
+
+        public int GetSerializedSize() => 120;
+
+        public  void WriteTo(TLWriteBuffer writer)
+        {
+            writer.WriteUInt32(Constructor);
+            Id.WriteTo(writer);
+            Account.WriteTo(writer);
+        }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32(Constructor);
+            Id.WriteTo(ref writer);
+            Account.WriteTo(ref writer);
+        }
+    }
+
+    /// <summary>
+    /// liteServer.getAccountStatePrunned = liteServer.AccountState
+    /// </summary>
+    public class LiteServerGetAccountStatePrunnedRequest : ILiteServerRequest
+    {
+        public const uint Constructor = 0xFD37FA8F;
+
+        public TonNodeBlockIdExt Id { get; set; }
+        public LiteServerAccountId Account { get; set; }
+
+        public int GetSerializedSize() => 120;
+
+        public  void WriteTo(TLWriteBuffer writer)
+        {
+            writer.WriteUInt32(Constructor);
+            Id.WriteTo(writer);
+            Account.WriteTo(writer);
+        }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32(Constructor);
+            Id.WriteTo(ref writer);
+            Account.WriteTo(ref writer);
+        }
+    }
+
+    /// <summary>
+    /// liteServer.runSmcMethod = liteServer.RunMethodResult
+    /// </summary>
+    public class LiteServerRunSmcMethodRequest : ILiteServerRequest
+    {
+        public const uint Constructor = 0x0B88730C;
+
+        public uint Mode { get; set; }
+        public TonNodeBlockIdExt Id { get; set; }
+        public LiteServerAccountId Account { get; set; }
+        public long MethodId { get; set; }
+        public byte[] Params { get; set; } = Array.Empty<byte>();
+
+        public int GetSerializedSize()
+        {
+            int size = 132;
+            size += TLWriteBuffer.GetBufferSize(Params.Length);
+            return size;
+        }
+
+        public  void WriteTo(TLWriteBuffer writer)
+        {
+            writer.WriteUInt32(Constructor);
+            writer.WriteUInt32(Mode);
+            Id.WriteTo(writer);
+            Account.WriteTo(writer);
+            writer.WriteInt64(MethodId);
+            writer.WriteBuffer(Params);
+        }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32(Constructor);
+            writer.WriteUInt32(Mode);
+            Id.WriteTo(ref writer);
+            Account.WriteTo(ref writer);
+            writer.WriteInt64(MethodId);
+            writer.WriteBuffer(Params);
+        }
+    }
+
+    /// <summary>
+    /// liteServer.getShardInfo = liteServer.ShardInfo
+    /// </summary>
+    public class LiteServerGetShardInfoRequest : ILiteServerRequest
+    {
+        public const uint Constructor = 0x284B701A;
+
+        public TonNodeBlockIdExt Id { get; set; }
+        public int Workchain { get; set; }
+        public long Shard { get; set; }
+        public bool Exact { get; set; }
+
+        public int GetSerializedSize() => 100;
+
+        public  void WriteTo(TLWriteBuffer writer)
+        {
+            writer.WriteUInt32(Constructor);
+            Id.WriteTo(writer);
+            writer.WriteInt32(Workchain);
+            writer.WriteInt64(Shard);
+            writer.WriteBool(Exact);
+        }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32(Constructor);
+            Id.WriteTo(ref writer);
+            writer.WriteInt32(Workchain);
+            writer.WriteInt64(Shard);
+            writer.WriteBool(Exact);
+        }
+    }
+
+    /// <summary>
+    /// liteServer.getAllShardsInfo = liteServer.AllShardsInfo
+    /// </summary>
+    public class LiteServerGetAllShardsInfoRequest : ILiteServerRequest
+    {
+        public const uint Constructor = 0xB91D6D84;
+
+        public TonNodeBlockIdExt Id { get; set; }
+
+        public int GetSerializedSize() => 84;
+
+        public  void WriteTo(TLWriteBuffer writer)
+        {
+            writer.WriteUInt32(Constructor);
+            Id.WriteTo(writer);
+        }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32(Constructor);
+            Id.WriteTo(ref writer);
+        }
+    }
+
+    /// <summary>
+    /// liteServer.getOneTransaction = liteServer.TransactionInfo
+    /// </summary>
+    public class LiteServerGetOneTransactionRequest : ILiteServerRequest
+    {
+        public const uint Constructor = 0x230202EB;
+
+        public TonNodeBlockIdExt Id { get; set; }
+        public LiteServerAccountId Account { get; set; }
+        public long Lt { get; set; }
+
+        public int GetSerializedSize() => 128;
+
+        public  void WriteTo(TLWriteBuffer writer)
+        {
+            writer.WriteUInt32(Constructor);
+            Id.WriteTo(writer);
+            Account.WriteTo(writer);
+            writer.WriteInt64(Lt);
+        }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32(Constructor);
+            Id.WriteTo(ref writer);
+            Account.WriteTo(ref writer);
+            writer.WriteInt64(Lt);
+        }
+    }
+
+    /// <summary>
+    /// liteServer.getTransactions = liteServer.TransactionList
+    /// </summary>
+    public class LiteServerGetTransactionsRequest : ILiteServerRequest
+    {
+        public const uint Constructor = 0xC2C4D530;
+
+        public uint Count { get; set; }
+        public LiteServerAccountId Account { get; set; }
+        public long Lt { get; set; }
+        public TLInt256 Hash { get; set; }
+
+        public int GetSerializedSize() => 84;
+
+        public  void WriteTo(TLWriteBuffer writer)
+        {
+            writer.WriteUInt32(Constructor);
+            writer.WriteUInt32(Count);
+            Account.WriteTo(writer);
+            writer.WriteInt64(Lt);
+            writer.WriteInt256(Hash);
+        }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32(Constructor);
+            writer.WriteUInt32(Count);
+            Account.WriteTo(ref writer);
+            writer.WriteInt64(Lt);
+            writer.WriteInt256(Hash);
+        }
+    }
+
+    /// <summary>
+    /// liteServer.lookupBlock = liteServer.BlockHeader
+    /// </summary>
+    public class LiteServerLookupBlockRequest : ILiteServerRequest
+    {
+        public const uint Constructor = 0x99FCF33D;
+
+        public uint Mode { get; set; }
+        public TonNodeBlockId Id { get; set; }
+        public long Lt { get; set; }
+        public int Utime { get; set; }
+
+        public int GetSerializedSize()
+        {
+            int size = 24;
+            if ((Mode & (1u << 1)) != 0)
+            {
+                size += 8;
+            }
+            if ((Mode & (1u << 2)) != 0)
+            {
+                size += 4;
+            }
+            return size;
+        }
+
+        public  void WriteTo(TLWriteBuffer writer)
+        {
+            writer.WriteUInt32(Constructor);
+            writer.WriteUInt32(Mode);
+            Id.WriteTo(writer);
+            if ((Mode & (1u << 1)) != 0)
+            {
+                writer.WriteInt64(Lt);
+            }
+            if ((Mode & (1u << 2)) != 0)
+            {
+                writer.WriteInt32(Utime);
+            }
+        }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32(Constructor);
+            writer.WriteUInt32(Mode);
+            Id.WriteTo(ref writer);
+            if ((Mode & (1u << 1)) != 0)
+            {
+                writer.WriteInt64(Lt);
+            }
+            if ((Mode & (1u << 2)) != 0)
+            {
+                writer.WriteInt32(Utime);
+            }
+        }
+    }
+
+    /// <summary>
+    /// liteServer.lookupBlockWithProof = liteServer.LookupBlockResult
+    /// </summary>
+    public class LiteServerLookupBlockWithProofRequest : ILiteServerRequest
+    {
+        public const uint Constructor = 0xD0F378D8;
+
+        public uint Mode { get; set; }
+        public TonNodeBlockId Id { get; set; }
+        public TonNodeBlockIdExt McBlockId { get; set; }
+        public long Lt { get; set; }
+        public int Utime { get; set; }
+
+        public int GetSerializedSize()
+        {
+            int size = 104;
+            if ((Mode & (1u << 1)) != 0)
+            {
+                size += 8;
+            }
+            if ((Mode & (1u << 2)) != 0)
+            {
+                size += 4;
+            }
+            return size;
+        }
+
+        public  void WriteTo(TLWriteBuffer writer)
+        {
+            writer.WriteUInt32(Constructor);
+            writer.WriteUInt32(Mode);
+            Id.WriteTo(writer);
+            McBlockId.WriteTo(writer);
+            if ((Mode & (1u << 1)) != 0)
+            {
+                writer.WriteInt64(Lt);
+            }
+            if ((Mode & (1u << 2)) != 0)
+            {
+                writer.WriteInt32(Utime);
+            }
+        }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32(Constructor);
+            writer.WriteUInt32(Mode);
+            Id.WriteTo(ref writer);
+            McBlockId.WriteTo(ref writer);
+            if ((Mode & (1u << 1)) != 0)
+            {
+                writer.WriteInt64(Lt);
+            }
+            if ((Mode & (1u << 2)) != 0)
+            {
+                writer.WriteInt32(Utime);
+            }
+        }
+    }
+
+    /// <summary>
+    /// liteServer.listBlockTransactions = liteServer.BlockTransactions
+    /// </summary>
+    public class LiteServerListBlockTransactionsRequest : ILiteServerRequest
+    {
+        public const uint Constructor = 0x05A2C1A4;
+
+        public TonNodeBlockIdExt Id { get; set; }
+        public uint Mode { get; set; }
+        public uint Count { get; set; }
+        public LiteServerTransactionId3 After { get; set; }
+
+        public bool ReverseOrder
+        {
+            get => (Mode & (1u << 6)) != 0;
+            set => Mode = value ? Mode | (1u << 6) : Mode & ~(1u << 6);
+        }
+
+        public bool WantProof
+        {
+            get => (Mode & (1u << 5)) != 0;
+            set => Mode = value ? Mode | (1u << 5) : Mode & ~(1u << 5);
+        }
+
+        public int GetSerializedSize()
+        {
+            int size = 92;
+            if ((Mode & (1u << 7)) != 0)
+            {
+                size += 40;
+            }
+            return size;
+        }
+
+        public  void WriteTo(TLWriteBuffer writer)
+        {
+            writer.WriteUInt32(Constructor);
+            Id.WriteTo(writer);
+            writer.WriteUInt32(Mode);
+            writer.WriteUInt32(Count);
+            if ((Mode & (1u << 7)) != 0)
+            {
+                After.WriteTo(writer);
+            }
+        }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32(Constructor);
+            Id.WriteTo(ref writer);
+            writer.WriteUInt32(Mode);
+            writer.WriteUInt32(Count);
+            if ((Mode & (1u << 7)) != 0)
+            {
+                After.WriteTo(ref writer);
+            }
+        }
+    }
+
+    /// <summary>
+    /// liteServer.listBlockTransactionsExt = liteServer.BlockTransactionsExt
+    /// </summary>
+    public class LiteServerListBlockTransactionsExtRequest : ILiteServerRequest
+    {
+        public const uint Constructor = 0x01D462AB;
+
+        public TonNodeBlockIdExt Id { get; set; }
+        public uint Mode { get; set; }
+        public uint Count { get; set; }
+        public LiteServerTransactionId3 After { get; set; }
+
+        public bool ReverseOrder
+        {
+            get => (Mode & (1u << 6)) != 0;
+            set => Mode = value ? Mode | (1u << 6) : Mode & ~(1u << 6);
+        }
+
+        public bool WantProof
+        {
+            get => (Mode & (1u << 5)) != 0;
+            set => Mode = value ? Mode | (1u << 5) : Mode & ~(1u << 5);
+        }
+
+        public int GetSerializedSize()
+        {
+            int size = 92;
+            if ((Mode & (1u << 7)) != 0)
+            {
+                size += 40;
+            }
+            return size;
+        }
+
+        public  void WriteTo(TLWriteBuffer writer)
+        {
+            writer.WriteUInt32(Constructor);
+            Id.WriteTo(writer);
+            writer.WriteUInt32(Mode);
+            writer.WriteUInt32(Count);
+            if ((Mode & (1u << 7)) != 0)
+            {
+                After.WriteTo(writer);
+            }
+        }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32(Constructor);
+            Id.WriteTo(ref writer);
+            writer.WriteUInt32(Mode);
+            writer.WriteUInt32(Count);
+            if ((Mode & (1u << 7)) != 0)
+            {
+                After.WriteTo(ref writer);
+            }
+        }
+    }
+
+    /// <summary>
+    /// liteServer.getBlockProof = liteServer.PartialBlockProof
+    /// </summary>
+    public class LiteServerGetBlockProofRequest : ILiteServerRequest
+    {
+        public const uint Constructor = 0x123269BC;
+
+        public uint Mode { get; set; }
+        public TonNodeBlockIdExt KnownBlock { get; set; }
+        public TonNodeBlockIdExt TargetBlock { get; set; }
+
+        public int GetSerializedSize()
+        {
+            int size = 88;
+            if ((Mode & (1u << 0)) != 0)
+            {
+                size += 80;
+            }
+            return size;
+        }
+
+        public  void WriteTo(TLWriteBuffer writer)
+        {
+            writer.WriteUInt32(Constructor);
+            writer.WriteUInt32(Mode);
+            KnownBlock.WriteTo(writer);
+            if ((Mode & (1u << 0)) != 0)
+            {
+                TargetBlock.WriteTo(writer);
+            }
+        }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32(Constructor);
+            writer.WriteUInt32(Mode);
+            KnownBlock.WriteTo(ref writer);
+            if ((Mode & (1u << 0)) != 0)
+            {
+                TargetBlock.WriteTo(ref writer);
+            }
+        }
+    }
+
+    /// <summary>
+    /// liteServer.getConfigAll = liteServer.ConfigInfo
+    /// </summary>
+    public class LiteServerGetConfigAllRequest : ILiteServerRequest
+    {
+        public const uint Constructor = 0x369D3BA0;
+
+        public uint Mode { get; set; }
+        public TonNodeBlockIdExt Id { get; set; }
+
+        public int GetSerializedSize() => 88;
+
+        public  void WriteTo(TLWriteBuffer writer)
+        {
+            writer.WriteUInt32(Constructor);
+            writer.WriteUInt32(Mode);
+            Id.WriteTo(writer);
+        }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32(Constructor);
+            writer.WriteUInt32(Mode);
+            Id.WriteTo(ref writer);
+        }
+    }
+
+    /// <summary>
+    /// liteServer.getConfigParams = liteServer.ConfigInfo
+    /// </summary>
+    public class LiteServerGetConfigParamsRequest : ILiteServerRequest
+    {
+        public const uint Constructor = 0xB72CCEC6;
+
+        public uint Mode { get; set; }
+        public TonNodeBlockIdExt Id { get; set; }
+        public int[] ParamList { get; set; } = Array.Empty<int>();
+
+        public int GetSerializedSize()
+        {
+            int size = 92;
+            size += ParamList.Length * 4;
+            return size;
+        }
+
+        public  void WriteTo(TLWriteBuffer writer)
+        {
+            writer.WriteUInt32(Constructor);
+            writer.WriteUInt32(Mode);
+            Id.WriteTo(writer);
+            writer.WriteInt32Vector(ParamList);
+        }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32(Constructor);
+            writer.WriteUInt32(Mode);
+            Id.WriteTo(ref writer);
+            writer.WriteInt32Vector(ParamList);
+        }
+    }
+
+    /// <summary>
+    /// liteServer.getValidatorStats = liteServer.ValidatorStats
+    /// </summary>
+    public class LiteServerGetValidatorStatsRequest : ILiteServerRequest
+    {
+        public const uint Constructor = 0xEA3D087F;
+
+        public uint Mode { get; set; }
+        public TonNodeBlockIdExt Id { get; set; }
+        public int Limit { get; set; }
+        public TLInt256 StartAfter { get; set; }
+        public int ModifiedAfter { get; set; }
+
+        public int GetSerializedSize()
+        {
+            int size = 92;
+            if ((Mode & (1u << 0)) != 0)
+            {
+                size += 32;
+            }
+            if ((Mode & (1u << 2)) != 0)
+            {
+                size += 4;
+            }
+            return size;
+        }
+
+        public  void WriteTo(TLWriteBuffer writer)
+        {
+            writer.WriteUInt32(Constructor);
+            writer.WriteUInt32(Mode);
+            Id.WriteTo(writer);
+            writer.WriteInt32(Limit);
+            if ((Mode & (1u << 0)) != 0)
+            {
+                writer.WriteInt256(StartAfter);
+            }
+            if ((Mode & (1u << 2)) != 0)
+            {
+                writer.WriteInt32(ModifiedAfter);
+            }
+        }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32(Constructor);
+            writer.WriteUInt32(Mode);
+            Id.WriteTo(ref writer);
+            writer.WriteInt32(Limit);
+            if ((Mode & (1u << 0)) != 0)
+            {
+                writer.WriteInt256(StartAfter);
+            }
+            if ((Mode & (1u << 2)) != 0)
+            {
+                writer.WriteInt32(ModifiedAfter);
+            }
+        }
+    }
+
+    /// <summary>
+    /// liteServer.getLibraries = liteServer.LibraryResult
+    /// </summary>
+    public class LiteServerGetLibrariesRequest : ILiteServerRequest
+    {
+        public const uint Constructor = 0xEAA43351;
+
+        public TLInt256[] LibraryList { get; set; } = Array.Empty<TLInt256>();
+
+        public int GetSerializedSize()
+        {
+            int size = 8;
+            size += LibraryList.Length * 32;
+            return size;
+        }
+
+        public  void WriteTo(TLWriteBuffer writer)
+        {
+            writer.WriteUInt32(Constructor);
+            writer.WriteInt256Vector(LibraryList);
+        }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32(Constructor);
+            writer.WriteInt256Vector(LibraryList);
+        }
+    }
+
+    /// <summary>
+    /// liteServer.getLibrariesWithProof = liteServer.LibraryResultWithProof
+    /// </summary>
+    public class LiteServerGetLibrariesWithProofRequest : ILiteServerRequest
+    {
+        public const uint Constructor = 0x325B04FF;
+
+        public TonNodeBlockIdExt Id { get; set; }
+        public uint Mode { get; set; }
+        public TLInt256[] LibraryList { get; set; } = Array.Empty<TLInt256>();
+
+        public int GetSerializedSize()
+        {
+            int size = 92;
+            size += LibraryList.Length * 32;
+            return size;
+        }
+
+        public  void WriteTo(TLWriteBuffer writer)
+        {
+            writer.WriteUInt32(Constructor);
+            Id.WriteTo(writer);
+            writer.WriteUInt32(Mode);
+            writer.WriteInt256Vector(LibraryList);
+        }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32(Constructor);
+            Id.WriteTo(ref writer);
+            writer.WriteUInt32(Mode);
+            writer.WriteInt256Vector(LibraryList);
+        }
+    }
+
+    /// <summary>
+    /// liteServer.getShardBlockProof = liteServer.ShardBlockProof
+    /// </summary>
+    public class LiteServerGetShardBlockProofRequest : ILiteServerRequest
+    {
+        public const uint Constructor = 0x082EF15E;
+
+        public TonNodeBlockIdExt Id { get; set; }
+
+        public int GetSerializedSize() => 84;
+
+        public  void WriteTo(TLWriteBuffer writer)
+        {
+            writer.WriteUInt32(Constructor);
+            Id.WriteTo(writer);
+        }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32(Constructor);
+            Id.WriteTo(ref writer);
+        }
+    }
+
+    /// <summary>
+    /// liteServer.getOutMsgQueueSizes = liteServer.OutMsgQueueSizes
+    /// </summary>
+    public class LiteServerGetOutMsgQueueSizesRequest : ILiteServerRequest
+    {
+        public const uint Constructor = 0xACC852AC;
+
+        public uint Mode { get; set; }
+        public int Wc { get; set; }
+        public long Shard { get; set; }
+
+        public int GetSerializedSize()
+        {
+            int size = 8;
+            if ((Mode & (1u << 0)) != 0)
+            {
+                size += 4;
+            }
+            if ((Mode & (1u << 0)) != 0)
+            {
+                size += 8;
+            }
+            return size;
+        }
+
+        public  void WriteTo(TLWriteBuffer writer)
+        {
+            writer.WriteUInt32(Constructor);
+            writer.WriteUInt32(Mode);
+            if ((Mode & (1u << 0)) != 0)
+            {
+                writer.WriteInt32(Wc);
+            }
+            if ((Mode & (1u << 0)) != 0)
+            {
+                writer.WriteInt64(Shard);
+            }
+        }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32(Constructor);
+            writer.WriteUInt32(Mode);
+            if ((Mode & (1u << 0)) != 0)
+            {
+                writer.WriteInt32(Wc);
+            }
+            if ((Mode & (1u << 0)) != 0)
+            {
+                writer.WriteInt64(Shard);
+            }
+        }
+    }
+
+    /// <summary>
+    /// liteServer.getBlockOutMsgQueueSize = liteServer.BlockOutMsgQueueSize
+    /// </summary>
+    public class LiteServerGetBlockOutMsgQueueSizeRequest : ILiteServerRequest
+    {
+        public const uint Constructor = 0x4A5FA346;
+
+        public uint Mode { get; set; }
+        public TonNodeBlockIdExt Id { get; set; }
+
+        public bool WantProof
+        {
+            get => (Mode & (1u << 0)) != 0;
+            set => Mode = value ? Mode | (1u << 0) : Mode & ~(1u << 0);
+        }
+
+        public int GetSerializedSize() => 88;
+
+        public  void WriteTo(TLWriteBuffer writer)
+        {
+            writer.WriteUInt32(Constructor);
+            writer.WriteUInt32(Mode);
+            Id.WriteTo(writer);
+        }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32(Constructor);
+            writer.WriteUInt32(Mode);
+            Id.WriteTo(ref writer);
+        }
+    }
+
+    /// <summary>
+    /// liteServer.getDispatchQueueInfo = liteServer.DispatchQueueInfo
+    /// </summary>
+    public class LiteServerGetDispatchQueueInfoRequest : ILiteServerRequest
+    {
+        public const uint Constructor = 0x47BC4364;
+
+        public uint Mode { get; set; }
+        public TonNodeBlockIdExt Id { get; set; }
+        public TLInt256 AfterAddr { get; set; }
+        public int MaxAccounts { get; set; }
+
+        public bool WantProof
+        {
+            get => (Mode & (1u << 0)) != 0;
+            set => Mode = value ? Mode | (1u << 0) : Mode & ~(1u << 0);
+        }
+
+        public int GetSerializedSize()
+        {
+            int size = 92;
+            if ((Mode & (1u << 1)) != 0)
+            {
+                size += 32;
+            }
+            return size;
+        }
+
+        public  void WriteTo(TLWriteBuffer writer)
+        {
+            writer.WriteUInt32(Constructor);
+            writer.WriteUInt32(Mode);
+            Id.WriteTo(writer);
+            if ((Mode & (1u << 1)) != 0)
+            {
+                writer.WriteInt256(AfterAddr);
+            }
+            writer.WriteInt32(MaxAccounts);
+        }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32(Constructor);
+            writer.WriteUInt32(Mode);
+            Id.WriteTo(ref writer);
+            if ((Mode & (1u << 1)) != 0)
+            {
+                writer.WriteInt256(AfterAddr);
+            }
+            writer.WriteInt32(MaxAccounts);
+        }
+    }
+
+    /// <summary>
+    /// liteServer.getDispatchQueueMessages = liteServer.DispatchQueueMessages
+    /// </summary>
+    public class LiteServerGetDispatchQueueMessagesRequest : ILiteServerRequest
+    {
+        public const uint Constructor = 0x3CB773C5;
+
+        public uint Mode { get; set; }
+        public TonNodeBlockIdExt Id { get; set; }
+        public TLInt256 Addr { get; set; }
+        public long AfterLt { get; set; }
+        public int MaxMessages { get; set; }
+
+        public bool WantProof
+        {
+            get => (Mode & (1u << 0)) != 0;
+            set => Mode = value ? Mode | (1u << 0) : Mode & ~(1u << 0);
+        }
+
+        public bool OneAccount
+        {
+            get => (Mode & (1u << 1)) != 0;
+            set => Mode = value ? Mode | (1u << 1) : Mode & ~(1u << 1);
+        }
+
+        public bool MessagesBoc
+        {
+            get => (Mode & (1u << 2)) != 0;
+            set => Mode = value ? Mode | (1u << 2) : Mode & ~(1u << 2);
+        }
+
+        public int GetSerializedSize() => 132;
+
+        public  void WriteTo(TLWriteBuffer writer)
+        {
+            writer.WriteUInt32(Constructor);
+            writer.WriteUInt32(Mode);
+            Id.WriteTo(writer);
+            writer.WriteInt256(Addr);
+            writer.WriteInt64(AfterLt);
+            writer.WriteInt32(MaxMessages);
+        }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32(Constructor);
+            writer.WriteUInt32(Mode);
+            Id.WriteTo(ref writer);
+            writer.WriteInt256(Addr);
+            writer.WriteInt64(AfterLt);
+            writer.WriteInt32(MaxMessages);
+        }
+    }
+
+    /// <summary>
+    /// liteServer.nonfinal.getValidatorGroups = liteServer.nonfinal.ValidatorGroups
+    /// </summary>
+    public class LiteServerNonfinalGetValidatorGroupsRequest : ILiteServerRequest
+    {
+        public const uint Constructor = 0x5AAF2C7E;
+
+        public uint Mode { get; set; }
+        public int Wc { get; set; }
+        public long Shard { get; set; }
+
+        public int GetSerializedSize()
+        {
+            int size = 8;
+            if ((Mode & (1u << 0)) != 0)
+            {
+                size += 4;
+            }
+            if ((Mode & (1u << 0)) != 0)
+            {
+                size += 8;
+            }
+            return size;
+        }
+
+        public  void WriteTo(TLWriteBuffer writer)
+        {
+            writer.WriteUInt32(Constructor);
+            writer.WriteUInt32(Mode);
+            if ((Mode & (1u << 0)) != 0)
+            {
+                writer.WriteInt32(Wc);
+            }
+            if ((Mode & (1u << 0)) != 0)
+            {
+                writer.WriteInt64(Shard);
+            }
+        }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32(Constructor);
+            writer.WriteUInt32(Mode);
+            if ((Mode & (1u << 0)) != 0)
+            {
+                writer.WriteInt32(Wc);
+            }
+            if ((Mode & (1u << 0)) != 0)
+            {
+                writer.WriteInt64(Shard);
+            }
+        }
+    }
+
+    /// <summary>
+    /// liteServer.nonfinal.getCandidate = liteServer.nonfinal.Candidate
+    /// </summary>
+    public class LiteServerNonfinalGetCandidateRequest : ILiteServerRequest
+    {
+        public const uint Constructor = 0x0252FEEE;
+
+        public LiteServerNonfinalCandidateId Id { get; set; }
+
+        public int GetSerializedSize() => 148;
+
+        public  void WriteTo(TLWriteBuffer writer)
+        {
+            writer.WriteUInt32(Constructor);
+            Id.WriteTo(writer);
+        }
+
+        public  void WriteTo(ref TLSpanWriter writer)
+        {
+            writer.WriteUInt32(Constructor);
+            Id.WriteTo(ref writer);
+        }
+    }
+
+    // ============================================================================
+    // Constructor Registry
+    // ============================================================================
+
+    /// <summary>
+    /// Constructor registry for all 50 generated types
+    /// </summary>
+    public static partial class TLSerializer
+    {
+        static readonly uint[] knownConstructors =
+        {
+            0xB0683FE3, // tonNode.blockId
+            0x3DB0AD4C, // tonNode.blockIdExt
+            0x527AFA73, // tonNode.zeroStateIdExt
+            0x1BB566EA, // liteServer.error
+            0x88729074, // liteServer.accountId
+            0xFC3C1D28, // liteServer.libraryEntry
+            0xF9333637, // liteServer.masterchainInfo
+            0xAE76CCDA, // liteServer.masterchainInfoExt
+            0x1D512914, // liteServer.currentTime
+            0xB33314CF, // liteServer.version
+            0x27A85F37, // liteServer.blockData
+            0x6A14E75E, // liteServer.blockState
+            0x071783EB, // liteServer.blockHeader
+            0x0D5B50AB, // liteServer.sendMsgStatus
+            0x7F151E0C, // liteServer.accountState
+            0xB9CA2418, // liteServer.runMethodResult
+            0x8943A75D, // liteServer.shardInfo
+            0x26DFD53B, // liteServer.allShardsInfo
+            0x8BBF0C77, // liteServer.transactionInfo
+            0xED0EC787, // liteServer.transactionList
+            0xFE240165, // liteServer.transactionMetadata
+            0xE944EBD2, // liteServer.transactionId
+            0xAD4463EC, // liteServer.transactionId3
+            0x01FB4F1A, // liteServer.blockTransactions
+            0xC495AF34, // liteServer.blockTransactionsExt
+            0x78AB7D2A, // liteServer.signature
+            0x0DF0E11B, // liteServer.signatureSet
+            0x5353875B, // liteServer.blockLinkBack
+            0x775A5528, // liteServer.blockLinkForward
+            0xF3BB3510, // liteServer.partialBlockProof
+            0xC87640D7, // liteServer.configInfo
+            0xEBB8ABD9, // liteServer.validatorStats
+            0x6A34CEC1, // liteServer.libraryResult
+            0xEE983C56, // liteServer.libraryResultWithProof
+            0xDDD11B76, // liteServer.shardBlockLink
+            0x330401A1, // liteServer.shardBlockProof
+            0x8850F75A, // liteServer.lookupBlockResult
+            0xFE7CB74A, // liteServer.outMsgQueueSize
+            0x2DE458AE, // liteServer.outMsgQueueSizes
+            0xE9E602FB, // liteServer.blockOutMsgQueueSize
+            0x3F213E07, // liteServer.accountDispatchQueueInfo
+            0x569404CB, // liteServer.dispatchQueueInfo
+            0x2352C9EC, // liteServer.dispatchQueueMessage
+            0xF4486B0C, // liteServer.dispatchQueueMessages
+            0xDC8427F8, // liteServer.debug.verbosity
+            0x24EECDA9, // liteServer.nonfinal.candidateId
+            0x87870AE4, // liteServer.nonfinal.candidate
+            0x95FDCCF3, // liteServer.nonfinal.candidateInfo
+            0x928BCA39, // liteServer.nonfinal.validatorGroupInfo
+            0xF982422F, // liteServer.nonfinal.validatorGroups
+        };
+
+        public static IReadOnlyList<uint> KnownConstructors => knownConstructors;
+
+        /// <summary>
+        /// Generated type for a constructor id, or null when the id is unknown
+        /// </summary>
+        public static Type ResolveType(uint constructor)
+        {
+            switch (constructor)
+            {
+                case 0xB0683FE3: return typeof(TonNodeBlockId);
+                case 0x3DB0AD4C: return typeof(TonNodeBlockIdExt);
+                case 0x527AFA73: return typeof(TonNodeZeroStateIdExt);
+                case 0x1BB566EA: return typeof(LiteServerError);
+                case 0x88729074: return typeof(LiteServerAccountId);
+                case 0xFC3C1D28: return typeof(LiteServerLibraryEntry);
+                case 0xF9333637: return typeof(LiteServerMasterchainInfo);
+                case 0xAE76CCDA: return typeof(LiteServerMasterchainInfoExt);
+                case 0x1D512914: return typeof(LiteServerCurrentTime);
+                case 0xB33314CF: return typeof(LiteServerVersion);
+                case 0x27A85F37: return typeof(LiteServerBlockData);
+                case 0x6A14E75E: return typeof(LiteServerBlockState);
+                case 0x071783EB: return typeof(LiteServerBlockHeader);
+                case 0x0D5B50AB: return typeof(LiteServerSendMsgStatus);
+                case 0x7F151E0C: return typeof(LiteServerAccountState);
+                case 0xB9CA2418: return typeof(LiteServerRunMethodResult);
+                case 0x8943A75D: return typeof(LiteServerShardInfo);
+                case 0x26DFD53B: return typeof(LiteServerAllShardsInfo);
+                case 0x8BBF0C77: return typeof(LiteServerTransactionInfo);
+                case 0xED0EC787: return typeof(LiteServerTransactionList);
+                case 0xFE240165: return typeof(LiteServerTransactionMetadata);
+                case 0xE944EBD2: return typeof(LiteServerTransactionId);
+                case 0xAD4463EC: return typeof(LiteServerTransactionId3);
+                case 0x01FB4F1A: return typeof(LiteServerBlockTransactions);
+                case 0xC495AF34: return typeof(LiteServerBlockTransactionsExt);
+                case 0x78AB7D2A: return typeof(LiteServerSignature);
+                case 0x0DF0E11B: return typeof(LiteServerSignatureSet);
+                case 0x5353875B: return typeof(LiteServerBlockLinkBack);
+                case 0x775A5528: return typeof(LiteServerBlockLinkForward);
+                case 0xF3BB3510: return typeof(LiteServerPartialBlockProof);
+                case 0xC87640D7: return typeof(LiteServerConfigInfo);
+                case 0xEBB8ABD9: return typeof(LiteServerValidatorStats);
+                case 0x6A34CEC1: return typeof(LiteServerLibraryResult);
+                case 0xEE983C56: return typeof(LiteServerLibraryResultWithProof);
+                case 0xDDD11B76: return typeof(LiteServerShardBlockLink);
+                case 0x330401A1: return typeof(LiteServerShardBlockProof);
+                case 0x8850F75A: return typeof(LiteServerLookupBlockResult);
+                case 0xFE7CB74A: return typeof(LiteServerOutMsgQueueSize);
+                case 0x2DE458AE: return typeof(LiteServerOutMsgQueueSizes);
+                case 0xE9E602FB: return typeof(LiteServerBlockOutMsgQueueSize);
+                case 0x3F213E07: return typeof(LiteServerAccountDispatchQueueInfo);
+                case 0x569404CB: return typeof(LiteServerDispatchQueueInfo);
+                case 0x2352C9EC: return typeof(LiteServerDispatchQueueMessage);
+                case 0xF4486B0C: return typeof(LiteServerDispatchQueueMessages);
+                case 0xDC8427F8: return typeof(LiteServerDebugVerbosity);
+                case 0x24EECDA9: return typeof(LiteServerNonfinalCandidateId);
+                case 0x87870AE4: return typeof(LiteServerNonfinalCandidate);
+                case 0x95FDCCF3: return typeof(LiteServerNonfinalCandidateInfo);
+                case 0x928BCA39: return typeof(LiteServerNonfinalValidatorGroupInfo);
+                case 0xF982422F: return typeof(LiteServerNonfinalValidatorGroups);
+                default: return null;
+            }
+        }
+
+        /// <summary>
+        /// Decode the fields of the type identified by an already consumed constructor id
+        /// </summary>
+        static object ReadBoxed(uint constructor, ref TLSpanReader reader)
+        {
+            switch (constructor)
+            {
+                case 0xB0683FE3: return TonNodeBlockId.ReadFrom(ref reader);
+                case 0x3DB0AD4C: return TonNodeBlockIdExt.ReadFrom(ref reader);
+                case 0x527AFA73: return TonNodeZeroStateIdExt.ReadFrom(ref reader);
+                case 0x1BB566EA: return LiteServerError.ReadFrom(ref reader);
+                case 0x88729074: return LiteServerAccountId.ReadFrom(ref reader);
+                case 0xFC3C1D28: return LiteServerLibraryEntry.ReadFrom(ref reader);
+                case 0xF9333637: return LiteServerMasterchainInfo.ReadFrom(ref reader);
+                case 0xAE76CCDA: return LiteServerMasterchainInfoExt.ReadFrom(ref reader);
+                case 0x1D512914: return LiteServerCurrentTime.ReadFrom(ref reader);
+                case 0xB33314CF: return LiteServerVersion.ReadFrom(ref reader);
+                case 0x27A85F37: return LiteServerBlockData.ReadFrom(ref reader);
+                case 0x6A14E75E: return LiteServerBlockState.ReadFrom(ref reader);
+                case 0x071783EB: return LiteServerBlockHeader.ReadFrom(ref reader);
+                case 0x0D5B50AB: return LiteServerSendMsgStatus.ReadFrom(ref reader);
+                case 0x7F151E0C: return LiteServerAccountState.ReadFrom(ref reader);
+                case 0xB9CA2418: return LiteServerRunMethodResult.ReadFrom(ref reader);
+                case 0x8943A75D: return LiteServerShardInfo.ReadFrom(ref reader);
+                case 0x26DFD53B: return LiteServerAllShardsInfo.ReadFrom(ref reader);
+                case 0x8BBF0C77: return LiteServerTransactionInfo.ReadFrom(ref reader);
+                case 0xED0EC787: return LiteServerTransactionList.ReadFrom(ref reader);
+                case 0xFE240165: return LiteServerTransactionMetadata.ReadFrom(ref reader);
+                case 0xE944EBD2: return LiteServerTransactionId.ReadFrom(ref reader);
+                case 0xAD4463EC: return LiteServerTransactionId3.ReadFrom(ref reader);
+                case 0x01FB4F1A: return LiteServerBlockTransactions.ReadFrom(ref reader);
+                case 0xC495AF34: return LiteServerBlockTransactionsExt.ReadFrom(ref reader);
+                case 0x78AB7D2A: return LiteServerSignature.ReadFrom(ref reader);
+                case 0x0DF0E11B: return LiteServerSignatureSet.ReadFrom(ref reader);
+                case 0x5353875B: return LiteServerBlockLinkBack.ReadFrom(ref reader);
+                case 0x775A5528: return LiteServerBlockLinkForward.ReadFrom(ref reader);
+                case 0xF3BB3510: return LiteServerPartialBlockProof.ReadFrom(ref reader);
+                case 0xC87640D7: return LiteServerConfigInfo.ReadFrom(ref reader);
+                case 0xEBB8ABD9: return LiteServerValidatorStats.ReadFrom(ref reader);
+                case 0x6A34CEC1: return LiteServerLibraryResult.ReadFrom(ref reader);
+                case 0xEE983C56: return LiteServerLibraryResultWithProof.ReadFrom(ref reader);
+                case 0xDDD11B76: return LiteServerShardBlockLink.ReadFrom(ref reader);
+                case 0x330401A1: return LiteServerShardBlockProof.ReadFrom(ref reader);
+                case 0x8850F75A: return LiteServerLookupBlockResult.ReadFrom(ref reader);
+                case 0xFE7CB74A: return LiteServerOutMsgQueueSize.ReadFrom(ref reader);
+                case 0x2DE458AE: return LiteServerOutMsgQueueSizes.ReadFrom(ref reader);
+                case 0xE9E602FB: return LiteServerBlockOutMsgQueueSize.ReadFrom(ref reader);
+                case 0x3F213E07: return LiteServerAccountDispatchQueueInfo.ReadFrom(ref reader);
+                case 0x569404CB: return LiteServerDispatchQueueInfo.ReadFrom(ref reader);
+                case 0x2352C9EC: return LiteServerDispatchQueueMessage.ReadFrom(ref reader);
+                case 0xF4486B0C: return LiteServerDispatchQueueMessages.ReadFrom(ref reader);
+                case 0xDC8427F8: return LiteServerDebugVerbosity.ReadFrom(ref reader);
+                case 0x24EECDA9: return LiteServerNonfinalCandidateId.ReadFrom(ref reader);
+                case 0x87870AE4: return LiteServerNonfinalCandidate.ReadFrom(ref reader);
+                case 0x95FDCCF3: return LiteServerNonfinalCandidateInfo.ReadFrom(ref reader);
+                case 0x928BCA39: return LiteServerNonfinalValidatorGroupInfo.ReadFrom(ref reader);
+                case 0xF982422F: return LiteServerNonfinalValidatorGroups.ReadFrom(ref reader);
+                default: throw new Exception($"Unknown constructor 0x{constructor:X8}");
+            }
+        }
     }
 
     // ============================================================================
     // Function Constructors
     // ============================================================================
 
-    public static class Functions
+    public static partial class Functions
     {
         public const uint GetMasterchainInfo = 0xBF56BE80;
         public const uint GetMasterchainInfoExt = 0x75156F9D;
@@ -1757,7 +5450,7 @@ namespace TonSdk.Adnl.LiteClient.Protocol
         public const uint GetOutMsgQueueSizes = 0xACC852AC;
         public const uint GetBlockOutMsgQueueSize = 0x4A5FA346;
         public const uint GetDispatchQueueInfo = 0x47BC4364;
-        public const uint WantProofMode0True = 0x77A2BE1D;
+        public const uint GetDispatchQueueMessages = 0x3CB773C5;
         public const uint NonfinalGetValidatorGroups = 0x5AAF2C7E;
         public const uint NonfinalGetCandidate = 0x0252FEEE;
         public const uint QueryPrefix = 0x67A0F35A;
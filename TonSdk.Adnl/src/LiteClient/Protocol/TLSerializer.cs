@@ -0,0 +1,55 @@
+using System;
+using TonSdk.Adnl.TL;
+
+namespace TonSdk.Adnl.LiteClient.Protocol;
+
+/// <summary>
+///     Decodes boxed TL values (constructor id followed by fields) through the generated constructor registry.
+///     The constructor is read once: liteServer.error becomes a <see cref="LiteServerException" />, anything else
+///     is dispatched straight to the generated span decoder, without copying the payload first.
+/// </summary>
+public static partial class TLSerializer
+{
+    public static T Read<T>(ReadOnlySpan<byte> data)
+    {
+        TLSpanReader reader = new(data);
+        return Read<T>(ref reader);
+    }
+
+    public static T Read<T>(ref TLSpanReader reader)
+    {
+        object value = ReadObject(ref reader);
+        if (value is T result) return result;
+        throw new Exception($"Unexpected response {value.GetType().Name}, expected {typeof(T).Name}");
+    }
+
+    /// <summary>
+    ///     Decode a boxed value of any generated type.
+    /// </summary>
+    public static object ReadObject(ref TLSpanReader reader)
+    {
+        uint constructor = reader.ReadUInt32();
+        if (constructor == LiteServerError.Constructor) throw ToException(LiteServerError.ReadFrom(ref reader));
+        return ReadBoxed(constructor, ref reader);
+    }
+
+    /// <summary>
+    ///     Check the constructor of a boxed value and return its fields as a slice of <paramref name="data" />,
+    ///     for the zero-copy *View types.
+    /// </summary>
+    public static ReadOnlyMemory<byte> ReadPayload(ReadOnlyMemory<byte> data, uint expectedConstructor)
+    {
+        TLSpanReader reader = new(data.Span);
+        uint constructor = reader.ReadUInt32();
+        if (constructor == LiteServerError.Constructor) throw ToException(LiteServerError.ReadFrom(ref reader));
+        if (constructor != expectedConstructor)
+            throw new Exception($"Unexpected constructor 0x{constructor:X8}, expected 0x{expectedConstructor:X8}");
+
+        return data.Slice(reader.Position);
+    }
+
+    static LiteServerException ToException(LiteServerError error)
+    {
+        return new LiteServerException(error.Code, error.Message);
+    }
+}
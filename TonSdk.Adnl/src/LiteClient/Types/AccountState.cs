@@ -63,6 +63,28 @@ public class ClientAccountState(
 
     public readonly AccountStatus Status = status;
 
+    /// <summary>
+    ///     Parse from raw TL schema type. With <paramref name="skipCodeAndData" /> only the root cell of the state is
+    ///     read: balance, status and last transaction lt are filled in, <see cref="Code" /> and <see cref="Data" />
+    ///     stay null. Falls back to the full parse when the root cell can't be read on its own.
+    /// </summary>
+    public static ClientAccountState FromRaw(LiteServerAccountState raw, Address address, bool skipCodeAndData)
+    {
+        if (!skipCodeAndData || raw.State == null || raw.State.Length == 0) return FromRaw(raw, address);
+
+        try
+        {
+            LazyCell root = BagOfCells.DeserializeLazy(raw.State)[0];
+            if (root.IsExotic) return FromRaw(raw, address);
+
+            return FromRootCell(raw, address, new Cell(root.Bits, Array.Empty<Cell>()).Parse());
+        }
+        catch (Exception)
+        {
+            return FromRaw(raw, address);
+        }
+    }
+
     /// <summary>
     ///     Parse from raw TL schema type.
     ///     Deserializes the account state from BOC format following JS SDK implementation.
@@ -89,7 +111,7 @@ public class ClientAccountState(
         try
         {
             // Parse BOC to get Cell (following old SDK: Cell.From(new Bits(accountStateBytes)).Parse())
-            Cell[] cells = BagOfCells.DeserializeBoc(new Bits(raw.State));
+            Cell[] cells = BagOfCells.DeserializeBoc(raw.State);
             if (cells.Length == 0) throw new Exception("Empty BOC");
 
             CellSlice accountSlice = cells[0].Parse();
@@ -112,8 +134,8 @@ public class ClientAccountState(
                     raw.ShardProof
                 );
 
-            // Parse the account (following old SDK)
-            Account account = Account.Load(accountSlice);
+            // Parse the account (following old SDK); Account.Load reads the account$1 tag itself
+            Account account = Account.Load(cells[0].Parse());
 
             // Extract data from parsed account
             Coins balance = account.Storage.Balance;
@@ -127,7 +149,7 @@ public class ClientAccountState(
             try
             {
                 // The proof contains shard state with account info
-                Cell[] proofCells = BagOfCells.DeserializeBoc(new Bits(raw.Proof));
+                Cell[] proofCells = BagOfCells.DeserializeBoc(raw.Proof);
                 if (proofCells.Length > 1 && proofCells[1].Refs.Length > 0)
                     // TODO: Parse shard state to get last transaction hash
                     // For now, we'll leave it empty
@@ -172,4 +194,30 @@ public class ClientAccountState(
             );
         }
     }
-}
\ No newline at end of file
+
+    // account$1 addr:MsgAddressInt storage_stat:StorageInfo storage:AccountStorage, leaving every reference unread
+    static ClientAccountState FromRootCell(LiteServerAccountState raw, Address address, CellSlice slice)
+    {
+        if (!slice.LoadBit())
+            return new ClientAccountState(address, Coins.Zero, AccountStatus.Nonexist, null, null, 0,
+                Array.Empty<byte>(), raw.State, raw.Proof, raw.Id, raw.Shardblk, raw.ShardProof);
+
+        if (slice.LoadAddress() == null) throw new Exception("Invalid account address");
+        slice.LoadVarUInt(7); // cells
+        slice.LoadVarUInt(7); // bits
+        slice.LoadVarUInt(7); // public_cells
+        slice.SkipBits(32); // last_paid
+        if (slice.LoadBit()) slice.LoadCoins(); // due_payment
+
+        long lastTransLt = (long)slice.LoadUInt(64);
+        Coins balance = slice.LoadCoins();
+        slice.SkipBit(); // extra currencies: the maybe bit of the HashmapE, its root is a reference
+
+        AccountStatus status = slice.LoadBit() ? AccountStatus.Active
+            : slice.LoadBit() ? AccountStatus.Frozen
+            : AccountStatus.Uninitialized;
+
+        return new ClientAccountState(address, balance, status, null, null, lastTransLt, Array.Empty<byte>(),
+            raw.State, raw.Proof, raw.Id, raw.Shardblk, raw.ShardProof);
+    }
+}
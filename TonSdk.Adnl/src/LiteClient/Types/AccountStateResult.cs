@@ -0,0 +1,18 @@
+using System;
+using TonSdk.Core.Addresses;
+
+namespace TonSdk.Adnl.LiteClient.Types;
+
+/// <summary>
+///     State of one account produced by
+///     <see cref="LiteClient.GetAccountStates(TonSdk.Adnl.LiteClient.Protocol.TonNodeBlockIdExt, System.Collections.Generic.IEnumerable{Address}, AccountStatesOptions?, System.Threading.CancellationToken)" />:
+///     either the state, or the error its query or parse failed with.
+/// </summary>
+public readonly struct AccountStateResult(Address address, ClientAccountState? state, Exception? error)
+{
+    public readonly Address Address = address;
+    public readonly ClientAccountState? State = state;
+    public readonly Exception? Error = error;
+
+    public bool IsSuccess => Error == null;
+}
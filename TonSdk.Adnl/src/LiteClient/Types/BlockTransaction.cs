@@ -23,12 +23,13 @@ public readonly struct BlockTransaction(Address account, long lt, byte[] hash)
         // The workchain information is not included in this structure
         // We default to workchain 0 (mainnet) unless specified otherwise
 
-        if (raw.Account is not { Length: 32 })
+        // Account is only present when mode bit 0 is set
+        if ((raw.Mode & 1) == 0)
             throw new ArgumentException("Invalid account data");
 
-        Address account = Address.Create(defaultWorkchain, raw.Account);
+        Address account = Address.Create(defaultWorkchain, raw.Account.ToArray());
 
-        return new BlockTransaction(account, raw.Lt, raw.Hash);
+        return new BlockTransaction(account, raw.Lt, raw.Hash.ToArray());
     }
 
     /// <summary>
@@ -36,10 +37,7 @@ public readonly struct BlockTransaction(Address account, long lt, byte[] hash)
     /// </summary>
     public static Address AddressFromAccountId(LiteServerAccountId accountId)
     {
-        if (accountId.Id is not { Length: 32 })
-            throw new ArgumentException("Invalid account ID");
-
-        return Address.Create(accountId.Workchain, accountId.Id);
+        return Address.Create(accountId.Workchain, accountId.Id.ToArray());
     }
 }
 
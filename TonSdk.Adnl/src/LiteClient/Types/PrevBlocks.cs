@@ -0,0 +1,66 @@
+using System;
+using TonSdk.Adnl.LiteClient.Protocol;
+using TonSdk.Adnl.TL;
+using TonSdk.Core.Boc;
+using TonSdk.Core.Boc.Cells;
+
+namespace TonSdk.Adnl.LiteClient.Types;
+
+/// <summary>
+///     Blocks a shard block follows, read from the BlockInfo in its liteServer.blockHeader proof.
+/// </summary>
+internal static class PrevBlocks
+{
+    const uint BlockTag = 0x11EF55AA; // block#11ef55aa
+    const uint BlockInfoTag = 0x9BC7A987; // block_info#9bc7a987
+
+    /// <summary>
+    ///     The previous block of <paramref name="block" />, or both of them when it is the first block after a merge.
+    /// </summary>
+    public static TonNodeBlockIdExt[] Parse(TonNodeBlockIdExt block, byte[] headerProof)
+    {
+        Cell root = BagOfCells.DeserializeBoc(headerProof)[0];
+        if (root.Type == CellType.MerkleProof) root = root.Refs[0];
+
+        CellSlice blockSlice = root.Parse();
+        if ((uint)blockSlice.LoadUInt(32) != BlockTag) throw new Exception("Block header proof: not a block");
+
+        // block_info#9bc7a987 version:uint32 not_master:(## 1) after_merge:(## 1) before_split:(## 1)
+        // after_split:(## 1) ... master_ref:not_master?^BlkMasterInfo prev_ref:^(BlkPrevInfo after_merge) ...
+        CellSlice info = blockSlice.LoadRef().Parse();
+        if ((uint)info.LoadUInt(32) != BlockInfoTag) throw new Exception("Block header proof: not a block info");
+        info.SkipBits(32);
+        bool notMaster = info.LoadBit();
+        bool afterMerge = info.LoadBit();
+        info.SkipBits(1);
+        bool afterSplit = info.LoadBit();
+
+        if (notMaster) info.SkipRefs(1);
+        Cell prevRef = info.LoadRef();
+
+        ulong shard = (ulong)block.Shard;
+        ulong lowest = shard & (~shard + 1);
+
+        // prev_blks_info$_ prev1:^ExtBlkRef prev2:^ExtBlkRef = BlkPrevInfo 1; the parents are the two halves
+        if (afterMerge)
+            return new[]
+            {
+                ReadExtBlkRef(prevRef.Refs[0].Parse(), block.Workchain, shard - (lowest >> 1)),
+                ReadExtBlkRef(prevRef.Refs[1].Parse(), block.Workchain, shard + (lowest >> 1))
+            };
+
+        // prev_blk_info$_ prev:ExtBlkRef = BlkPrevInfo 0; after a split it is the parent shard's block
+        ulong prevShard = afterSplit ? (shard - lowest) | (lowest << 1) : shard;
+        return new[] { ReadExtBlkRef(prevRef.Parse(), block.Workchain, prevShard) };
+    }
+
+    // ext_blk_ref$_ end_lt:uint64 seq_no:uint32 root_hash:bits256 file_hash:bits256 = ExtBlkRef
+    static TonNodeBlockIdExt ReadExtBlkRef(CellSlice slice, int workchain, ulong shard)
+    {
+        slice.SkipBits(64);
+        int seqno = (int)(uint)slice.LoadUInt(32);
+        TLInt256 rootHash = new(slice.LoadBytes(32));
+        TLInt256 fileHash = new(slice.LoadBytes(32));
+        return new TonNodeBlockIdExt(workchain, unchecked((long)shard), seqno, rootHash, fileHash);
+    }
+}
@@ -0,0 +1,38 @@
+using TonSdk.Adnl.LiteClient.Protocol;
+
+namespace TonSdk.Adnl.LiteClient.Types;
+
+/// <summary>
+///     One block produced by <see cref="LiteClient.ScanBlocks(int, int?, BlockScannerOptions?, System.Threading.CancellationToken)" />
+///     with all of its transactions.
+/// </summary>
+public class ScannedBlock(TonNodeBlockIdExt masterchainBlock, TonNodeBlockIdExt block, BlockTransaction[] transactions)
+{
+    /// <summary>
+    ///     Block itself: a shard block, or the masterchain block when equal to <see cref="MasterchainBlock" />
+    /// </summary>
+    public readonly TonNodeBlockIdExt Block = block;
+
+    /// <summary>
+    ///     Masterchain block that committed <see cref="Block" />
+    /// </summary>
+    public readonly TonNodeBlockIdExt MasterchainBlock = masterchainBlock;
+
+    public readonly BlockTransaction[] Transactions = transactions;
+
+    public bool IsMasterchain => Block.Workchain == -1;
+}
+
+/// <summary>
+///     One transaction produced by
+///     <see cref="LiteClient.ScanTransactions(int, int?, BlockScannerOptions?, System.Threading.CancellationToken)" />.
+/// </summary>
+public readonly struct ScannedTransaction(
+    TonNodeBlockIdExt masterchainBlock,
+    TonNodeBlockIdExt block,
+    BlockTransaction transaction)
+{
+    public readonly TonNodeBlockIdExt MasterchainBlock = masterchainBlock;
+    public readonly TonNodeBlockIdExt Block = block;
+    public readonly BlockTransaction Transaction = transaction;
+}
@@ -0,0 +1,91 @@
+using System;
+using System.Collections.Generic;
+using TonSdk.Adnl.LiteClient.Protocol;
+using TonSdk.Adnl.TL;
+using TonSdk.Core.Boc;
+using TonSdk.Core.Boc.Cells;
+
+namespace TonSdk.Adnl.LiteClient.Types;
+
+/// <summary>
+///     Latest block of one shard as committed by a masterchain block (an entry of its ShardHashes).
+/// </summary>
+internal readonly record struct ShardTop(int Workchain, long Shard, int Seqno, TLInt256 RootHash, TLInt256 FileHash)
+{
+    static readonly HashmapOptions<int, Cell> ShardHashesOptions = new()
+    {
+        KeySize = 32,
+        Deserializers = new HashmapDeserializers<int, Cell>
+        {
+            Key = key => (int)key.Parse().LoadInt(32),
+            Value = value => value.Refs[0]
+        }
+    };
+
+    public TonNodeBlockId BlockId => new(Workchain, Shard, Seqno);
+    public TonNodeBlockIdExt BlockIdExt => new(Workchain, Shard, Seqno, RootHash, FileHash);
+
+    /// <summary>
+    ///     Whether the two shards overlap: one is the other or one of its ancestors.
+    /// </summary>
+    public static bool Intersects(long left, long right)
+    {
+        ulong a = (ulong)left, b = (ulong)right;
+        ulong prefix = Math.Max(a & (~a + 1), b & (~b + 1));
+        ulong mask = ~((prefix << 1) - 1);
+        return ((a ^ b) & mask) == 0;
+    }
+
+    /// <summary>
+    ///     Whether <paramref name="shard" /> is a strict ancestor of <paramref name="descendant" />.
+    /// </summary>
+    public static bool IsAncestor(long shard, long descendant)
+    {
+        ulong a = (ulong)shard, b = (ulong)descendant;
+        return (a & (~a + 1)) > (b & (~b + 1)) && Intersects(shard, descendant);
+    }
+
+    /// <summary>
+    ///     Parse the data of liteServer.allShardsInfo:
+    ///     <c>ShardHashes = HashmapE 32 ^(BinTree ShardDescr)</c>, keyed by workchain.
+    /// </summary>
+    public static ShardTop[] Parse(byte[] data)
+    {
+        if (data.Length == 0) return Array.Empty<ShardTop>();
+
+        Cell root = BagOfCells.DeserializeBoc(data)[0];
+
+        // Lite servers send the HashmapE (a maybe bit and the root reference); accept a bare Hashmap root as well
+        IEnumerable<KeyValuePair<int, Cell>> workchains = root.BitsCount == 1
+            ? HashmapE<int, Cell>.Deserialize(root.Parse(), ShardHashesOptions).Entries
+            : Hashmap<int, Cell>.Deserialize(root, ShardHashesOptions).Entries;
+
+        List<ShardTop> tops = new();
+        foreach (KeyValuePair<int, Cell> workchain in workchains)
+            ReadBinTree(workchain.Value, workchain.Key, 1UL << 63, tops);
+        return tops.ToArray();
+    }
+
+    // bt_leaf$0 leaf:X | bt_fork$1 left:^(BinTree X) right:^(BinTree X); a fork splits the shard in two
+    static void ReadBinTree(Cell node, int workchain, ulong shard, List<ShardTop> tops)
+    {
+        CellSlice slice = node.Parse();
+        if (slice.LoadBit())
+        {
+            ulong half = (shard & (~shard + 1)) >> 1;
+            ReadBinTree(slice.LoadRef(), workchain, shard - half, tops);
+            ReadBinTree(slice.LoadRef(), workchain, shard + half, tops);
+            return;
+        }
+
+        // shard_descr#b or shard_descr_new#a: seq_no:uint32 reg_mc_seqno:uint32 start_lt:uint64 end_lt:uint64
+        // root_hash:bits256 file_hash:bits256 ...
+        slice.SkipBits(4);
+        int seqno = (int)(uint)slice.LoadUInt(32);
+        slice.SkipBits(32 + 64 + 64);
+        TLInt256 rootHash = new(slice.LoadBytes(32));
+        TLInt256 fileHash = new(slice.LoadBytes(32));
+
+        tops.Add(new ShardTop(workchain, unchecked((long)shard), seqno, rootHash, fileHash));
+    }
+}
@@ -0,0 +1,84 @@
+using System;
+using System.Buffers.Binary;
+using System.Runtime.InteropServices;
+
+namespace TonSdk.Adnl.TL;
+
+/// <summary>
+///     Bulk conversion between TL's little-endian wire layout and int/long/int256 arrays.
+///     On little-endian machines the wire bytes are the in-memory representation, so each call is a single copy.
+/// </summary>
+internal static class TLBlittable
+{
+    public static void Write(ReadOnlySpan<int> source, Span<byte> destination)
+    {
+        if (BitConverter.IsLittleEndian)
+        {
+            MemoryMarshal.AsBytes(source).CopyTo(destination);
+            return;
+        }
+
+        for (int i = 0; i < source.Length; i++)
+            BinaryPrimitives.WriteInt32LittleEndian(destination.Slice(i * 4), source[i]);
+    }
+
+    public static void Write(ReadOnlySpan<long> source, Span<byte> destination)
+    {
+        if (BitConverter.IsLittleEndian)
+        {
+            MemoryMarshal.AsBytes(source).CopyTo(destination);
+            return;
+        }
+
+        for (int i = 0; i < source.Length; i++)
+            BinaryPrimitives.WriteInt64LittleEndian(destination.Slice(i * 8), source[i]);
+    }
+
+    public static void Read(ReadOnlySpan<byte> source, Span<int> destination)
+    {
+        if (BitConverter.IsLittleEndian)
+        {
+            source.CopyTo(MemoryMarshal.AsBytes(destination));
+            return;
+        }
+
+        for (int i = 0; i < destination.Length; i++)
+            destination[i] = BinaryPrimitives.ReadInt32LittleEndian(source.Slice(i * 4));
+    }
+
+    public static void Read(ReadOnlySpan<byte> source, Span<long> destination)
+    {
+        if (BitConverter.IsLittleEndian)
+        {
+            source.CopyTo(MemoryMarshal.AsBytes(destination));
+            return;
+        }
+
+        for (int i = 0; i < destination.Length; i++)
+            destination[i] = BinaryPrimitives.ReadInt64LittleEndian(source.Slice(i * 8));
+    }
+
+    public static void Write(ReadOnlySpan<TLInt256> source, Span<byte> destination)
+    {
+        if (BitConverter.IsLittleEndian)
+        {
+            MemoryMarshal.AsBytes(source).CopyTo(destination);
+            return;
+        }
+
+        for (int i = 0; i < source.Length; i++)
+            source[i].CopyTo(destination.Slice(i * TLInt256.Size));
+    }
+
+    public static void Read(ReadOnlySpan<byte> source, Span<TLInt256> destination)
+    {
+        if (BitConverter.IsLittleEndian)
+        {
+            source.CopyTo(MemoryMarshal.AsBytes(destination));
+            return;
+        }
+
+        for (int i = 0; i < destination.Length; i++)
+            destination[i] = new TLInt256(source.Slice(i * TLInt256.Size, TLInt256.Size));
+    }
+}
@@ -0,0 +1,85 @@
+using System;
+using System.Buffers.Binary;
+using System.Runtime.InteropServices;
+#if NET7_0_OR_GREATER
+using System.Runtime.Intrinsics;
+#endif
+
+namespace TonSdk.Adnl.TL;
+
+/// <summary>
+///     TL int128 as an unmanaged value: two little-endian ulongs in wire order.
+///     Named with the TL prefix so it never clashes with System.Int128.
+/// </summary>
+[StructLayout(LayoutKind.Sequential)]
+public readonly struct TLInt128 : IEquatable<TLInt128>
+{
+    public const int Size = 16;
+
+    readonly ulong p0;
+    readonly ulong p1;
+
+    public TLInt128(ReadOnlySpan<byte> bytes)
+    {
+        if (bytes.Length != Size)
+            throw new ArgumentException($"Expected {Size} bytes, got {bytes.Length}", nameof(bytes));
+
+        p0 = BinaryPrimitives.ReadUInt64LittleEndian(bytes);
+        p1 = BinaryPrimitives.ReadUInt64LittleEndian(bytes.Slice(8));
+    }
+
+    public static TLInt128 Zero => default;
+
+    public bool IsZero => (p0 | p1) == 0;
+
+    public void CopyTo(Span<byte> destination)
+    {
+        if (destination.Length < Size) throw new ArgumentException("Destination is too short", nameof(destination));
+
+        BinaryPrimitives.WriteUInt64LittleEndian(destination, p0);
+        BinaryPrimitives.WriteUInt64LittleEndian(destination.Slice(8), p1);
+    }
+
+    public byte[] ToArray()
+    {
+        byte[] bytes = new byte[Size];
+        CopyTo(bytes);
+        return bytes;
+    }
+
+    public bool Equals(TLInt128 other)
+    {
+#if NET7_0_OR_GREATER
+        if (Vector128.IsHardwareAccelerated)
+            return Vector128.Create(p0, p1) == Vector128.Create(other.p0, other.p1);
+#endif
+        return ((p0 ^ other.p0) | (p1 ^ other.p1)) == 0;
+    }
+
+    public override bool Equals(object? obj)
+    {
+        return obj is TLInt128 other && Equals(other);
+    }
+
+    public override int GetHashCode()
+    {
+        return HashCode.Combine(p0, p1);
+    }
+
+    public override string ToString()
+    {
+        Span<byte> bytes = stackalloc byte[Size];
+        CopyTo(bytes);
+        return Convert.ToHexString(bytes);
+    }
+
+    public static bool operator ==(TLInt128 left, TLInt128 right)
+    {
+        return left.Equals(right);
+    }
+
+    public static bool operator !=(TLInt128 left, TLInt128 right)
+    {
+        return !left.Equals(right);
+    }
+}
@@ -0,0 +1,91 @@
+using System;
+using System.Buffers.Binary;
+using System.Runtime.InteropServices;
+#if NET7_0_OR_GREATER
+using System.Runtime.Intrinsics;
+#endif
+
+namespace TonSdk.Adnl.TL;
+
+/// <summary>
+///     TL int256 (hashes, account ids) as an unmanaged value: four little-endian ulongs in wire order.
+///     Decoding one needs no heap array, and on little-endian hosts an array of them has exactly the wire layout.
+/// </summary>
+[StructLayout(LayoutKind.Sequential)]
+public readonly struct TLInt256 : IEquatable<TLInt256>
+{
+    public const int Size = 32;
+
+    readonly ulong p0;
+    readonly ulong p1;
+    readonly ulong p2;
+    readonly ulong p3;
+
+    public TLInt256(ReadOnlySpan<byte> bytes)
+    {
+        if (bytes.Length != Size)
+            throw new ArgumentException($"Expected {Size} bytes, got {bytes.Length}", nameof(bytes));
+
+        p0 = BinaryPrimitives.ReadUInt64LittleEndian(bytes);
+        p1 = BinaryPrimitives.ReadUInt64LittleEndian(bytes.Slice(8));
+        p2 = BinaryPrimitives.ReadUInt64LittleEndian(bytes.Slice(16));
+        p3 = BinaryPrimitives.ReadUInt64LittleEndian(bytes.Slice(24));
+    }
+
+    public static TLInt256 Zero => default;
+
+    public bool IsZero => (p0 | p1 | p2 | p3) == 0;
+
+    public void CopyTo(Span<byte> destination)
+    {
+        if (destination.Length < Size) throw new ArgumentException("Destination is too short", nameof(destination));
+
+        BinaryPrimitives.WriteUInt64LittleEndian(destination, p0);
+        BinaryPrimitives.WriteUInt64LittleEndian(destination.Slice(8), p1);
+        BinaryPrimitives.WriteUInt64LittleEndian(destination.Slice(16), p2);
+        BinaryPrimitives.WriteUInt64LittleEndian(destination.Slice(24), p3);
+    }
+
+    public byte[] ToArray()
+    {
+        byte[] bytes = new byte[Size];
+        CopyTo(bytes);
+        return bytes;
+    }
+
+    public bool Equals(TLInt256 other)
+    {
+#if NET7_0_OR_GREATER
+        if (Vector256.IsHardwareAccelerated)
+            return Vector256.Create(p0, p1, p2, p3) == Vector256.Create(other.p0, other.p1, other.p2, other.p3);
+#endif
+        return ((p0 ^ other.p0) | (p1 ^ other.p1) | (p2 ^ other.p2) | (p3 ^ other.p3)) == 0;
+    }
+
+    public override bool Equals(object? obj)
+    {
+        return obj is TLInt256 other && Equals(other);
+    }
+
+    public override int GetHashCode()
+    {
+        return HashCode.Combine(p0, p1, p2, p3);
+    }
+
+    public override string ToString()
+    {
+        Span<byte> bytes = stackalloc byte[Size];
+        CopyTo(bytes);
+        return Convert.ToHexString(bytes);
+    }
+
+    public static bool operator ==(TLInt256 left, TLInt256 right)
+    {
+        return left.Equals(right);
+    }
+
+    public static bool operator !=(TLInt256 left, TLInt256 right)
+    {
+        return !left.Equals(right);
+    }
+}
@@ -40,10 +40,14 @@ public class TLReadBuffer(byte[] buffer)
         return reader.ReadByte();
     }
 
-    public byte[] ReadInt256()
+    public TLInt256 ReadInt256()
     {
-        EnsureSize(32);
-        return reader.ReadBytes(32);
+        return new TLInt256(ReadBytes(TLInt256.Size));
+    }
+
+    public TLInt128 ReadInt128()
+    {
+        return new TLInt128(ReadBytes(TLInt128.Size));
     }
 
     public byte[] ReadBytes(int size)
@@ -100,9 +104,45 @@ public class TLReadBuffer(byte[] buffer)
         throw new Exception("Unknown boolean value");
     }
 
+    /// <summary>
+    ///     Read a vector length and check that <paramref name="minElementSize" /> bytes per element are still
+    ///     available, so a corrupt or hostile count fails before anything is allocated.
+    /// </summary>
+    public int ReadVectorCount(int minElementSize)
+    {
+        uint count = ReadUInt32();
+        if ((ulong)count * (ulong)Math.Max(minElementSize, 1) > (ulong)Remaining)
+            throw new Exception("Vector length exceeds buffer");
+        return (int)count;
+    }
+
+    public int[] ReadInt32Vector()
+    {
+        int count = ReadVectorCount(4);
+        int[] result = new int[count];
+        TLBlittable.Read(ReadBytes(count * 4), result);
+        return result;
+    }
+
+    public long[] ReadInt64Vector()
+    {
+        int count = ReadVectorCount(8);
+        long[] result = new long[count];
+        TLBlittable.Read(ReadBytes(count * 8), result);
+        return result;
+    }
+
+    public TLInt256[] ReadInt256Vector()
+    {
+        int count = ReadVectorCount(TLInt256.Size);
+        TLInt256[] result = new TLInt256[count];
+        TLBlittable.Read(ReadBytes(count * TLInt256.Size), result);
+        return result;
+    }
+
     public T[] ReadVector<T>(Func<TLReadBuffer, T> codec)
     {
-        int count = (int)ReadUInt32();
+        int count = ReadVectorCount(4);
         T[] result = new T[count];
         for (int i = 0; i < count; i++) result[i] = codec(this);
         return result;
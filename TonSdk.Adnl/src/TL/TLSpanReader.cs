@@ -0,0 +1,210 @@
+using System;
+using System.Buffers.Binary;
+using System.Text;
+
+namespace TonSdk.Adnl.TL;
+
+/// <summary>
+///     Allocation-free TL reader over a span.
+///     Every read validates the bytes it needs once, up front, and then reads them directly from the span.
+/// </summary>
+public ref struct TLSpanReader
+{
+    const uint BoolTrue = 0x997275b5;
+    const uint BoolFalse = 0xbc799737;
+
+    readonly ReadOnlySpan<byte> buffer;
+    int position;
+
+    public TLSpanReader(ReadOnlySpan<byte> buffer)
+    {
+        this.buffer = buffer;
+        position = 0;
+    }
+
+    public int Position => position;
+
+    public int Remaining => buffer.Length - position;
+
+    void EnsureSize(int needBytes)
+    {
+        if ((uint)needBytes > (uint)(buffer.Length - position))
+            throw new Exception("Not enough bytes");
+    }
+
+    public int ReadInt32()
+    {
+        EnsureSize(4);
+        int value = BinaryPrimitives.ReadInt32LittleEndian(buffer.Slice(position));
+        position += 4;
+        return value;
+    }
+
+    public uint ReadUInt32()
+    {
+        EnsureSize(4);
+        uint value = BinaryPrimitives.ReadUInt32LittleEndian(buffer.Slice(position));
+        position += 4;
+        return value;
+    }
+
+    public long ReadInt64()
+    {
+        EnsureSize(8);
+        long value = BinaryPrimitives.ReadInt64LittleEndian(buffer.Slice(position));
+        position += 8;
+        return value;
+    }
+
+    public byte ReadUInt8()
+    {
+        EnsureSize(1);
+        return buffer[position++];
+    }
+
+    public bool ReadBool()
+    {
+        return ReadUInt32() switch
+        {
+            BoolTrue => true,
+            BoolFalse => false,
+            _ => throw new Exception("Unknown boolean value")
+        };
+    }
+
+    /// <summary>
+    ///     Read 32 raw bytes without copying them.
+    /// </summary>
+    public ReadOnlySpan<byte> ReadInt256Span()
+    {
+        return ReadBytesSpan(32);
+    }
+
+    public TLInt256 ReadInt256()
+    {
+        return new TLInt256(ReadBytesSpan(TLInt256.Size));
+    }
+
+    public TLInt128 ReadInt128()
+    {
+        return new TLInt128(ReadBytesSpan(TLInt128.Size));
+    }
+
+    /// <summary>
+    ///     Read <paramref name="size" /> raw bytes without copying them.
+    /// </summary>
+    public ReadOnlySpan<byte> ReadBytesSpan(int size)
+    {
+        EnsureSize(size);
+        ReadOnlySpan<byte> value = buffer.Slice(position, size);
+        position += size;
+        return value;
+    }
+
+    public byte[] ReadBytes(int size)
+    {
+        return ReadBytesSpan(size).ToArray();
+    }
+
+    /// <summary>
+    ///     Read a length-prefixed TL buffer without copying it.
+    ///     The length, payload and alignment padding are validated together before the position moves.
+    /// </summary>
+    public ReadOnlySpan<byte> ReadBufferSpan()
+    {
+        int offset = SkipBuffer(out int length);
+        return buffer.Slice(offset, length);
+    }
+
+    /// <summary>
+    ///     Skip a length-prefixed TL buffer and return the offset of its payload from the start of the source,
+    ///     so callers can later slice the payload out of the memory the reader was created over.
+    /// </summary>
+    public int SkipBuffer(out int length)
+    {
+        EnsureSize(1);
+        int len = buffer[position];
+        int headerSize = 1;
+
+        if (len == 254)
+        {
+            EnsureSize(4);
+            len = buffer[position + 1] | (buffer[position + 2] << 8) | (buffer[position + 3] << 16);
+            headerSize = 4;
+        }
+
+        int dataStart = position + headerSize;
+        int end = dataStart + len;
+        int paddedEnd = (end + 3) & ~3;
+
+        // Trailing padding may be absent at the very end of the buffer, as with TLReadBuffer
+        if (end > buffer.Length)
+            throw new Exception("Not enough bytes");
+
+        position = Math.Min(paddedEnd, buffer.Length);
+        length = len;
+        return dataStart;
+    }
+
+    public void Skip(int size)
+    {
+        EnsureSize(size);
+        position += size;
+    }
+
+    public byte[] ReadBuffer()
+    {
+        return ReadBufferSpan().ToArray();
+    }
+
+    public string ReadString()
+    {
+        return Encoding.UTF8.GetString(ReadBufferSpan());
+    }
+
+    /// <summary>
+    ///     Read a vector length and check that <paramref name="minElementSize" /> bytes per element are still
+    ///     available, so a corrupt or hostile count fails before anything is allocated.
+    /// </summary>
+    public int ReadVectorCount(int minElementSize)
+    {
+        uint count = ReadUInt32();
+        if ((ulong)count * (ulong)Math.Max(minElementSize, 1) > (ulong)(buffer.Length - position))
+            throw new Exception("Vector length exceeds buffer");
+        return (int)count;
+    }
+
+    public int[] ReadInt32Vector()
+    {
+        int count = ReadVectorCount(4);
+        int[] result = new int[count];
+        TLBlittable.Read(ReadBytesSpan(count * 4), result);
+        return result;
+    }
+
+    public long[] ReadInt64Vector()
+    {
+        int count = ReadVectorCount(8);
+        long[] result = new long[count];
+        TLBlittable.Read(ReadBytesSpan(count * 8), result);
+        return result;
+    }
+
+    public TLInt256[] ReadInt256Vector()
+    {
+        int count = ReadVectorCount(TLInt256.Size);
+        TLInt256[] result = new TLInt256[count];
+        TLBlittable.Read(ReadBytesSpan(count * TLInt256.Size), result);
+        return result;
+    }
+
+    /// <summary>
+    ///     Return all unread bytes without copying them.
+    /// </summary>
+    public ReadOnlySpan<byte> ReadObject()
+    {
+        ReadOnlySpan<byte> rest = buffer.Slice(position);
+        position = buffer.Length;
+        return rest;
+    }
+}
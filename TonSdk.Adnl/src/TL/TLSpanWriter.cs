@@ -0,0 +1,158 @@
+using System;
+using System.Buffers.Binary;
+using System.Numerics;
+using System.Text;
+
+namespace TonSdk.Adnl.TL;
+
+/// <summary>
+///     Allocation-free TL writer over a caller-provided span.
+///     The destination is never grown; writes past its end throw.
+/// </summary>
+public ref struct TLSpanWriter
+{
+    readonly Span<byte> buffer;
+    int position;
+
+    public TLSpanWriter(Span<byte> buffer)
+    {
+        this.buffer = buffer;
+        position = 0;
+    }
+
+    /// <summary>
+    ///     Number of bytes written so far.
+    /// </summary>
+    public int Written => position;
+
+    public int Remaining => buffer.Length - position;
+
+    /// <summary>
+    ///     The written part of the destination span.
+    /// </summary>
+    public ReadOnlySpan<byte> WrittenSpan => buffer.Slice(0, position);
+
+    void EnsureSize(int needBytes)
+    {
+        if ((uint)needBytes > (uint)(buffer.Length - position))
+            throw new Exception("Not enough space in destination buffer");
+    }
+
+    public void WriteInt32(int val)
+    {
+        EnsureSize(4);
+        BinaryPrimitives.WriteInt32LittleEndian(buffer.Slice(position), val);
+        position += 4;
+    }
+
+    public void WriteUInt32(uint val)
+    {
+        EnsureSize(4);
+        BinaryPrimitives.WriteUInt32LittleEndian(buffer.Slice(position), val);
+        position += 4;
+    }
+
+    public void WriteInt64(long val)
+    {
+        EnsureSize(8);
+        BinaryPrimitives.WriteInt64LittleEndian(buffer.Slice(position), val);
+        position += 8;
+    }
+
+    public void WriteUInt8(byte val)
+    {
+        EnsureSize(1);
+        buffer[position++] = val;
+    }
+
+    public void WriteInt256(BigInteger val)
+    {
+        EnsureSize(32);
+        Span<byte> target = buffer.Slice(position, 32);
+        target.Clear();
+        if (!val.TryWriteBytes(target, out int bytesWritten)) throw new Exception("Invalid int256 length");
+        if (val < 0 && bytesWritten < 32)
+            // two's complement representation
+            target[bytesWritten..].Fill(0xFF);
+        position += 32;
+    }
+
+    public void WriteInt256(TLInt256 val)
+    {
+        EnsureSize(TLInt256.Size);
+        val.CopyTo(buffer.Slice(position));
+        position += TLInt256.Size;
+    }
+
+    public void WriteInt128(TLInt128 val)
+    {
+        EnsureSize(TLInt128.Size);
+        val.CopyTo(buffer.Slice(position));
+        position += TLInt128.Size;
+    }
+
+    public void WriteBytes(ReadOnlySpan<byte> data, int size)
+    {
+        if (data.Length != size) throw new Exception($"Input array size not equals to {size}.");
+        EnsureSize(size);
+        data.CopyTo(buffer.Slice(position));
+        position += size;
+    }
+
+    public void WriteBuffer(ReadOnlySpan<byte> buf)
+    {
+        int headerSize = buf.Length <= 253 ? 1 : 4;
+        int paddedSize = (headerSize + buf.Length + 3) & ~3;
+        EnsureSize(paddedSize);
+
+        if (headerSize == 1)
+        {
+            buffer[position] = (byte)buf.Length;
+        }
+        else
+        {
+            buffer[position] = 254;
+            buffer[position + 1] = (byte)buf.Length;
+            buffer[position + 2] = (byte)(buf.Length >> 8);
+            buffer[position + 3] = (byte)(buf.Length >> 16);
+        }
+
+        buf.CopyTo(buffer.Slice(position + headerSize));
+        buffer.Slice(position + headerSize + buf.Length, paddedSize - headerSize - buf.Length).Clear();
+        position += paddedSize;
+    }
+
+    public void WriteInt32Vector(ReadOnlySpan<int> values)
+    {
+        EnsureSize(4 + values.Length * 4);
+        WriteUInt32((uint)values.Length);
+        TLBlittable.Write(values, buffer.Slice(position));
+        position += values.Length * 4;
+    }
+
+    public void WriteInt64Vector(ReadOnlySpan<long> values)
+    {
+        EnsureSize(4 + values.Length * 8);
+        WriteUInt32((uint)values.Length);
+        TLBlittable.Write(values, buffer.Slice(position));
+        position += values.Length * 8;
+    }
+
+    public void WriteInt256Vector(ReadOnlySpan<TLInt256> values)
+    {
+        EnsureSize(4 + values.Length * TLInt256.Size);
+        WriteUInt32((uint)values.Length);
+        TLBlittable.Write(values, buffer.Slice(position));
+        position += values.Length * TLInt256.Size;
+    }
+
+    public void WriteString(string src)
+    {
+        WriteBuffer(Encoding.UTF8.GetBytes(src));
+    }
+
+    public void WriteBool(bool src)
+    {
+        WriteUInt32(src ? 0x997275b5 : 0xbc799737);
+    }
+}
@@ -1,108 +1,194 @@
 using System;
-using System.IO;
+using System.Buffers;
+using System.Buffers.Binary;
 using System.Numerics;
 using System.Text;
 
 namespace TonSdk.Adnl.TL;
 
-public class TLWriteBuffer
+public class TLWriteBuffer : IDisposable
 {
-    MemoryStream stream;
-    BinaryWriter writer;
+    readonly ArrayPool<byte>? pool;
+    byte[] buffer;
+    int position;
 
-    public TLWriteBuffer()
+    public TLWriteBuffer() : this(128)
     {
-        stream = new MemoryStream(128);
-        writer = new BinaryWriter(stream);
+    }
+
+    /// <summary>
+    ///     Create a buffer with room for exactly <paramref name="capacity" /> bytes.
+    ///     When the generated GetSerializedSize() is used for the capacity, the buffer never grows
+    ///     and <see cref="Build" /> returns it without copying.
+    /// </summary>
+    public TLWriteBuffer(int capacity)
+    {
+        if (capacity < 0) throw new ArgumentOutOfRangeException(nameof(capacity));
+        buffer = capacity == 0 ? Array.Empty<byte>() : new byte[capacity];
+    }
+
+    /// <summary>
+    ///     Create a buffer backed by an array rented from <paramref name="pool" />.
+    ///     The array is returned to the pool on <see cref="Dispose" />; use <see cref="WrittenMemory" />
+    ///     to consume the result without copying it.
+    /// </summary>
+    public TLWriteBuffer(int capacity, ArrayPool<byte> pool)
+    {
+        if (capacity < 0) throw new ArgumentOutOfRangeException(nameof(capacity));
+        this.pool = pool;
+        buffer = pool.Rent(Math.Max(capacity, 1));
+    }
+
+    /// <summary>
+    ///     Number of bytes written so far.
+    /// </summary>
+    public int Length => position;
+
+    public ReadOnlySpan<byte> WrittenSpan => buffer.AsSpan(0, position);
+
+    public ReadOnlyMemory<byte> WrittenMemory => buffer.AsMemory(0, position);
+
+    public void Dispose()
+    {
+        if (pool == null || buffer.Length == 0) return;
+        pool.Return(buffer);
+        buffer = Array.Empty<byte>();
+        position = 0;
+    }
+
+    /// <summary>
+    ///     Serialized size of a TL bytes value of the given length: length prefix, payload and padding.
+    /// </summary>
+    public static int GetBufferSize(int length)
+    {
+        int headerSize = length <= 253 ? 1 : 4;
+        return (headerSize + length + 3) & ~3;
+    }
+
+    public static int GetStringSize(string src)
+    {
+        return GetBufferSize(Encoding.UTF8.GetByteCount(src));
     }
 
     void EnsureSize(int needBytes)
     {
-        if (stream.Length - stream.Position < needBytes)
-        {
-            int newLength = (int)stream.Length * 2;
-            MemoryStream newStream = new(newLength);
-            stream.Position = 0;
-            stream.CopyTo(newStream);
-            stream = newStream;
-            writer = new BinaryWriter(stream);
-        }
+        if (buffer.Length - position >= needBytes) return;
+
+        int newLength = Math.Max(buffer.Length * 2, position + needBytes);
+        byte[] newBuffer = pool?.Rent(newLength) ?? new byte[newLength];
+        Buffer.BlockCopy(buffer, 0, newBuffer, 0, position);
+        if (pool != null && buffer.Length != 0) pool.Return(buffer);
+        buffer = newBuffer;
     }
 
     public void WriteInt32(int val)
     {
         EnsureSize(4);
-        writer.Write(val);
+        BinaryPrimitives.WriteInt32LittleEndian(buffer.AsSpan(position), val);
+        position += 4;
     }
 
     public void WriteUInt32(uint val)
     {
         EnsureSize(4);
-        writer.Write(val);
+        BinaryPrimitives.WriteUInt32LittleEndian(buffer.AsSpan(position), val);
+        position += 4;
     }
 
     public void WriteInt64(long val)
     {
         EnsureSize(8);
-        writer.Write(val);
+        BinaryPrimitives.WriteInt64LittleEndian(buffer.AsSpan(position), val);
+        position += 8;
     }
 
     public void WriteUInt8(byte val)
     {
         EnsureSize(1);
-        writer.Write(val);
+        buffer[position++] = val;
     }
 
     public void WriteInt256(BigInteger val)
     {
         EnsureSize(32);
-        Span<byte> buffer = stackalloc byte[32];
-        buffer.Clear();
-        if (!val.TryWriteBytes(buffer, out int bytesWritten)) throw new Exception("Invalid int256 length");
+        Span<byte> target = buffer.AsSpan(position, 32);
+        target.Clear();
+        if (!val.TryWriteBytes(target, out int bytesWritten)) throw new Exception("Invalid int256 length");
         if (val < 0 && bytesWritten < 32)
             // two's complement representation
-            buffer[bytesWritten..].Fill(0xFF);
+            target[bytesWritten..].Fill(0xFF);
+
+        position += 32;
+    }
+
+    public void WriteInt256(TLInt256 val)
+    {
+        EnsureSize(TLInt256.Size);
+        val.CopyTo(buffer.AsSpan(position));
+        position += TLInt256.Size;
+    }
 
-        writer.Write(buffer);
+    public void WriteInt128(TLInt128 val)
+    {
+        EnsureSize(TLInt128.Size);
+        val.CopyTo(buffer.AsSpan(position));
+        position += TLInt128.Size;
     }
 
     public void WriteBytes(byte[] data, int size)
     {
         if (data.Length != size) throw new Exception($"Input array size not equals to {size}.");
         EnsureSize(size);
-        writer.Write(data);
+        Buffer.BlockCopy(data, 0, buffer, position, size);
+        position += size;
     }
 
     public void WriteBuffer(byte[] buf)
     {
-        EnsureSize(buf.Length + 4);
-        int len = 0;
-        if (buf.Length <= 253)
-        {
-            WriteUInt8((byte)buf.Length);
-            len += 1;
-        }
-        else
-        {
-            WriteUInt8(254);
-            EnsureSize(3 + buf.Length);
-            byte[] lengthBytes = BitConverter.GetBytes(buf.Length);
-            if (!BitConverter.IsLittleEndian) Array.Reverse(lengthBytes);
-            writer.Write(lengthBytes, 0, 3);
-            len += 4;
-        }
+        WriteBuffer(buf.AsSpan());
+    }
 
-        foreach (byte byteVal in buf)
-        {
-            WriteUInt8(byteVal);
-            len += 1;
-        }
+    public void WriteBuffer(ReadOnlySpan<byte> buf)
+    {
+        EnsureSize(GetBufferSize(buf.Length));
+        WriteBufferHeader(buf.Length);
+        buf.CopyTo(buffer.AsSpan(position));
+        position += buf.Length;
+        WriteBufferPadding(buf.Length);
+    }
 
-        while (len % 4 != 0)
+    /// <summary>
+    ///     Write only the length prefix of a TL bytes value, so its payload can be serialized in place.
+    ///     Must be followed by exactly <paramref name="length" /> payload bytes and <see cref="WriteBufferPadding" />.
+    /// </summary>
+    public void WriteBufferHeader(int length)
+    {
+        if (length <= 253)
         {
-            WriteUInt8(0);
-            len += 1;
+            WriteUInt8((byte)length);
+            return;
         }
+
+        EnsureSize(4);
+        buffer[position] = 254;
+        buffer[position + 1] = (byte)length;
+        buffer[position + 2] = (byte)(length >> 8);
+        buffer[position + 3] = (byte)(length >> 16);
+        position += 4;
+    }
+
+    /// <summary>
+    ///     Write the alignment padding that closes a TL bytes value started with <see cref="WriteBufferHeader" />.
+    /// </summary>
+    public void WriteBufferPadding(int length)
+    {
+        int headerSize = length <= 253 ? 1 : 4;
+        int padding = GetBufferSize(length) - headerSize - length;
+        if (padding == 0) return;
+
+        EnsureSize(padding);
+        buffer.AsSpan(position, padding).Clear();
+        position += padding;
     }
 
     public void WriteString(string src)
@@ -115,6 +201,30 @@ public class TLWriteBuffer
         WriteUInt32(src ? 0x997275b5 : 0xbc799737);
     }
 
+    public void WriteInt32Vector(ReadOnlySpan<int> values)
+    {
+        EnsureSize(4 + values.Length * 4);
+        WriteUInt32((uint)values.Length);
+        TLBlittable.Write(values, buffer.AsSpan(position));
+        position += values.Length * 4;
+    }
+
+    public void WriteInt64Vector(ReadOnlySpan<long> values)
+    {
+        EnsureSize(4 + values.Length * 8);
+        WriteUInt32((uint)values.Length);
+        TLBlittable.Write(values, buffer.AsSpan(position));
+        position += values.Length * 8;
+    }
+
+    public void WriteInt256Vector(ReadOnlySpan<TLInt256> values)
+    {
+        EnsureSize(4 + values.Length * TLInt256.Size);
+        WriteUInt32((uint)values.Length);
+        TLBlittable.Write(values, buffer.AsSpan(position));
+        position += values.Length * TLInt256.Size;
+    }
+
     public void WriteVector<T>(Action<T, TLWriteBuffer> codec, T[] data)
     {
         WriteUInt32((uint)data.Length);
@@ -123,6 +233,8 @@ public class TLWriteBuffer
 
     public byte[] Build()
     {
-        return stream.ToArray();
+        // An exactly pre-sized buffer is handed out as is; any later write reallocates first
+        if (pool == null && position == buffer.Length) return buffer;
+        return buffer.AsSpan(0, position).ToArray();
     }
-}
\ No newline at end of file
+}
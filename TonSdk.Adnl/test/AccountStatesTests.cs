@@ -0,0 +1,178 @@
+using NUnit.Framework;
+using TonSdk.Adnl.LiteClient;
+using TonSdk.Adnl.LiteClient.Protocol;
+using TonSdk.Adnl.LiteClient.Types;
+using TonSdk.Adnl.TL;
+using TonSdk.Core.Addresses;
+using TonSdk.Core.Blocks;
+using TonSdk.Core.Boc;
+using TonSdk.Core.Boc.Cells;
+using TonSdk.Core.Economics;
+
+namespace TonSdk.Adnl.Tests;
+
+public class AccountStatesTests
+{
+    static readonly TonNodeBlockIdExt Block = new(0, unchecked((long)0x8000000000000000), 7,
+        new TLInt256(new byte[32]), new TLInt256(new byte[32]));
+
+    [Test]
+    public async Task Test_YieldsEveryAddressWithPerAddressErrors()
+    {
+        FakeLiteEngine accounts = Accounts();
+        using LiteClient.LiteClient client = LiteClient.LiteClient.Create(accounts);
+        Address[] addresses = Enumerable.Range(1, 50).Select(Account).ToArray();
+
+        List<AccountStateResult> results = await Collect(client.GetAccountStates(Block, addresses));
+
+        Assert.That(results.Select(r => r.Address.Hash[0]).OrderBy(b => b),
+            Is.EqualTo(addresses.Select(a => a.Hash[0])));
+
+        AccountStateResult[] failed = results.Where(r => !r.IsSuccess).ToArray();
+        Assert.That(failed.Select(r => r.Address.Hash[0] % 10).Distinct(), Is.EqualTo(new[] { 0 }));
+        Assert.That(failed.Length, Is.EqualTo(5));
+        Assert.That(failed.All(r => r.Error is LiteServerException && r.State == null), Is.True);
+
+        AccountStateResult ok = results.Single(r => r.Address.Hash[0] == 3);
+        Assert.That(ok.State!.Balance.ToBigInt(), Is.EqualTo(Balance(3).ToBigInt()));
+        Assert.That(ok.State.Status, Is.EqualTo(AccountStatus.Active));
+        Assert.That(ok.State.Code, Is.Not.Null);
+    }
+
+    [TestCase(false)]
+    [TestCase(true)]
+    public async Task Test_SkipCodeAndDataMatchesTheFullParse(bool hasIdx)
+    {
+        FakeLiteEngine accounts = Accounts(hasIdx);
+        using LiteClient.LiteClient client = LiteClient.LiteClient.Create(accounts);
+        Address[] addresses = { Account(1), Account(2), Account(4), Account(11) };
+
+        List<AccountStateResult> full = await Collect(client.GetAccountStates(Block, addresses));
+        List<AccountStateResult> summary = await Collect(client.GetAccountStates(Block, addresses,
+            new AccountStatesOptions { SkipCodeAndData = true }));
+
+        foreach (AccountStateResult expected in full)
+        {
+            ClientAccountState actual = summary.Single(r => r.Address.Equals(expected.Address)).State!;
+            Assert.That(actual.Balance.ToBigInt(), Is.EqualTo(expected.State!.Balance.ToBigInt()));
+            Assert.That(actual.Status, Is.EqualTo(expected.State.Status));
+            Assert.That(actual.LastTransactionLt, Is.EqualTo(expected.State.LastTransactionLt));
+            Assert.That(actual.Code, Is.Null);
+            Assert.That(actual.Data, Is.Null);
+        }
+
+        Assert.That(full.Select(r => r.State!.Status).Distinct().Count(), Is.EqualTo(3),
+            "active, frozen and nonexistent accounts are covered");
+    }
+
+    [Test]
+    public async Task Test_BoundsQueriesInFlight()
+    {
+        FakeLiteEngine accounts = Accounts(delayMs: 5);
+        using LiteClient.LiteClient client = LiteClient.LiteClient.Create(accounts);
+
+        List<AccountStateResult> results = await Collect(client.GetAccountStates(Block,
+            Enumerable.Range(1, 60).Select(Account), new AccountStatesOptions { MaxConcurrency = 4 }));
+
+        Assert.That(results.Count, Is.EqualTo(60));
+        Assert.That(accounts.MaxConcurrent, Is.InRange(2, 4));
+    }
+
+    [Test]
+    public async Task Test_LeavingEarlyStopsTheBatch()
+    {
+        FakeLiteEngine accounts = Accounts(delayMs: 5);
+        using LiteClient.LiteClient client = LiteClient.LiteClient.Create(accounts);
+
+        await foreach (AccountStateResult _ in client.GetAccountStates(Block, Enumerable.Range(1, 1000).Select(Account),
+                           new AccountStatesOptions { MaxConcurrency = 2 }))
+            break;
+
+        int queried = accounts.Calls;
+        await Task.Delay(50);
+        Assert.That(accounts.Calls, Is.EqualTo(queried));
+        Assert.That(queried, Is.LessThan(10));
+    }
+
+    static Address Account(int n)
+    {
+        byte[] hash = new byte[32];
+        hash[0] = (byte)n;
+        return new Address(0, hash);
+    }
+
+    static async Task<List<AccountStateResult>> Collect(IAsyncEnumerable<AccountStateResult> batch)
+    {
+        List<AccountStateResult> results = new();
+        await foreach (AccountStateResult result in batch) results.Add(result);
+        return results;
+    }
+
+    static Coins Balance(int n)
+    {
+        return Coins.FromNano(n * 1_000_000_007L);
+    }
+
+    /// <summary>
+    ///     Lite server holding one account per address. Accounts ending in 0 fail with liteServer.error,
+    ///     ending in 1 don't exist, ending in 4 are frozen and the rest are active.
+    /// </summary>
+    static FakeLiteEngine Accounts(bool hasIdx = false, int delayMs = 0)
+    {
+        return new FakeLiteEngine(request => Answer((LiteServerGetAccountStateRequest)request, hasIdx))
+        {
+            DelayMs = delayMs
+        };
+    }
+
+    static byte[] Answer(LiteServerGetAccountStateRequest request, bool hasIdx)
+    {
+        int n = request.Account.Id.ToArray()[0];
+        TLWriteBuffer writer = new(1024);
+        if (n % 10 == 0)
+        {
+            writer.WriteUInt32(LiteServerError.Constructor);
+            new LiteServerError { Code = 651, Message = "state not found" }.WriteTo(writer);
+            return writer.Build();
+        }
+
+        writer.WriteUInt32(LiteServerAccountState.Constructor);
+        new LiteServerAccountState
+        {
+            Id = request.Id,
+            Shardblk = request.Id,
+            State = AccountCell(n).Serialize(hasIdx).ToBytes()
+        }.WriteTo(writer);
+        return writer.Build();
+    }
+
+    static Cell AccountCell(int n)
+    {
+        if (n % 10 == 1) return new CellBuilder().StoreBit(false).Build();
+
+        CellBuilder account = new CellBuilder()
+            .StoreBit(true)
+            .StoreAddress(Account(n))
+            .StoreVarUInt(3, 7)
+            .StoreVarUInt(1000, 7)
+            .StoreVarUInt(0, 7)
+            .StoreUInt(1700000000, 32)
+            .StoreBit(false)
+            .StoreUInt((ulong)(n * 1000), 64)
+            .StoreCoins(Balance(n))
+            .StoreBit(false);
+
+        if (n % 10 == 4)
+            return account.StoreBit(false).StoreBit(true).StoreBytes(new byte[32]).Build();
+
+        Cell code = new CellBuilder().StoreUInt((ulong)n, 32).Build();
+        Cell data = new CellBuilder().StoreUInt(0, 64).StoreRef(code).Build();
+        return account
+            .StoreBit(true)
+            .StoreBit(false).StoreBit(false)
+            .StoreBit(true).StoreRef(code)
+            .StoreBit(true).StoreRef(data)
+            .StoreBit(false)
+            .Build();
+    }
+}
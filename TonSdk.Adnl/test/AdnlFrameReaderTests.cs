@@ -0,0 +1,124 @@
+using System.Buffers.Binary;
+using NUnit.Framework;
+using TonSdk.Adnl.Adnl;
+
+namespace TonSdk.Adnl.Tests;
+
+public class AdnlFrameReaderTests
+{
+    static readonly byte[] Key = Enumerable.Range(0, 32).Select(i => (byte)i).ToArray();
+    static readonly byte[] Iv = Enumerable.Range(100, 16).Select(i => (byte)i).ToArray();
+
+    [TestCase(1)]
+    [TestCase(7)]
+    [TestCase(68)]
+    [TestCase(1000)]
+    [TestCase(1 << 20)]
+    public void Test_DeliversPacketsSplitAcrossReads(int chunkSize)
+    {
+        byte[][] payloads = { Array.Empty<byte>(), Payload(1, 1), Payload(2, 300), Payload(3, 70_000), Payload(4, 12) };
+
+        List<byte[]> received = Receive(Encrypt(payloads), chunkSize, out int buffered);
+
+        Assert.That(received, Is.EqualTo(payloads));
+        Assert.That(buffered, Is.EqualTo(0));
+    }
+
+    [Test]
+    public void Test_DeliversPayloadLargerThanTheInitialBuffer()
+    {
+        byte[] payload = Payload(5, 3 * 1024 * 1024 + 17);
+
+        List<byte[]> received = Receive(Encrypt(payload), AdnlFrameReader.MinimumReadSize, out int buffered);
+
+        Assert.That(received, Has.Count.EqualTo(1));
+        Assert.That(received[0], Is.EqualTo(payload));
+        Assert.That(buffered, Is.EqualTo(0));
+    }
+
+    [Test]
+    public void Test_KeepsIncompletePacketBuffered()
+    {
+        byte[] stream = Encrypt(Payload(6, 100));
+
+        List<byte[]> received = Receive(stream.AsSpan(0, stream.Length - 1).ToArray(), 1 << 20, out int buffered);
+
+        Assert.That(received, Is.Empty);
+        Assert.That(buffered, Is.EqualTo(stream.Length - 1));
+    }
+
+    [Test]
+    public void Test_RejectsPacketWithBadHash()
+    {
+        byte[] packet = new AdnlPacket(Payload(7, 40)).Data;
+        packet[^1] ^= 1;
+        byte[] stream = CipherFactory.CreateCipheriv(Key, Iv).Update(packet);
+
+        Exception? exception = Assert.Throws<Exception>(() => Receive(stream, 1 << 20, out _));
+        Assert.That(exception!.Message, Does.Contain("Bad packet hash"));
+    }
+
+    [Test]
+    public void Test_RejectsPacketShorterThanNonceAndHash()
+    {
+        byte[] stream = CipherFactory.CreateCipheriv(Key, Iv).Update(new byte[] { 63, 0, 0, 0 });
+
+        Exception? exception = Assert.Throws<Exception>(() => Receive(stream, 1 << 20, out _));
+        Assert.That(exception!.Message, Does.Contain("Bad packet size"));
+    }
+
+    [TestCase(AdnlPacket.MaxPacketSize + 1)]
+    [TestCase(int.MaxValue - 4)]
+    [TestCase((long)uint.MaxValue)]
+    public void Test_RejectsPacketLargerThanTheMaximum(long size)
+    {
+        byte[] header = new byte[4];
+        BinaryPrimitives.WriteUInt32LittleEndian(header, (uint)size);
+        byte[] stream = CipherFactory.CreateCipheriv(Key, Iv).Update(header);
+
+        Exception? exception = Assert.Throws<Exception>(() => Receive(stream, 1 << 20, out _));
+        Assert.That(exception!.Message, Does.Contain("Bad packet size"));
+    }
+
+    [Test]
+    public void Test_AcceptsSizePrefixUpToTheMaximum()
+    {
+        byte[] header = new byte[4];
+        BinaryPrimitives.WriteUInt32LittleEndian(header, AdnlPacket.MaxPacketSize);
+
+        Assert.That(AdnlPacket.TryGetLength(header, out int length), Is.True);
+        Assert.That(length, Is.EqualTo(4 + AdnlPacket.MaxPacketSize));
+    }
+
+    static List<byte[]> Receive(byte[] stream, int chunkSize, out int buffered)
+    {
+        List<byte[]> received = new();
+        using AdnlFrameReader reader = new(CipherFactory.CreateDecipheriv(Key, Iv));
+
+        for (int offset = 0; offset < stream.Length;)
+        {
+            Memory<byte> memory = reader.GetMemory();
+            int count = Math.Min(Math.Min(chunkSize, memory.Length), stream.Length - offset);
+            stream.AsSpan(offset, count).CopyTo(memory.Span);
+            offset += count;
+
+            reader.Advance(count, payload => received.Add(payload.ToArray()));
+        }
+
+        buffered = reader.Buffered;
+        return received;
+    }
+
+    static byte[] Encrypt(params byte[][] payloads)
+    {
+        byte[] packets = payloads.SelectMany(payload => new AdnlPacket(payload).Data).ToArray();
+        return CipherFactory.CreateCipheriv(Key, Iv).Update(packets);
+    }
+
+    static byte[] Payload(int seed, int length)
+    {
+        byte[] payload = new byte[length];
+        new Random(seed).NextBytes(payload);
+        return payload;
+    }
+}
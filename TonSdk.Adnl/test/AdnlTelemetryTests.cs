@@ -0,0 +1,152 @@
+using System.Collections.Concurrent;
+using System.Diagnostics;
+using System.Diagnostics.Metrics;
+using NUnit.Framework;
+using TonSdk.Adnl.Diagnostics;
+using TonSdk.Adnl.LiteClient;
+using TonSdk.Adnl.LiteClient.Engines;
+using TonSdk.Adnl.LiteClient.Protocol;
+using TonSdk.Adnl.TL;
+
+namespace TonSdk.Adnl.Tests;
+
+public class AdnlTelemetryTests
+{
+    [Test]
+    public async Task Test_QueryIsTracedAndMeasured()
+    {
+        using Recorder recorder = new();
+        using LoopbackLiteServer server = new(TimeResponse());
+        using LiteSingleEngine engine = new(server.Host, server.Port, server.PublicKey);
+        using LiteClient.LiteClient client = LiteClient.LiteClient.Create(engine);
+
+        await client.GetTime();
+
+        Assert.That(recorder.Find("tonsdk.liteclient.query.duration", "method", "liteServer.getTime")
+            .Select(m => m.Tags["status"]), Is.EqualTo(new[] { "ok" }));
+        Assert.That(recorder.Find("tonsdk.liteclient.decode.duration", "type", "liteServer.currentTime"), Is.Not.Empty);
+        Assert.That(recorder.Sum("tonsdk.adnl.bytes.sent"), Is.GreaterThan(0));
+        Assert.That(recorder.Sum("tonsdk.adnl.packets.received"), Is.GreaterThanOrEqualTo(2), "handshake and answer");
+        Assert.That(recorder.Find("tonsdk.adnl.cipher.duration", "direction", "decrypt"), Is.Not.Empty);
+        Assert.That(recorder.Find("tonsdk.adnl.connections.opened", "server.port", server.Port), Is.Not.Empty);
+
+        Activity activity = recorder.Activities.Single(a => a.OperationName == "liteServer.getTime");
+        Assert.That(activity.Kind, Is.EqualTo(ActivityKind.Client));
+        Assert.That(activity.GetTagItem("tonsdk.status"), Is.EqualTo("ok"));
+    }
+
+    [Test]
+    public async Task Test_RoundRobinTagsBackends()
+    {
+        using Recorder recorder = new();
+        using RoundRobinEngine engine = new(new FakeLiteEngine(_ => throw new IOException("backend down")),
+            new FakeLiteEngine(_ => TimeResponse()));
+        using LiteClient.LiteClient client = LiteClient.LiteClient.Create(engine);
+
+        // The rotation starts at index 1, so the healthy backend answers first and the failing one fails over
+        await client.GetTime();
+        await client.GetTime();
+
+        Assert.That(recorder.Find("tonsdk.liteclient.backend.queries", "backend", 0).Select(m => m.Tags["status"]),
+            Is.EqualTo(new[] { "error" }));
+        Assert.That(recorder.Find("tonsdk.liteclient.backend.queries", "backend", 1).Select(m => m.Tags["status"]),
+            Is.EqualTo(new[] { "ok", "ok" }));
+        Assert.That(recorder.Find("tonsdk.liteclient.backend.duration", "backend", 1).Count, Is.EqualTo(2));
+    }
+
+    [Test]
+    public async Task Test_PendingGaugeAndTimeouts()
+    {
+        using Recorder recorder = new();
+        using QueryManager queries = new();
+        long before = recorder.Observe("tonsdk.adnl.queries.pending");
+
+        Task<byte[]> pending = await queries.RegisterQueryAsync(new TLInt256(new byte[32]), Array.Empty<byte>(), 20,
+            CancellationToken.None);
+        Assert.That(recorder.Observe("tonsdk.adnl.queries.pending"), Is.EqualTo(before + 1));
+
+        Assert.ThrowsAsync<TaskCanceledException>(async () => await pending);
+        Assert.That(recorder.Sum("tonsdk.adnl.queries.timeouts"), Is.EqualTo(1));
+        Assert.That(recorder.Observe("tonsdk.adnl.queries.pending"), Is.EqualTo(before));
+    }
+
+    [Test]
+    public void Test_MethodNamesFollowTheSchema()
+    {
+        Assert.That(AdnlTelemetry.GetMethodName(typeof(LiteServerGetMasterchainInfoExtRequest)),
+            Is.EqualTo("liteServer.getMasterchainInfoExt"));
+        Assert.That(AdnlTelemetry.GetMethodName(typeof(LiteServerAccountState)), Is.EqualTo("liteServer.accountState"));
+    }
+
+    static byte[] TimeResponse()
+    {
+        TLWriteBuffer writer = new(8);
+        writer.WriteUInt32(LiteServerCurrentTime.Constructor);
+        writer.WriteInt32(1_700_000_000);
+        return writer.Build();
+    }
+
+    record Measurement(string Instrument, double Value, Dictionary<string, object?> Tags);
+
+    /// <summary>
+    ///     Collects every measurement and activity of the library while alive.
+    /// </summary>
+    sealed class Recorder : IDisposable
+    {
+        readonly ActivityListener activityListener;
+        readonly MeterListener meterListener = new();
+        readonly ConcurrentQueue<Measurement> measurements = new();
+
+        public Recorder()
+        {
+            meterListener.InstrumentPublished = (instrument, listener) =>
+            {
+                if (instrument.Meter.Name == AdnlTelemetry.MeterName) listener.EnableMeasurementEvents(instrument);
+            };
+            meterListener.SetMeasurementEventCallback<long>((instrument, value, tags, _) => Add(instrument, value, tags));
+            meterListener.SetMeasurementEventCallback<double>((instrument, value, tags, _) => Add(instrument, value, tags));
+            meterListener.Start();
+
+            activityListener = new ActivityListener
+            {
+                ShouldListenTo = source => source.Name == AdnlTelemetry.ActivitySourceName,
+                Sample = (ref ActivityCreationOptions<ActivityContext> _) => ActivitySamplingResult.AllData,
+                ActivityStopped = Activities.Enqueue
+            };
+            ActivitySource.AddActivityListener(activityListener);
+        }
+
+        public ConcurrentQueue<Activity> Activities { get; } = new();
+
+        public List<Measurement> Find(string instrument, string tag, object value)
+        {
+            return measurements.Where(m => m.Instrument == instrument && Equals(m.Tags.GetValueOrDefault(tag), value))
+                .ToList();
+        }
+
+        public double Sum(string instrument)
+        {
+            return measurements.Where(m => m.Instrument == instrument).Sum(m => m.Value);
+        }
+
+        public long Observe(string instrument)
+        {
+            measurements.Clear();
+            meterListener.RecordObservableInstruments();
+            return (long)measurements.Last(m => m.Instrument == instrument).Value;
+        }
+
+        public void Dispose()
+        {
+            meterListener.Dispose();
+            activityListener.Dispose();
+        }
+
+        void Add(Instrument instrument, double value, ReadOnlySpan<KeyValuePair<string, object?>> tags)
+        {
+            Dictionary<string, object?> copy = new();
+            foreach (KeyValuePair<string, object?> tag in tags) copy[tag.Key] = tag.Value;
+            measurements.Enqueue(new Measurement(instrument.Name, value, copy));
+        }
+    }
+}
@@ -0,0 +1,72 @@
+using NUnit.Framework;
+using TonSdk.Adnl.Adnl;
+using TonSdk.Core.Cryptography;
+
+namespace TonSdk.Adnl.Tests;
+
+public class AesCtrKeystreamTests
+{
+    [Test]
+    public void Test_MatchesNistCtrAes256Vector()
+    {
+        // NIST SP 800-38A, F.5.5 CTR-AES256.Encrypt
+        byte[] key = Utils.HexToBytes("603deb1015ca71be2b73aef0857d77811f352c073b6108d72d9810a30914dff4");
+        byte[] iv = Utils.HexToBytes("f0f1f2f3f4f5f6f7f8f9fafbfcfdfeff");
+        byte[] data = Utils.HexToBytes(
+            "6bc1bee22e409f96e93d7e117393172aae2d8a571e03ac9c9eb76fac45af8e51" +
+            "30c81c46a35ce411e5fbc1191a0a52eff69f2445df4f9b17ad2b417be66c3710");
+
+        new AesCtrKeystream(key, iv).Transform(data);
+
+        Assert.That(data, Is.EqualTo(Utils.HexToBytes(
+            "601ec313775789a5b7a7f504bbf3d228f443e3ca4d62b59aca84e990cacaf5c5" +
+            "2b0930daa23de94ce87017ba2d84988ddfc9c58db67aada613c2dd08457941a6")));
+    }
+
+    [TestCase("000102030405060708090a0b0c0d0e0f", 1)]
+    [TestCase("0000000000000000ffffffffffffff00", 2)]
+    [TestCase("fffffffffffffffffffffffffffffff0", 3)]
+    public void Test_MatchesAesCtrModeAcrossChunks(string ivHex, int seed)
+    {
+        byte[] key = Enumerable.Range(1, 32).Select(i => (byte)i).ToArray();
+        Random random = new(seed);
+        byte[] data = new byte[100_000];
+        random.NextBytes(data);
+
+        AesCtrMode reference = new(key, new AesCounter(Utils.HexToBytes(ivHex)));
+        using AesCtrKeystream keystream = new(key, Utils.HexToBytes(ivHex));
+
+        byte[] expected = reference.Encrypt(data);
+        byte[] actual = (byte[])data.Clone();
+        for (int offset = 0; offset < actual.Length;)
+        {
+            int count = Math.Min(random.Next(0, 5_000), actual.Length - offset);
+            keystream.Transform(actual.AsSpan(offset, count));
+            offset += count;
+        }
+
+        Assert.That(actual, Is.EqualTo(expected));
+    }
+
+    [Test]
+    public void Test_LeavesIvUntouched()
+    {
+        byte[] iv = Enumerable.Repeat((byte)0xFF, 16).ToArray();
+
+        new AesCtrKeystream(new byte[32], iv).Transform(new byte[10_000]);
+
+        Assert.That(iv, Is.EqualTo(Enumerable.Repeat((byte)0xFF, 16).ToArray()));
+    }
+
+    [Test]
+    public void Test_DisposeReleasesTheTransform()
+    {
+        AesCtrKeystream keystream = new(new byte[32], new byte[16]);
+        keystream.Transform(new byte[100]);
+
+        keystream.Dispose();
+        keystream.Dispose();
+
+        Assert.Throws<ObjectDisposedException>(() => keystream.Transform(new byte[1]));
+    }
+}
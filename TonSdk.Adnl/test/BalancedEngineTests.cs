@@ -0,0 +1,126 @@
+using System.Diagnostics;
+using NUnit.Framework;
+using TonSdk.Adnl.LiteClient;
+using TonSdk.Adnl.LiteClient.Engines;
+using TonSdk.Adnl.LiteClient.Protocol;
+
+namespace TonSdk.Adnl.Tests;
+
+public class BalancedEngineTests
+{
+    static readonly LiteServerGetTimeRequest Request = new();
+
+    [Test]
+    public async Task Test_PrefersFasterBackend()
+    {
+        FakeLiteEngine fast = Backend(1);
+        FakeLiteEngine slow = Backend(40);
+        using BalancedEngine engine = new(fast, slow);
+
+        for (int i = 0; i < 20; i++)
+            await engine.QueryAsync(Request);
+
+        Assert.That(slow.Calls, Is.LessThanOrEqualTo(2));
+        Assert.That(fast.Calls, Is.GreaterThanOrEqualTo(18));
+    }
+
+    [Test]
+    public async Task Test_SpreadsOutstandingQueries()
+    {
+        TaskCompletionSource gate = new();
+        FakeLiteEngine first = Backend(gate: gate);
+        FakeLiteEngine second = Backend(gate: gate);
+        using BalancedEngine engine = new(first, second);
+
+        Task<byte[]>[] responses = Enumerable.Range(0, 10).Select(_ => engine.QueryAsync(Request)).ToArray();
+        Assert.That(engine.GetBackendStats().Sum(s => s.Outstanding), Is.EqualTo(10));
+        Assert.That(Math.Abs(first.Calls - second.Calls), Is.LessThanOrEqualTo(1));
+
+        gate.SetResult();
+        await Task.WhenAll(responses);
+        Assert.That(engine.GetBackendStats().Sum(s => s.Outstanding), Is.EqualTo(0));
+    }
+
+    [Test]
+    public async Task Test_EjectsFailingBackendAndProbesItBack()
+    {
+        FakeLiteEngine healthy = Backend(5);
+        bool fail = true;
+        FakeLiteEngine failing = new(_ => fail ? throw new InvalidOperationException("Backend failed") : new byte[] { 1 });
+        BalancedEngineOptions options = new() { FailureThreshold = 2, EjectionMs = 100 };
+        using BalancedEngine engine = new(options, healthy, failing);
+
+        for (int i = 0; i < 10; i++)
+            Assert.That(await engine.QueryAsync(Request), Is.Not.Null, "failures are retried on the healthy backend");
+
+        Assert.That(failing.Calls, Is.EqualTo(2));
+        Assert.That(engine.GetBackendStats()[1].Ejected, Is.True);
+
+        fail = false;
+        await Task.Delay(150);
+        Assert.That(engine.GetBackendStats()[1].Ejected, Is.False, "ejection ran out, waiting for a probe");
+
+        await engine.QueryAsync(Request);
+        Assert.That(failing.Calls, Is.EqualTo(3), "the recovered backend failed fast, so it scores best");
+        Assert.That(engine.GetBackendStats()[1].Ejected, Is.False);
+    }
+
+    [Test]
+    public void Test_ThrowsWhenEveryBackendFails()
+    {
+        using BalancedEngine engine = new(FailingBackend(), FailingBackend());
+
+        Assert.ThrowsAsync<InvalidOperationException>(async () => await engine.QueryAsync(Request));
+    }
+
+    [Test]
+    public async Task Test_HedgesSlowQueryAndCancelsTheLoser()
+    {
+        FakeLiteEngine fast = Backend(1);
+        FakeLiteEngine slow = Backend(5000, online: false);
+        BalancedEngineOptions options = new() { Hedging = true, MinHedgeDelayMs = 10 };
+        using BalancedEngine engine = new(options, fast, slow);
+
+        // Warm up the latency percentile on the fast backend only; the slow one, never measured, then scores best
+        for (int i = 0; i < 40; i++)
+            await engine.QueryAsync(Request);
+        slow.Online = true;
+
+        Stopwatch sw = Stopwatch.StartNew();
+        await engine.QueryAsync(Request);
+        sw.Stop();
+
+        Assert.That(slow.Calls, Is.EqualTo(1));
+        Assert.That(engine.Hedges, Is.EqualTo(1));
+        Assert.That(sw.ElapsedMilliseconds, Is.LessThan(2000));
+        Assert.That(await slow.Cancelled.Task.WaitAsync(TimeSpan.FromSeconds(5)), Is.True);
+    }
+
+    [Test]
+    public async Task Test_DoesNotHedgeSendMessage()
+    {
+        FakeLiteEngine fast = Backend(1);
+        FakeLiteEngine slow = Backend(100, online: false);
+        BalancedEngineOptions options = new() { Hedging = true, MinHedgeDelayMs = 10 };
+        using BalancedEngine engine = new(options, fast, slow);
+
+        for (int i = 0; i < 40; i++)
+            await engine.QueryAsync(Request);
+        slow.Online = true;
+
+        await engine.QueryAsync(new LiteServerSendMessageRequest { Body = new byte[] { 1 } });
+
+        Assert.That(engine.Hedges, Is.EqualTo(0));
+        Assert.That(slow.Calls + fast.Calls, Is.EqualTo(41));
+    }
+
+    static FakeLiteEngine Backend(int delayMs = 0, TaskCompletionSource? gate = null, bool online = true)
+    {
+        return new FakeLiteEngine(_ => new byte[] { 1 }) { DelayMs = delayMs, Gate = gate, Online = online };
+    }
+
+    static FakeLiteEngine FailingBackend()
+    {
+        return new FakeLiteEngine(_ => throw new InvalidOperationException("Backend failed"));
+    }
+}
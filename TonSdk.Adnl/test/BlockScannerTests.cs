@@ -0,0 +1,340 @@
+using NUnit.Framework;
+using TonSdk.Adnl.LiteClient;
+using TonSdk.Adnl.LiteClient.Protocol;
+using TonSdk.Adnl.LiteClient.Types;
+using TonSdk.Adnl.TL;
+using TonSdk.Core.Boc;
+using TonSdk.Core.Boc.bits;
+using TonSdk.Core.Boc.Cells;
+
+namespace TonSdk.Adnl.Tests;
+
+public class BlockScannerTests
+{
+    const long Root = unchecked((long)0x8000000000000000);
+    const long Left = 0x4000000000000000;
+    const long Right = unchecked((long)0xC000000000000000);
+
+    [Test]
+    public async Task Test_YieldsShardBlocksThenMasterchainInOrder()
+    {
+        // Every masterchain block s commits shard blocks 2s - 1 and 2s
+        FakeChain chain = new(seqno => new[] { (Root, 2 * seqno) }) { Head = 10 };
+        using LiteClient.LiteClient client = LiteClient.LiteClient.Create(chain.Engine());
+
+        List<ScannedBlock> blocks = await Collect(client.ScanBlocks(2, 4, new BlockScannerOptions { PageSize = 2 }));
+
+        Assert.That(blocks.Select(b => (b.Block.Workchain, b.Block.Seqno)), Is.EqualTo(new[]
+        {
+            (0, 3), (0, 4), (-1, 2),
+            (0, 5), (0, 6), (-1, 3),
+            (0, 7), (0, 8), (-1, 4)
+        }));
+        Assert.That(blocks.Select(b => b.MasterchainBlock.Seqno), Is.EqualTo(new[] { 2, 2, 2, 3, 3, 3, 4, 4, 4 }));
+        Assert.That(blocks[0].Transactions.Select(t => t.Lt), Is.EqualTo(FakeChain.Lts(3)), "pages are joined");
+        Assert.That(blocks[0].Transactions[0].Account.Workchain, Is.EqualTo(0));
+    }
+
+    [Test]
+    public async Task Test_SplitListsParentBlocksOnce()
+    {
+        // The shard produces 13, then splits; both children continue at 14
+        FakeChain chain = new(seqno => seqno < 3 ? new[] { (Root, 6 * seqno) } : new[] { (Left, 14), (Right, 14) })
+        {
+            Head = 3,
+            SplitAfter = 13
+        };
+        using LiteClient.LiteClient client = LiteClient.LiteClient.Create(chain.Engine());
+
+        List<ScannedBlock> blocks = await Collect(client.ScanBlocks(3, 3));
+
+        Assert.That(blocks.Select(b => (b.Block.Shard, b.Block.Seqno)), Is.EqualTo(new[]
+        {
+            (Root, 13), (Left, 14), (Right, 14), (Root, 3)
+        }));
+    }
+
+    [Test]
+    public async Task Test_MergeListsBothParentsBlocks()
+    {
+        // The halves are at 10 and 12, go on to 14 and 15, then merge into 16
+        FakeChain chain = new(seqno => seqno < 3 ? new[] { (Left, 10), (Right, 12) } : new[] { (Root, 16) })
+        {
+            Head = 3,
+            Merge = (16, 14, 15)
+        };
+        using LiteClient.LiteClient client = LiteClient.LiteClient.Create(chain.Engine());
+
+        List<ScannedBlock> blocks = await Collect(client.ScanBlocks(3, 3));
+
+        Assert.That(blocks.Select(b => (b.Block.Shard, b.Block.Seqno)), Is.EqualTo(new[]
+        {
+            (Left, 11), (Left, 12), (Left, 13), (Right, 13), (Left, 14), (Right, 14), (Right, 15), (Root, 16),
+            (Root, 3)
+        }));
+    }
+
+    [Test]
+    public async Task Test_ResumesFromCheckpoint()
+    {
+        FakeChain chain = new(seqno => new[] { (Root, seqno) }) { Head = 5 };
+        using LiteClient.LiteClient client = LiteClient.LiteClient.Create(chain.Engine());
+        ScannedBlock checkpoint = (await Collect(client.ScanBlocks(3, 3))).Last();
+
+        List<ScannedBlock> resumed = await Collect(client.ScanBlocks(checkpoint.MasterchainBlock, 5));
+
+        Assert.That(resumed.Select(b => (b.Block.Workchain, b.Block.Seqno)),
+            Is.EqualTo(new[] { (0, 4), (-1, 4), (0, 5), (-1, 5) }));
+
+        TonNodeBlockIdExt forked = new(-1, Root, 3, new TLInt256(new byte[32]), checkpoint.MasterchainBlock.FileHash);
+        Assert.ThrowsAsync<InvalidOperationException>(async () => await Collect(client.ScanBlocks(forked, 5)));
+    }
+
+    [Test]
+    public async Task Test_PrefetchWaitsForTheConsumer()
+    {
+        FakeChain chain = new(seqno => new[] { (Root, seqno) }) { Head = 1000 };
+        using LiteClient.LiteClient client = LiteClient.LiteClient.Create(chain.Engine());
+        BlockScannerOptions options = new() { PrefetchDepth = 3 };
+
+        await using (IAsyncEnumerator<ScannedBlock> scan = client.ScanBlocks(10, null, options).GetAsyncEnumerator())
+        {
+            Assert.That(await scan.MoveNextAsync(), Is.True);
+            await Task.Delay(100);
+
+            Assert.That(chain.MaxMasterchainLookup, Is.EqualTo(12), "only the prefetch window is fetched");
+        }
+
+        int stopped = chain.MaxMasterchainLookup;
+        await Task.Delay(100);
+        Assert.That(chain.MaxMasterchainLookup, Is.EqualTo(stopped));
+    }
+
+    [Test]
+    public async Task Test_BoundsParallelQueries()
+    {
+        FakeChain chain = new(seqno => new[] { (Left, 4 * seqno), (Right, 4 * seqno) }) { Head = 30 };
+        FakeLiteEngine engine = chain.Engine(delayMs: 10);
+        using LiteClient.LiteClient client = LiteClient.LiteClient.Create(engine);
+
+        List<ScannedBlock> blocks = await Collect(client.ScanBlocks(2, 30,
+            new BlockScannerOptions { PrefetchDepth = 8, MaxParallelism = 5 }));
+
+        Assert.That(blocks.Count, Is.EqualTo(29 * 9));
+        Assert.That(engine.MaxConcurrent, Is.InRange(2, 5));
+    }
+
+    static async Task<List<ScannedBlock>> Collect(IAsyncEnumerable<ScannedBlock> scan)
+    {
+        List<ScannedBlock> blocks = new();
+        await foreach (ScannedBlock block in scan) blocks.Add(block);
+        return blocks;
+    }
+
+    /// <summary>
+    ///     Synthetic chain, served through <see cref="Engine" />. Shard blocks have five transactions each,
+    ///     masterchain blocks two.
+    /// </summary>
+    class FakeChain(Func<int, (long shard, int top)[]> shards)
+    {
+        int maxMasterchainLookup;
+
+        public int Head { get; init; }
+
+        /// <summary>
+        ///     Shard blocks up to this seqno belong to the root shard, whatever shard they are looked up by.
+        /// </summary>
+        public int SplitAfter { get; init; }
+
+        /// <summary>
+        ///     Root shard block merging the two halves, after their last blocks. Looked up by the root shard, earlier
+        ///     seqnos find a block of the left half only, like the prefix lookup of a lite server.
+        /// </summary>
+        public (int seqno, int leftLast, int rightLast)? Merge { get; init; }
+
+        public int MaxMasterchainLookup => Volatile.Read(ref maxMasterchainLookup);
+
+        public static long[] Lts(int seqno, int count = 5)
+        {
+            return Enumerable.Range(0, count).Select(i => seqno * 100L + i).ToArray();
+        }
+
+        public FakeLiteEngine Engine(int delayMs = 0)
+        {
+            return new FakeLiteEngine(Answer) { DelayMs = delayMs };
+        }
+
+        byte[] Answer(ILiteServerRequest request)
+        {
+            TLWriteBuffer writer = new(1024);
+            switch (request)
+            {
+                case LiteServerGetMasterchainInfoRequest:
+                    writer.WriteUInt32(LiteServerMasterchainInfo.Constructor);
+                    new LiteServerMasterchainInfo { Last = Id(-1, Root, Head) }.WriteTo(writer);
+                    break;
+                case LiteServerLookupBlockRequest lookup:
+                    TonNodeBlockId id = lookup.Id;
+                    if (id.Workchain == -1)
+                        InterlockedMax(ref maxMasterchainLookup, id.Seqno);
+                    long shard = id.Workchain == 0 && id.Seqno <= SplitAfter ? Root : id.Shard;
+                    if (id.Workchain == 0 && id.Shard == Root && id.Seqno < Merge?.seqno) shard = Left;
+                    writer.WriteUInt32(LiteServerBlockHeader.Constructor);
+                    new LiteServerBlockHeader { Id = Id(id.Workchain, shard, id.Seqno) }.WriteTo(writer);
+                    break;
+                case LiteServerGetBlockHeaderRequest header:
+                    writer.WriteUInt32(LiteServerBlockHeader.Constructor);
+                    new LiteServerBlockHeader
+                    {
+                        Id = header.Id,
+                        Mode = header.Mode,
+                        HeaderProof = HeaderProof(header.Id)
+                    }.WriteTo(writer);
+                    break;
+                case LiteServerGetAllShardsInfoRequest allShards:
+                    writer.WriteUInt32(LiteServerAllShardsInfo.Constructor);
+                    new LiteServerAllShardsInfo
+                    {
+                        Id = allShards.Id,
+                        Data = ShardHashes(shards(allShards.Id.Seqno))
+                    }.WriteTo(writer);
+                    break;
+                case LiteServerListBlockTransactionsRequest list:
+                    writer.WriteUInt32(LiteServerBlockTransactions.Constructor);
+                    ListTransactions(list).WriteTo(writer);
+                    break;
+                default:
+                    throw new NotSupportedException(request.GetType().Name);
+            }
+
+            return writer.Build();
+        }
+
+        static LiteServerBlockTransactions ListTransactions(LiteServerListBlockTransactionsRequest list)
+        {
+            long[] lts = Lts(list.Id.Seqno, list.Id.Workchain == -1 ? 2 : 5)
+                .Where(lt => list.After == null || lt > list.After.Lt)
+                .ToArray();
+            long[] page = lts.Take((int)list.Count).ToArray();
+
+            return new LiteServerBlockTransactions
+            {
+                Id = list.Id,
+                ReqCount = list.Count,
+                Incomplete = page.Length < lts.Length,
+                Ids = page.Select(lt => new LiteServerTransactionId
+                {
+                    Mode = list.Mode & 7,
+                    Account = Hash(lt),
+                    Lt = lt,
+                    Hash = Hash(lt)
+                }).ToArray()
+            };
+        }
+
+        /// <summary>
+        ///     Merkle proof of the block with its BlockInfo, which links to the previous block: the one before in the
+        ///     same shard, the parent after <see cref="SplitAfter" />, or both halves for <see cref="Merge" />.
+        /// </summary>
+        byte[] HeaderProof(TonNodeBlockIdExt id)
+        {
+            bool afterMerge = id.Shard == Root && id.Seqno == Merge?.seqno;
+            bool afterSplit = id.Shard != Root && id.Seqno == SplitAfter + 1;
+            Cell prevRef = afterMerge
+                ? new CellBuilder()
+                    .StoreRef(ExtBlkRef(Left, Merge!.Value.leftLast))
+                    .StoreRef(ExtBlkRef(Right, Merge.Value.rightLast))
+                    .Build()
+                : ExtBlkRef(afterSplit ? Root : id.Shard, id.Seqno - 1);
+
+            Cell info = new CellBuilder()
+                .StoreUInt(0x9bc7a987, 32)
+                .StoreUInt(0, 32)
+                .StoreBit(true)
+                .StoreBit(afterMerge)
+                .StoreBit(false)
+                .StoreBit(afterSplit)
+                .StoreUInt(0, 4 + 8)
+                .StoreUInt((ulong)id.Seqno, 32)
+                .StoreUInt(0, 32)
+                .StoreRef(ExtBlkRef(Root, 1))
+                .StoreRef(prevRef)
+                .Build();
+            Cell block = new CellBuilder().StoreUInt(0x11ef55aa, 32).StoreInt(-239, 32).StoreRef(info).Build();
+            Bits proof = new BitsBuilder(8 + 256 + 16)
+                .StoreUInt(3, 8)
+                .StoreBits(block.Hash)
+                .StoreUInt((ulong)block.Depth, 16)
+                .Build();
+
+            return new Cell(proof, new[] { block }, CellType.MerkleProof).Serialize().ToBytes();
+        }
+
+        static Cell ExtBlkRef(long shard, int seqno)
+        {
+            TonNodeBlockIdExt id = Id(0, shard, seqno);
+            return new CellBuilder()
+                .StoreUInt((ulong)seqno * 100, 64)
+                .StoreUInt((ulong)seqno, 32)
+                .StoreBytes(id.RootHash.ToArray())
+                .StoreBytes(id.FileHash.ToArray())
+                .Build();
+        }
+
+        static byte[] ShardHashes((long shard, int top)[] tops)
+        {
+            Cell tree = tops.Length == 1
+                ? ShardDescr(tops[0].shard, tops[0].top)
+                : new CellBuilder().StoreBit(true)
+                    .StoreRef(ShardDescr(tops[0].shard, tops[0].top))
+                    .StoreRef(ShardDescr(tops[1].shard, tops[1].top))
+                    .Build();
+
+            HashmapE<int, Cell> hashes = new(new HashmapOptions<int, Cell>
+            {
+                KeySize = 32,
+                Serializers = new HashmapSerializers<int, Cell>
+                {
+                    Key = key => new BitsBuilder(32).StoreInt(key, 32).Build(),
+                    Value = value => new CellBuilder().StoreRef(value).Build()
+                }
+            });
+            hashes.Set(0, tree);
+            return hashes.Serialize().Serialize().ToBytes();
+        }
+
+        static Cell ShardDescr(long shard, int seqno)
+        {
+            TonNodeBlockIdExt id = Id(0, shard, seqno);
+            return new CellBuilder()
+                .StoreBit(false)
+                .StoreUInt(0xb, 4)
+                .StoreUInt((ulong)seqno, 32)
+                .StoreUInt(0, 32)
+                .StoreUInt(0UL, 64)
+                .StoreUInt(0UL, 64)
+                .StoreBytes(id.RootHash.ToArray())
+                .StoreBytes(id.FileHash.ToArray())
+                .Build();
+        }
+
+        static TonNodeBlockIdExt Id(int workchain, long shard, int seqno)
+        {
+            return new TonNodeBlockIdExt(workchain, shard, seqno, Hash(workchain * 7919L + shard + seqno),
+                Hash(~seqno));
+        }
+
+        static TLInt256 Hash(long value)
+        {
+            byte[] bytes = new byte[32];
+            BitConverter.TryWriteBytes(bytes, value);
+            return new TLInt256(bytes);
+        }
+
+        static void InterlockedMax(ref int location, int value)
+        {
+            for (int seen = Volatile.Read(ref location); value > seen; seen = Volatile.Read(ref location))
+                Interlocked.CompareExchange(ref location, value, seen);
+        }
+    }
+}
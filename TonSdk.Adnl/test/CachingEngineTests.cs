@@ -0,0 +1,167 @@
+using NUnit.Framework;
+using TonSdk.Adnl.LiteClient;
+using TonSdk.Adnl.LiteClient.Engines;
+using TonSdk.Adnl.LiteClient.Protocol;
+using TonSdk.Adnl.TL;
+
+namespace TonSdk.Adnl.Tests;
+
+public class CachingEngineTests
+{
+    [Test]
+    public async Task Test_CachesImmutableRequests()
+    {
+        FakeLiteEngine inner = Inner();
+        using CachingEngine engine = new(inner);
+
+        byte[] first = await engine.QueryAsync(BlockRequest(1));
+        byte[] second = await engine.QueryAsync(BlockRequest(1));
+        await engine.QueryAsync(BlockRequest(2));
+
+        Assert.That(second, Is.SameAs(first));
+        Assert.That(inner.Calls, Is.EqualTo(2));
+        Assert.That(engine.Hits, Is.EqualTo(1));
+        Assert.That(engine.Misses, Is.EqualTo(2));
+        Assert.That(engine.Count, Is.EqualTo(2));
+    }
+
+    [Test]
+    public async Task Test_CoalescesConcurrentRequests()
+    {
+        TaskCompletionSource gate = new();
+        FakeLiteEngine inner = Inner(gate);
+        using CachingEngine engine = new(inner);
+
+        Task<byte[]>[] responses = Enumerable.Range(0, 8).Select(_ => engine.QueryAsync(BlockRequest(1))).ToArray();
+        gate.SetResult();
+        byte[][] results = await Task.WhenAll(responses);
+
+        Assert.That(inner.Calls, Is.EqualTo(1));
+        Assert.That(engine.Coalesced, Is.EqualTo(7));
+        Assert.That(results.All(r => ReferenceEquals(r, results[0])), Is.True);
+    }
+
+    [Test]
+    public async Task Test_CallerCancellationDoesNotFailOthers()
+    {
+        TaskCompletionSource gate = new();
+        FakeLiteEngine inner = Inner(gate);
+        using CachingEngine engine = new(inner);
+        using CancellationTokenSource cancellation = new();
+
+        Task<byte[]> cancelled = engine.QueryAsync(BlockRequest(1), cancellationToken: cancellation.Token);
+        Task<byte[]> other = engine.QueryAsync(BlockRequest(1));
+        cancellation.Cancel();
+        gate.SetResult();
+
+        Assert.ThrowsAsync<TaskCanceledException>(async () => await cancelled);
+        Assert.That(await other, Is.Not.Null);
+        Assert.That(inner.Calls, Is.EqualTo(1));
+    }
+
+    [Test]
+    public async Task Test_ShortLivedEntriesExpire()
+    {
+        FakeLiteEngine inner = Inner();
+        using CachingEngine engine = new(inner, shortLivedTtlMs: 50);
+
+        await engine.QueryAsync(new LiteServerGetMasterchainInfoRequest());
+        await engine.QueryAsync(new LiteServerGetMasterchainInfoRequest());
+        Assert.That(inner.Calls, Is.EqualTo(1));
+
+        await Task.Delay(100);
+        await engine.QueryAsync(new LiteServerGetMasterchainInfoRequest());
+        Assert.That(inner.Calls, Is.EqualTo(2));
+    }
+
+    [Test]
+    public async Task Test_BlockProofToTheLastBlockExpires()
+    {
+        FakeLiteEngine inner = Inner();
+        using CachingEngine engine = new(inner, shortLivedTtlMs: 50);
+
+        await engine.QueryAsync(ProofRequest(target: true));
+        await engine.QueryAsync(ProofRequest(target: false));
+        await Task.Delay(100);
+        await engine.QueryAsync(ProofRequest(target: true));
+        await engine.QueryAsync(ProofRequest(target: false));
+
+        Assert.That(inner.Calls, Is.EqualTo(3), "only the proof without a target block is fetched again");
+    }
+
+    [Test]
+    public async Task Test_EvictsLeastRecentlyUsedBySize()
+    {
+        FakeLiteEngine inner = Inner(responseSize: 1000);
+        using CachingEngine engine = new(inner, maxCacheBytes: 2500);
+
+        await engine.QueryAsync(BlockRequest(1));
+        await engine.QueryAsync(BlockRequest(2));
+        await engine.QueryAsync(BlockRequest(1));
+        await engine.QueryAsync(BlockRequest(3));
+
+        Assert.That(engine.Evictions, Is.EqualTo(1));
+        Assert.That(engine.Count, Is.EqualTo(2));
+        Assert.That(engine.CachedBytes, Is.LessThanOrEqualTo(2500));
+
+        await engine.QueryAsync(BlockRequest(1));
+        Assert.That(inner.Calls, Is.EqualTo(3), "block 1 was used recently and must still be cached");
+        await engine.QueryAsync(BlockRequest(2));
+        Assert.That(inner.Calls, Is.EqualTo(4));
+    }
+
+    [Test]
+    public async Task Test_DoesNotCacheErrors()
+    {
+        FakeLiteEngine inner = Inner(returnError: true);
+        using CachingEngine engine = new(inner);
+
+        await engine.QueryAsync(BlockRequest(1));
+        await engine.QueryAsync(BlockRequest(1));
+
+        Assert.That(inner.Calls, Is.EqualTo(2));
+        Assert.That(engine.Count, Is.EqualTo(0));
+    }
+
+    [Test]
+    public async Task Test_DoesNotCacheSendMessage()
+    {
+        FakeLiteEngine inner = Inner();
+        using CachingEngine engine = new(inner);
+
+        await engine.QueryAsync(new LiteServerSendMessageRequest { Body = new byte[] { 1, 2, 3 } });
+        await engine.QueryAsync(new LiteServerSendMessageRequest { Body = new byte[] { 1, 2, 3 } });
+
+        Assert.That(inner.Calls, Is.EqualTo(2));
+        Assert.That(engine.Misses, Is.EqualTo(0));
+    }
+
+    static LiteServerGetBlockRequest BlockRequest(int seqno)
+    {
+        return new LiteServerGetBlockRequest
+        {
+            Id = new TonNodeBlockIdExt(-1, long.MinValue, seqno, new TLInt256(new byte[32]),
+                new TLInt256(new byte[32]))
+        };
+    }
+
+    static LiteServerGetBlockProofRequest ProofRequest(bool target)
+    {
+        return new LiteServerGetBlockProofRequest
+        {
+            Mode = target ? 1u : 0u,
+            KnownBlock = BlockRequest(1).Id,
+            TargetBlock = BlockRequest(2).Id
+        };
+    }
+
+    static FakeLiteEngine Inner(TaskCompletionSource? gate = null, bool returnError = false, int responseSize = 16)
+    {
+        return new FakeLiteEngine(_ =>
+        {
+            byte[] response = new byte[responseSize];
+            BitConverter.TryWriteBytes(response, returnError ? LiteServerError.Constructor : 0x6377CF0D);
+            return response;
+        }) { Gate = gate };
+    }
+}
@@ -0,0 +1,163 @@
+using System.Numerics;
+using NUnit.Framework;
+using TonSdk.Adnl.LiteClient.Protocol;
+using TonSdk.Adnl.TL;
+
+namespace TonSdk.Adnl.Tests;
+
+/// <summary>
+///     <see cref="Encoder.EncodeRequest" /> against the hand-written Encode* helpers it replaced: each legacy body
+///     below is the one those helpers wrote, wrapped in liteServer.query and adnl.message.query the way they did.
+/// </summary>
+public class EncoderTests
+{
+    static readonly TonNodeBlockIdExt BlockId = new(-1, long.MinValue, 34_000_000, Hash(1), Hash(2));
+    static readonly LiteServerAccountId Account = new() { Workchain = 0, Id = Hash(3) };
+
+    [Test]
+    public void Test_ArgumentlessRequestsMatchTheLegacyEncoding()
+    {
+        AssertLegacyEncoding(new LiteServerGetMasterchainInfoRequest(),
+            w => w.WriteUInt32(Functions.GetMasterchainInfo));
+        AssertLegacyEncoding(new LiteServerGetTimeRequest(), w => w.WriteUInt32(Functions.GetTime));
+        AssertLegacyEncoding(new LiteServerGetVersionRequest(), w => w.WriteUInt32(Functions.GetVersion));
+        AssertLegacyEncoding(new LiteServerGetMasterchainInfoExtRequest { Mode = 3 }, w =>
+        {
+            w.WriteUInt32(Functions.GetMasterchainInfoExt);
+            w.WriteUInt32(3);
+        });
+    }
+
+    [Test]
+    public void Test_BlockRequestsMatchTheLegacyEncoding()
+    {
+        AssertLegacyEncoding(new LiteServerGetBlockRequest { Id = BlockId }, w =>
+        {
+            w.WriteUInt32(Functions.GetBlock);
+            BlockId.WriteTo(w);
+        });
+        AssertLegacyEncoding(new LiteServerGetBlockHeaderRequest { Id = BlockId, Mode = 1 }, w =>
+        {
+            w.WriteUInt32(Functions.GetBlockHeader);
+            BlockId.WriteTo(w);
+            w.WriteUInt32(1);
+        });
+        AssertLegacyEncoding(new LiteServerGetAllShardsInfoRequest { Id = BlockId }, w =>
+        {
+            w.WriteUInt32(Functions.GetAllShardsInfo);
+            BlockId.WriteTo(w);
+        });
+    }
+
+    // LiteClient clears the lt and utime bits of the mode when the value is missing, as the helper used to
+    [TestCase(1u, null, null)]
+    [TestCase(2u, 45_000_000_000_000L, null)]
+    [TestCase(4u, null, 1_700_000_000u)]
+    public void Test_LookupBlockMatchesTheLegacyEncoding(uint mode, long? lt, uint? utime)
+    {
+        TonNodeBlockId id = new(0, long.MinValue, 42_000_000);
+        LiteServerLookupBlockRequest request = new()
+        {
+            Mode = mode,
+            Id = id,
+            Lt = lt ?? 0,
+            Utime = (int)(utime ?? 0)
+        };
+
+        AssertLegacyEncoding(request, w =>
+        {
+            w.WriteUInt32(Functions.LookupBlock);
+            w.WriteUInt32(mode);
+            id.WriteTo(w);
+            if ((mode & 2) != 0 && lt.HasValue) w.WriteInt64(lt.Value);
+            if ((mode & 4) != 0 && utime.HasValue) w.WriteUInt32(utime.Value);
+        });
+    }
+
+    [Test]
+    public void Test_ListBlockTransactionsMatchesTheLegacyEncoding()
+    {
+        LiteServerTransactionId3 after = new() { Account = Hash(4), Lt = 45_000_000_000_001 };
+        foreach ((uint mode, LiteServerTransactionId3? from) in new[] { (7u, (LiteServerTransactionId3?)null), (7u | 128, after) })
+            AssertLegacyEncoding(new LiteServerListBlockTransactionsRequest
+            {
+                Id = BlockId,
+                Mode = mode,
+                Count = 40,
+                After = from!
+            }, w =>
+            {
+                w.WriteUInt32(Functions.ListBlockTransactions);
+                BlockId.WriteTo(w);
+                w.WriteUInt32(mode);
+                w.WriteUInt32(40);
+                if ((mode & 128) != 0 && from != null) from.WriteTo(w);
+            });
+    }
+
+    [Test]
+    public void Test_AccountRequestsMatchTheLegacyEncoding()
+    {
+        AssertLegacyEncoding(new LiteServerGetAccountStateRequest { Id = BlockId, Account = Account }, w =>
+        {
+            w.WriteUInt32(Functions.GetAccountState);
+            BlockId.WriteTo(w);
+            Account.WriteTo(w);
+        });
+
+        byte[] hash = Hash(5).ToArray();
+        AssertLegacyEncoding(new LiteServerGetTransactionsRequest
+        {
+            Count = 16,
+            Account = Account,
+            Lt = 45_000_000_000_002,
+            Hash = new TLInt256(hash)
+        }, w =>
+        {
+            w.WriteUInt32(Functions.GetTransactions);
+            w.WriteUInt32(16);
+            Account.WriteTo(w);
+            w.WriteInt64(45_000_000_000_002);
+            w.WriteBytes(hash, 32);
+        });
+    }
+
+    [TestCase(0)]
+    [TestCase(253)]
+    [TestCase(254)]
+    [TestCase(1000)]
+    public void Test_SendMessageMatchesTheLegacyEncoding(int length)
+    {
+        byte[] body = Enumerable.Range(0, length).Select(i => (byte)i).ToArray();
+
+        AssertLegacyEncoding(new LiteServerSendMessageRequest { Body = body }, w =>
+        {
+            w.WriteUInt32(Functions.SendMessage);
+            w.WriteBuffer(body);
+        });
+    }
+
+    static void AssertLegacyEncoding(ILiteServerRequest request, Action<TLWriteBuffer> writeLegacyBody)
+    {
+        (byte[] queryId, byte[] data) = Encoder.EncodeRequest(request);
+
+        TLWriteBuffer method = new();
+        writeLegacyBody(method);
+
+        TLWriteBuffer liteQuery = new();
+        liteQuery.WriteUInt32(0x7AF98BB4); // liteServer.query
+        liteQuery.WriteBuffer(method.Build());
+
+        TLWriteBuffer packet = new();
+        packet.WriteUInt32(0x6A118B44); // adnl.message.query
+        packet.WriteInt256(new BigInteger(queryId));
+        packet.WriteBuffer(liteQuery.Build());
+
+        Assert.That(data, Is.EqualTo(packet.Build()));
+    }
+
+    static TLInt256 Hash(byte seed)
+    {
+        return new TLInt256(Enumerable.Range(0, 32).Select(i => (byte)(seed * 31 + i)).ToArray());
+    }
+}
@@ -0,0 +1,105 @@
+using System.Collections.Concurrent;
+using TonSdk.Adnl.LiteClient;
+using TonSdk.Adnl.LiteClient.Protocol;
+
+namespace TonSdk.Adnl.Tests;
+
+/// <summary>
+///     Stand-in lite server for engine and client tests. It answers every request through the response callback,
+///     after an optional gate and delay, and records the requests it served and how many were in flight at once.
+/// </summary>
+internal sealed class FakeLiteEngine : ILiteEngine
+{
+    readonly Func<ILiteServerRequest, byte[]> respond;
+    int concurrent;
+    int maxConcurrent;
+
+    /// <param name="respond">Serialized answer to a request; an exception thrown here fails the query</param>
+    public FakeLiteEngine(Func<ILiteServerRequest, byte[]> respond)
+    {
+        this.respond = respond;
+    }
+
+    /// <summary>
+    ///     Requests in the order they arrived, recorded before the gate and the delay.
+    /// </summary>
+    public ConcurrentQueue<ILiteServerRequest> Requests { get; } = new();
+
+    /// <summary>
+    ///     Completed once a query is cancelled while it waits on the gate or the delay.
+    /// </summary>
+    public TaskCompletionSource<bool> Cancelled { get; } = new();
+
+    public TaskCompletionSource? Gate { get; init; }
+    public int DelayMs { get; init; }
+    public volatile bool Online = true;
+
+    public int Calls => Requests.Count;
+    public int MaxConcurrent => Volatile.Read(ref maxConcurrent);
+
+    public bool IsReady => Online;
+    public bool IsClosed => false;
+
+    // Never raised: the fake is connected from the start
+    public event Action? Connected
+    {
+        add { }
+        remove { }
+    }
+
+    public event Action? Ready
+    {
+        add { }
+        remove { }
+    }
+
+    public event Action? Closed
+    {
+        add { }
+        remove { }
+    }
+
+    public event Action<Exception>? Error
+    {
+        add { }
+        remove { }
+    }
+
+    public Task<byte[]> QueryAsync(
+        Func<(byte[] queryId, byte[] data)> encoder,
+        int timeout = 30000,
+        CancellationToken cancellationToken = default)
+    {
+        throw new NotSupportedException();
+    }
+
+    public async Task<byte[]> QueryAsync(
+        ILiteServerRequest request,
+        int timeout = 30000,
+        CancellationToken cancellationToken = default)
+    {
+        Requests.Enqueue(request);
+        int now = Interlocked.Increment(ref concurrent);
+        for (int seen = Volatile.Read(ref maxConcurrent); now > seen; seen = Volatile.Read(ref maxConcurrent))
+            Interlocked.CompareExchange(ref maxConcurrent, now, seen);
+        try
+        {
+            if (Gate != null) await Gate.Task.WaitAsync(cancellationToken);
+            if (DelayMs > 0) await Task.Delay(DelayMs, cancellationToken);
+            return respond(request);
+        }
+        catch (OperationCanceledException) when (cancellationToken.IsCancellationRequested)
+        {
+            Cancelled.TrySetResult(true);
+            throw;
+        }
+        finally
+        {
+            Interlocked.Decrement(ref concurrent);
+        }
+    }
+
+    public void Dispose()
+    {
+    }
+}
@@ -0,0 +1,73 @@
+using NUnit.Framework;
+using TonSdk.Adnl.LiteClient;
+using TonSdk.Adnl.LiteClient.Engines;
+using TonSdk.Adnl.LiteClient.Protocol;
+using TonSdk.Adnl.TL;
+
+namespace TonSdk.Adnl.Tests;
+
+public class LitePooledEngineTests
+{
+    const int Now = 1_700_000_000;
+
+    [Test]
+    public async Task Test_SingleEngineQueriesLoopbackServer()
+    {
+        using LoopbackLiteServer server = new(TimeResponse());
+        using LiteSingleEngine engine = new(server.Host, server.Port, server.PublicKey);
+        using LiteClient.LiteClient client = LiteClient.LiteClient.Create(engine);
+
+        LiteServerCurrentTime time = await client.GetTime();
+
+        Assert.That(time.Now, Is.EqualTo(Now));
+    }
+
+    [Test]
+    public async Task Test_SpreadsQueriesOverPool()
+    {
+        using LoopbackLiteServer server = new(TimeResponse(), responseDelayMs: 20);
+        using LitePooledEngine engine = new(server.Host, server.Port, server.PublicKey, poolSize: 3);
+        using LiteClient.LiteClient client = LiteClient.LiteClient.Create(engine);
+        await WaitUntil(() => engine.ReadyCount == 3);
+
+        LiteServerCurrentTime[] times = await Task.WhenAll(Enumerable.Range(0, 60).Select(_ => client.GetTime()));
+
+        Assert.That(times.All(t => t.Now == Now), Is.True);
+        Assert.That(server.Handshakes, Is.EqualTo(3));
+        Assert.That(server.Queries, Is.EqualTo(60));
+    }
+
+    [Test]
+    public async Task Test_ReconnectsConnectionsIndependently()
+    {
+        using LoopbackLiteServer server = new(TimeResponse());
+        using LitePooledEngine engine = new(server.Host, server.Port, server.PublicKey, poolSize: 2,
+            reconnectTimeoutMs: 100);
+        using LiteClient.LiteClient client = LiteClient.LiteClient.Create(engine);
+        await WaitUntil(() => engine.ReadyCount == 2);
+
+        engine.Disconnect(0);
+        Assert.That(engine.ReadyCount, Is.EqualTo(1));
+        Assert.That(engine.IsReady, Is.True);
+        Assert.That((await client.GetTime()).Now, Is.EqualTo(Now), "the other connection keeps serving");
+
+        await WaitUntil(() => engine.ReadyCount == 2);
+        Assert.That(server.Handshakes, Is.EqualTo(3));
+        Assert.That((await client.GetTime()).Now, Is.EqualTo(Now));
+    }
+
+    static byte[] TimeResponse()
+    {
+        TLWriteBuffer writer = new(8);
+        writer.WriteUInt32(LiteServerCurrentTime.Constructor);
+        writer.WriteInt32(Now);
+        return writer.Build();
+    }
+
+    static async Task WaitUntil(Func<bool> condition)
+    {
+        for (int i = 0; i < 100 && !condition(); i++)
+            await Task.Delay(50);
+        Assert.That(condition(), Is.True, "timed out waiting for the engine");
+    }
+}
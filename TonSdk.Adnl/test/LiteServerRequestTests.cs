@@ -0,0 +1,79 @@
+using NUnit.Framework;
+using TonSdk.Adnl.LiteClient.Protocol;
+using TonSdk.Adnl.TL;
+
+namespace TonSdk.Adnl.Tests;
+
+public class LiteServerRequestTests
+{
+    static readonly TonNodeBlockIdExt BlockId = new(-1, long.MinValue, 100, TLInt256.Zero, TLInt256.Zero);
+
+    [Test]
+    public void Test_FlagsAreStoredInModeBits()
+    {
+        LiteServerListBlockTransactionsRequest request = new() { Id = BlockId, Count = 16 };
+
+        request.WantProof = true;
+        request.ReverseOrder = true;
+        Assert.That(request.Mode, Is.EqualTo(32u | 64u));
+
+        request.WantProof = false;
+        Assert.That(request.Mode, Is.EqualTo(64u));
+        Assert.That(request.ReverseOrder, Is.True);
+    }
+
+    [Test]
+    public void Test_ConditionalFieldsFollowMode()
+    {
+        LiteServerListBlockTransactionsRequest request = new()
+        {
+            Id = BlockId,
+            Count = 16,
+            After = new LiteServerTransactionId3 { Account = TLInt256.Zero, Lt = 1 }
+        };
+
+        Assert.That(Serialize(request).Length, Is.EqualTo(4 + 80 + 4 + 4));
+
+        request.Mode |= 128;
+        Assert.That(Serialize(request).Length, Is.EqualTo(4 + 80 + 4 + 4 + 40));
+    }
+
+    [Test]
+    public void Test_GetLibrariesWritesFixedWidthHashes()
+    {
+        byte[] first = new byte[32];
+        byte[] second = new byte[32];
+        first[0] = 1;
+        second[31] = 2;
+
+        byte[] written = Serialize(new LiteServerGetLibrariesRequest { LibraryList = new[] { new TLInt256(first), new TLInt256(second) } });
+
+        Assert.That(written.Length, Is.EqualTo(4 + 4 + 64));
+        Assert.That(BitConverter.ToUInt32(written, 0), Is.EqualTo(LiteServerGetLibrariesRequest.Constructor));
+        Assert.That(BitConverter.ToUInt32(written, 4), Is.EqualTo(2u));
+        Assert.That(written[8], Is.EqualTo(1));
+        Assert.That(written[8 + 63], Is.EqualTo(2));
+    }
+
+    [Test]
+    public void Test_RunSmcMethodSizeMatchesWrittenBytes()
+    {
+        LiteServerRunSmcMethodRequest request = new()
+        {
+            Mode = 4,
+            Id = BlockId,
+            Account = new LiteServerAccountId { Workchain = 0, Id = TLInt256.Zero },
+            MethodId = 85143,
+            Params = new byte[300]
+        };
+
+        Assert.That(Serialize(request).Length, Is.EqualTo(request.GetSerializedSize()));
+    }
+
+    static byte[] Serialize(ILiteServerRequest request)
+    {
+        TLWriteBuffer writer = new(request.GetSerializedSize());
+        request.WriteTo(writer);
+        return writer.Build();
+    }
+}
@@ -0,0 +1,107 @@
+using System.Runtime.InteropServices;
+using NUnit.Framework;
+using TonSdk.Adnl.LiteClient.Protocol;
+using TonSdk.Adnl.TL;
+
+namespace TonSdk.Adnl.Tests;
+
+public class LiteServerViewTests
+{
+    [Test]
+    public void Test_AccountStateViewSlicesWithoutCopying()
+    {
+        LiteServerAccountState source = new()
+        {
+            Id = new TonNodeBlockIdExt(-1, long.MinValue, 7, Hash(1), Hash(2)),
+            Shardblk = new TonNodeBlockIdExt(0, long.MinValue, 8, Hash(3), Hash(4)),
+            ShardProof = Filled(10, 5),
+            Proof = Filled(300, 6),
+            State = Filled(70000, 7)
+        };
+        byte[] data = Serialize(source);
+
+        LiteServerAccountStateView view = new(data);
+
+        Assert.That(view.Shardblk.Seqno, Is.EqualTo(8));
+        Assert.That(view.Proof.ToArray(), Is.EqualTo(source.Proof));
+        Assert.That(MemoryMarshal.TryGetArray(view.State, out ArraySegment<byte> state), Is.True);
+        Assert.That(state.Array, Is.SameAs(data));
+        Assert.That(state.Count, Is.EqualTo(70000));
+
+        Assert.That(Serialize(view.Materialize()), Is.EqualTo(data));
+    }
+
+    [TestCase(0u)]
+    [TestCase(0b00101u)]
+    [TestCase(0b11111u)]
+    public void Test_RunMethodResultViewFollowsMode(uint mode)
+    {
+        LiteServerRunMethodResult source = new()
+        {
+            Mode = mode,
+            Id = new TonNodeBlockIdExt(-1, long.MinValue, 7, Hash(1), Hash(2)),
+            Shardblk = new TonNodeBlockIdExt(0, long.MinValue, 8, Hash(3), Hash(4)),
+            ShardProof = (mode & 1) != 0 ? Filled(20, 5) : Array.Empty<byte>(),
+            Proof = (mode & 1) != 0 ? Filled(21, 6) : Array.Empty<byte>(),
+            StateProof = (mode & 2) != 0 ? Filled(22, 7) : Array.Empty<byte>(),
+            InitC7 = (mode & 8) != 0 ? Filled(23, 8) : Array.Empty<byte>(),
+            LibExtras = (mode & 16) != 0 ? Filled(24, 9) : Array.Empty<byte>(),
+            ExitCode = -14,
+            Result = (mode & 4) != 0 ? Filled(400, 10) : Array.Empty<byte>()
+        };
+        byte[] data = Serialize(source);
+
+        LiteServerRunMethodResultView view = new(data);
+
+        Assert.That(view.Mode, Is.EqualTo(mode));
+        Assert.That(view.ExitCode, Is.EqualTo(-14));
+        Assert.That(view.Result.ToArray(), Is.EqualTo(source.Result));
+        Assert.That(Serialize(view.Materialize()), Is.EqualTo(data));
+    }
+
+    [Test]
+    public void Test_TruncatedBufferThrowsOnParse()
+    {
+        LiteServerBlockData source = new()
+        {
+            Id = new TonNodeBlockIdExt(0, long.MinValue, 1, Hash(1), Hash(2)),
+            Data = Filled(1000, 3)
+        };
+        byte[] data = Serialize(source);
+
+        Assert.Throws<Exception>(() => _ = new LiteServerBlockDataView(data.AsMemory(0, data.Length - 8)));
+    }
+
+    static byte[] Serialize(LiteServerAccountState value)
+    {
+        TLWriteBuffer writer = new(value.GetSerializedSize());
+        value.WriteTo(writer);
+        return writer.Build();
+    }
+
+    static byte[] Serialize(LiteServerRunMethodResult value)
+    {
+        TLWriteBuffer writer = new(value.GetSerializedSize());
+        value.WriteTo(writer);
+        return writer.Build();
+    }
+
+    static byte[] Serialize(LiteServerBlockData value)
+    {
+        TLWriteBuffer writer = new(value.GetSerializedSize());
+        value.WriteTo(writer);
+        return writer.Build();
+    }
+
+    static TLInt256 Hash(byte seed)
+    {
+        return new TLInt256(Filled(TLInt256.Size, seed));
+    }
+
+    static byte[] Filled(int length, byte seed)
+    {
+        byte[] data = new byte[length];
+        for (int i = 0; i < length; i++) data[i] = (byte)(seed + i);
+        return data;
+    }
+}
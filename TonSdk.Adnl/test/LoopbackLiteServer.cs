@@ -0,0 +1,166 @@
+using System;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+using System.Linq;
+using System.Net;
+using System.Net.Sockets;
+using System.Threading;
+using System.Threading.Tasks;
+using TonSdk.Adnl.Adnl;
+using TonSdk.Adnl.TL;
+
+namespace TonSdk.Adnl.Tests;
+
+/// <summary>
+///     Stand-in lite server on the loopback interface for driving engines end to end.
+///     It completes the ADNL handshake with its own key and answers every adnl.message.query with a fixed response,
+///     after an optional delay. Shared with the benchmarks project, which links this file.
+/// </summary>
+internal sealed class LoopbackLiteServer : IDisposable
+{
+    const uint AdnlMessageQuery = 0x6A118B44; // adnl.message.query
+    const uint AdnlMessageAnswer = 0xB4E874E4; // adnl.message.answer
+
+    readonly ConcurrentDictionary<Socket, bool> clients = new();
+    readonly Ed25519 key = new();
+    readonly TcpListener listener;
+    readonly byte[] response;
+    int handshakes;
+    long queries;
+
+    public LoopbackLiteServer(byte[] response, int responseDelayMs = 0)
+    {
+        this.response = response;
+        ResponseDelayMs = responseDelayMs;
+
+        listener = new TcpListener(IPAddress.Loopback, 0);
+        listener.Start();
+        _ = AcceptAsync();
+    }
+
+    public string Host => IPAddress.Loopback.ToString();
+    public int Port => ((IPEndPoint)listener.LocalEndpoint).Port;
+    public byte[] PublicKey => key.PublicKey;
+    public int ResponseDelayMs { get; set; }
+
+    /// <summary>
+    ///     Completed handshakes, counting reconnections.
+    /// </summary>
+    public int Handshakes => Volatile.Read(ref handshakes);
+
+    public long Queries => Interlocked.Read(ref queries);
+
+    public void Dispose()
+    {
+        listener.Stop();
+        foreach (Socket client in clients.Keys)
+            client.Dispose();
+    }
+
+    async Task AcceptAsync()
+    {
+        try
+        {
+            while (true)
+            {
+                Socket socket = await listener.AcceptSocketAsync().ConfigureAwait(false);
+                socket.NoDelay = true;
+                clients[socket] = true;
+                _ = ServeAsync(socket);
+            }
+        }
+        catch (Exception)
+        {
+            // Listener stopped
+        }
+    }
+
+    async Task ServeAsync(Socket socket)
+    {
+        try
+        {
+            using NetworkStream stream = new(socket, true);
+
+            // peer key id (32) | client public key (32) | sha256 of the AES params (32) | encrypted AES params (160)
+            byte[] handshake = new byte[256];
+            await stream.ReadExactlyAsync(handshake).ConfigureAwait(false);
+
+            byte[] shared = key.CalculateSharedSecret(handshake[32..64]);
+            byte[] hash = handshake[64..96];
+            byte[] handshakeKey = shared[..16].Concat(hash[16..32]).ToArray();
+            byte[] handshakeNonce = hash[..4].Concat(shared[20..32]).ToArray();
+            byte[] aesParams = CipherFactory.CreateDecipheriv(handshakeKey, handshakeNonce).Update(handshake[96..]);
+
+            // The client receives with the first key and nonce and sends with the second
+            Cipher cipher = CipherFactory.CreateCipheriv(aesParams[..32], aesParams[64..80]);
+            Decipher decipher = CipherFactory.CreateDecipheriv(aesParams[32..64], aesParams[80..96]);
+            SemaphoreSlim writeLock = new(1, 1);
+
+            await WriteAsync(stream, cipher, writeLock, Array.Empty<byte>()).ConfigureAwait(false);
+            Interlocked.Increment(ref handshakes);
+
+            using AdnlFrameReader reader = new(decipher);
+            List<byte[]> queryIds = new();
+            while (true)
+            {
+                int bytesRead = await stream.ReadAsync(reader.GetMemory()).ConfigureAwait(false);
+                if (bytesRead == 0) break;
+
+                reader.Advance(bytesRead, payload =>
+                {
+                    TLSpanReader query = new(payload);
+                    if (query.ReadUInt32() == AdnlMessageQuery) queryIds.Add(payload.Slice(4, 32).ToArray());
+                });
+
+                foreach (byte[] queryId in queryIds)
+                    _ = AnswerAsync(stream, cipher, writeLock, queryId);
+                queryIds.Clear();
+            }
+        }
+        catch (Exception)
+        {
+            // Client went away
+        }
+        finally
+        {
+            clients.TryRemove(socket, out _);
+            socket.Dispose();
+        }
+    }
+
+    async Task AnswerAsync(NetworkStream stream, Cipher cipher, SemaphoreSlim writeLock, byte[] queryId)
+    {
+        Interlocked.Increment(ref queries);
+        if (ResponseDelayMs > 0) await Task.Delay(ResponseDelayMs).ConfigureAwait(false);
+
+        TLWriteBuffer writer = new(4 + 32 + TLWriteBuffer.GetBufferSize(response.Length));
+        writer.WriteUInt32(AdnlMessageAnswer);
+        writer.WriteBytes(queryId, 32);
+        writer.WriteBuffer(response);
+
+        try
+        {
+            await WriteAsync(stream, cipher, writeLock, writer.Build()).ConfigureAwait(false);
+        }
+        catch (Exception)
+        {
+            // Connection dropped while answering
+        }
+    }
+
+    static async Task WriteAsync(NetworkStream stream, Cipher cipher, SemaphoreSlim writeLock, byte[] payload)
+    {
+        byte[] packet = new AdnlPacket(payload).Data;
+
+        await writeLock.WaitAsync().ConfigureAwait(false);
+        try
+        {
+            cipher.Update(packet.AsSpan());
+            await stream.WriteAsync(packet).ConfigureAwait(false);
+        }
+        finally
+        {
+            writeLock.Release();
+        }
+    }
+}
@@ -0,0 +1,164 @@
+using System.Runtime.CompilerServices;
+using NUnit.Framework;
+using TonSdk.Adnl.LiteClient.Engines;
+using TonSdk.Adnl.TL;
+
+namespace TonSdk.Adnl.Tests;
+
+public class QueryManagerTests
+{
+    static readonly byte[] Packet = { 1, 2, 3 };
+
+    [Test]
+    public async Task Test_CompletesQueryById()
+    {
+        using QueryManager queries = new();
+        Task<byte[]> response = await queries.RegisterQueryAsync(Id(1), Packet, 30000, CancellationToken.None);
+
+        Assert.That(queries.CompleteQuery(Id(2), new byte[] { 2 }), Is.False);
+        Assert.That(queries.CompleteQuery(new TLInt256(Id(1).ToArray()), new byte[] { 1 }), Is.True);
+
+        Assert.That(await response, Is.EqualTo(new byte[] { 1 }));
+        Assert.That(queries.PendingCount, Is.EqualTo(0));
+        Assert.That(queries.CompleteQuery(Id(1), new byte[] { 1 }), Is.False);
+    }
+
+    [Test]
+    public async Task Test_RejectsDuplicateId()
+    {
+        using QueryManager queries = new(maxInFlight: 2);
+        await queries.RegisterQueryAsync(Id(1), Packet, 30000, CancellationToken.None);
+
+        Assert.ThrowsAsync<InvalidOperationException>(async () =>
+            await queries.RegisterQueryAsync(Id(1), Packet, 30000, CancellationToken.None));
+        Assert.That(queries.PendingCount, Is.EqualTo(1));
+    }
+
+    [Test]
+    public async Task Test_TimesOutThroughTheWheel()
+    {
+        using QueryManager queries = new(timerTickMs: 10);
+        Task<byte[]> response = await queries.RegisterQueryAsync(Id(1), Packet, 30, CancellationToken.None);
+
+        Assert.ThrowsAsync<TaskCanceledException>(async () => await response);
+        Assert.That(queries.PendingCount, Is.EqualTo(0));
+        Assert.That(queries.CompleteQuery(Id(1), Packet), Is.False);
+    }
+
+    [Test]
+    public async Task Test_CancellationFreesTheSlot()
+    {
+        using QueryManager queries = new(maxInFlight: 1);
+        using CancellationTokenSource cancellation = new();
+        Task<byte[]> response = await queries.RegisterQueryAsync(Id(1), Packet, 30000, cancellation.Token);
+
+        cancellation.Cancel();
+
+        Assert.ThrowsAsync<TaskCanceledException>(async () => await response);
+        Task<byte[]> next = await queries.RegisterQueryAsync(Id(2), Packet, 30000, CancellationToken.None);
+        Assert.That(next.IsCompleted, Is.False);
+    }
+
+    [Test]
+    public async Task Test_WaitsForSlotWhenFull()
+    {
+        using QueryManager queries = new(maxInFlight: 2);
+        await queries.RegisterQueryAsync(Id(1), Packet, 30000, CancellationToken.None);
+        await queries.RegisterQueryAsync(Id(2), Packet, 30000, CancellationToken.None);
+
+        Task<Task<byte[]>> third = queries.RegisterQueryAsync(Id(3), Packet, 30000, CancellationToken.None).AsTask();
+        await Task.Delay(50);
+        Assert.That(third.IsCompleted, Is.False);
+        Assert.That(queries.PendingCount, Is.EqualTo(2));
+
+        queries.CompleteQuery(Id(1), Packet);
+        Task<byte[]> response = await third.WaitAsync(TimeSpan.FromSeconds(5));
+
+        Assert.That(queries.PendingCount, Is.EqualTo(2));
+        queries.CompleteQuery(Id(3), new byte[] { 3 });
+        Assert.That(await response, Is.EqualTo(new byte[] { 3 }));
+    }
+
+    [Test]
+    public async Task Test_FailAllQueries()
+    {
+        using QueryManager queries = new();
+        Task<byte[]> first = await queries.RegisterQueryAsync(Id(1), Packet, 30000, CancellationToken.None);
+        Task<byte[]> second = await queries.RegisterQueryAsync(Id(2), new byte[] { 4 }, 30000, CancellationToken.None);
+
+        Assert.That(queries.GetAllPendingPackets(), Is.EquivalentTo(new[] { Packet, new byte[] { 4 } }));
+        queries.FailAllQueries(new InvalidOperationException("Connection closed"));
+
+        Assert.ThrowsAsync<InvalidOperationException>(async () => await first);
+        Assert.ThrowsAsync<InvalidOperationException>(async () => await second);
+        Assert.That(queries.PendingCount, Is.EqualTo(0));
+    }
+
+    [TestCase("complete")]
+    [TestCase("fail")]
+    [TestCase("timeout")]
+    [TestCase("dispose")]
+    public void Test_FinishedQueriesLeaveTheTokenAlone(string route)
+    {
+        // A registration left on a long-lived token would keep the query and its response alive with it
+        using CancellationTokenSource cancellation = new();
+        WeakReference response = RunQuery(route, cancellation.Token);
+
+        GC.Collect();
+        GC.WaitForPendingFinalizers();
+        GC.Collect();
+        Assert.That(response.IsAlive, Is.False);
+    }
+
+    [Test]
+    public void Test_TimerWheelCancelAndExpire()
+    {
+        using TimerWheel wheel = new(tickMs: 60_000);
+        CountingEntry cancelled = new();
+        CountingEntry expired = new();
+
+        wheel.Schedule(cancelled, 1);
+        wheel.Schedule(expired, 1);
+        Assert.That(wheel.Count, Is.EqualTo(2));
+        Assert.That(wheel.Cancel(cancelled), Is.True);
+        Assert.That(wheel.Cancel(cancelled), Is.False);
+
+        wheel.Advance();
+        Assert.That(expired.Expirations, Is.EqualTo(0), "deadlines round up to the next tick");
+        Assert.That(wheel.Count, Is.EqualTo(1));
+    }
+
+    // Not async and not inlined, so nothing of the query outlives the call on the caller's side
+    [MethodImpl(MethodImplOptions.NoInlining)]
+    static WeakReference RunQuery(string route, CancellationToken cancellationToken)
+    {
+        using QueryManager queries = new(timerTickMs: 10);
+        Task<byte[]> response = queries.RegisterQueryAsync(Id(1), Packet, route == "timeout" ? 10 : 30000,
+            cancellationToken).AsTask().Result;
+
+        if (route == "complete") queries.CompleteQuery(Id(1), Packet);
+        if (route == "fail") queries.FailQuery(Id(1), new IOException());
+        if (route == "dispose") queries.Dispose();
+        Task.WhenAny(response).Wait();
+        Assert.That(response.IsCompletedSuccessfully, Is.EqualTo(route == "complete"));
+        return new WeakReference(response);
+    }
+
+    static TLInt256 Id(byte value)
+    {
+        byte[] bytes = new byte[TLInt256.Size];
+        bytes[0] = value;
+        bytes[31] = value;
+        return new TLInt256(bytes);
+    }
+
+    class CountingEntry : TimerWheelEntry
+    {
+        public int Expirations;
+
+        protected internal override void OnExpired()
+        {
+            Expirations++;
+        }
+    }
+}
@@ -0,0 +1,75 @@
+using NUnit.Framework;
+using TonSdk.Adnl.LiteClient.Protocol;
+using TonSdk.Adnl.TL;
+
+namespace TonSdk.Adnl.Tests;
+
+public class TLSerializerTests
+{
+    [Test]
+    public void Test_ReadDecodesBoxedValue()
+    {
+        LiteServerVersion source = new() { Mode = 1, Version = 0x101, Capabilities = 7, Now = 1700000000 };
+
+        LiteServerVersion decoded = TLSerializer.Read<LiteServerVersion>(Boxed(LiteServerVersion.Constructor, source.WriteTo));
+
+        Assert.That(decoded.Version, Is.EqualTo(0x101));
+        Assert.That(decoded.Capabilities, Is.EqualTo(7));
+        Assert.That(decoded.Now, Is.EqualTo(1700000000));
+    }
+
+    [Test]
+    public void Test_ReadRaisesLiteServerError()
+    {
+        LiteServerError error = new() { Code = 651, Message = "cannot load block" };
+        byte[] data = Boxed(LiteServerError.Constructor, error.WriteTo);
+
+        LiteServerException exception = Assert.Throws<LiteServerException>(() => TLSerializer.Read<LiteServerVersion>(data));
+        Assert.That(exception.Code, Is.EqualTo(651));
+        Assert.That(exception.ServerMessage, Is.EqualTo("cannot load block"));
+
+        Assert.Throws<LiteServerException>(() => TLSerializer.ReadPayload(data, LiteServerVersion.Constructor));
+    }
+
+    [Test]
+    public void Test_ReadRejectsUnexpectedType()
+    {
+        LiteServerCurrentTime time = new() { Now = 42 };
+        byte[] data = Boxed(LiteServerCurrentTime.Constructor, time.WriteTo);
+
+        Assert.Throws<Exception>(() => TLSerializer.Read<LiteServerVersion>(data));
+        Assert.Throws<Exception>(() => TLSerializer.ReadPayload(data, LiteServerVersion.Constructor));
+        Assert.Throws<Exception>(() => TLSerializer.Read<LiteServerVersion>(new byte[] { 1, 2, 3, 4 }));
+    }
+
+    [Test]
+    public void Test_ReadPayloadSlicesAfterConstructor()
+    {
+        LiteServerCurrentTime time = new() { Now = 42 };
+        byte[] data = Boxed(LiteServerCurrentTime.Constructor, time.WriteTo);
+
+        ReadOnlyMemory<byte> payload = TLSerializer.ReadPayload(data, LiteServerCurrentTime.Constructor);
+
+        Assert.That(payload.Length, Is.EqualTo(4));
+        Assert.That(BitConverter.ToInt32(payload.Span), Is.EqualTo(42));
+    }
+
+    [Test]
+    public void Test_RegistryResolvesEveryConstructor()
+    {
+        Assert.That(TLSerializer.KnownConstructors.Count, Is.GreaterThan(0));
+        foreach (uint constructor in TLSerializer.KnownConstructors)
+            Assert.That(TLSerializer.ResolveType(constructor), Is.Not.Null);
+
+        Assert.That(TLSerializer.ResolveType(LiteServerMasterchainInfo.Constructor), Is.EqualTo(typeof(LiteServerMasterchainInfo)));
+        Assert.That(TLSerializer.ResolveType(0xDEADBEEF), Is.Null);
+    }
+
+    static byte[] Boxed(uint constructor, Action<TLWriteBuffer> write)
+    {
+        TLWriteBuffer writer = new();
+        writer.WriteUInt32(constructor);
+        write(writer);
+        return writer.Build();
+    }
+}
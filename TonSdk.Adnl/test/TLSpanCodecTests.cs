@@ -0,0 +1,217 @@
+using NUnit.Framework;
+using TonSdk.Adnl.LiteClient.Protocol;
+using TonSdk.Adnl.TL;
+
+namespace TonSdk.Adnl.Tests;
+
+public class TLSpanCodecTests
+{
+    [TestCase(0)]
+    [TestCase(1)]
+    [TestCase(3)]
+    [TestCase(253)]
+    [TestCase(254)]
+    [TestCase(1000)]
+    public void Test_SpanWriterBufferMatchesTLWriteBuffer(int length)
+    {
+        byte[] data = new byte[length];
+        new Random(length).NextBytes(data);
+
+        TLWriteBuffer writeBuffer = new();
+        writeBuffer.WriteBuffer(data);
+        byte[] expected = writeBuffer.Build();
+
+        byte[] destination = new byte[expected.Length];
+        TLSpanWriter spanWriter = new(destination);
+        spanWriter.WriteBuffer(data);
+
+        Assert.That(spanWriter.Written, Is.EqualTo(expected.Length));
+        Assert.That(destination, Is.EqualTo(expected));
+
+        TLSpanReader reader = new(expected);
+        Assert.That(reader.ReadBuffer(), Is.EqualTo(data));
+        Assert.That(reader.Remaining, Is.EqualTo(0));
+    }
+
+    [Test]
+    public void Test_BlockTransactionsRoundTrip()
+    {
+        LiteServerBlockTransactions source = new()
+        {
+            Id = new TonNodeBlockIdExt(0, long.MinValue, 42, Hash(1), Hash(2)),
+            ReqCount = 2,
+            Incomplete = true,
+            Ids = new[]
+            {
+                new LiteServerTransactionId { Mode = 0b111, Account = Hash(3), Lt = 100, Hash = Hash(4) },
+                new LiteServerTransactionId { Mode = 0b010, Lt = 200 }
+            },
+            Proof = Filled(300, 5)
+        };
+
+        TLWriteBuffer writeBuffer = new();
+        source.WriteTo(writeBuffer);
+        byte[] expected = writeBuffer.Build();
+
+        byte[] destination = new byte[expected.Length];
+        TLSpanWriter writer = new(destination);
+        source.WriteTo(ref writer);
+        Assert.That(destination, Is.EqualTo(expected));
+
+        TLSpanReader reader = new(expected);
+        LiteServerBlockTransactions decoded = LiteServerBlockTransactions.ReadFrom(ref reader);
+
+        Assert.That(reader.Remaining, Is.EqualTo(0));
+        Assert.That(decoded.Id.Seqno, Is.EqualTo(42));
+        Assert.That(decoded.Id.FileHash, Is.EqualTo(source.Id.FileHash));
+        Assert.That(decoded.Incomplete, Is.True);
+        Assert.That(decoded.Ids.Length, Is.EqualTo(2));
+        Assert.That(decoded.Ids[0].Hash, Is.EqualTo(source.Ids[0].Hash));
+        Assert.That(decoded.Ids[1].Lt, Is.EqualTo(200));
+        Assert.That(decoded.Proof, Is.EqualTo(source.Proof));
+    }
+
+    [Test]
+    public void Test_SpanReaderRejectsTruncatedBuffer()
+    {
+        TLWriteBuffer writeBuffer = new();
+        writeBuffer.WriteBuffer(Filled(100, 7));
+        byte[] truncated = writeBuffer.Build()[..50];
+
+        Assert.Throws<Exception>(() =>
+        {
+            TLSpanReader reader = new(truncated);
+            reader.ReadBuffer();
+        });
+    }
+
+    [Test]
+    public void Test_SpanWriterRejectsSmallDestination()
+    {
+        Assert.Throws<Exception>(() =>
+        {
+            TLSpanWriter writer = new(new byte[8]);
+            writer.WriteBuffer(Filled(8, 1));
+        });
+    }
+
+    [Test]
+    public void Test_PrimitiveVectorsRoundTrip()
+    {
+        int[] ints = { 0, -1, int.MaxValue, 34 };
+        long[] longs = { long.MinValue, 1, 40_000_000_000_000 };
+        TLInt256[] hashes = { Hash(1), Hash(2), Hash(3) };
+
+        TLWriteBuffer writeBuffer = new();
+        writeBuffer.WriteInt32Vector(ints);
+        writeBuffer.WriteInt64Vector(longs);
+        writeBuffer.WriteInt256Vector(hashes);
+        byte[] expected = writeBuffer.Build();
+
+        Assert.That(expected.Length, Is.EqualTo(4 + 16 + 4 + 24 + 4 + 96));
+        Assert.That(BitConverter.ToInt32(expected, 8), Is.EqualTo(-1));
+
+        byte[] destination = new byte[expected.Length];
+        TLSpanWriter writer = new(destination);
+        writer.WriteInt32Vector(ints);
+        writer.WriteInt64Vector(longs);
+        writer.WriteInt256Vector(hashes);
+        Assert.That(destination, Is.EqualTo(expected));
+
+        TLSpanReader reader = new(expected);
+        Assert.That(reader.ReadInt32Vector(), Is.EqualTo(ints));
+        Assert.That(reader.ReadInt64Vector(), Is.EqualTo(longs));
+        TLInt256[] decoded = reader.ReadInt256Vector();
+        Assert.That(decoded, Is.EqualTo(hashes));
+        Assert.That(decoded[2].ToArray(), Is.EqualTo(Filled(32, 3)));
+
+        TLReadBuffer readBuffer = new(expected);
+        Assert.That(readBuffer.ReadInt32Vector(), Is.EqualTo(ints));
+        Assert.That(readBuffer.ReadInt64Vector(), Is.EqualTo(longs));
+        Assert.That(readBuffer.ReadInt256Vector(), Is.EqualTo(hashes));
+    }
+
+    [Test]
+    public void Test_Int256IsValueEqualAndKeepsWireOrder()
+    {
+        byte[] bytes = new byte[TLInt256.Size];
+        for (int i = 0; i < bytes.Length; i++) bytes[i] = (byte)i;
+
+        TLInt256 value = new(bytes);
+        TLInt256 same = new(bytes.AsSpan());
+        bytes[31] ^= 1;
+        TLInt256 other = new(bytes);
+
+        Assert.That(value == same, Is.True);
+        Assert.That(value.GetHashCode(), Is.EqualTo(same.GetHashCode()));
+        Assert.That(value != other, Is.True);
+        Assert.That(TLInt256.Zero.IsZero, Is.True);
+        Assert.That(value.ToString(), Does.StartWith("000102"));
+
+        TLSpanWriter writer = new(new byte[TLInt256.Size + TLInt128.Size]);
+        writer.WriteInt256(value);
+        writer.WriteInt128(new TLInt128(bytes.AsSpan(0, TLInt128.Size)));
+        TLSpanReader reader = new(writer.WrittenSpan);
+        Assert.That(reader.ReadInt256(), Is.EqualTo(value));
+        Assert.That(reader.ReadInt128().ToArray(), Is.EqualTo(bytes.AsSpan(0, TLInt128.Size).ToArray()));
+
+        Assert.Throws<ArgumentException>(() => _ = new TLInt256(new byte[16]));
+    }
+
+    [Test]
+    public void Test_VectorCountIsCheckedBeforeAllocating()
+    {
+        TLWriteBuffer writeBuffer = new();
+        new TonNodeBlockIdExt(0, long.MinValue, 1, Hash(1), Hash(2)).WriteTo(writeBuffer);
+        writeBuffer.WriteUInt32(0);
+        writeBuffer.WriteBool(false);
+        writeBuffer.WriteUInt32(int.MaxValue);
+        byte[] hostile = writeBuffer.Build();
+
+        Exception exception = Assert.Throws<Exception>(() =>
+        {
+            TLSpanReader reader = new(hostile);
+            LiteServerBlockTransactions.ReadFrom(ref reader);
+        });
+        Assert.That(exception.Message, Is.EqualTo("Vector length exceeds buffer"));
+        Assert.Throws<Exception>(() => LiteServerBlockTransactions.ReadFrom(new TLReadBuffer(hostile)));
+    }
+
+    [Test]
+    public void Test_ConditionalTypeReadsItsVector()
+    {
+        LiteServerDispatchQueueInfo source = new()
+        {
+            Mode = 1,
+            Id = new TonNodeBlockIdExt(0, long.MinValue, 1, Hash(1), Hash(2)),
+            AccountDispatchQueues = new[]
+            {
+                new LiteServerAccountDispatchQueueInfo { Addr = Hash(3), Size = 2, MinLt = 10, MaxLt = 20 }
+            },
+            Complete = true,
+            Proof = Filled(12, 4)
+        };
+
+        TLWriteBuffer writeBuffer = new();
+        source.WriteTo(writeBuffer);
+        TLSpanReader reader = new(writeBuffer.Build());
+        LiteServerDispatchQueueInfo decoded = LiteServerDispatchQueueInfo.ReadFrom(ref reader);
+
+        Assert.That(decoded.AccountDispatchQueues.Length, Is.EqualTo(1));
+        Assert.That(decoded.AccountDispatchQueues[0].MaxLt, Is.EqualTo(20));
+        Assert.That(decoded.Complete, Is.True);
+        Assert.That(decoded.Proof, Is.EqualTo(source.Proof));
+    }
+
+    static TLInt256 Hash(byte value)
+    {
+        return new TLInt256(Filled(TLInt256.Size, value));
+    }
+
+    static byte[] Filled(int length, byte value)
+    {
+        byte[] bytes = new byte[length];
+        Array.Fill(bytes, value);
+        return bytes;
+    }
+}
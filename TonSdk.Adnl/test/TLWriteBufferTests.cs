@@ -1,6 +1,8 @@
-﻿using System.Numerics;
+﻿using System.Buffers;
+using System.Numerics;
 using System.Security.Cryptography;
 using NUnit.Framework;
+using TonSdk.Adnl.LiteClient.Protocol;
 using TonSdk.Adnl.TL;
 
 namespace TonSdk.Adnl.Tests;
@@ -46,6 +48,72 @@ public class TLWriteBufferTests
         Assert.That(restoredValue, Is.EqualTo(value));
     }
 
+    [Test]
+    public void Test_BufferGrowsPastInitialCapacity()
+    {
+        TLWriteBuffer writeBuffer = new();
+        for (int i = 0; i < 1000; ++i) writeBuffer.WriteInt32(i);
+
+        byte[] written = writeBuffer.Build();
+
+        Assert.That(written.Length, Is.EqualTo(4000));
+        Assert.That(BitConverter.ToInt32(written, 999 * 4), Is.EqualTo(999));
+    }
+
+    [Test]
+    public void Test_GeneratedSerializedSizeMatchesWrittenBytes()
+    {
+        LiteServerBlockTransactions transactions = new()
+        {
+            Id = new TonNodeBlockIdExt(0, long.MinValue, 1, TLInt256.Zero, TLInt256.Zero),
+            ReqCount = 2,
+            Ids = new[]
+            {
+                new LiteServerTransactionId { Mode = 0b111, Account = TLInt256.Zero, Lt = 1, Hash = TLInt256.Zero },
+                new LiteServerTransactionId { Mode = 0b010, Lt = 2 }
+            },
+            Proof = new byte[300]
+        };
+        LiteServerError error = new() { Code = 651, Message = "block not found" };
+
+        AssertWrittenSize(transactions.GetSerializedSize(), transactions.WriteTo);
+        AssertWrittenSize(error.GetSerializedSize(), error.WriteTo);
+        AssertWrittenSize(transactions.Id.GetSerializedSize(), transactions.Id.WriteTo);
+    }
+
+    [Test]
+    public void Test_PreSizedBufferIsBuiltWithoutCopy()
+    {
+        byte[] body = new byte[1000];
+        TLWriteBuffer writeBuffer = new(TLWriteBuffer.GetBufferSize(body.Length));
+        writeBuffer.WriteBuffer(body);
+
+        Assert.That(writeBuffer.Build(), Is.SameAs(writeBuffer.Build()));
+        Assert.That(writeBuffer.Length, Is.EqualTo(1004));
+    }
+
+    [Test]
+    public void Test_PooledBufferMatchesUnpooled()
+    {
+        byte[] body = new byte[300];
+        new Random(1).NextBytes(body);
+
+        TLWriteBuffer expected = new();
+        expected.WriteBuffer(body);
+
+        using TLWriteBuffer pooled = new(8, ArrayPool<byte>.Shared);
+        pooled.WriteBuffer(body);
+
+        Assert.That(pooled.WrittenSpan.ToArray(), Is.EqualTo(expected.Build()));
+    }
+
+    static void AssertWrittenSize(int expectedSize, Action<TLWriteBuffer> write)
+    {
+        TLWriteBuffer writeBuffer = new();
+        write(writeBuffer);
+        Assert.That(writeBuffer.Build().Length, Is.EqualTo(expectedSize));
+    }
+
     // AdnlKeys generation logic
     static byte[] GenerateRandomBytes(int byteSize)
     {
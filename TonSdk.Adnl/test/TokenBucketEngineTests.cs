@@ -0,0 +1,160 @@
+using System.Diagnostics;
+using NUnit.Framework;
+using TonSdk.Adnl.LiteClient;
+using TonSdk.Adnl.LiteClient.Engines;
+using TonSdk.Adnl.LiteClient.Protocol;
+using TonSdk.Adnl.TL;
+
+namespace TonSdk.Adnl.Tests;
+
+public class TokenBucketEngineTests
+{
+    static readonly LiteServerGetTimeRequest TimeRequest = new();
+
+    [Test]
+    public async Task Test_BurstThenSteadyRate()
+    {
+        using TokenBucketEngine engine = new(Inner(),
+            new TokenBucketEngineOptions { TokensPerSecond = 20, BurstSize = 5 });
+
+        Stopwatch sw = Stopwatch.StartNew();
+        for (int i = 0; i < 5; i++)
+            await engine.QueryAsync(TimeRequest);
+        long burstMs = sw.ElapsedMilliseconds;
+
+        for (int i = 0; i < 5; i++)
+            await engine.QueryAsync(TimeRequest);
+        sw.Stop();
+
+        Assert.That(burstMs, Is.LessThan(100));
+        Assert.That(sw.ElapsedMilliseconds, Is.InRange(200, 1000), "five more tokens at 20/s take 250 ms");
+    }
+
+    [Test]
+    public async Task Test_HeavyRequestIsNotOvertaken()
+    {
+        FakeLiteEngine inner = Inner();
+        using TokenBucketEngine engine = new(inner,
+            new TokenBucketEngineOptions { TokensPerSecond = 50, BurstSize = 5 });
+        await engine.QueryAsync(BlockRequest());
+
+        Task<byte[]> block = engine.QueryAsync(BlockRequest());
+        Task<byte[]> time = engine.QueryAsync(TimeRequest);
+        Assert.That(engine.QueuedRequests, Is.EqualTo(2));
+
+        await Task.WhenAll(block, time);
+        Assert.That(Order(inner), Is.EqualTo(new[] { "block", "block", "time" }));
+    }
+
+    [Test]
+    public async Task Test_CancelledWaiterLeavesTheQueue()
+    {
+        FakeLiteEngine inner = Inner();
+        using TokenBucketEngine engine = new(inner,
+            new TokenBucketEngineOptions { TokensPerSecond = 10, BurstSize = 1 });
+        using CancellationTokenSource cancellation = new();
+        await engine.QueryAsync(TimeRequest);
+
+        Task<byte[]> cancelled = engine.QueryAsync(TimeRequest, cancellationToken: cancellation.Token);
+        Task<byte[]> next = engine.QueryAsync(TimeRequest);
+        cancellation.Cancel();
+
+        Assert.ThrowsAsync<TaskCanceledException>(async () => await cancelled);
+        await next;
+        Assert.That(inner.Calls, Is.EqualTo(2));
+        Assert.That(engine.QueuedRequests, Is.EqualTo(0));
+    }
+
+    [Test]
+    public async Task Test_RateLimitedEngineChargesOnePerQuery()
+    {
+        FakeLiteEngine inner = Inner();
+        using RateLimitedEngine engine = new(inner, 3);
+
+        for (int i = 0; i < 3; i++)
+            await engine.QueryAsync(BlockRequest());
+
+        Assert.That(engine.AvailableTokens, Is.LessThan(1));
+        Assert.That(engine.ConcurrencyLimit, Is.Null);
+    }
+
+    [Test]
+    public async Task Test_ConcurrencyBacksOffOncePerEpisode()
+    {
+        TaskCompletionSource gate = new();
+        bool returnError = true;
+        using TokenBucketEngine engine = new(Inner(gate, () => Volatile.Read(ref returnError)), AdaptiveOptions(8));
+
+        Task<byte[]>[] errors = Enumerable.Range(0, 4).Select(_ => engine.QueryAsync(TimeRequest)).ToArray();
+        gate.SetResult();
+        await Task.WhenAll(errors);
+        Assert.That(engine.ConcurrencyLimit, Is.EqualTo(4));
+
+        Volatile.Write(ref returnError, false);
+        for (int i = 0; i < 20; i++)
+            await engine.QueryAsync(TimeRequest);
+        Assert.That(engine.ConcurrencyLimit, Is.GreaterThan(4));
+    }
+
+    [Test]
+    public void Test_TimeoutsCountAsOverload()
+    {
+        using TokenBucketEngine engine = new(Inner(timeOut: true), AdaptiveOptions(8));
+
+        Assert.ThrowsAsync<TaskCanceledException>(async () => await engine.QueryAsync(TimeRequest));
+        Assert.That(engine.ConcurrencyLimit, Is.EqualTo(4));
+    }
+
+    [Test]
+    public async Task Test_ConcurrencyLimitCapsInFlight()
+    {
+        TaskCompletionSource gate = new();
+        FakeLiteEngine inner = Inner(gate);
+        using TokenBucketEngine engine = new(inner, AdaptiveOptions(2));
+
+        Task<byte[]>[] responses = Enumerable.Range(0, 5).Select(_ => engine.QueryAsync(TimeRequest)).ToArray();
+        await Task.Delay(50);
+        Assert.That(inner.Calls, Is.EqualTo(2));
+
+        gate.SetResult();
+        await Task.WhenAll(responses);
+        Assert.That(inner.Calls, Is.EqualTo(5));
+    }
+
+    static TokenBucketEngineOptions AdaptiveOptions(int initialConcurrency)
+    {
+        return new TokenBucketEngineOptions
+        {
+            TokensPerSecond = 10_000,
+            AdaptiveConcurrency = true,
+            InitialConcurrency = initialConcurrency
+        };
+    }
+
+    static LiteServerGetBlockRequest BlockRequest()
+    {
+        return new LiteServerGetBlockRequest
+        {
+            Id = new TonNodeBlockIdExt(-1, long.MinValue, 1, new TLInt256(new byte[32]), new TLInt256(new byte[32]))
+        };
+    }
+
+    static FakeLiteEngine Inner(TaskCompletionSource? gate = null, Func<bool>? returnError = null,
+        bool timeOut = false)
+    {
+        return new FakeLiteEngine(_ =>
+        {
+            if (timeOut) throw new TaskCanceledException();
+
+            byte[] response = new byte[8];
+            BitConverter.TryWriteBytes(response,
+                returnError?.Invoke() == true ? LiteServerError.Constructor : LiteServerCurrentTime.Constructor);
+            return response;
+        }) { Gate = gate };
+    }
+
+    static string[] Order(FakeLiteEngine inner)
+    {
+        return inner.Requests.Select(r => r is LiteServerGetBlockRequest ? "block" : "time").ToArray();
+    }
+}
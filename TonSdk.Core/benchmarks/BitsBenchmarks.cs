@@ -0,0 +1,105 @@
+using System;
+using System.Numerics;
+using BenchmarkDotNet.Attributes;
+using TonSdk.Core.Addresses;
+using TonSdk.Core.Boc;
+using TonSdk.Core.Boc.bits;
+using TonSdk.Core.Boc.Cells;
+using TonSdk.Core.Economics;
+
+namespace TonSdk.Core.Benchmarks;
+
+/// <summary>
+///     The bit-level work under every cell: hashing a freshly built tree of 1365 cells, writing and reading the
+///     fields of a message-like cell, parsing addresses, and a BoC round trip through new cells.
+/// </summary>
+[MemoryDiagnoser]
+public class BitsBenchmarks
+{
+    Bits[] data = null!;
+    Address address;
+    string friendly = null!;
+    byte[] boc = null!;
+    Cell message = null!;
+
+    [GlobalSetup]
+    public void Setup()
+    {
+        Random random = new(1);
+        data = new Bits[1365];
+        for (int i = 0; i < data.Length; i++)
+        {
+            byte[] bytes = new byte[random.Next(1, 128)];
+            random.NextBytes(bytes);
+            data[i] = new Bits(bytes).Slice(0, bytes.Length * 8 - random.Next(0, 8));
+        }
+
+        byte[] hash = new byte[32];
+        random.NextBytes(hash);
+        address = Address.Create(0, hash);
+        friendly = address.ToString();
+        message = BuildMessage();
+        boc = BagOfCells.SerializeBoc(BuildTree(), true).ToBytes();
+    }
+
+    [Benchmark]
+    public Bits CellHash()
+    {
+        return BuildTree().Hash;
+    }
+
+    [Benchmark]
+    public Cell BuildMessage()
+    {
+        return new CellBuilder()
+            .StoreUInt(0x18, 6)
+            .StoreAddress(address)
+            .StoreCoins(Coins.FromNano(1_500_000_000))
+            .StoreUInt(0, 1 + 4 + 4 + 64 + 32 + 1 + 1)
+            .StoreUInt(0x0f8a7ea5, 32)
+            .StoreUInt(ulong.MaxValue, 64)
+            .StoreInt(-12345, 257)
+            .Build();
+    }
+
+    [Benchmark]
+    public BigInteger ParseMessage()
+    {
+        CellSlice slice = message.Parse();
+        slice.SkipBits(6);
+        slice.LoadAddress();
+        BigInteger sum = slice.LoadCoins().ToBigInt();
+        slice.SkipBits(1 + 4 + 4 + 64 + 32 + 1 + 1);
+        return sum + slice.LoadUInt(32) + slice.LoadUInt(64) + slice.LoadInt(257);
+    }
+
+    [Benchmark]
+    public Address ParseAddress()
+    {
+        return Address.Parse(friendly);
+    }
+
+    [Benchmark]
+    public int BocRoundTrip()
+    {
+        return BagOfCells.SerializeBoc(BagOfCells.DeserializeBoc(boc), true).Length;
+    }
+
+    Cell BuildTree()
+    {
+        int next = 0;
+
+        // Four references per node, five levels deep
+        Cell Build(int level)
+        {
+            Bits bits = data[next++];
+            if (level == 0) return new Cell(bits, Array.Empty<Cell>());
+
+            Cell[] refs = new Cell[4];
+            for (int i = 0; i < refs.Length; i++) refs[i] = Build(level - 1);
+            return new Cell(bits, refs);
+        }
+
+        return Build(5);
+    }
+}
@@ -0,0 +1,56 @@
+using BenchmarkDotNet.Attributes;
+using TonSdk.Core.Boc;
+using TonSdk.Core.Boc.bits;
+using TonSdk.Core.Boc.Cells;
+
+namespace TonSdk.Core.Benchmarks;
+
+/// <summary>
+///     Opening a BoC of <see cref="Cells" /> cells, four references per node: building every cell, against opening
+///     it lazily and reading one root-to-leaf path, as block and proof explorers do.
+/// </summary>
+[MemoryDiagnoser]
+public class BocDeserializeBenchmarks
+{
+    byte[] boc = null!;
+
+    [Params(10_000, 100_000)] public int Cells;
+
+    [Params(false, true)] public bool HasIdx;
+
+    [GlobalSetup]
+    public void Setup()
+    {
+        int next = 0;
+
+        Cell Build(int count)
+        {
+            CellBuilder builder = new CellBuilder().StoreUInt((ulong)next++, 64).StoreUInt(0, 7);
+            count--;
+            for (int i = 0; i < 4 && count > 0; i++)
+            {
+                int share = (count + 3 - i) / (4 - i);
+                builder.StoreRef(Build(share));
+                count -= share;
+            }
+
+            return builder.Build();
+        }
+
+        boc = BagOfCells.SerializeBoc(Build(Cells), HasIdx).ToBytes();
+    }
+
+    [Benchmark(Baseline = true)]
+    public Cell Eager()
+    {
+        return BagOfCells.DeserializeBoc(boc)[0];
+    }
+
+    [Benchmark]
+    public Bits LazyPath()
+    {
+        LazyCell cell = BagOfCells.DeserializeLazy(boc)[0];
+        while (cell.RefsCount > 0) cell = cell.GetRef(cell.RefsCount - 1);
+        return cell.Bits;
+    }
+}
@@ -0,0 +1,67 @@
+using System.Buffers;
+using System.IO;
+using BenchmarkDotNet.Attributes;
+using TonSdk.Core.Boc;
+using TonSdk.Core.Boc.bits;
+using TonSdk.Core.Boc.Cells;
+
+namespace TonSdk.Core.Benchmarks;
+
+/// <summary>
+///     Serializing a tree of <see cref="Cells" /> distinct cells, four references per node, plus one cell shared by
+///     every leaf. Cell hashes are computed in setup, so the numbers cover ordering and writing only.
+/// </summary>
+[MemoryDiagnoser]
+public class BocSerializeBenchmarks
+{
+    readonly ArrayBufferWriter<byte> buffer = new();
+    Cell root = null!;
+
+    [Params(10_000, 100_000, 1_000_000)] public int Cells;
+
+    [GlobalSetup]
+    public void Setup()
+    {
+        Cell shared = new CellBuilder().StoreUInt(0xC0FFEE, 32).Build();
+        int next = 0;
+
+        Cell Build(int count)
+        {
+            CellBuilder builder = new CellBuilder().StoreUInt((ulong)next++, 64).StoreUInt(0, 7);
+            count--;
+            if (count == 0) return builder.StoreRef(shared).Build();
+
+            for (int i = 0; i < 4 && count > 0; i++)
+            {
+                int share = (count + 3 - i) / (4 - i);
+                builder.StoreRef(Build(share));
+                count -= share;
+            }
+
+            return builder.Build();
+        }
+
+        root = Build(Cells);
+        _ = root.Hash;
+    }
+
+    [Benchmark(Baseline = true)]
+    public Bits ToBits()
+    {
+        return BagOfCells.SerializeBoc(root, true);
+    }
+
+    [Benchmark]
+    public int ToBufferWriter()
+    {
+        buffer.Clear();
+        BagOfCells.SerializeBoc(root, buffer, true);
+        return buffer.WrittenCount;
+    }
+
+    [Benchmark]
+    public void ToStream()
+    {
+        BagOfCells.SerializeBoc(root, Stream.Null, true);
+    }
+}
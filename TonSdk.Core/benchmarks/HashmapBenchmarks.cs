@@ -0,0 +1,74 @@
+using System.Collections.Generic;
+using System.Linq;
+using System.Numerics;
+using BenchmarkDotNet.Attributes;
+using TonSdk.Core.Boc;
+using TonSdk.Core.Boc.bits;
+using TonSdk.Core.Boc.Cells;
+
+namespace TonSdk.Core.Benchmarks;
+
+/// <summary>
+///     Reading one value, and a run of 16 neighbouring entries, from a dictionary of <see cref="Entries" /> 32-bit
+///     keys: deserializing every entry first, against descending the lazy view.
+/// </summary>
+[MemoryDiagnoser]
+public class HashmapBenchmarks
+{
+    static readonly HashmapOptions<uint, BigInteger> Options = new()
+    {
+        KeySize = 32,
+        Serializers = new HashmapSerializers<uint, BigInteger>
+        {
+            Key = key => new BitsBuilder(32).StoreUInt(key, 32).Build(),
+            Value = value => new CellBuilder().StoreUInt(value, 64).Build()
+        },
+        Deserializers = new HashmapDeserializers<uint, BigInteger>
+        {
+            Key = bits => (uint)bits.Parse().LoadUInt(32),
+            Value = cell => cell.Parse().LoadUInt(64)
+        }
+    };
+
+    Cell dict = null!;
+    uint key;
+
+    [Params(1_000, 10_000)] public int Entries;
+
+    [GlobalSetup]
+    public void Setup()
+    {
+        HashmapE<uint, BigInteger> hashmap = new(Options);
+        for (uint i = 0; i < Entries; i++) hashmap.Set(i * 2654435761u, i);
+
+        // Read back from a BoC, as dictionaries from the network are
+        dict = Cell.From(hashmap.Build().Serialize());
+        key = (uint)(Entries / 2) * 2654435761u;
+    }
+
+    [Benchmark(Baseline = true)]
+    public BigInteger EagerGet()
+    {
+        return HashmapE<uint, BigInteger>.Deserialize(dict.Parse(), Options).Get(key);
+    }
+
+    [Benchmark]
+    public BigInteger LazyGet()
+    {
+        return HashmapE<uint, BigInteger>.DeserializeLazy(dict.Parse(), Options).Get(key);
+    }
+
+    [Benchmark]
+    public List<KeyValuePair<uint, BigInteger>> EagerRange()
+    {
+        return HashmapE<uint, BigInteger>.Deserialize(dict.Parse(), Options).Entries
+            .SkipWhile(entry => entry.Key < key).Take(16).ToList();
+    }
+
+    [Benchmark]
+    public List<KeyValuePair<uint, BigInteger>> LazyRange()
+    {
+        return HashmapE<uint, BigInteger>.DeserializeLazy(dict.Parse(), Options).EntriesInRange(key, uint.MaxValue)
+            .Take(16).ToList();
+    }
+}
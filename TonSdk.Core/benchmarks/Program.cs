@@ -0,0 +1,12 @@
+using BenchmarkDotNet.Running;
+
+namespace TonSdk.Core.Benchmarks;
+
+public static class Program
+{
+    // dotnet run -c Release -- --filter '*'
+    public static void Main(string[] args)
+    {
+        BenchmarkSwitcher.FromAssembly(typeof(Program).Assembly).Run(args);
+    }
+}
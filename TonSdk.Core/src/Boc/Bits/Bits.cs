@@ -1,9 +1,16 @@
 using System;
+using System.Buffers.Binary;
 using System.Collections;
+using System.Numerics;
 using System.Security.Cryptography;
 
 namespace TonSdk.Core.Boc.bits;
 
+/// <summary>
+///     Immutable sequence of bits, kept first bit first in the high bits of a byte array, as cells store them.
+///     <see cref="Slice" /> and the loads of <see cref="BitsSlice" /> return views over the same array; bits outside
+///     of a view are never read.
+/// </summary>
 public class Bits : IComparable<Bits>
 {
     static readonly char[] HexSymbols =
@@ -12,50 +19,72 @@ public class Bits : IComparable<Bits>
         '8', '9', 'A', 'B', 'C', 'D', 'E', 'F'
     };
 
+    static readonly byte[] ReversedBits = BuildReversedBits();
 
-    public Bits(int length = 1023)
+    readonly byte[] bytes;
+    readonly int offset;
+
+    public Bits(int length = 1023) : this(new byte[(length + 7) / 8], 0, length)
     {
-        Data = new BitArray(length);
     }
 
-    public Bits(BitArray b)
+    public Bits(BitArray b) : this(FromBitArray(b), 0, b.Length)
     {
-        Data = b;
     }
 
-    public Bits(string s) : this(FromString(s))
+    public Bits(string s)
     {
+        (bytes, Length) = FromString(s);
     }
 
-    public Bits(byte[] bytesOrig)
+    public Bits(byte[] bytesOrig) : this((byte[])bytesOrig.Clone(), 0, bytesOrig.Length * 8)
     {
-        byte[] bytes = (byte[])bytesOrig.Clone();
-        for (int i = 0; i < bytes.Length; i++) bytes[i] = bytes[i].ReverseBits();
+    }
 
-        Data = new BitArray(bytes);
+    /// <summary>
+    ///     Bits <paramref name="offset" /> to <paramref name="offset" /> + <paramref name="length" /> of
+    ///     <paramref name="bytes" />, which is shared, not copied.
+    /// </summary>
+    internal Bits(byte[] bytes, int offset, int length)
+    {
+        this.bytes = bytes;
+        this.offset = offset;
+        Length = length;
     }
 
-    public int Length => Data.Length;
+    public int Length { get; }
 
-    public BitArray Data { get; }
+    /// <summary>
+    ///     Copy of the bits as a <see cref="BitArray" />; changing it doesn't change these bits.
+    /// </summary>
+    public BitArray Data => ToBitArray();
+
+    public bool this[int index]
+    {
+        get
+        {
+            if ((uint)index >= (uint)Length) throw new ArgumentOutOfRangeException(nameof(index), index,
+                    "Index was out of range. Must be non-negative and less than the size of the collection.");
+
+            int position = offset + index;
+            return (bytes[position >> 3] & (0x80 >> (position & 7))) != 0;
+        }
+    }
 
     public int CompareTo(Bits other)
     {
-        // Ensure the BitArrays are the same length
-        if (Data.Count != other.Data.Count)
+        if (Length != other.Length)
             throw new ArgumentException("BitArrays must be the same length");
 
-        // Compute XOR of the two BitArrays
-        BitArray xorResult = new BitArray(Data).Xor(other.Data);
-
-        // Look for the first set bit
-        for (int i = 0; i < xorResult.Count; i++)
-            if (xorResult[i])
-                // If the current bit is true and the other is false, return 1.
-                // Otherwise, return -1.
-                return Data[i] ? 1 : -1;
+        // The first differing bit decides, and it is the highest differing bit of the first differing word
+        for (int start = 0; start < Length; start += 64)
+        {
+            int size = Math.Min(64, Length - start);
+            ulong x = ReadUInt64(start, size);
+            ulong y = other.ReadUInt64(start, size);
+            if (x != y) return x > y ? 1 : -1;
+        }
 
-        // If all bits are identical, the BitArrays are equal
         return 0;
     }
 
@@ -67,26 +96,23 @@ public class Bits : IComparable<Bits>
         if (start < 0 || end < 0 || start > end || start > Length || end > Length)
             throw new ArgumentException("Invalid slice range");
 
-        BitArray ret = new(end - start);
-        for (int i = start; i < end; i++) ret[i - start] = Data[i];
-
-        return new Bits(ret);
+        return new Bits(bytes, offset + start, end - start);
     }
 
     public Bits Augment(int divider = 8)
     {
-        BitArray bits = (BitArray)Data.Clone();
         if (divider != 4 && divider != 8)
             throw new ArgumentException("Invalid divider. Can be (4 | 8)", nameof(divider));
 
-        int l = bits.Length;
+        int l = Length;
         int newL = (l + divider - 1) / divider * divider;
         if (l == newL) return this;
 
-        bits.Length = newL;
-        bits[bits.Length - (newL - l)] = true;
+        byte[] augmented = new byte[(newL + 7) / 8];
+        WriteTo(augmented, 0);
+        Write(augmented, l, 1, 1);
 
-        return new Bits(bits);
+        return new Bits(augmented, 0, newL);
     }
 
     public Bits Rollback(int divider = 8)
@@ -99,7 +125,7 @@ public class Bits : IComparable<Bits>
         int? pos = null;
 
         for (int i = Length - 1; i >= Length - 1 - divider; i--)
-            if (Data[i])
+            if (this[i])
             {
                 pos = i;
                 break;
@@ -110,25 +136,27 @@ public class Bits : IComparable<Bits>
         return Slice(0, (int)pos);
     }
 
-    static BitArray FromString(string s)
+    static (byte[] bytes, int length) FromString(string s)
     {
-        static BitArray fromBinaryString(string bitString)
+        static (byte[], int) fromBinaryString(string bitString)
         {
-            BitArray bits = new(bitString.Length);
-            for (int i = 0; i < bitString.Length; i++) bits.Set(i, bitString[i] == '1');
+            byte[] bits = new byte[(bitString.Length + 7) / 8];
+            for (int i = 0; i < bitString.Length; i++)
+                if (bitString[i] == '1')
+                    bits[i >> 3] |= (byte)(0x80 >> (i & 7));
 
-            return bits;
+            return (bits, bitString.Length);
         }
 
-        static BitArray fromHexString(string hexStringOrig)
+        static (byte[], int) fromHexString(string hexStringOrig)
         {
-            static BitArray parse(string h)
+            static byte[] parse(string h)
             {
-                BitArray bits = new(h.Length * 4);
+                byte[] bits = new byte[(h.Length + 1) / 2];
                 for (int i = 0; i < h.Length; i++)
                 {
                     byte b = Convert.ToByte(h.Substring(i, 1), 16);
-                    for (int j = 0; j < 4; j++) bits.Set(i * 4 + j, (b & (1 << (3 - j))) != 0);
+                    bits[i >> 1] |= (byte)(i % 2 == 0 ? b << 4 : b);
                 }
 
                 return bits;
@@ -137,88 +165,87 @@ public class Bits : IComparable<Bits>
             string hexString = hexStringOrig;
             bool partialEnd = hexString[hexString.Length - 1] == '_';
 
-            if (!partialEnd) return parse(hexString);
+            if (!partialEnd) return (parse(hexString), hexString.Length * 4);
 
             hexString = hexString.Substring(0, hexString.Length - 1);
-            BitArray bits = parse(hexString);
+            byte[] bits = parse(hexString);
 
+            // The completion tag is the last set bit
             int lastTrueIndex = -1;
             for (int i = bits.Length - 1; i >= 0; i--)
-                if (bits[i])
+                if (bits[i] != 0)
                 {
-                    lastTrueIndex = i;
+                    lastTrueIndex = i * 8 + 7 - BitOperations.TrailingZeroCount(bits[i]);
                     break;
                 }
 
-            bits.Length = lastTrueIndex;
-            return bits;
+            if (lastTrueIndex < 0)
+                throw new ArgumentException("Hex string ending in '_' has no completion tag", nameof(s));
+
+            return (bits, lastTrueIndex);
         }
 
-        static BitArray fromFiftBinary(string fiftBits)
+        static (byte[], int) fromFiftBinary(string fiftBits)
         {
             return fromBinaryString(fiftBits.Substring(2, fiftBits.Length - 3));
         }
 
-        static BitArray fromFiftHex(string fiftHex)
+        static (byte[], int) fromFiftHex(string fiftHex)
         {
             return fromHexString(fiftHex.Substring(2, fiftHex.Length - 3));
         }
 
-        static BitArray fromBase64(string base64, bool url = false)
+        static (byte[], int) fromBase64(string base64, bool url = false)
         {
             if (url) base64 = base64.Replace('-', '+').Replace('_', '/');
 
             while (base64.Length % 4 != 0) base64 += "=";
 
             byte[] bytes = Convert.FromBase64String(base64);
-            for (int i = 0; i < bytes.Length; i++) bytes[i] = bytes[i].ReverseBits();
-
-            return new BitArray(bytes);
+            return (bytes, bytes.Length * 8);
         }
 
-        BitArray bits;
         if (s.IsBinaryString())
-            bits = fromBinaryString(s);
-        else if (s.IsHexString())
-            bits = fromHexString(s);
-        else if (s.IsBase64())
-            bits = fromBase64(s);
-        else if (s.IsBase64Url())
-            bits = fromBase64(s, true);
-        else if (s.IsFiftBinary())
-            bits = fromFiftBinary(s);
-        else if (s.IsFiftHex())
-            bits = fromFiftHex(s);
-        else
-            throw new ArgumentException("Unknown string type, supported: binary, hex, fiftBinary, fiftHex");
-
-        return bits;
+            return fromBinaryString(s);
+        if (s.IsHexString())
+            return fromHexString(s);
+        if (s.IsBase64())
+            return fromBase64(s);
+        if (s.IsBase64Url())
+            return fromBase64(s, true);
+        if (s.IsFiftBinary())
+            return fromFiftBinary(s);
+        if (s.IsFiftHex())
+            return fromFiftHex(s);
+
+        throw new ArgumentException("Unknown string type, supported: binary, hex, fiftBinary, fiftHex");
     }
 
     public Bits Hash()
     {
-        using (SHA256 algorithm = SHA256.Create())
-        {
-            byte[] hashBytes = algorithm.ComputeHash(ToBytes());
-            return new Bits(hashBytes);
-        }
+        byte[] hashBytes = offset % 8 == 0 && Length % 8 == 0
+            ? SHA256.HashData(bytes.AsSpan(offset / 8, Length / 8))
+            : SHA256.HashData(ToBytes());
+        return new Bits(hashBytes, 0, hashBytes.Length * 8);
     }
 
     public T[] GetCopyTo<T>(T[] to)
     {
-        Data.CopyTo(to, 0);
+        ToBitArray().CopyTo(to, 0);
         return to;
     }
 
     public byte[] ToBytes(bool needReverse = true)
     {
-        byte[] bytes = GetCopyTo(new byte[(Data.Length + 7) / 8]);
+        byte[] result = new byte[(Length + 7) / 8];
+        CopyTo(result);
 
-        if (!BitConverter.IsLittleEndian || !needReverse) return bytes;
+        // Without the reversal, bytes are laid out as in a BitArray: first bit in the lowest bit
+        if (!needReverse)
+            for (int i = 0; i < result.Length; i++)
+                result[i] = ReversedBits[result[i]];
 
-        for (int i = 0; i < bytes.Length; i++) bytes[i] = bytes[i].ReverseBits();
-
-        return bytes;
+        return result;
     }
 
     public override string ToString()
@@ -230,33 +257,19 @@ public class Bits : IComparable<Bits>
     {
         string toBinaryString(bool fift = false)
         {
-            bool[] bools = new bool[Data.Length];
-            Data.CopyTo(bools, 0);
-            char[] chars = Array.ConvertAll(bools, b => b ? '1' : '0');
+            char[] chars = new char[Length];
+            for (int i = 0; i < chars.Length; i++) chars[i] = this[i] ? '1' : '0';
             string newStr = new(chars);
             return fift ? $"b{{{newStr}}}" : newStr;
         }
 
         string toHexString(bool fift = false)
         {
-            Bits bits = new(Data);
-            int length = Data.Length;
-            bool areDivisible = length % 4 == 0;
-            BitArray augmented = areDivisible ? bits.Data : bits.Augment(4).Data;
+            bool areDivisible = Length % 4 == 0;
+            Bits augmented = areDivisible ? this : Augment(4);
             int charCount = augmented.Length / 4;
             char[] hexChars = new char[charCount + (areDivisible ? 0 : 1)];
-            for (int i = 0; i < charCount; i++)
-            {
-                int value = 0;
-                for (int j = 0; j < 4; j++)
-                {
-                    int index = i * 4 + j;
-                    bool bit = index <= length && augmented.Get(index);
-                    if (bit) value |= 1 << (3 - j);
-                }
-
-                hexChars[i] = HexSymbols[value];
-            }
+            for (int i = 0; i < charCount; i++) hexChars[i] = HexSymbols[augmented.ReadUInt64(i * 4, 4)];
 
             if (!areDivisible) hexChars[hexChars.Length - 1] = '_';
 
@@ -288,7 +301,7 @@ public class Bits : IComparable<Bits>
 
     public virtual Bits Clone()
     {
-        return new Bits(Data);
+        return new Bits(bytes, offset, Length);
     }
 
     public BitsSlice Parse()
@@ -298,7 +311,7 @@ public class Bits : IComparable<Bits>
 
     public BitArray Unwrap()
     {
-        return Data;
+        return ToBitArray();
     }
 
     public override bool Equals(object? obj)
@@ -306,21 +319,162 @@ public class Bits : IComparable<Bits>
         if (obj == null || GetType() != obj.GetType())
             return false;
 
-        Bits other = (Bits)obj;
-        if (Data.Length != other.Data.Length) return false;
+        return SequenceEqual((Bits)obj);
+    }
 
-        for (int i = 0; i < Data.Length; i++)
-            if (Data[i] != other.Data[i])
-                return false;
+    public override int GetHashCode()
+    {
+        return ContentHashCode();
+    }
+
+    internal bool SequenceEqual(Bits other)
+    {
+        if (Length != other.Length) return false;
+
+        for (int start = 0; start < Length; start += 64)
+        {
+            int size = Math.Min(64, Length - start);
+            if (ReadUInt64(start, size) != other.ReadUInt64(start, size)) return false;
+        }
 
         return true;
     }
 
-    public override int GetHashCode()
+    internal int ContentHashCode()
+    {
+        HashCode hash = new();
+        hash.Add(Length);
+        for (int start = 0; start < Length; start += 64) hash.Add(ReadUInt64(start, Math.Min(64, Length - start)));
+
+        return hash.ToHashCode();
+    }
+
+    /// <summary>
+    ///     Bits <paramref name="start" /> to <paramref name="start" /> + <paramref name="size" /> as an unsigned
+    ///     big-endian number, at most 64 bits; the caller checks the range.
+    /// </summary>
+    internal ulong ReadUInt64(int start, int size)
     {
-        int hash = 17;
-        for (int i = 0; i < Data.Length; i++) hash = hash * 31 + Data[i].GetHashCode();
+        if (size == 0) return 0;
 
-        return hash;
+        int position = offset + start;
+        int index = position >> 3;
+        int shift = position & 7;
+        ulong word;
+        if (index + 8 <= bytes.Length)
+        {
+            word = BinaryPrimitives.ReadUInt64BigEndian(bytes.AsSpan(index)) << shift;
+            if (shift + size > 64) word |= (ulong)bytes[index + 8] >> (8 - shift);
+        }
+        else
+        {
+            // Fewer than eight bytes left, so the bits fit in what there is
+            word = 0;
+            for (int i = index; i < bytes.Length; i++) word |= (ulong)bytes[i] << (56 - (i - index) * 8);
+            word <<= shift;
+        }
+
+        return word >> (64 - size);
+    }
+
+    /// <summary>
+    ///     Write the bits, first bit first, to <paramref name="destination" />, zeroing the rest of the last byte.
+    /// </summary>
+    internal void CopyTo(Span<byte> destination)
+    {
+        int count = (Length + 7) / 8;
+        if (count == 0) return;
+
+        if (offset % 8 == 0)
+        {
+            bytes.AsSpan(offset / 8, count).CopyTo(destination);
+        }
+        else
+        {
+            int i = 0;
+            for (; (i + 8) * 8 <= Length; i += 8)
+                BinaryPrimitives.WriteUInt64BigEndian(destination.Slice(i), ReadUInt64(i * 8, 64));
+            for (; i < count; i++)
+            {
+                int size = Math.Min(8, Length - i * 8);
+                destination[i] = (byte)(ReadUInt64(i * 8, size) << (8 - size));
+            }
+        }
+
+        int tail = Length % 8;
+        if (tail != 0) destination[count - 1] &= (byte)(0xFF << (8 - tail));
+    }
+
+    /// <summary>
+    ///     Write the bits into <paramref name="destination" /> from bit <paramref name="position" /> on, leaving the
+    ///     bits around them as they are.
+    /// </summary>
+    internal void WriteTo(byte[] destination, int position)
+    {
+        int start = 0;
+        if (offset % 8 == 0 && position % 8 == 0)
+        {
+            Buffer.BlockCopy(bytes, offset / 8, destination, position / 8, Length / 8);
+            start = Length / 8 * 8;
+        }
+
+        for (; start < Length; start += 64)
+        {
+            int size = Math.Min(64, Length - start);
+            Write(destination, position + start, ReadUInt64(start, size), size);
+        }
+    }
+
+    /// <summary>
+    ///     Write the low <paramref name="size" /> bits of <paramref name="value" />, at most 64, into
+    ///     <paramref name="destination" /> from bit <paramref name="position" /> on.
+    /// </summary>
+    internal static void Write(byte[] destination, int position, ulong value, int size)
+    {
+        if (size == 0) return;
+
+        value <<= 64 - size;
+        int index = position >> 3;
+        int shift = position & 7;
+        if (index + 8 <= destination.Length && shift + size <= 64)
+        {
+            ulong mask = (ulong.MaxValue << (64 - size)) >> shift;
+            Span<byte> span = destination.AsSpan(index);
+            ulong word = BinaryPrimitives.ReadUInt64BigEndian(span);
+            BinaryPrimitives.WriteUInt64BigEndian(span, (word & ~mask) | (value >> shift));
+            return;
+        }
+
+        // Byte by byte near the end of the array or across a ninth byte
+        while (size > 0)
+        {
+            int take = Math.Min(8 - shift, size);
+            int mask = ((0xFF << (8 - take)) & 0xFF) >> shift;
+            destination[index] = (byte)((destination[index] & ~mask) | ((int)(value >> 56) >> shift));
+            value <<= take;
+            size -= take;
+            shift = 0;
+            index++;
+        }
+    }
+
+    BitArray ToBitArray()
+    {
+        return new BitArray(ToBytes(false)) { Length = Length };
+    }
+
+    internal static byte[] FromBitArray(BitArray bits)
+    {
+        byte[] result = new byte[(bits.Length + 7) / 8];
+        bits.CopyTo(result, 0);
+        for (int i = 0; i < result.Length; i++) result[i] = ReversedBits[result[i]];
+        return result;
+    }
+
+    static byte[] BuildReversedBits()
+    {
+        byte[] table = new byte[256];
+        for (int i = 0; i < 256; i++) table[i] = ((byte)i).ReverseBits();
+        return table;
     }
-}
\ No newline at end of file
+}
@@ -1,6 +1,6 @@
 ﻿using System;
+using System.Buffers.Binary;
 using System.Collections;
-using System.Linq;
 using System.Numerics;
 using System.Text;
 using TonSdk.Core.Addresses;
@@ -8,21 +8,52 @@ using TonSdk.Core.Economics;
 
 namespace TonSdk.Core.Boc.bits;
 
-public abstract class BitsBuilderImpl<T, TU>(BitArray bits, int cnt)
+public abstract class BitsBuilderImpl<T, TU>
     where T : BitsBuilderImpl<T, TU>
 {
-    protected BitArray _Data = bits;
-    protected int BitsCnt = cnt;
+    protected int BitsCnt;
 
-    public BitsBuilderImpl(int length = 1023) : this(new BitArray(length), 0)
+    /// <summary>
+    ///     Bits written so far, first bit first in the high bits of each byte, with room for <see cref="Length" />.
+    /// </summary>
+    private protected byte[] buffer;
+
+    public BitsBuilderImpl(int length = 1023) : this(new byte[(length + 7) / 8], length, 0)
+    {
+    }
+
+    public BitsBuilderImpl(BitArray bits, int cnt) : this(Bits.FromBitArray(bits), bits.Length, cnt)
+    {
+    }
+
+    private protected BitsBuilderImpl(byte[] bits, int length, int cnt)
     {
+        buffer = bits;
+        Length = length;
+        BitsCnt = cnt;
     }
 
-    public int Length => _Data.Length;
+    /// <summary>
+    ///     Copy of the whole buffer, <see cref="Length" /> bits. Changing the copy has no effect until it is
+    ///     assigned back, which also sets <see cref="Length" />; the Store methods work on the buffer directly.
+    /// </summary>
+    [Obsolete("_Data returns a copy of the builder's bits: changing it has no effect until it is assigned back. " +
+              "Use the Store methods to write bits and Data to read them.")]
+    protected BitArray _Data
+    {
+        get => new Bits(buffer, 0, Length).Data;
+        set
+        {
+            buffer = Bits.FromBitArray(value);
+            Length = value.Length;
+        }
+    }
 
-    public int RemainderBits => _Data.Length - BitsCnt;
+    public int Length { get; private set; }
 
-    public Bits Data => new(_Data.Slice(0, BitsCnt));
+    public int RemainderBits => Length - BitsCnt;
+
+    public Bits Data => new(buffer.AsSpan(0, (BitsCnt + 7) / 8).ToArray(), 0, BitsCnt);
 
     protected void CheckBitsOverflow(Bits bits)
     {
@@ -68,7 +99,7 @@ public abstract class BitsBuilderImpl<T, TU>(BitArray bits, int cnt)
     public T StoreBit(bool b, bool needCheck = true)
     {
         if (needCheck) CheckBitsOverflow(1);
-        _Data[BitsCnt++] = b;
+        Bits.Write(buffer, BitsCnt++, b ? 1UL : 0, 1);
         return (T)this;
     }
 
@@ -79,13 +110,14 @@ public abstract class BitsBuilderImpl<T, TU>(BitArray bits, int cnt)
 
     public T StoreBytes(byte[] b, bool needCheck = true)
     {
-        Bits bits = new(b);
+        // Written straight from the caller's array, so no copy is needed
+        Bits bits = new(b, 0, b.Length * 8);
         return StoreBits(bits, needCheck);
     }
 
     public T StoreBytes(ReadOnlySpan<byte> b, bool needCheck = true)
     {
-        Bits bits = new(b.ToArray());
+        Bits bits = new(b.ToArray(), 0, b.Length * 8);
         return StoreBits(bits, needCheck);
     }
 
@@ -97,26 +129,27 @@ public abstract class BitsBuilderImpl<T, TU>(BitArray bits, int cnt)
 
     public T StoreUInt(ulong value, int size, bool needCheck = true)
     {
-        BigInteger max = new BigInteger(1) << size;
-        if (value >= max) throw new ArgumentException("");
+        if (size < 0 || (size < 64 && value >> size != 0)) throw new ArgumentException("");
 
-        return StoreNumber(value, size, needCheck);
+        return StoreNumber(value, size, false);
     }
 
     public T StoreUInt(BigInteger value, int size, bool needCheck = true)
     {
-        BigInteger max = new BigInteger(1) << size;
-        if (value < 0 || value >= max) throw new ArgumentException("Value is out of range");
+        if (value < 0 || value.GetBitLength() > size) throw new ArgumentException("Value is out of range");
 
-        return StoreNumber(value, size, needCheck);
+        return StoreNumber(value, size);
     }
 
     public T StoreInt(long value, int size, bool needCheck = true)
     {
-        BigInteger max = BigInteger.One << (size - 1);
-        if (value < -max || value > max) throw new ArgumentException("");
+        if (size < 64)
+        {
+            long max = size < 1 ? 0 : 1L << (size - 1);
+            if (value < -max || value > max) throw new ArgumentException("");
+        }
 
-        return StoreNumber(value, size, needCheck);
+        return StoreNumber((ulong)value, size, value < 0);
     }
 
     public T StoreInt(BigInteger value, int size, bool needCheck = true)
@@ -124,63 +157,61 @@ public abstract class BitsBuilderImpl<T, TU>(BitArray bits, int cnt)
         BigInteger max = BigInteger.One << (size - 1);
         if (value < -max || value > max) throw new ArgumentException("");
 
-        return StoreNumber(value, size, needCheck);
+        return StoreNumber(value, size);
     }
 
     public T StoreUInt32Le(uint value)
     {
-        return StoreBytes(BitConverter.GetBytes(value));
+        return StoreUInt(BinaryPrimitives.ReverseEndianness(value), 32);
     }
 
     public T StoreUInt64Le(ulong value)
     {
-        return StoreBytes(BitConverter.GetBytes(value));
+        return StoreUInt(BinaryPrimitives.ReverseEndianness(value), 64);
     }
 
-    T StoreNumber(BigInteger value, int size, bool needCheck)
+    /// <summary>
+    ///     Store <paramref name="size" /> bits of a two's complement number: the low 64 bits of
+    ///     <paramref name="value" />, preceded by copies of the sign when <paramref name="size" /> is larger.
+    /// </summary>
+    T StoreNumber(ulong value, int size, bool negative)
     {
-        return StoreNumberInternal(value.ToByteArray(), size, needCheck);
-    }
+        CheckBitsOverflow(size);
+        if (size <= 0) return (T)this;
 
-    T StoreNumber(ulong value, int size, bool needCheck)
-    {
-        return StoreNumberInternal(BitConverter.GetBytes(value), size, needCheck);
-    }
+        for (int high = size - 64; high > 0; high -= 64)
+        {
+            int chunk = Math.Min(high, 64);
+            Bits.Write(buffer, BitsCnt, negative ? ulong.MaxValue : 0, chunk);
+            BitsCnt += chunk;
+        }
 
-    T StoreNumber(long value, int size, bool needCheck)
-    {
-        return StoreNumberInternal(BitConverter.GetBytes(value), size, needCheck);
+        int low = Math.Min(size, 64);
+        Bits.Write(buffer, BitsCnt, value, low);
+        BitsCnt += low;
+        return (T)this;
     }
 
-    T StoreNumberInternal(byte[] bytes, int size, bool needCheck)
+    T StoreNumber(BigInteger value, int size)
     {
-        if (BitConverter.IsLittleEndian)
-            Array.Reverse(bytes);
+        bool negative = value.Sign < 0;
+        if (size <= 64)
+            return StoreNumber(value >= long.MinValue && value <= long.MaxValue
+                ? (ulong)(long)value
+                : (ulong)(value & ulong.MaxValue), size, negative);
 
-        BitArray bitArray = new Bits(bytes).Data;
-        int change = size - bitArray.Count;
-
-        if (change < 0)
-        {
-            bool[] boolArray = new bool[bitArray.Count];
-            bitArray.CopyTo(boolArray, 0);
-            bitArray = new BitArray(boolArray.Skip(-change).ToArray());
-        }
-        else
-        {
-            bool sgn = bitArray[0]; // Check sign bit
-            BitArray newBitArray = new(size, sgn);
-            for (int i = 0; i < bitArray.Count; i++) newBitArray[i + change] = bitArray[i];
-            bitArray = newBitArray;
-        }
+        CheckBitsOverflow(size);
+        byte[] bytes = value.ToByteArray(false, true);
+        Bits bits = new(bytes, 0, bytes.Length * 8);
+        if (bits.Length >= size) return StoreBits(bits.Slice(bits.Length - size, bits.Length));
 
-        Bits bits = new(bitArray);
+        StoreNumber(negative ? ulong.MaxValue : 0, size - bits.Length, negative);
         return StoreBits(bits);
     }
 
     public T StoreAddress(Address? address)
     {
-        if (address == null) return StoreBits(new BitArray(2, false));
+        if (address == null) return StoreUInt(0, 2);
 
         CheckBitsOverflow(267);
         StoreUInt(0b100, 3);
@@ -231,16 +262,12 @@ public abstract class BitsBuilderImpl<T, TU>(BitArray bits, int cnt)
 
     protected void Write(Bits newBits, int offset)
     {
-        Write(newBits.Data, offset);
+        newBits.WriteTo(buffer, offset);
     }
 
     protected void Write(BitArray newBits, int offset)
     {
-        // var _newBits = (BitArray)newBits.Clone();
-        // _newBits.Length = _Data.Length;
-        // _newBits.LeftShift(offset);
-        // _Data.Or(_newBits);
-        for (int i = 0; i < newBits.Length; i++) _Data[i + offset] = newBits[i];
+        Write(new Bits(newBits), offset);
     }
 }
 
@@ -250,13 +277,13 @@ public class BitsBuilder : BitsBuilderImpl<BitsBuilder, Bits>
     {
     }
 
-    BitsBuilder(BitArray bits, int cnt) : base(bits, cnt)
+    BitsBuilder(byte[] bits, int length, int cnt) : base(bits, length, cnt)
     {
     }
 
     public override BitsBuilder Clone()
     {
-        return new BitsBuilder((BitArray)_Data.Clone(), BitsCnt);
+        return new BitsBuilder((byte[])buffer.Clone(), Length, BitsCnt);
     }
 
     public override Bits Build()
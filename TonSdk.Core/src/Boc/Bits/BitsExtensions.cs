@@ -56,19 +56,12 @@ public class BitsEqualityComparer : IEqualityComparer<Bits>
 {
     public bool Equals(Bits x, Bits y)
     {
-        if (x.Length != y.Length)
-            return false;
-        for (int i = 0; i < x.Length; i++)
-            if (x.Data[i] != y.Data[i])
-                return false;
-
-        return true;
+        return x.SequenceEqual(y);
     }
 
     public int GetHashCode(Bits obj)
     {
-        Bits bits = obj.Hash();
-        return bits.GetCopyTo(new int[8])[0];
+        return obj.ContentHashCode();
     }
 }
 
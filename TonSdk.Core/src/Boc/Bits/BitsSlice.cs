@@ -1,4 +1,5 @@
 ﻿using System;
+using System.Buffers.Binary;
 using System.Collections;
 using System.Numerics;
 using System.Text;
@@ -34,7 +35,7 @@ public abstract class BitsSliceImpl<T, TU> where T : BitsSliceImpl<T, TU>
 
     public int RemainderBits => BitsEn - BitsSt;
 
-    public Bits Bits => new(__Bits.Data.Slice(BitsSt, BitsEn));
+    public Bits Bits => __Bits.Slice(BitsSt, BitsEn);
 
     protected void CheckBitsUnderflow(int bitEnd)
     {
@@ -65,7 +66,7 @@ public abstract class BitsSliceImpl<T, TU> where T : BitsSliceImpl<T, TU>
         CheckSize(size);
         int bitEnd = BitsSt + size;
         CheckBitsUnderflow(bitEnd);
-        return new Bits(__Bits.Data.Slice(BitsSt, bitEnd));
+        return __Bits.Slice(BitsSt, bitEnd);
     }
 
     public Bits LoadBits(int size)
@@ -73,9 +74,9 @@ public abstract class BitsSliceImpl<T, TU> where T : BitsSliceImpl<T, TU>
         CheckSize(size);
         int bitEnd = BitsSt + size;
         CheckBitsUnderflow(bitEnd);
-        BitArray bits = __Bits.Data.Slice(BitsSt, bitEnd);
+        Bits bits = __Bits.Slice(BitsSt, bitEnd);
         BitsSt = bitEnd;
-        return new Bits(bits);
+        return bits;
     }
 
     public T SkipBit()
@@ -87,21 +88,21 @@ public abstract class BitsSliceImpl<T, TU> where T : BitsSliceImpl<T, TU>
     {
         int bitEnd = BitsSt + 1;
         CheckBitsUnderflow(bitEnd);
-        return __Bits.Data[BitsSt];
+        return __Bits[BitsSt];
     }
 
     public bool ReadBit(int idx)
     {
         int bitEnd = BitsSt + idx + 1;
         CheckBitsUnderflow(bitEnd);
-        return __Bits.Data[BitsSt + idx];
+        return __Bits[BitsSt + idx];
     }
 
     public bool LoadBit()
     {
         int bitEnd = BitsSt + 1;
         CheckBitsUnderflow(bitEnd);
-        bool bit = __Bits.Data[BitsSt];
+        bool bit = __Bits[BitsSt];
         BitsSt = bitEnd;
         return bit;
     }
@@ -310,22 +311,21 @@ public abstract class BitsSliceImpl<T, TU> where T : BitsSliceImpl<T, TU>
 
     BigInteger _unsafeReadBigInteger(int size, bool sgn = false, bool le = false)
     {
-        BigInteger result = 0;
-
-        if (le)
-        {
-            BitArray bits = new(LoadBits(size).ToBytes());
-            for (int i = 0; i < size; i++)
-                if (bits[i])
-                    result |= BigInteger.One << i;
-        }
-        else
+        if (size <= 64)
         {
-            for (int i = 0; i < size; i++)
-                if (__Bits.Data[BitsSt + i])
-                    result |= BigInteger.One << (size - 1 - i);
+            ulong value = __Bits.ReadUInt64(BitsSt, size);
+            if (le) value = BinaryPrimitives.ReverseEndianness(value) >> (64 - size);
+
+            // Negative when the most significant bit is set: extend the sign to 64 bits
+            if (!sgn || size == 0 || value >> (size - 1) == 0) return value;
+            return (long)(value | (size == 64 ? 0 : ulong.MaxValue << size));
         }
 
+        byte[] bytes = __Bits.Slice(BitsSt, BitsSt + size).ToBytes();
+        BigInteger result = le
+            ? new BigInteger(bytes, true)
+            : new BigInteger(bytes, true, true) >> (bytes.Length * 8 - size);
+
         // Check if the most significant bit is set (which means the number is negative)
         if (sgn & ((result & (BigInteger.One << (size - 1))) != 0))
             // If the number is negative, apply two's complement
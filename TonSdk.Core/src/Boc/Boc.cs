@@ -1,7 +1,10 @@
 ﻿using System;
+using System.Buffers;
+using System.Buffers.Binary;
 using System.Collections.Generic;
+using System.IO;
 using System.Linq;
-using JustCRC32C;
+using System.Runtime.InteropServices;
 using TonSdk.Core.Boc.bits;
 using TonSdk.Core.Boc.Cells;
 
@@ -9,166 +12,45 @@ namespace TonSdk.Core.Boc;
 
 public static class BagOfCells
 {
-    const uint BocConstructor = 0xb5ee9c72;
+    internal const uint BocConstructor = 0xb5ee9c72;
 
-    static BocHeader DeserializeHeader(Bits headerBits)
-    {
-        BitsSlice hs = headerBits.Parse();
-        if ((uint)hs.LoadUInt(32) != BocConstructor) throw new Exception("Unknown BOC constructor");
-
-        bool hasIdx = hs.LoadBit();
-        bool hasCrc32C = hs.LoadBit();
-        bool hasCacheBits = hs.LoadBit();
-        byte flags = (byte)hs.LoadUInt(2);
-        if (flags != 0) throw new Exception("Unknown flags");
-        byte sizeBytes = (byte)hs.LoadUInt(3);
-        if (sizeBytes > 4) throw new Exception("Invalid size");
-        byte offsetBytes = (byte)hs.LoadUInt(8);
-        if (offsetBytes > 8) throw new Exception("Invalid offset");
-        uint cellsNum = (uint)hs.LoadUInt(sizeBytes * 8);
-        uint rootsNum = (uint)hs.LoadUInt(sizeBytes * 8);
-        if (rootsNum < 1) throw new Exception("Invalid rootsNum");
-        uint absentNum = (uint)hs.LoadUInt(sizeBytes * 8);
-        if (rootsNum + absentNum > cellsNum) throw new Exception("Invalid absentNum");
-        ulong totalCellsSize = (ulong)hs.LoadUInt(offsetBytes * 8);
-
-        ulong calcRemainderBits = rootsNum * sizeBytes * 8
-                                  + totalCellsSize * 8
-                                  + (hasIdx ? cellsNum * offsetBytes * 8 : 0)
-                                  + (ulong)(hasCrc32C ? 32 : 0);
-
-        if ((ulong)hs.RemainderBits != calcRemainderBits) throw new Exception("Invalid BOC size");
-
-        uint[] rootList = new uint[rootsNum];
-        for (int i = 0; i < rootsNum; i++) rootList[i] = (uint)hs.LoadUInt(sizeBytes * 8);
-
-        if (hasIdx) hs.SkipBits((int)(cellsNum * offsetBytes * 8));
-
-        Bits cellsData = hs.LoadBits((int)(totalCellsSize * 8));
-
-        if (hasCrc32C)
-        {
-            Bits crc32Bits = headerBits.Slice(0, -32);
-            //Console.WriteLine(hs.RemainderBits);
-            uint crc32C = (uint)hs.LoadUInt32Le();
-            uint crc32CCalc = Crc32C.Calculate(crc32Bits.ToBytes());
-            //Console.WriteLine(crc32c);
-            //Console.WriteLine(crc32c_calc);
-            if (crc32C != crc32CCalc) throw new Exception("Invalid CRC32C");
-        }
-
-        return new BocHeader
-        {
-            HasIdx = hasIdx,
-            HasCrc32C = hasCrc32C,
-            HasCacheBits = hasCacheBits,
-            Flags = flags,
-            SizeBytes = sizeBytes,
-            OffsetBytes = offsetBytes,
-            CellsNum = cellsNum,
-            RootsNum = rootsNum,
-            AbsentNum = absentNum,
-            TotalCellsSize = totalCellsSize,
-            RootList = rootList,
-            CellsData = cellsData
-        };
-    }
-
-    static RawCell DeserializeCell(BitsSlice dataSlice, ushort refIndexSize)
+    public static Cell[] DeserializeBoc(Bits data)
     {
-        if (dataSlice.RemainderBits < 2) throw new Exception("BOC not enough bytes to encode cell descriptors");
-
-        uint refsDescriptor = (uint)dataSlice.LoadUInt(8);
-        uint level = refsDescriptor >> 5;
-        uint totalRefs = refsDescriptor & 7;
-        bool hasHashes = (refsDescriptor & 16) != 0;
-        bool isExotic = (refsDescriptor & 8) != 0;
-        bool isAbsent = totalRefs == 7 && hasHashes;
-
-        if (isAbsent) throw new Exception("BoC can't deserialize absent cell");
-
-        if (totalRefs > 4) throw new Exception($"BoC cell can't has more than 4 refs {totalRefs}");
-
-        uint bitsDescriptor = (uint)dataSlice.LoadUInt(8);
-        bool isAugmented = (bitsDescriptor & 1) != 0;
-        long dataSize = (bitsDescriptor >> 1) + (isAugmented ? 1 : 0);
-        uint hashesSize = hasHashes ? (level + 1) * 32 : 0;
-        uint depthSize = hasHashes ? (level + 1) * 2 : 0;
-
-        if (dataSlice.RemainderBits < hashesSize + depthSize + dataSize + refIndexSize * totalRefs)
-            throw new Exception("BoC not enough bytes to encode cell data");
-
-        if (hasHashes) dataSlice.SkipBits((int)(hashesSize + depthSize));
-
-        Bits data = isAugmented
-            ? dataSlice.LoadBits((int)dataSize * 8).Rollback()
-            : dataSlice.LoadBits((int)dataSize * 8);
-
-        if (isExotic && data.Length < 8) throw new Exception("BoC not enough bytes for an exotic cell type");
-
-        CellType type = isExotic ? (CellType)(int)data.Slice(0, 8).Parse().LoadInt(8) : CellType.Ordinary;
-
-        if (isExotic && type == CellType.Ordinary)
-            throw new Exception("BoC an exotic cell can't be of ordinary type");
-
-        ulong[] refs = new ulong[totalRefs];
-        for (int i = 0; i < totalRefs; i++) refs[i] = (ulong)dataSlice.LoadUInt(refIndexSize * 8);
-
-        return new RawCell
-        {
-            Type = type,
-            Builder = new CellBuilder(data.Length).StoreBits(data),
-            Refs = refs
-        };
+        return DeserializeBoc(data.ToBytes());
     }
 
-    public static Cell[] DeserializeBoc(Bits data)
+    /// <summary>
+    ///     Deserialize every cell of a BoC and return the roots.
+    /// </summary>
+    public static Cell[] DeserializeBoc(ReadOnlyMemory<byte> data)
     {
-        BocHeader headers = DeserializeHeader(data);
-        RawCell[] rawCells = new RawCell[headers.CellsNum];
-
-        BitsSlice cellsDataSlice = headers.CellsData.Parse();
+        BocReader reader = new(data);
+        Cell[] cells = new Cell[reader.CellsNum];
 
-        for (int i = 0; i < headers.CellsNum; i++) rawCells[i] = DeserializeCell(cellsDataSlice, headers.SizeBytes);
-
-        for (int i = (int)(headers.CellsNum - 1); i >= 0; i--)
+        // References always point further into the BoC, so building from the end finds every child ready
+        for (int i = reader.CellsNum - 1; i >= 0; i--)
         {
-            foreach (ulong refIndex in rawCells[i].Refs)
-            {
-                if (refIndex >= (ulong)rawCells.Length)
-                    throw new Exception(
-                        $"BOC deserialization error: Reference index {refIndex} is out of bounds (total cells: {rawCells.Length})");
-
-                RawCell rawRefCell = rawCells[refIndex];
-                if (refIndex < (ulong)i) throw new Exception("Topological order is broken");
-
-                rawCells[i].Builder.StoreRef(rawRefCell.Builder.Build());
-            }
+            RawCellInfo info = reader.ReadCell(i);
+            Cell[] refs = info.RefsCount == 0 ? Array.Empty<Cell>() : new Cell[info.RefsCount];
+            for (int r = 0; r < refs.Length; r++) refs[r] = cells[reader.ReadRef(info, i, r)];
 
-            rawCells[i].Cell = rawCells[i].Builder.Build();
+            cells[i] = new Cell(reader.ReadBits(info), refs, reader.ReadType(info));
         }
 
-        return headers.RootList.Select(i => rawCells[i].Cell!).ToArray();
+        return reader.Roots.Select(i => cells[i]).ToArray();
     }
 
-
-    static Bits SerializeCell(Cell cell, Dictionary<Bits, int> cellsIndex, int refSize)
+    /// <summary>
+    ///     Open a BoC without building its cells. Only the header is read (and the CRC32C checked when present and
+    ///     <paramref name="verifyCrc32C" /> is set); each <see cref="LazyCell" /> decodes its data and references on
+    ///     first access, locating cells through the has_idx index when the BoC has one.
+    /// </summary>
+    public static LazyCell[] DeserializeLazy(ReadOnlyMemory<byte> data, bool verifyCrc32C = true)
     {
-        Bits ret = cell.BitsWithDescriptors;
-        refSize *= 8;
-        int l = ret.Length + cell.RefsCount * refSize;
-        BitsBuilder b = new BitsBuilder(l).StoreBits(ret);
-        foreach (Cell refCell in cell.Refs)
-        {
-            Bits refHash = refCell.Hash;
-            int refIndex = cellsIndex[refHash];
-            b.StoreUInt(refIndex, refSize);
-        }
-
-        return b.Build();
+        LazyBoc boc = new(new BocReader(data, verifyCrc32C));
+        return boc.Reader.Roots.Select(boc.GetCell).ToArray();
     }
 
-
     public static Bits SerializeBoc(
         Cell root,
         bool hasIdx = false,
@@ -178,77 +60,74 @@ public static class BagOfCells
         return SerializeBoc(new[] { root }, hasIdx, hasCrc32C);
     }
 
-
-    static (List<(Bits, Cell)> sortedCells, Dictionary<Bits, int> hashToIndex)
-        TopologicalSort(Cell[] roots)
+    public static Bits SerializeBoc(
+        Cell[] roots,
+        bool hasIdx = false,
+        bool hasCrc32C = true
+    )
     {
-        // List of already sorted vertices of the graph
-        List<(Bits, Cell)> sortedCells = new();
-        // Dictionary that maps the cell hash to its index in the sorted list
-        Dictionary<Bits, int> hashToIndex = new(new BitsEqualityComparer());
-
-        // Recursive function for graph traversal and topological sorting
-        void visitCell(Cell cell)
-        {
-            foreach (Cell neighbor in cell.Refs)
-                if (!hashToIndex.ContainsKey(neighbor.Hash))
-                    visitCell(neighbor);
-
-            // Check that the cell is not yet added to the list of sorted cells
-            if (!hashToIndex.ContainsKey(cell.Hash))
-            {
-                // Add the cell to the beginning of the list of sorted cells
-                sortedCells.Insert(0, (cell.Hash, cell));
-                // Shift the already added cells one position to the right
-                for (int i = 1; i < sortedCells.Count; i++) hashToIndex[sortedCells[i].Item2.Hash]++;
-
-                // Add the cell to the hashToIndex dictionary
-                hashToIndex[cell.Hash] = 0;
-            }
-        }
-
-        // Perform traversal and topological sorting for each vertex of the graph
-        for (int i = roots.Length - 1; i > -1; i--)
-        {
-            // foreach (var rootCell in roots) {
-            Cell rootCell = roots[i];
-            foreach (Cell cell in rootCell.Refs) visitCell(cell);
+        ArrayBufferWriter<byte> output = new();
+        SerializeBoc(roots, output, hasIdx, hasCrc32C);
+        return new Bits(output.WrittenSpan.ToArray(), 0, output.WrittenCount * 8);
+    }
 
-            visitCell(rootCell);
-        }
+    public static void SerializeBoc(
+        Cell root,
+        IBufferWriter<byte> output,
+        bool hasIdx = false,
+        bool hasCrc32C = true
+    )
+    {
+        SerializeBoc(new[] { root }, output, hasIdx, hasCrc32C);
+    }
 
-        return (sortedCells, hashToIndex);
+    public static void SerializeBoc(
+        Cell root,
+        Stream output,
+        bool hasIdx = false,
+        bool hasCrc32C = true
+    )
+    {
+        SerializeBoc(new[] { root }, output, hasIdx, hasCrc32C);
     }
 
+    public static void SerializeBoc(
+        Cell[] roots,
+        Stream output,
+        bool hasIdx = false,
+        bool hasCrc32C = true
+    )
+    {
+        StreamBufferWriter writer = new(output);
+        SerializeBoc(roots, writer, hasIdx, hasCrc32C);
+        writer.Flush();
+    }
 
-    public static Bits SerializeBoc(
+    /// <summary>
+    ///     Serialize the cells reachable from <paramref name="roots" /> straight into <paramref name="output" />, one
+    ///     cell at a time, with the CRC32C computed as the bytes are written. Cells with equal hashes are stored once.
+    /// </summary>
+    public static void SerializeBoc(
         Cell[] roots,
+        IBufferWriter<byte> output,
         bool hasIdx = false,
         bool hasCrc32C = true
         // bool hasCacheBits = false    // always false
         // uint flags = 0               // always 0
     )
     {
+        if (roots.Length == 0) throw new ArgumentException("BoC needs at least one root", nameof(roots));
+
         const bool hasCacheBits = false;
         const uint flags = 0;
-        (List<(Bits, Cell)> sortedCells, Dictionary<Bits, int> indexHashmap) = TopologicalSort(roots);
+        (List<Cell> finished, Dictionary<Cell, int> positions) = TopologicalSort(roots);
 
-        int cellsNum = sortedCells.Count;
+        int cellsNum = finished.Count;
         int sBytes = (cellsNum.BitLength() + 7) / 8;
 
-        int[] offsets = new int[cellsNum];
-        int totalSize = 0;
-        BitsBuilder dataBuilder = new(cellsNum * (16 + 1024 + sBytes * 8 * 4));
-        for (int i = 0; i < cellsNum; i++)
-        {
-            Bits serializedCell = SerializeCell(sortedCells[i].Item2, indexHashmap, sBytes);
-            dataBuilder.StoreBits(serializedCell);
-            totalSize += serializedCell.Length / 8;
-            offsets[i] = totalSize;
-        }
-
-        Bits dataBits = dataBuilder.Build();
-        int offsetBytes = Math.Max((dataBits.Length.BitLength() + 7) / 8, 1);
+        long totalSize = 0;
+        foreach (Cell cell in finished) totalSize += SerializedSize(cell, sBytes);
+        int offsetBytes = Math.Max((BitLength(totalSize * 8) + 7) / 8, 1);
 
         /*
           serialized_boc#b5ee9c72 has_idx:(## 1) has_crc32c:(## 1)
@@ -265,62 +144,184 @@ public static class BagOfCells
                                   crc32c:has_crc32c?uint32
                                   = BagOfCells;
          */
-        int l = 32 + 1 + 1 + 1 + 2 + 3 + 8 + sBytes * 8 + sBytes * 8 + sBytes * 8 + offsetBytes * 8 +
-                roots.Length * sBytes * 8 + (hasIdx ? 1 : 0) * cellsNum * offsetBytes * 8 + dataBits.Length +
-                (hasCrc32C ? 1 : 0) * 32;
-        BitsBuilder bocBuilder = new BitsBuilder(l)
-            .StoreUInt(BocConstructor, 32, false) // serialized_boc#b5ee9c72
-            .StoreBit(hasIdx, false) // has_idx:(## 1)
-            .StoreBit(hasCrc32C, false) // has_crc32c:(## 1)
-            .StoreBit(hasCacheBits, false) // has_cache_bits:(## 1)
-            .StoreUInt(flags, 2, false) // flags:(## 2) { flags = 0 }
-            .StoreUInt(sBytes, 3, false) // size:(## 3) { size <= 4 }
-            .StoreUInt(offsetBytes, 8, false) // off_bytes:(## 8) { off_bytes <= 8 }
-            .StoreUInt(cellsNum, sBytes * 8, false) // cells:(##(size * 8))
-            .StoreUInt(roots.Length, sBytes * 8) // roots:(##(size * 8)) { roots >= 1 }
-            .StoreUInt(0, sBytes * 8, false) // ??? absent:(##(size * 8)) { roots + absent <= cells }
-            .StoreUInt(dataBits.Length / 8, offsetBytes * 8, false); // tot_cells_size:(##(off_bytes * 8))
-
-        foreach (Cell rootCell in roots)
-            bocBuilder.StoreUInt(indexHashmap[rootCell.Hash], sBytes * 8,
-                false); // root_list:(roots * ##(size * 8))
+        BocSink sink = new(output, hasCrc32C);
+
+        Span<byte> header = sink.GetSpan(6 + 3 * sBytes + offsetBytes);
+        BinaryPrimitives.WriteUInt32BigEndian(header, BocConstructor); // serialized_boc#b5ee9c72
+        header[4] = (byte)((hasIdx ? 0x80 : 0) | (hasCrc32C ? 0x40 : 0) | (hasCacheBits ? 0x20 : 0) |
+                           (int)(flags << 3) | sBytes);
+        header[5] = (byte)offsetBytes;
+        WriteUInt(header.Slice(6, sBytes), (ulong)cellsNum);
+        WriteUInt(header.Slice(6 + sBytes, sBytes), (ulong)roots.Length);
+        WriteUInt(header.Slice(6 + 2 * sBytes, sBytes), 0); // absent
+        WriteUInt(header.Slice(6 + 3 * sBytes, offsetBytes), (ulong)totalSize);
+        sink.Advance(header.Slice(0, 6 + 3 * sBytes + offsetBytes));
+
+        // Cells were collected in the order the search finished them; the BoC lists them the other way round
+        int last = cellsNum - 1;
+        foreach (Cell root in roots)
+        {
+            Span<byte> span = sink.GetSpan(sBytes).Slice(0, sBytes);
+            WriteUInt(span, (ulong)(last - positions[root]));
+            sink.Advance(span);
+        }
 
         if (hasIdx)
-            foreach (int offset in offsets)
-                bocBuilder.StoreUInt(offset, offsetBytes * 8, false); // index:has_idx?(cells * ##(off_bytes * 8))
+        {
+            long offset = 0;
+            for (int i = last; i >= 0; i--)
+            {
+                offset += SerializedSize(finished[i], sBytes);
+                Span<byte> span = sink.GetSpan(offsetBytes).Slice(0, offsetBytes);
+                WriteUInt(span, (ulong)offset);
+                sink.Advance(span);
+            }
+        }
 
-        bocBuilder.StoreBits(dataBits, false); // cell_data:(tot_cells_size * [ uint8 ])
+        for (int i = last; i >= 0; i--)
+        {
+            Cell cell = finished[i];
+            int size = SerializedSize(cell, sBytes);
+            Span<byte> span = sink.GetSpan(size);
+
+            span[0] = (byte)(cell.RefsCount + (cell.IsExotic ? 8 : 0));
+            span[1] = (byte)cell.FullData;
+            int position = 2 + WriteData(cell.Bits, span.Slice(2));
+            foreach (Cell child in cell.Refs)
+            {
+                WriteUInt(span.Slice(position, sBytes), (ulong)(last - positions[child]));
+                position += sBytes;
+            }
+
+            sink.Advance(span.Slice(0, size));
+        }
 
         if (hasCrc32C)
         {
-            uint crc32C = Crc32C.Calculate(bocBuilder.Build().Augment().ToBytes());
-            bocBuilder.StoreUInt32Le(crc32C); // crc32c:has_crc32c?uint32
+            uint crc32C = sink.Crc32C;
+            BinaryPrimitives.WriteUInt32LittleEndian(output.GetSpan(4), crc32C); // crc32c:has_crc32c?uint32
+            output.Advance(4);
+        }
+    }
+
+    /// <summary>
+    ///     Order the cells reachable from the roots so that every cell comes before the cells it references.
+    ///     Depth-first search with an explicit stack, so deep trees can't overflow the call stack, in O(cells + refs);
+    ///     cells with equal hashes are visited once and share a position.
+    /// </summary>
+    /// <returns>
+    ///     The cells in the order the search finished them, the reverse of the BoC order, and the position there of
+    ///     every cell object met.
+    /// </returns>
+    static (List<Cell> finished, Dictionary<Cell, int> positions) TopologicalSort(Cell[] roots)
+    {
+        List<Cell> finished = new();
+        Dictionary<Cell, int> positions = new(ReferenceEqualityComparer.Instance);
+        Dictionary<HashKey, int> hashPositions = new();
+        Stack<(Cell cell, HashKey key, int next)> path = new();
+
+        // Known cells get their position; an unseen one is pushed to be visited
+        void Discover(Cell cell)
+        {
+            if (positions.ContainsKey(cell)) return;
+
+            HashKey key = HashKey.From(cell.Hash);
+            if (hashPositions.TryGetValue(key, out int position))
+                positions[cell] = position;
+            else
+                path.Push((cell, key, 0));
+        }
+
+        // The last root is finished first, so the first one ends up at index 0
+        for (int i = roots.Length - 1; i >= 0; i--)
+        {
+            Discover(roots[i]);
+            while (path.Count > 0)
+            {
+                (Cell cell, HashKey key, int next) = path.Pop();
+                if (next < cell.RefsCount)
+                {
+                    path.Push((cell, key, next + 1));
+                    Discover(cell.Refs[next]);
+                    continue;
+                }
+
+                positions[cell] = finished.Count;
+                hashPositions[key] = finished.Count;
+                finished.Add(cell);
+            }
         }
 
-        return bocBuilder.Build();
+        return (finished, positions);
+    }
+
+    static int SerializedSize(Cell cell, int refSize)
+    {
+        return 2 + (cell.BitsCount + 7) / 8 + cell.RefsCount * refSize;
+    }
+
+    /// <summary>
+    ///     Write the data bits of a cell, augmented to whole bytes, and return the number of bytes written.
+    /// </summary>
+    static int WriteData(Bits bits, Span<byte> destination)
+    {
+        int length = bits.Length;
+        int bytes = (length + 7) / 8;
+
+        bits.CopyTo(destination);
+        int tail = length % 8;
+        if (tail != 0) destination[bytes - 1] |= (byte)(0x80 >> tail);
+
+        return bytes;
     }
 
-    struct BocHeader
+    static void WriteUInt(Span<byte> destination, ulong value)
     {
-        public bool HasIdx;
-        public bool HasCrc32C;
-        public bool HasCacheBits;
-        public byte Flags;
-        public byte SizeBytes;
-        public byte OffsetBytes;
-        public uint CellsNum;
-        public uint RootsNum;
-        public uint AbsentNum;
-        public ulong TotalCellsSize;
-        public uint[] RootList;
-        public Bits CellsData;
+        for (int i = destination.Length - 1; i >= 0; i--, value >>= 8) destination[i] = (byte)value;
     }
 
-    struct RawCell
+    static int BitLength(long x)
     {
-        public Cell? Cell;
-        public CellType Type;
-        public CellBuilder Builder;
-        public ulong[] Refs;
+        int length = 1;
+        while ((x >>= 1) != 0) length++;
+        return length;
+    }
+
+    /// <summary>
+    ///     Cell hash as a dictionary key.
+    /// </summary>
+    readonly record struct HashKey(int A, int B, int C, int D, int E, int F, int G, int H)
+    {
+        public static HashKey From(Bits hash)
+        {
+            Span<byte> bytes = stackalloc byte[CellTraits.hash_bytes];
+            hash.CopyTo(bytes);
+            ReadOnlySpan<int> words = MemoryMarshal.Cast<byte, int>(bytes);
+            return new HashKey(words[0], words[1], words[2], words[3], words[4], words[5], words[6], words[7]);
+        }
+    }
+
+    /// <summary>
+    ///     Output of the serializer, feeding the CRC32C with every byte written.
+    /// </summary>
+    struct BocSink(IBufferWriter<byte> output, bool hasCrc32C)
+    {
+        Crc32CAccumulator crc = Crc32CAccumulator.Create();
+
+        public uint Crc32C => crc.Result;
+
+        public Span<byte> GetSpan(int size)
+        {
+            return output.GetSpan(size);
+        }
+
+        /// <summary>
+        ///     Commit the bytes written to the start of the last span.
+        /// </summary>
+        public void Advance(ReadOnlySpan<byte> written)
+        {
+            if (hasCrc32C) crc.Append(written);
+            output.Advance(written.Length);
+        }
     }
 }
\ No newline at end of file
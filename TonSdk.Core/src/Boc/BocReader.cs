@@ -0,0 +1,236 @@
+using System;
+using System.Buffers.Binary;
+using System.Numerics;
+using TonSdk.Core.Boc.bits;
+using TonSdk.Core.Boc.Cells;
+
+namespace TonSdk.Core.Boc;
+
+/// <summary>
+///     Byte-aligned reader over a serialized bag of cells. The header is validated up front; cells are located
+///     through the has_idx index when the BoC carries one, or through offsets collected by one pass over the cell
+///     descriptors, and are only decoded when asked for.
+/// </summary>
+internal sealed class BocReader
+{
+    readonly ReadOnlyMemory<byte> data;
+    readonly bool hasCacheBits;
+    readonly int cellsEnd;
+    readonly int cellsStart;
+    readonly int indexStart;
+    readonly int offsetBytes;
+    int[]? offsets;
+
+    public BocReader(ReadOnlyMemory<byte> data, bool verifyCrc32C = true)
+    {
+        this.data = data;
+        ReadOnlySpan<byte> span = data.Span;
+        if (span.Length < 6 || BinaryPrimitives.ReadUInt32BigEndian(span) != BagOfCells.BocConstructor)
+            throw new Exception("Unknown BOC constructor");
+
+        HasIdx = (span[4] & 0x80) != 0;
+        bool hasCrc32C = (span[4] & 0x40) != 0;
+        hasCacheBits = (span[4] & 0x20) != 0;
+        if ((span[4] & 0x18) != 0) throw new Exception("Unknown flags");
+        SizeBytes = span[4] & 7;
+        if (SizeBytes is 0 or > 4) throw new Exception("Invalid size");
+        offsetBytes = span[5];
+        if (offsetBytes is 0 or > 8) throw new Exception("Invalid offset");
+
+        int position = 6;
+        if (span.Length < position + 3 * SizeBytes + offsetBytes) throw new Exception("Invalid BOC size");
+        ulong cellsNum = ReadUInt(span, ref position, SizeBytes);
+        ulong rootsNum = ReadUInt(span, ref position, SizeBytes);
+        if (rootsNum < 1) throw new Exception("Invalid rootsNum");
+        ulong absentNum = ReadUInt(span, ref position, SizeBytes);
+        if (rootsNum + absentNum > cellsNum) throw new Exception("Invalid absentNum");
+        ulong totalCellsSize = ReadUInt(span, ref position, offsetBytes);
+
+        // Every cell takes at least its two descriptor bytes, so a count the data can't hold is rejected before any
+        // per-cell allocation
+        if (cellsNum > int.MaxValue || totalCellsSize > (ulong)span.Length || cellsNum * 2 > totalCellsSize)
+            throw new Exception("Invalid BOC size");
+
+        ulong remainder = rootsNum * (ulong)SizeBytes + totalCellsSize +
+                          (HasIdx ? cellsNum * (ulong)offsetBytes : 0) + (hasCrc32C ? 4UL : 0);
+        if ((ulong)(span.Length - position) != remainder) throw new Exception("Invalid BOC size");
+
+        CellsNum = (int)cellsNum;
+        Roots = new int[rootsNum];
+        for (int i = 0; i < Roots.Length; i++)
+        {
+            Roots[i] = (int)ReadUInt(span, ref position, SizeBytes);
+            if (Roots[i] >= CellsNum) throw new Exception("Invalid root index");
+        }
+
+        indexStart = position;
+        cellsStart = position + (HasIdx ? CellsNum * offsetBytes : 0);
+        cellsEnd = cellsStart + (int)totalCellsSize;
+
+        if (hasCrc32C && verifyCrc32C)
+        {
+            Crc32CAccumulator crc = Crc32CAccumulator.Create();
+            crc.Append(span.Slice(0, span.Length - 4));
+            if (BinaryPrimitives.ReadUInt32LittleEndian(span.Slice(span.Length - 4)) != crc.Result)
+                throw new Exception("Invalid CRC32C");
+        }
+    }
+
+    public bool HasIdx { get; }
+    public int SizeBytes { get; }
+    public int CellsNum { get; }
+    public int[] Roots { get; }
+
+    /// <summary>
+    ///     Descriptor of cell <paramref name="index" />, with the positions of its parts.
+    /// </summary>
+    public RawCellInfo ReadCell(int index)
+    {
+        if ((uint)index >= (uint)CellsNum)
+            throw new Exception(
+                $"BOC deserialization error: Reference index {index} is out of bounds (total cells: {CellsNum})");
+
+        int offset = CellOffset(index);
+        ReadOnlySpan<byte> span = data.Span;
+        if (offset + 2 > cellsEnd) throw new Exception("BOC not enough bytes to encode cell descriptors");
+
+        RawCellInfo cell = new(span[offset], span[offset + 1], offset, SizeBytes);
+        if (cell.IsAbsent) throw new Exception("BoC can't deserialize absent cell");
+        if (cell.RefsCount > CellTraits.max_refs)
+            throw new Exception($"BoC cell can't has more than 4 refs {cell.RefsCount}");
+        if (cell.End > cellsEnd) throw new Exception("BoC not enough bytes to encode cell data");
+        if (cell.IsExotic && cell.DataLength == 0) throw new Exception("BoC not enough bytes for an exotic cell type");
+
+        return cell;
+    }
+
+    public ReadOnlySpan<byte> Span(int offset, int length)
+    {
+        return data.Span.Slice(offset, length);
+    }
+
+    public ReadOnlyMemory<byte> Memory(int offset, int length)
+    {
+        return data.Slice(offset, length);
+    }
+
+    /// <summary>
+    ///     Index of reference <paramref name="i" /> of <paramref name="cell" />, which must come after the cell itself.
+    /// </summary>
+    public int ReadRef(in RawCellInfo cell, int index, int i)
+    {
+        int position = cell.RefsOffset + i * SizeBytes;
+        ulong child = ReadUInt(data.Span, ref position, SizeBytes);
+        if (child >= (ulong)CellsNum)
+            throw new Exception(
+                $"BOC deserialization error: Reference index {child} is out of bounds (total cells: {CellsNum})");
+        if (child <= (ulong)index) throw new Exception("Topological order is broken");
+
+        return (int)child;
+    }
+
+    /// <summary>
+    ///     Data bits of the cell, with the completion tag of augmented data removed.
+    /// </summary>
+    public Bits ReadBits(in RawCellInfo cell)
+    {
+        byte[] bytes = data.Span.Slice(cell.DataOffset, cell.DataLength).ToArray();
+
+        int length = bytes.Length * 8;
+        if (cell.IsAugmented)
+        {
+            byte last = bytes.Length == 0 ? (byte)0 : bytes[bytes.Length - 1];
+            if (last == 0) throw new Exception("Incorrectly augmented bits.");
+            length -= BitOperations.TrailingZeroCount(last) + 1;
+        }
+
+        return new Bits(bytes, 0, length);
+    }
+
+    public CellType ReadType(in RawCellInfo cell)
+    {
+        if (!cell.IsExotic) return CellType.Ordinary;
+
+        CellType type = (CellType)(int)(sbyte)data.Span[cell.DataOffset];
+        if (type == CellType.Ordinary) throw new Exception("BoC an exotic cell can't be of ordinary type");
+        return type;
+    }
+
+    int CellOffset(int index)
+    {
+        if (HasIdx)
+        {
+            if (index == 0) return cellsStart;
+
+            // The index holds the end offset of every cell, doubled when a cache bit is appended
+            int position = indexStart + (index - 1) * offsetBytes;
+            ulong end = ReadUInt(data.Span, ref position, offsetBytes);
+            return cellsStart + (int)(hasCacheBits ? end >> 1 : end);
+        }
+
+        offsets ??= CollectOffsets();
+        return offsets[index];
+    }
+
+    int[] CollectOffsets()
+    {
+        ReadOnlySpan<byte> span = data.Span;
+        int[] result = new int[CellsNum];
+        int offset = cellsStart;
+        for (int i = 0; i < CellsNum; i++)
+        {
+            if (offset + 2 > cellsEnd) throw new Exception("BOC not enough bytes to encode cell descriptors");
+            result[i] = offset;
+            offset = new RawCellInfo(span[offset], span[offset + 1], offset, SizeBytes).End;
+        }
+
+        return result;
+    }
+
+    static ulong ReadUInt(ReadOnlySpan<byte> span, ref int position, int size)
+    {
+        ulong value = 0;
+        for (int i = 0; i < size; i++) value = (value << 8) | span[position++];
+        return value;
+    }
+}
+
+/// <summary>
+///     Layout of one serialized cell: d1 d2 [hashes and depths] data refs.
+/// </summary>
+internal readonly struct RawCellInfo
+{
+    public readonly int Offset;
+    public readonly int RefsCount;
+    public readonly bool IsExotic;
+    public readonly bool HasHashes;
+    public readonly int LevelMask;
+    public readonly bool IsAugmented;
+    public readonly int DataLength;
+    readonly int refSize;
+
+    public RawCellInfo(byte d1, byte d2, int offset, int refSize)
+    {
+        Offset = offset;
+        RefsCount = d1 & 7;
+        IsExotic = (d1 & 8) != 0;
+        HasHashes = (d1 & 16) != 0;
+        LevelMask = d1 >> 5;
+        IsAugmented = (d2 & 1) != 0;
+        DataLength = (d2 + 1) >> 1;
+        this.refSize = refSize;
+    }
+
+    public bool IsAbsent => RefsCount == 7 && HasHashes;
+
+    /// <summary>
+    ///     Hashes (and as many depths) stored when with_hashes is set: one per significant level.
+    /// </summary>
+    public int HashesCount => HasHashes ? BitOperations.PopCount((uint)LevelMask) + 1 : 0;
+
+    public int HashesOffset => Offset + 2;
+    public int DepthsOffset => HashesOffset + HashesCount * CellTraits.hash_bytes;
+    public int DataOffset => DepthsOffset + HashesCount * CellTraits.depth_bytes;
+    public int RefsOffset => DataOffset + DataLength;
+    public int End => RefsOffset + (IsAbsent ? 0 : RefsCount) * refSize;
+}
@@ -119,6 +119,16 @@ public class CellSlice : BitsSliceImpl<CellSlice, Cell>
         return HashmapE<TK, TV>.Deserialize(this, opt);
     }
 
+    public LazyHashmap<TK, TV> ReadDictLazy<TK, TV>(HashmapOptions<TK, TV> opt, bool memoize = false)
+    {
+        return HashmapE<TK, TV>.DeserializeLazy(this, opt, false, memoize);
+    }
+
+    public LazyHashmap<TK, TV> LoadDictLazy<TK, TV>(HashmapOptions<TK, TV> opt, bool memoize = false)
+    {
+        return HashmapE<TK, TV>.DeserializeLazy(this, opt, true, memoize);
+    }
+
     public Cell RestoreRemainder()
     {
         return new Cell(Bits, Refs);
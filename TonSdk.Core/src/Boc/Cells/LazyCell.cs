@@ -0,0 +1,209 @@
+using System;
+using System.Buffers.Binary;
+using System.Collections.Generic;
+using System.Threading;
+using TonSdk.Core.Boc.bits;
+
+namespace TonSdk.Core.Boc.Cells;
+
+/// <summary>
+///     Cell of a BoC opened with <see cref="BagOfCells.DeserializeLazy(ReadOnlyMemory{byte}, bool)" />. Only its
+///     descriptor is read up front; data bits and references are decoded on first access and cached, so exploring a
+///     few branches of a large block or proof costs memory for the cells touched, not the whole tree.
+/// </summary>
+/// <remarks>
+///     The cell keeps the BoC buffer alive and reads from it, so the buffer must not change while cells are in use.
+/// </remarks>
+public sealed class LazyCell
+{
+    readonly RawCellInfo info;
+    readonly LazyCell?[] refs;
+    readonly LazyBoc boc;
+    Bits? bits;
+    Cell? cell;
+    int depth = -1;
+
+    internal LazyCell(LazyBoc boc, int index)
+    {
+        this.boc = boc;
+        Index = index;
+        info = boc.Reader.ReadCell(index);
+        refs = info.RefsCount == 0 ? Array.Empty<LazyCell?>() : new LazyCell?[info.RefsCount];
+        Type = boc.Reader.ReadType(info);
+    }
+
+    /// <summary>
+    ///     Position of the cell in the BoC
+    /// </summary>
+    public int Index { get; }
+
+    public CellType Type { get; }
+    public bool IsExotic => Type != CellType.Ordinary;
+    public int RefsCount => info.RefsCount;
+
+    /// <summary>
+    ///     Level mask from the cell descriptor
+    /// </summary>
+    public int LevelMask => info.LevelMask;
+
+    /// <summary>
+    ///     Whether the BoC stores the hash and depth of this cell, so <see cref="Hash" /> and <see cref="Depth" />
+    ///     are read rather than computed.
+    /// </summary>
+    public bool HasStoredHash => info.HasHashes;
+
+    public Bits Bits => bits ??= boc.Reader.ReadBits(info);
+
+    public int BitsCount => Bits.Length;
+
+    /// <summary>
+    ///     Representation hash: the highest-level hash stored in the BoC when there is one, otherwise the hash of the
+    ///     materialized cell (see <see cref="ToCell" />).
+    /// </summary>
+    public Bits Hash
+    {
+        get
+        {
+            if (!info.HasHashes) return ToCell().Hash;
+
+            int offset = info.HashesOffset + (info.HashesCount - 1) * CellTraits.hash_bytes;
+            return new Bits(boc.Reader.Span(offset, CellTraits.hash_bytes).ToArray(), 0, CellTraits.hash_bits);
+        }
+    }
+
+    /// <summary>
+    ///     Depth of the tree below this cell: the stored one when the BoC has it, otherwise computed from the
+    ///     references without decoding their data.
+    /// </summary>
+    public int Depth
+    {
+        get
+        {
+            if (depth < 0) depth = ComputeDepth();
+            return depth;
+        }
+    }
+
+    /// <summary>
+    ///     Reference <paramref name="i" />, decoded on first access.
+    /// </summary>
+    public LazyCell GetRef(int i)
+    {
+        if ((uint)i >= (uint)refs.Length) throw new ArgumentOutOfRangeException(nameof(i));
+
+        LazyCell? child = Volatile.Read(ref refs[i]);
+        if (child != null) return child;
+
+        child = boc.GetCell(boc.Reader.ReadRef(info, Index, i));
+        return Interlocked.CompareExchange(ref refs[i], child, null) ?? child;
+    }
+
+    public IEnumerable<LazyCell> Refs
+    {
+        get
+        {
+            for (int i = 0; i < refs.Length; i++) yield return GetRef(i);
+        }
+    }
+
+    /// <summary>
+    ///     The cell with its whole subtree built as ordinary <see cref="Cell" /> objects. Subtrees shared within the
+    ///     BoC are built once.
+    /// </summary>
+    public Cell ToCell()
+    {
+        if (cell != null) return cell;
+
+        // Children before parents, with an explicit stack: BoCs from the network can be arbitrarily deep
+        Stack<(LazyCell cell, bool expanded)> pending = new();
+        pending.Push((this, false));
+        while (pending.Count > 0)
+        {
+            (LazyCell current, bool expanded) = pending.Pop();
+            if (current.cell != null) continue;
+
+            if (!expanded)
+            {
+                pending.Push((current, true));
+                for (int i = current.refs.Length - 1; i >= 0; i--)
+                {
+                    LazyCell child = current.GetRef(i);
+                    if (child.cell == null) pending.Push((child, false));
+                }
+
+                continue;
+            }
+
+            Cell[] children = new Cell[current.refs.Length];
+            for (int i = 0; i < children.Length; i++) children[i] = current.GetRef(i).cell!;
+            current.cell = new Cell(current.Bits, children, current.Type);
+        }
+
+        return cell!;
+    }
+
+    int ComputeDepth()
+    {
+        if (info.HasHashes)
+        {
+            int offset = info.DepthsOffset + (info.HashesCount - 1) * CellTraits.depth_bytes;
+            return BinaryPrimitives.ReadUInt16BigEndian(boc.Reader.Span(offset, CellTraits.depth_bytes));
+        }
+
+        Stack<(LazyCell cell, bool expanded)> pending = new();
+        pending.Push((this, false));
+        while (pending.Count > 0)
+        {
+            (LazyCell current, bool expanded) = pending.Pop();
+            if (current.depth >= 0) continue;
+
+            if (current.refs.Length == 0)
+            {
+                current.depth = 0;
+                continue;
+            }
+
+            if (!expanded)
+            {
+                pending.Push((current, true));
+                for (int i = 0; i < current.refs.Length; i++)
+                {
+                    LazyCell child = current.GetRef(i);
+                    if (child.depth < 0 && !child.info.HasHashes) pending.Push((child, false));
+                }
+
+                continue;
+            }
+
+            int max = 0;
+            for (int i = 0; i < current.refs.Length; i++) max = Math.Max(max, current.GetRef(i).Depth);
+            current.depth = max + 1;
+        }
+
+        return depth;
+    }
+}
+
+/// <summary>
+///     Cells of one lazily opened BoC, each created once on first access. Only touched cells are kept.
+/// </summary>
+internal sealed class LazyBoc(BocReader reader)
+{
+    readonly Dictionary<int, LazyCell> cells = new();
+
+    public BocReader Reader { get; } = reader;
+
+    public LazyCell GetCell(int index)
+    {
+        lock (cells)
+        {
+            if (!cells.TryGetValue(index, out LazyCell? cell))
+            {
+                cell = new LazyCell(this, index);
+                cells.Add(index, cell);
+            }
+
+            return cell;
+        }
+    }
+}
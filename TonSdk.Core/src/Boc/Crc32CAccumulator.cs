@@ -0,0 +1,91 @@
+using System;
+using System.Buffers.Binary;
+using System.Runtime.Intrinsics.Arm;
+using System.Runtime.Intrinsics.X86;
+
+namespace TonSdk.Core.Boc;
+
+/// <summary>
+///     CRC32C (Castagnoli) computed over data appended piece by piece, so a BoC can be checksummed while it is
+///     being written. Uses the SSE4.2 or ARMv8 CRC instructions when the CPU has them.
+/// </summary>
+internal struct Crc32CAccumulator
+{
+    const uint Polynomial = 0x82F63B78;
+    static readonly uint[] Table = BuildTable();
+
+    uint state;
+
+    public static Crc32CAccumulator Create()
+    {
+        return new Crc32CAccumulator { state = uint.MaxValue };
+    }
+
+    public uint Result => ~state;
+
+    /// <summary>
+    ///     Implementation <see cref="Append(ReadOnlySpan{byte})" /> uses on this CPU.
+    /// </summary>
+    internal static readonly Implementation Best = Sse42.X64.IsSupported ? Implementation.Sse42
+        : Crc32.Arm64.IsSupported ? Implementation.Arm64
+        : Implementation.Table;
+
+    public void Append(ReadOnlySpan<byte> data)
+    {
+        Append(data, Best);
+    }
+
+    /// <summary>
+    ///     Append with a given implementation, which the CPU must support; lets tests reach the fallbacks.
+    /// </summary>
+    internal void Append(ReadOnlySpan<byte> data, Implementation implementation)
+    {
+        uint crc = state;
+        if (implementation == Implementation.Sse42)
+        {
+            while (data.Length >= 8)
+            {
+                crc = (uint)Sse42.X64.Crc32(crc, BinaryPrimitives.ReadUInt64LittleEndian(data));
+                data = data.Slice(8);
+            }
+
+            foreach (byte b in data) crc = Sse42.Crc32(crc, b);
+        }
+        else if (implementation == Implementation.Arm64)
+        {
+            while (data.Length >= 8)
+            {
+                crc = Crc32.Arm64.ComputeCrc32C(crc, BinaryPrimitives.ReadUInt64LittleEndian(data));
+                data = data.Slice(8);
+            }
+
+            foreach (byte b in data) crc = Crc32.ComputeCrc32C(crc, b);
+        }
+        else
+        {
+            foreach (byte b in data) crc = Table[(byte)(crc ^ b)] ^ (crc >> 8);
+        }
+
+        state = crc;
+    }
+
+    static uint[] BuildTable()
+    {
+        uint[] table = new uint[256];
+        for (uint i = 0; i < 256; i++)
+        {
+            uint crc = i;
+            for (int bit = 0; bit < 8; bit++) crc = (crc & 1) != 0 ? (crc >> 1) ^ Polynomial : crc >> 1;
+            table[i] = crc;
+        }
+
+        return table;
+    }
+
+    internal enum Implementation
+    {
+        Table,
+        Sse42,
+        Arm64
+    }
+}
@@ -107,6 +107,18 @@ public abstract class HashmapBase<T, TK, TV> where T : HashmapBase<T, TK, TV>
         return default;
     }
 
+    /// <summary>
+    ///     Deserialized key-value pairs in key order
+    /// </summary>
+    public IEnumerable<KeyValuePair<TK, TV>> Entries
+    {
+        get
+        {
+            CheckDeserializers();
+            return Map.Select(kvp => new KeyValuePair<TK, TV>(DeserializeKey!(kvp.Key), DeserializeValue!(kvp.Value)));
+        }
+    }
+
 
     /// <summary>
     ///     Serialize Hashmap object to TVM Cell
@@ -224,7 +236,8 @@ public abstract class HashmapBase<T, TK, TV> where T : HashmapBase<T, TK, TV>
         Bits repeated = getRepeated(label);
         Bits labelShort = SerializeLabelShort(label);
         Bits labelLong = SerializeLabelLong(label, m);
-        Bits? labelSame = nodes.Count > 1 && repeated.Length > 1
+        // hml_same can only stand for the whole label: a shorter run would leave a fork with one side empty
+        Bits? labelSame = nodes.Count > 1 && repeated.Length > 1 && repeated.Length == label.Length
             ? SerializeLabelSame(repeated, m)
             : null;
 
@@ -279,7 +292,7 @@ public abstract class HashmapBase<T, TK, TV> where T : HashmapBase<T, TK, TV>
     {
         return new BitsBuilder()
             .StoreBit(true).StoreBit(true)
-            .StoreBit(bits.Data[0])
+            .StoreBit(bits[0])
             .StoreUInt(bits.Length, (int)Math.Ceiling(Math.Log(m + 1, 2)))
             .Build();
     }
@@ -314,7 +327,7 @@ public abstract class HashmapBase<T, TK, TV> where T : HashmapBase<T, TK, TV>
         return nodes;
     }
 
-    protected static Bits DeserializeLabel(CellSlice edge, long m)
+    protected internal static Bits DeserializeLabel(CellSlice edge, long m)
     {
         // m = length at most possible bits of n (key)
 
@@ -474,6 +487,31 @@ public class HashmapE<TK, TV>(HashmapOptions<TK, TV> opt) : HashmapBase<HashmapE
         return hashmap;
     }
 
+    /// <summary>
+    ///     Reads a HashmapE from TVM CellSlice as a lazy view: nodes are decoded only when a lookup or an enumeration
+    ///     reaches them, instead of deserializing every entry up front
+    /// </summary>
+    /// <param name="dictSlice">TVM CellSlice includes dictionary</param>
+    /// <param name="opt">
+    ///     Hashmap options: KeySize, Serializers, Deserializers, etc.
+    /// </param>
+    /// <param name="inplace">Move the slice past the dictionary</param>
+    /// <param name="memoize">Keep decoded nodes for later lookups and enumerations</param>
+    /// <returns>LazyHashmap object</returns>
+    public static LazyHashmap<TK, TV> DeserializeLazy(CellSlice dictSlice, HashmapOptions<TK, TV> opt,
+        bool inplace = true, bool memoize = false)
+    {
+        Cell? dictCell = dictSlice.ReadBit() ? dictSlice.ReadRef() : null;
+
+        if (inplace)
+        {
+            dictSlice.SkipBit();
+            if (dictCell != null) dictSlice.SkipRef();
+        }
+
+        return LazyHashmap<TK, TV>.FromRoot(dictCell, opt, memoize);
+    }
+
     /// <summary>
     ///     Alias for HashmapE.Deserialize();
     ///     Deserializes hashmap from TVM CellSlice to C# object
@@ -0,0 +1,309 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics.CodeAnalysis;
+using System.Linq;
+using TonSdk.Core.Boc.bits;
+using TonSdk.Core.Boc.Cells;
+
+namespace TonSdk.Core.Boc;
+
+/// <summary>
+///     Read-only view of a dictionary that decodes nodes only along the paths it walks. A lookup descends labels and
+///     forks to a single leaf, in O(key size) whatever the size of the dictionary; enumerations stream entries in
+///     key order and skip the subtrees outside the requested prefix or range.
+/// </summary>
+/// <remarks>
+///     Keys are ordered bit by bit, as unsigned numbers: with signed keys, negative ones come after positive ones.
+/// </remarks>
+public sealed class LazyHashmap<TK, TV>
+{
+    readonly Func<Bits, TK>? deserializeKey;
+    readonly Func<Cell, TV>? deserializeValue;
+    readonly int keySize;
+    readonly Dictionary<(Cell, int), Node>? nodes;
+    readonly Cell? root;
+    readonly Func<TK, Bits>? serializeKey;
+
+    LazyHashmap(Cell? root, HashmapOptions<TK, TV> opt, bool memoize)
+    {
+        if (opt.KeySize == 0) throw new Exception("Key size can not be 0");
+
+        this.root = root;
+        keySize = (int)opt.KeySize;
+        serializeKey = opt.Serializers?.Key;
+        deserializeKey = opt.Deserializers?.Key;
+        deserializeValue = opt.Deserializers?.Value;
+        nodes = memoize ? new Dictionary<(Cell, int), Node>() : null;
+    }
+
+    public bool IsEmpty => root == null;
+
+    /// <summary>
+    ///     Entries in key order, decoded one at a time as the enumeration advances
+    /// </summary>
+    public IEnumerable<KeyValuePair<TK, TV>> Entries
+    {
+        get
+        {
+            CheckDeserializers();
+            return Walk(null, null).Select(Entry);
+        }
+    }
+
+    /// <summary>
+    ///     View over a Hashmap root cell, or an empty view for null.
+    /// </summary>
+    /// <param name="root">Root of the dictionary, the reference of a HashmapE</param>
+    /// <param name="opt">Hashmap options: KeySize, Serializers, Deserializers</param>
+    /// <param name="memoize">Keep the nodes decoded by lookups and enumerations, so later ones reuse them</param>
+    public static LazyHashmap<TK, TV> FromRoot(Cell? root, HashmapOptions<TK, TV> opt, bool memoize = false)
+    {
+        if (root != null && root.BitsCount < 2)
+            throw new Exception("Hashmap: can't be empty. It must contain at least 1 key-value pair.");
+
+        return new LazyHashmap<TK, TV>(root, opt, memoize);
+    }
+
+    public bool TryGetValue(TK key, [MaybeNullWhen(false)] out TV value)
+    {
+        CheckSerializers();
+        CheckDeserializers();
+
+        Cell? cell = Find(SerializeKey(key));
+        if (cell == null)
+        {
+            value = default;
+            return false;
+        }
+
+        value = deserializeValue!(cell);
+        return true;
+    }
+
+    /// <summary>
+    ///     Value for <paramref name="key" />, or the default of <typeparamref name="TV" /> when there is none, like
+    ///     <see cref="HashmapBase{T,TK,TV}.Get" />.
+    /// </summary>
+    public TV Get(TK key)
+    {
+        return TryGetValue(key, out TV? value) ? value : default!;
+    }
+
+    public bool ContainsKey(TK key)
+    {
+        CheckSerializers();
+        return Find(SerializeKey(key)) != null;
+    }
+
+    /// <summary>
+    ///     Entries whose key starts with <paramref name="prefix" />, in key order.
+    /// </summary>
+    public IEnumerable<KeyValuePair<TK, TV>> EntriesWithPrefix(Bits prefix)
+    {
+        if (prefix.Length > keySize) throw new ArgumentException("Prefix is longer than the key", nameof(prefix));
+        CheckDeserializers();
+
+        int rest = keySize - prefix.Length;
+        BitsBuilder min = new BitsBuilder(keySize).StoreBits(prefix);
+        BitsBuilder max = new BitsBuilder(keySize).StoreBits(prefix);
+        if (rest > 0)
+        {
+            min.StoreUInt(0, rest);
+            max.StoreInt(-1, rest);
+        }
+
+        return Walk(min.Build(), max.Build()).Select(Entry);
+    }
+
+    /// <summary>
+    ///     Entries with keys from <paramref name="from" /> to <paramref name="to" />, both included, in key order.
+    /// </summary>
+    /// <exception cref="ArgumentException">
+    ///     <paramref name="from" /> comes after <paramref name="to" /> in key order. With signed keys that includes
+    ///     every range from a negative key to a non-negative one: query its two halves separately.
+    /// </exception>
+    public IEnumerable<KeyValuePair<TK, TV>> EntriesInRange(TK from, TK to)
+    {
+        CheckSerializers();
+        CheckDeserializers();
+
+        Bits min = SerializeKey(from);
+        Bits max = SerializeKey(to);
+        if (min.CompareTo(max) > 0)
+            throw new ArgumentException("Range start comes after its end in key order", nameof(from));
+
+        return Walk(min, max).Select(Entry);
+    }
+
+    /// <summary>
+    ///     Entry with the smallest key, or null for an empty dictionary
+    /// </summary>
+    public KeyValuePair<TK, TV>? Min()
+    {
+        return Edge(false);
+    }
+
+    /// <summary>
+    ///     Entry with the largest key, or null for an empty dictionary
+    /// </summary>
+    public KeyValuePair<TK, TV>? Max()
+    {
+        return Edge(true);
+    }
+
+    void CheckSerializers()
+    {
+        if (serializeKey == null) throw new Exception("Serializers are not set");
+    }
+
+    void CheckDeserializers()
+    {
+        if (deserializeKey == null || deserializeValue == null) throw new Exception("Deserializers are not set");
+    }
+
+    Bits SerializeKey(TK key)
+    {
+        Bits bits = serializeKey!(key);
+        if (bits.Length != keySize) throw new Exception("Wrong key size");
+        return bits;
+    }
+
+    KeyValuePair<TK, TV> Entry((Bits key, Cell value) entry)
+    {
+        return new KeyValuePair<TK, TV>(deserializeKey!(entry.key), deserializeValue!(entry.value));
+    }
+
+    Cell? Find(Bits key)
+    {
+        Cell? cell = root;
+        int position = 0;
+        while (cell != null)
+        {
+            Node node = GetNode(cell, keySize - position);
+            if (!node.Label.SequenceEqual(key.Slice(position, position + node.Label.Length))) return null;
+
+            position += node.Label.Length;
+            if (node.Value != null) return node.Value;
+
+            cell = key[position] ? node.Right! : node.Left!;
+            position++;
+        }
+
+        return null;
+    }
+
+    KeyValuePair<TK, TV>? Edge(bool max)
+    {
+        CheckDeserializers();
+        if (root == null) return null;
+
+        Cell cell = root;
+        BitsBuilder key = new(keySize);
+        while (true)
+        {
+            Node node = GetNode(cell, key.RemainderBits);
+            key.StoreBits(node.Label);
+            if (node.Value != null) return Entry((key.Build(), node.Value));
+
+            key.StoreBit(max);
+            cell = max ? node.Right! : node.Left!;
+        }
+    }
+
+    /// <summary>
+    ///     Depth-first walk, left before right, over the leaves with keys between <paramref name="min" /> and
+    ///     <paramref name="max" />; a subtree is entered only when the key bits leading to it can still fall between
+    ///     them.
+    /// </summary>
+    IEnumerable<(Bits key, Cell value)> Walk(Bits? min, Bits? max)
+    {
+        if (root == null) yield break;
+
+        Stack<(Cell cell, Bits prefix)> pending = new();
+        pending.Push((root, new Bits(0)));
+        while (pending.Count > 0)
+        {
+            (Cell cell, Bits prefix) = pending.Pop();
+            Node node = GetNode(cell, keySize - prefix.Length);
+            Bits path = node.Label.Length == 0 ? prefix : Append(prefix, node.Label);
+            if (!InRange(path, min, max)) continue;
+
+            if (node.Value != null)
+            {
+                yield return (path, node.Value);
+                continue;
+            }
+
+            Bits right = Append(path, true);
+            if (InRange(right, min, max)) pending.Push((node.Right!, right));
+
+            Bits left = Append(path, false);
+            if (InRange(left, min, max)) pending.Push((node.Left!, left));
+        }
+    }
+
+    static bool InRange(Bits path, Bits? min, Bits? max)
+    {
+        if (min != null && path.CompareTo(min.Slice(0, path.Length)) < 0) return false;
+        if (max != null && path.CompareTo(max.Slice(0, path.Length)) > 0) return false;
+        return true;
+    }
+
+    static Bits Append(Bits prefix, Bits bits)
+    {
+        return new BitsBuilder(prefix.Length + bits.Length).StoreBits(prefix).StoreBits(bits).Build();
+    }
+
+    static Bits Append(Bits prefix, bool bit)
+    {
+        return new BitsBuilder(prefix.Length + 1).StoreBits(prefix).StoreBit(bit).Build();
+    }
+
+    Node GetNode(Cell cell, int m)
+    {
+        if (nodes == null) return ParseNode(cell, m);
+
+        // A cell shared between subtrees at different depths decodes differently, hence the depth in the key
+        lock (nodes)
+        {
+            if (!nodes.TryGetValue((cell, m), out Node? node))
+            {
+                node = ParseNode(cell, m);
+                nodes.Add((cell, m), node);
+            }
+
+            return node;
+        }
+    }
+
+    /// <summary>
+    ///     Decode the edge in <paramref name="cell" /> with <paramref name="m" /> key bits left: its label, then the
+    ///     value of a leaf or the references of a fork.
+    /// </summary>
+    static Node ParseNode(Cell cell, int m)
+    {
+        CellSlice edge = cell.Parse();
+        Bits label = HashmapE<TK, TV>.DeserializeLabel(edge, m);
+        if (label.Length > m) throw new Exception("Hashmap: invalid hashmap structure");
+
+        // hmn_leaf#_ {X:Type} value:X = HashmapNode 0 X;
+        if (label.Length == m) return new Node(label, new CellBuilder().StoreCellSlice(edge).Build(), null, null);
+
+        // hmn_fork#_ {n:#} {X:Type} left:^(Hashmap n X) right:^(Hashmap n X) = HashmapNode (n + 1) X;
+        if (edge.RemainderRefs != 2) throw new Exception("Hashmap: invalid hashmap structure");
+
+        return new Node(label, null, edge.LoadRef(), edge.LoadRef());
+    }
+
+    /// <summary>
+    ///     Decoded edge: a leaf has a <see cref="Value" />, a fork a <see cref="Left" /> and a <see cref="Right" />
+    ///     reference.
+    /// </summary>
+    sealed class Node(Bits label, Cell? value, Cell? left, Cell? right)
+    {
+        public Bits Label { get; } = label;
+        public Cell? Value { get; } = value;
+        public Cell? Left { get; } = left;
+        public Cell? Right { get; } = right;
+    }
+}
@@ -0,0 +1,49 @@
+using System;
+using System.Buffers;
+using System.IO;
+
+namespace TonSdk.Core.Boc;
+
+/// <summary>
+///     <see cref="IBufferWriter{T}" /> over a <see cref="Stream" />: bytes are collected in a fixed buffer and written
+///     out whenever it fills up, and on <see cref="Flush" />.
+/// </summary>
+internal sealed class StreamBufferWriter(Stream stream, int bufferSize = 64 * 1024) : IBufferWriter<byte>
+{
+    byte[] buffer = new byte[bufferSize];
+    int written;
+
+    public void Advance(int count)
+    {
+        if (count < 0 || written + count > buffer.Length) throw new ArgumentOutOfRangeException(nameof(count));
+        written += count;
+    }
+
+    public Memory<byte> GetMemory(int sizeHint = 0)
+    {
+        Reserve(sizeHint);
+        return buffer.AsMemory(written);
+    }
+
+    public Span<byte> GetSpan(int sizeHint = 0)
+    {
+        Reserve(sizeHint);
+        return buffer.AsSpan(written);
+    }
+
+    public void Flush()
+    {
+        if (written == 0) return;
+        stream.Write(buffer, 0, written);
+        written = 0;
+    }
+
+    void Reserve(int sizeHint)
+    {
+        sizeHint = Math.Max(sizeHint, 1);
+        if (buffer.Length - written >= sizeHint) return;
+
+        Flush();
+        if (buffer.Length < sizeHint) buffer = new byte[sizeHint];
+    }
+}
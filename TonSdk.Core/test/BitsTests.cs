@@ -0,0 +1,357 @@
+using System.Collections;
+using System.Numerics;
+using System.Security.Cryptography;
+using NUnit.Framework;
+using TonSdk.Core.Boc.bits;
+using TonSdk.Core.Economics;
+
+namespace TonSdk.Core.Tests;
+
+public class BitsTests
+{
+    [Test]
+    public void Test_UIntRoundTripsAtEveryWidth()
+    {
+        Random random = new(1);
+        for (int size = 1; size <= 300; size++)
+        {
+            BigInteger max = (BigInteger.One << size) - 1;
+            foreach (BigInteger value in new[] { BigInteger.Zero, max, RandomBelow(random, max + 1) })
+            for (int offset = 0; offset < 8; offset++)
+            {
+                Bits bits = new BitsBuilder().StoreBits(Prefix(offset)).StoreUInt(value, size).Build();
+
+                Assert.That(bits.ToString("bin"), Is.EqualTo(Prefix(offset) + Binary(value, size)));
+                Assert.That(bits.Parse().SkipBits(offset).LoadUInt(size), Is.EqualTo(value));
+            }
+        }
+
+        for (int size = 1; size <= 64; size++)
+        {
+            ulong value = size == 64 ? ulong.MaxValue : (1UL << size) - 1;
+            Bits bits = new BitsBuilder().StoreBits(Prefix(3)).StoreUInt(value, size).Build();
+
+            Assert.That(bits.ToString("bin"), Is.EqualTo(Prefix(3) + Binary(value, size)));
+            Assert.That(bits.Parse().SkipBits(3).LoadUInt(size), Is.EqualTo((BigInteger)value));
+        }
+    }
+
+    [Test]
+    public void Test_IntRoundTripsAtEveryWidth()
+    {
+        Random random = new(2);
+        for (int size = 1; size <= 300; size++)
+        {
+            BigInteger half = BigInteger.One << (size - 1);
+            BigInteger[] values =
+            {
+                -half, half - 1, BigInteger.MinusOne, BigInteger.Zero, RandomBelow(random, half * 2) - half
+            };
+            foreach (BigInteger value in values)
+            for (int offset = 0; offset < 8; offset++)
+            {
+                Bits bits = new BitsBuilder().StoreBits(Prefix(offset)).StoreInt(value, size).Build();
+
+                Assert.That(bits.ToString("bin"), Is.EqualTo(Prefix(offset) + Binary(value, size)));
+                Assert.That(bits.Parse().SkipBits(offset).LoadInt(size), Is.EqualTo(value));
+            }
+        }
+
+        for (int size = 1; size <= 64; size++)
+        {
+            long min = size == 64 ? long.MinValue : -(1L << (size - 1));
+            foreach (long value in new[] { min, -1L, 0L, -min - 1 })
+            {
+                Bits bits = new BitsBuilder().StoreBits(Prefix(5)).StoreInt(value, size).Build();
+
+                Assert.That(bits.ToString("bin"), Is.EqualTo(Prefix(5) + Binary(value, size)));
+                Assert.That(bits.Parse().SkipBits(5).LoadInt(size), Is.EqualTo((BigInteger)value));
+            }
+        }
+    }
+
+    [Test]
+    public void Test_StoreIntRejectsOutOfRangeValues()
+    {
+        Assert.Throws<ArgumentException>(() => new BitsBuilder().StoreUInt(BigInteger.MinusOne, 8));
+        Assert.Throws<ArgumentException>(() => new BitsBuilder().StoreUInt(new BigInteger(256), 8));
+        Assert.Throws<ArgumentException>(() => new BitsBuilder().StoreUInt(256UL, 8));
+        Assert.Throws<ArgumentException>(() => new BitsBuilder().StoreInt(-200L, 8));
+        Assert.Throws<ArgumentException>(() => new BitsBuilder().StoreInt(new BigInteger(200), 8));
+    }
+
+    [TestCase(0, "0000")]
+    [TestCase(1, "000100000001")]
+    [TestCase(255, "000111111111")]
+    [TestCase(1000, "00100000001111101000")]
+    [TestCase(123456789, "010000000111010110111100110100010101")]
+    public void Test_CoinsEncoding(long nano, string expected)
+    {
+        Bits bits = new BitsBuilder().StoreCoins(Coins.FromNano(nano)).Build();
+
+        Assert.That(bits.ToString("bin"), Is.EqualTo(expected));
+        Assert.That(bits.Parse().LoadCoins().ToBigInt(), Is.EqualTo(new BigInteger(nano)));
+    }
+
+    [Test]
+    public void Test_VarUIntRoundTrips()
+    {
+        BigInteger[] values =
+        {
+            0, 1, 255, 1000, 65535, 123456789, long.MaxValue,
+            BigInteger.Parse("1000000000000000000000000000000000000"),
+            (BigInteger.One << 119) - 1
+        };
+
+        foreach (int length in new[] { 16, 32 })
+        foreach (BigInteger value in values)
+        {
+            Bits bits = new BitsBuilder().StoreBit(true).StoreVarUInt(value, length).StoreBit(true).Build();
+            BitsSlice slice = bits.Parse().SkipBit();
+
+            Assert.That(slice.LoadVarUInt(length), Is.EqualTo(value));
+            Assert.That(slice.LoadBit(), Is.True);
+            Assert.That(slice.RemainderBits, Is.EqualTo(0));
+        }
+
+        Bits signed = new BitsBuilder().StoreVarInt(1000, 16).Build();
+        Assert.That(signed.ToString("bin"), Is.EqualTo("00100000001111101000"));
+        Assert.That(signed.Parse().LoadVarInt(16), Is.EqualTo(new BigInteger(1000)));
+    }
+
+    [Test]
+    public void Test_StoreBitsAcrossUnalignedOffsets()
+    {
+        Random random = new(3);
+        byte[] bytes = new byte[16];
+        random.NextBytes(bytes);
+        Bits source = new(bytes);
+
+        for (int prefix = 0; prefix < 16; prefix++)
+        for (int start = 0; start < 8; start++)
+        for (int length = 0; length <= 72; length++)
+        {
+            Bits piece = source.Slice(start, start + length);
+            Bits bits = new BitsBuilder().StoreBits(Prefix(prefix)).StoreBits(piece).StoreBit(true).Build();
+
+            string expected = Prefix(prefix) + source.ToString("bin").Substring(start, length) + "1";
+            Assert.That(bits.ToString("bin"), Is.EqualTo(expected));
+            Assert.That(bits.Parse().SkipBits(prefix).LoadBits(length), Is.EqualTo(piece));
+        }
+    }
+
+    [Test]
+    public void Test_CompareToOrdersLikeUnsignedNumbers()
+    {
+        Random random = new(4);
+        for (int i = 0; i < 2000; i++)
+        {
+            int length = random.Next(1, 200);
+            int start = random.Next(0, 8);
+            Bits x = RandomBits(random, start + length).Slice(start, start + length);
+            Bits y = random.Next(4) == 0 ? new Bits(x.ToString("bin")) : RandomBits(random, length);
+
+            int expected = Unsigned(x).CompareTo(Unsigned(y));
+            Assert.That(x.CompareTo(y), Is.EqualTo(expected));
+            Assert.That(y.CompareTo(x), Is.EqualTo(-expected));
+        }
+
+        Assert.Throws<ArgumentException>(() => new Bits("101").CompareTo(new Bits("1010")));
+    }
+
+    [Test]
+    public void Test_HashIsSha256OfTheBytes()
+    {
+        Random random = new(5);
+        for (int length = 0; length <= 80; length++)
+        for (int start = 0; start < 8; start++)
+        {
+            Bits bits = RandomBits(random, start + length).Slice(start, start + length);
+            Bits hash = bits.Hash();
+
+            Assert.That(hash.Length, Is.EqualTo(256));
+            Assert.That(hash.ToBytes(), Is.EqualTo(SHA256.HashData(bits.ToBytes())));
+        }
+    }
+
+    [TestCase("1", "1", "C_", "b{1}", "x{C_}")]
+    [TestCase("0", "0", "4_", "b{0}", "x{4_}")]
+    [TestCase("1010", "1010", "A", "b{1010}", "x{A}")]
+    [TestCase("10101", "10101", "AC_", "b{10101}", "x{AC_}")]
+    [TestCase("1011000", "1011000", "B1_", "b{1011000}", "x{B1_}")]
+    [TestCase("x{B1_}", "1011000", "B1_", "b{1011000}", "x{B1_}")]
+    [TestCase("DEADBEEF", "11011110101011011011111011101111", "DEADBEEF", "b{11011110101011011011111011101111}",
+        "x{DEADBEEF}")]
+    public void Test_ToStringModes(string input, string bin, string hex, string fiftBin, string fiftHex)
+    {
+        Bits bits = new(input);
+
+        Assert.That(bits.ToString("bin"), Is.EqualTo(bin));
+        Assert.That(bits.ToString("hex"), Is.EqualTo(hex));
+        Assert.That(bits.ToString("fiftBin"), Is.EqualTo(fiftBin));
+        Assert.That(bits.ToString("fiftHex"), Is.EqualTo(fiftHex));
+        Assert.That(new Bits(fiftHex), Is.EqualTo(bits));
+        Assert.That(new Bits(fiftBin), Is.EqualTo(bits));
+    }
+
+    [TestCase("0_")]
+    [TestCase("00_")]
+    [TestCase("x{0_}")]
+    [TestCase("x{000_}")]
+    public void Test_HexWithoutCompletionTagIsRejected(string input)
+    {
+        Assert.Throws<ArgumentException>(() => new Bits(input));
+    }
+
+    [Test]
+    public void Test_EmptyBits()
+    {
+        Bits bits = new("x{8_}");
+
+        Assert.That(bits.Length, Is.EqualTo(0));
+        Assert.That(bits.ToString("bin"), Is.EqualTo(""));
+        Assert.That(bits.ToString("hex"), Is.EqualTo(""));
+        Assert.That(bits.ToString("fiftBin"), Is.EqualTo("b{}"));
+        Assert.That(bits.ToString("fiftHex"), Is.EqualTo("x{}"));
+        Assert.That(bits.ToString("base64"), Is.EqualTo(""));
+        Assert.That(new Bits(""), Is.EqualTo(bits));
+    }
+
+    [Test]
+    public void Test_ToStringOfAnUnalignedView()
+    {
+        Bits bits = new Bits("DEADBEEF").Slice(3, 20);
+
+        Assert.That(bits.ToString("bin"), Is.EqualTo("11110101011011011"));
+        Assert.That(bits.ToString("hex"), Is.EqualTo("F56DC_"));
+        Assert.That(bits.ToString("base64"), Is.EqualTo("9W2A"));
+        Assert.That(bits.ToString("base64url"), Is.EqualTo("9W2A"));
+        Assert.That(bits.ToString(), Is.EqualTo("9W2A"));
+        Assert.Throws<ArgumentException>(() => bits.ToString("oct"));
+    }
+
+    [Test]
+    public void Test_AugmentAndRollback()
+    {
+        Bits bits = new("101");
+
+        Assert.That(bits.Augment().ToString("bin"), Is.EqualTo("10110000"));
+        Assert.That(bits.Augment(4).ToString("bin"), Is.EqualTo("1011"));
+        Assert.That(bits.Augment().Rollback(), Is.EqualTo(bits));
+        Assert.That(bits.Augment(4).Rollback(4), Is.EqualTo(bits));
+
+        Bits aligned = new("10100000");
+        Assert.That(aligned.Augment(), Is.EqualTo(aligned));
+        Assert.That(aligned.Rollback().ToString("bin"), Is.EqualTo("10"));
+
+        Bits view = new Bits("FF00").Slice(5, 10);
+        Assert.That(view.Augment().ToString("bin"), Is.EqualTo("11100100"));
+        Assert.That(view.Augment().Rollback(), Is.EqualTo(view));
+
+        Assert.Throws<ArgumentException>(() => bits.Augment(3));
+        Assert.Throws<ArgumentException>(() => bits.Rollback(16));
+        Assert.That(Assert.Catch(() => bits.Rollback()).Message, Is.EqualTo("Bits length is less than divider"));
+        Assert.That(Assert.Catch(() => new Bits("000000000").Rollback()).Message,
+            Is.EqualTo("Incorrectly augmented bits."));
+    }
+
+    [Test]
+    public void Test_Slice()
+    {
+        Bits bits = new("1100101011110000");
+
+        Assert.That(bits.Slice(2, 7).ToString("bin"), Is.EqualTo("00101"));
+        Assert.That(bits.Slice(-4, -1).ToString("bin"), Is.EqualTo("000"));
+        Assert.That(bits.Slice(3, 3).Length, Is.EqualTo(0));
+        Assert.That(bits.Slice(0, 16), Is.EqualTo(bits));
+        Assert.That(bits.Slice(3, 14).Slice(2, 9).ToString("bin"), Is.EqualTo("0101111"));
+        Assert.That(bits.Slice(3, 14).Slice(2, 9)[6], Is.True);
+
+        Assert.Throws<ArgumentException>(() => bits.Slice(5, 4));
+        Assert.Throws<ArgumentException>(() => bits.Slice(0, 17));
+        Assert.Throws<ArgumentException>(() => bits.Slice(-17, 3));
+        Assert.Throws<ArgumentOutOfRangeException>(() => _ = bits.Slice(2, 7)[5]);
+    }
+
+    [Test]
+    public void Test_ProtectedDataIsACopyUntilAssignedBack()
+    {
+        LegacyBuilder builder = new();
+        builder.StoreUInt(0b101, 3);
+
+        builder.SetFirstBitInCopy(false);
+        Assert.That(builder.Build().ToString("bin"), Is.EqualTo("101"));
+
+        builder.SetFirstBit(false);
+        Assert.That(builder.Build().ToString("bin"), Is.EqualTo("001"));
+        Assert.That(builder.Length, Is.EqualTo(16));
+    }
+
+    static string Prefix(int length)
+    {
+        char[] chars = new char[length];
+        for (int i = 0; i < length; i++) chars[i] = i % 3 == 0 ? '1' : '0';
+        return new string(chars);
+    }
+
+    // Two's complement of value in size bits, first bit first
+    static string Binary(BigInteger value, int size)
+    {
+        BigInteger unsigned = value.Sign < 0 ? (BigInteger.One << size) + value : value;
+        char[] chars = new char[size];
+        for (int i = 0; i < size; i++) chars[size - 1 - i] = ((unsigned >> i) & 1) == 1 ? '1' : '0';
+        return new string(chars);
+    }
+
+    static BigInteger Unsigned(Bits bits)
+    {
+        BigInteger value = BigInteger.Zero;
+        foreach (char bit in bits.ToString("bin")) value = (value << 1) | (bit - '0');
+        return value;
+    }
+
+    static BigInteger RandomBelow(Random random, BigInteger bound)
+    {
+        byte[] bytes = new byte[bound.GetByteCount(true) + 1];
+        random.NextBytes(bytes);
+        return new BigInteger(bytes, true) % bound;
+    }
+
+    static Bits RandomBits(Random random, int length)
+    {
+        char[] chars = new char[length];
+        for (int i = 0; i < length; i++) chars[i] = random.Next(2) == 0 ? '0' : '1';
+        return new Bits(new string(chars));
+    }
+
+#pragma warning disable CS0618 // _Data is obsolete; these tests pin what it still does
+    sealed class LegacyBuilder : BitsBuilderImpl<LegacyBuilder, Bits>
+    {
+        public LegacyBuilder() : base(16)
+        {
+        }
+
+        public void SetFirstBitInCopy(bool value)
+        {
+            _Data[0] = value;
+        }
+
+        public void SetFirstBit(bool value)
+        {
+            BitArray data = _Data;
+            data[0] = value;
+            _Data = data;
+        }
+
+        public override LegacyBuilder Clone()
+        {
+            return new LegacyBuilder { _Data = _Data, BitsCnt = BitsCnt };
+        }
+
+        public override Bits Build()
+        {
+            return Data;
+        }
+    }
+#pragma warning restore CS0618
+}
@@ -0,0 +1,35 @@
+using System.Buffers.Binary;
+using NUnit.Framework;
+using TonSdk.Core.Boc;
+
+namespace TonSdk.Core.Tests;
+
+public class BocReaderTests
+{
+    [Test]
+    public void Test_CellCountTheDataCantHoldIsRejected()
+    {
+        // Four-byte sizes, 0xFFFFFFFF cells, one root, and 8 bytes of cells: at most 4 cells fit
+        byte[] boc = Convert.FromHexString("B5EE9C7204" + "01" + "FFFFFFFF" + "00000001" + "00000000" + "08" +
+                                           "00000000" + "0000000000000000");
+
+        Assert.That(Assert.Catch(() => BagOfCells.DeserializeBoc(boc)).Message, Is.EqualTo("Invalid BOC size"));
+        Assert.That(Assert.Catch(() => BagOfCells.DeserializeLazy(boc)).Message, Is.EqualTo("Invalid BOC size"));
+
+        // Five cells of two descriptor bytes don't fit in 8 bytes either
+        BinaryPrimitives.WriteUInt32BigEndian(boc.AsSpan(6), 5);
+        Assert.That(Assert.Catch(() => BagOfCells.DeserializeLazy(boc)).Message, Is.EqualTo("Invalid BOC size"));
+    }
+
+    [TestCase("proof.boc")]
+    [TestCase("proof_idx_cache_bits.boc")]
+    public void Test_Crc32CIsChecked(string name)
+    {
+        byte[] boc = LazyCellTests.Sample(name);
+        boc[boc.Length - 5] ^= 1;
+
+        Assert.That(Assert.Catch(() => BagOfCells.DeserializeBoc(boc)).Message, Is.EqualTo("Invalid CRC32C"));
+        Assert.That(Assert.Catch(() => BagOfCells.DeserializeLazy(boc)).Message, Is.EqualTo("Invalid CRC32C"));
+        Assert.That(BagOfCells.DeserializeLazy(boc, false).Length, Is.EqualTo(1));
+    }
+}
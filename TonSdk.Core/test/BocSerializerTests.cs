@@ -0,0 +1,106 @@
+using System.Buffers;
+using System.Runtime.Intrinsics.Arm;
+using System.Runtime.Intrinsics.X86;
+using NUnit.Framework;
+using TonSdk.Core.Boc;
+using TonSdk.Core.Boc.Cells;
+
+namespace TonSdk.Core.Tests;
+
+public class BocSerializerTests
+{
+    // Golden/boc_recursive_serializer.txt holds the output of the recursive SerializeBoc that the linear-time one
+    // replaced, for every case with and without the index and the CRC32C: one hex BoC per line
+    [Test]
+    public void Test_OutputIsByteIdenticalToTheRecursiveSerializer()
+    {
+        string[] expected = File.ReadAllLines(Path.Combine(AppContext.BaseDirectory, "Golden",
+            "boc_recursive_serializer.txt"));
+
+        List<string> actual = new();
+        foreach (Cell[] roots in Cases())
+        foreach (bool hasIdx in new[] { false, true })
+        foreach (bool hasCrc32C in new[] { false, true })
+        {
+            byte[] bytes = BagOfCells.SerializeBoc(roots, hasIdx, hasCrc32C).ToBytes();
+
+            ArrayBufferWriter<byte> writer = new();
+            BagOfCells.SerializeBoc(roots, writer, hasIdx, hasCrc32C);
+            MemoryStream stream = new();
+            BagOfCells.SerializeBoc(roots, stream, hasIdx, hasCrc32C);
+
+            Assert.That(writer.WrittenSpan.ToArray(), Is.EqualTo(bytes));
+            Assert.That(stream.ToArray(), Is.EqualTo(bytes));
+            actual.Add(Convert.ToHexString(bytes));
+        }
+
+        Assert.That(actual, Is.EqualTo(expected));
+    }
+
+    [TestCase("Table")]
+    [TestCase("Sse42")]
+    [TestCase("Arm64")]
+    public void Test_Crc32CCheckValue(string name)
+    {
+        Crc32CAccumulator.Implementation implementation = Enum.Parse<Crc32CAccumulator.Implementation>(name);
+        if ((implementation == Crc32CAccumulator.Implementation.Sse42 && !Sse42.X64.IsSupported) ||
+            (implementation == Crc32CAccumulator.Implementation.Arm64 && !Crc32.Arm64.IsSupported))
+            Assert.Ignore($"{name} is not supported on this CPU");
+
+        Crc32CAccumulator crc = Crc32CAccumulator.Create();
+        crc.Append("123456789"u8, implementation);
+        Assert.That(crc.Result, Is.EqualTo(0xE3069283));
+
+        // Split between the 8-byte steps and the bytes after them, the result is the same
+        byte[] data = Enumerable.Range(0, 1000).Select(i => (byte)(i * 7)).ToArray();
+        Crc32CAccumulator whole = Crc32CAccumulator.Create();
+        whole.Append(data, Crc32CAccumulator.Implementation.Table);
+        for (int split = 0; split < 20; split++)
+        {
+            Crc32CAccumulator pieces = Crc32CAccumulator.Create();
+            pieces.Append(data.AsSpan(0, split), implementation);
+            pieces.Append(data.AsSpan(split), implementation);
+            Assert.That(pieces.Result, Is.EqualTo(whole.Result));
+        }
+    }
+
+    // Keep in step with the generator of Golden/boc_recursive_serializer.txt: trees from a seeded Random, with cells
+    // shared between and within them, the wallet v3r2 code and a long chain
+    static IEnumerable<Cell[]> Cases()
+    {
+        Random random = new(1);
+        yield return new[] { new CellBuilder().Build() };
+        yield return new[] { new CellBuilder().StoreUInt(0xDEADBEEF, 32).Build() };
+        yield return BagOfCells.DeserializeBoc(LazyCellTests.Sample("wallet_v3r2_code.boc"));
+        for (int i = 0; i < 4; i++) yield return new[] { Tree(random, 3) };
+        yield return new[] { Tree(random, 3), Tree(random, 2), Shared(1) };
+        yield return new[] { Chain(300) };
+    }
+
+    static Cell Tree(Random random, int depth)
+    {
+        CellBuilder builder = new();
+        int bits = random.Next(0, 1024);
+        for (int i = 0; i < bits; i++) builder.StoreBit(random.Next(2) == 1);
+        if (depth > 0)
+        {
+            int refs = random.Next(0, 5);
+            for (int i = 0; i < refs; i++)
+                builder.StoreRef(random.Next(4) == 0 ? Shared(random.Next(3)) : Tree(random, depth - 1));
+        }
+
+        return builder.Build();
+    }
+
+    static Cell Shared(int k)
+    {
+        return new CellBuilder().StoreUInt((ulong)k, 32).Build();
+    }
+
+    static Cell Chain(int length)
+    {
+        Cell cell = new CellBuilder().StoreUInt(0, 16).Build();
+        for (int i = 1; i < length; i++) cell = new CellBuilder().StoreUInt((ulong)i, 16).StoreRef(cell).Build();
+        return cell;
+    }
+}
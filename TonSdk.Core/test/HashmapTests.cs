@@ -0,0 +1,63 @@
+using System.Numerics;
+using NUnit.Framework;
+using TonSdk.Core.Boc;
+using TonSdk.Core.Boc.bits;
+using TonSdk.Core.Boc.Cells;
+
+namespace TonSdk.Core.Tests;
+
+public class HashmapTests
+{
+    // Below the root fork, 00010101 and 00011101 share the label 001. Its leading run 00 must not be written
+    // as an hml_same label, or the fork under it gets an empty side.
+    [TestCase(new[] { 0b00010101, 0b00011101, 0b11111111 })]
+    [TestCase(new[] { 0b00000001, 0b00000011 })]
+    [TestCase(new[] { 0b11100000, 0b11101000, 0b11101100 })]
+    [TestCase(new[] { 0b00000000, 0b00000001, 0b11111110, 0b11111111 })]
+    public void Test_LabelWithALeadingRunRoundTrips(int[] keys)
+    {
+        HashmapE<BigInteger, BigInteger> dict = new(Options(8));
+        foreach (int key in keys) dict.Set(key, key + 1);
+
+        Cell cell = Cell.From(dict.Build().Serialize());
+        HashmapE<BigInteger, BigInteger> read = HashmapE<BigInteger, BigInteger>.Deserialize(cell.Parse(), Options(8));
+
+        Assert.That(read.Entries.Select(kv => (int)kv.Key), Is.EqualTo(keys.OrderBy(k => k)));
+        foreach (int key in keys) Assert.That(read.Get(key), Is.EqualTo(new BigInteger(key + 1)));
+    }
+
+    [Test]
+    public void Test_RandomDictionariesRoundTrip()
+    {
+        Random random = new(1);
+        for (int i = 0; i < 2000; i++)
+        {
+            int[] keys = Enumerable.Range(0, random.Next(1, 8)).Select(_ => random.Next(256)).Distinct().ToArray();
+            HashmapE<BigInteger, BigInteger> dict = new(Options(8));
+            foreach (int key in keys) dict.Set(key, key);
+
+            HashmapE<BigInteger, BigInteger> read =
+                HashmapE<BigInteger, BigInteger>.Deserialize(dict.Build().Parse(), Options(8));
+
+            Assert.That(read.Entries.Select(kv => (int)kv.Key), Is.EqualTo(keys.OrderBy(k => k)));
+        }
+    }
+
+    internal static HashmapOptions<BigInteger, BigInteger> Options(int keySize, int valueSize = 64)
+    {
+        return new HashmapOptions<BigInteger, BigInteger>
+        {
+            KeySize = (uint)keySize,
+            Serializers = new HashmapSerializers<BigInteger, BigInteger>
+            {
+                Key = k => new BitsBuilder(keySize).StoreUInt(k, keySize).Build(),
+                Value = v => new CellBuilder().StoreUInt(v, valueSize).Build()
+            },
+            Deserializers = new HashmapDeserializers<BigInteger, BigInteger>
+            {
+                Key = k => k.Parse().LoadUInt(keySize),
+                Value = v => v.Parse().LoadUInt(valueSize)
+            }
+        };
+    }
+}
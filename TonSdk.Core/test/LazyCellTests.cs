@@ -0,0 +1,168 @@
+using System.Buffers.Binary;
+using System.Security.Cryptography;
+using NUnit.Framework;
+using TonSdk.Core.Boc;
+using TonSdk.Core.Boc.bits;
+using TonSdk.Core.Boc.Cells;
+
+namespace TonSdk.Core.Tests;
+
+/// <summary>
+///     The lazy reader against the eager one, over the BoCs in Golden/: the wallet v3r2 code from mainnet, and a
+///     Merkle proof and a Merkle update laid out as the TON node writes them (tools/generate_boc_samples.py), plain,
+///     with the has_idx index, with cache bits and with stored hashes.
+/// </summary>
+public class LazyCellTests
+{
+    const string ProofHash = "ed39c2c8ed1234bc0879ba496f19c338ae36cc2da26efb9d4ab621dee6cb3607";
+    const string ProvenBlockHash = "066665eca7562f3713e13d9ca757750bac01b0cfeafd031d2019b91d173cd4ea";
+    const string UpdateHash = "c3cd0a1ad7c7bb7434532c524dbd2c4407745c81538e5632be3062f96e982868";
+    const string WalletCodeHash = "84dafa449f98a6987789ba232358072bc0f76dc4524002a5d0918b9a75d2d599";
+
+    [TestCase("wallet_v3r2_code.boc")]
+    [TestCase("proof.boc")]
+    [TestCase("proof_idx.boc")]
+    [TestCase("proof_idx_cache_bits.boc")]
+    [TestCase("proof_hashes.boc")]
+    [TestCase("update_two_roots_hashes.boc")]
+    public void Test_MatchesTheEagerDeserializer(string name)
+    {
+        byte[] boc = Sample(name);
+
+        Cell[] eager = BagOfCells.DeserializeBoc(boc);
+        LazyCell[] lazy = BagOfCells.DeserializeLazy(boc);
+
+        Assert.That(lazy.Length, Is.EqualTo(eager.Length));
+        HashSet<int> visited = new();
+        for (int i = 0; i < eager.Length; i++) AssertSameTree(lazy[i], eager[i], visited);
+    }
+
+    [TestCase("proof_idx.boc")]
+    [TestCase("proof_idx_cache_bits.boc")]
+    [TestCase("proof_hashes.boc")]
+    public void Test_IndexAndStoredHashesDontChangeTheCells(string name)
+    {
+        Cell plain = BagOfCells.DeserializeBoc(Sample("proof.boc"))[0];
+
+        Assert.That(BagOfCells.DeserializeBoc(Sample(name))[0].Hash, Is.EqualTo(plain.Hash));
+        Assert.That(BagOfCells.DeserializeLazy(Sample(name))[0].ToCell().Hash, Is.EqualTo(plain.Hash));
+    }
+
+    [TestCase("proof_idx.boc")]
+    [TestCase("proof_idx_cache_bits.boc")]
+    public void Test_CellsAreLocatedThroughTheIndex(string name)
+    {
+        byte[] boc = Sample(name);
+        LazyCell kept = BagOfCells.DeserializeLazy(boc)[0].GetRef(0).GetRef(1);
+        Assert.That(kept.Index, Is.EqualTo(2));
+
+        // Copy the index entry that ends cell 1 over the one that ends cell 0: reading cell 1 through the index
+        // now lands on cell 2, which a pass over the descriptors would not
+        byte[] broken = (byte[])boc.Clone();
+        int sizeBytes = broken[4] & 7;
+        int offsetBytes = broken[5];
+        int index = 6 + 4 * sizeBytes + offsetBytes;
+        broken.AsSpan(index + offsetBytes, offsetBytes).CopyTo(broken.AsSpan(index));
+
+        LazyCell moved = BagOfCells.DeserializeLazy(broken, false)[0].GetRef(0);
+        Assert.That(moved.Index, Is.EqualTo(1));
+        Assert.That(moved.Bits, Is.EqualTo(kept.Bits));
+        Assert.That(moved.RefsCount, Is.EqualTo(kept.RefsCount));
+    }
+
+    [Test]
+    public void Test_StoredHashesAndDepthsAreRead()
+    {
+        LazyCell proof = BagOfCells.DeserializeLazy(Sample("proof_hashes.boc"))[0];
+
+        Assert.That(proof.HasStoredHash, Is.True);
+        Assert.That(proof.Type, Is.EqualTo(CellType.MerkleProof));
+        Assert.That(proof.Hash.ToString("hex").ToLower(), Is.EqualTo(ProofHash));
+        Assert.That(proof.Depth, Is.EqualTo(14));
+
+        // The proof carries the hash of the block it proves, level 0 of the cell under it
+        Assert.That(proof.Bits.Slice(8, 264).ToString("hex").ToLower(), Is.EqualTo(ProvenBlockHash));
+        Assert.That(proof.GetRef(0).LevelMask, Is.EqualTo(1));
+        Assert.That(proof.GetRef(0).GetRef(0).Type, Is.EqualTo(CellType.PrunedBranch));
+
+        // Below the pruned branch, hashes of ordinary cells are the ones computed from the cells
+        LazyCell kept = proof.GetRef(0).GetRef(1);
+        Assert.That(kept.LevelMask, Is.EqualTo(0));
+        Assert.That(kept.Hash, Is.EqualTo(kept.ToCell().Hash));
+        foreach (LazyCell child in kept.Refs) Assert.That(child.Hash, Is.EqualTo(child.ToCell().Hash));
+
+        LazyCell[] roots = BagOfCells.DeserializeLazy(Sample("update_two_roots_hashes.boc"));
+        Assert.That(roots[0].Type, Is.EqualTo(CellType.MerkleUpdate));
+        Assert.That(roots[0].Hash.ToString("hex").ToLower(), Is.EqualTo(UpdateHash));
+        Assert.That(roots[1].Hash.ToString("hex").ToLower(), Is.EqualTo(ProofHash));
+    }
+
+    [Test]
+    public void Test_ExoticCellsKeepTheirTypeAndHashWithIt()
+    {
+        Cell proof = BagOfCells.DeserializeBoc(Sample("proof.boc"))[0];
+        Cell pruned = proof.Refs[0].Refs[0];
+
+        Assert.That(proof.Type, Is.EqualTo(CellType.MerkleProof));
+        Assert.That(proof.IsExotic, Is.True);
+        Assert.That(pruned.Type, Is.EqualTo(CellType.PrunedBranch));
+
+        // The descriptor hashed with the data marks the cell exotic, so it no longer hashes like an ordinary cell
+        Assert.That(proof.Hash, Is.EqualTo(new Bits(DescriptorHash(proof))));
+        Assert.That(pruned.Hash, Is.EqualTo(new Bits(DescriptorHash(pruned))));
+        Assert.That(proof.Hash, Is.Not.EqualTo(new Cell(proof.Bits, proof.Refs).Hash));
+        Assert.That(pruned.Hash, Is.Not.EqualTo(new Cell(pruned.Bits, pruned.Refs).Hash));
+
+        LazyCell lazy = BagOfCells.DeserializeLazy(Sample("proof.boc"))[0];
+        Assert.That(lazy.Hash, Is.EqualTo(proof.Hash));
+        Assert.That(lazy.GetRef(0).GetRef(0).Hash, Is.EqualTo(pruned.Hash));
+    }
+
+    [Test]
+    public void Test_WalletCodeRoundTrips()
+    {
+        byte[] boc = Sample("wallet_v3r2_code.boc");
+        Cell code = BagOfCells.DeserializeBoc(boc)[0];
+
+        Assert.That(code.Hash.ToString("hex").ToLower(), Is.EqualTo(WalletCodeHash));
+        Assert.That(BagOfCells.DeserializeLazy(boc)[0].Hash, Is.EqualTo(code.Hash));
+        Assert.That(BagOfCells.DeserializeBoc(BagOfCells.SerializeBoc(code))[0].Hash, Is.EqualTo(code.Hash));
+    }
+
+    static void AssertSameTree(LazyCell lazy, Cell eager, HashSet<int> visited)
+    {
+        if (!visited.Add(lazy.Index)) return;
+
+        Assert.That(lazy.Type, Is.EqualTo(eager.Type));
+        Assert.That(lazy.Bits, Is.EqualTo(eager.Bits));
+        Assert.That(lazy.RefsCount, Is.EqualTo(eager.RefsCount));
+        Assert.That(lazy.Depth, Is.EqualTo(eager.Depth));
+        Assert.That(lazy.ToCell().Hash, Is.EqualTo(eager.Hash));
+
+        // A stored hash is the one the node computed, which for cells with levels is not the one Cell computes
+        if (!lazy.HasStoredHash) Assert.That(lazy.Hash, Is.EqualTo(eager.Hash));
+
+        for (int i = 0; i < eager.RefsCount; i++) AssertSameTree(lazy.GetRef(i), eager.Refs[i], visited);
+    }
+
+    // SHA-256 of d1 d2, the augmented data, then the depth and the hash of every reference
+    static byte[] DescriptorHash(Cell cell)
+    {
+        List<byte> bytes = new() { (byte)(cell.RefsCount + (cell.IsExotic ? 8 : 0)), (byte)cell.FullData };
+        bytes.AddRange(cell.Bits.Augment().ToBytes());
+        byte[] depth = new byte[2];
+        foreach (Cell child in cell.Refs)
+        {
+            BinaryPrimitives.WriteUInt16BigEndian(depth, (ushort)child.Depth);
+            bytes.AddRange(depth);
+        }
+
+        foreach (Cell child in cell.Refs) bytes.AddRange(child.Hash.ToBytes());
+        return SHA256.HashData(bytes.ToArray());
+    }
+
+    internal static byte[] Sample(string name)
+    {
+        return File.ReadAllBytes(Path.Combine(AppContext.BaseDirectory, "Golden", name));
+    }
+}
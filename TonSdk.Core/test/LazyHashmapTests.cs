@@ -0,0 +1,145 @@
+using System.Numerics;
+using NUnit.Framework;
+using TonSdk.Core.Boc;
+using TonSdk.Core.Boc.bits;
+using TonSdk.Core.Boc.Cells;
+
+namespace TonSdk.Core.Tests;
+
+public class LazyHashmapTests
+{
+    [TestCase(1)]
+    [TestCase(2)]
+    [TestCase(8)]
+    [TestCase(16)]
+    [TestCase(32)]
+    [TestCase(64)]
+    [TestCase(100)]
+    [TestCase(257)]
+    public void Test_MatchesTheEagerReader(int keySize)
+    {
+        Random random = new(keySize);
+        BigInteger space = BigInteger.One << keySize;
+        HashmapOptions<BigInteger, BigInteger> opt = HashmapTests.Options(keySize);
+
+        BigInteger RandomKey()
+        {
+            byte[] bytes = new byte[keySize / 8 + 2];
+            random.NextBytes(bytes);
+            BigInteger key = new BigInteger(bytes, true) % space;
+
+            // Half of the keys share their high bits, for long common labels
+            return random.Next(2) == 0 && keySize > 8 ? (key % 64) | (space - 1 - 1023) : key;
+        }
+
+        for (int round = 0; round < 25; round++)
+        {
+            HashSet<BigInteger> keys = new();
+            HashmapE<BigInteger, BigInteger> dict = new(opt);
+            int count = random.Next(0, (int)BigInteger.Min(space, 300) + 1);
+            while (keys.Count < count)
+            {
+                BigInteger key = RandomKey();
+                if (keys.Add(key)) dict.Set(key, random.NextInt64() >> 1);
+            }
+
+            Cell cell = Cell.From(dict.Build().Serialize());
+            List<KeyValuePair<BigInteger, BigInteger>> eager =
+                HashmapE<BigInteger, BigInteger>.Deserialize(cell.Parse(), opt).Entries.ToList();
+
+            foreach (bool memoize in new[] { false, true })
+            {
+                CellSlice slice = cell.Parse();
+                LazyHashmap<BigInteger, BigInteger> lazy = slice.LoadDictLazy(opt, memoize);
+
+                Assert.That(slice.RemainderBits, Is.EqualTo(0));
+                Assert.That(slice.RemainderRefs, Is.EqualTo(0));
+                Assert.That(lazy.IsEmpty, Is.EqualTo(count == 0));
+                Assert.That(lazy.Entries, Is.EqualTo(eager));
+                Assert.That(lazy.Min(), Is.EqualTo(count == 0 ? null : eager[0]));
+                Assert.That(lazy.Max(), Is.EqualTo(count == 0 ? null : eager[^1]));
+
+                foreach (KeyValuePair<BigInteger, BigInteger> entry in eager)
+                {
+                    Assert.That(lazy.Get(entry.Key), Is.EqualTo(entry.Value));
+                    Assert.That(lazy.ContainsKey(entry.Key), Is.True);
+                }
+
+                for (int i = 0; i < 50; i++)
+                {
+                    BigInteger key = RandomKey();
+                    Assert.That(lazy.TryGetValue(key, out _), Is.EqualTo(keys.Contains(key)));
+                    Assert.That(lazy.ContainsKey(key), Is.EqualTo(keys.Contains(key)));
+                }
+
+                for (int i = 0; i < 20; i++)
+                {
+                    BigInteger from = RandomKey();
+                    BigInteger to = RandomKey();
+                    if (from > to) (from, to) = (to, from);
+                    Assert.That(lazy.EntriesInRange(from, to),
+                        Is.EqualTo(eager.Where(kv => kv.Key >= from && kv.Key <= to)));
+
+                    int prefixLength = random.Next(0, keySize + 1);
+                    Bits prefix = Key(RandomKey(), keySize).Slice(0, prefixLength);
+                    Assert.That(lazy.EntriesWithPrefix(prefix),
+                        Is.EqualTo(eager.Where(kv => Key(kv.Key, keySize).Slice(0, prefixLength).Equals(prefix))));
+                }
+            }
+        }
+    }
+
+    [Test]
+    public void Test_RangeStartingAfterItsEndIsRejected()
+    {
+        HashmapOptions<BigInteger, BigInteger> opt = SignedOptions(8);
+        HashmapE<BigInteger, BigInteger> dict = new(opt);
+        for (int key = -3; key <= 3; key++) dict.Set(key, key);
+        LazyHashmap<BigInteger, BigInteger> lazy = dict.Build().Parse().LoadDictLazy(opt);
+
+        Assert.That(lazy.EntriesInRange(-3, -1).Select(kv => (int)kv.Key), Is.EqualTo(new[] { -3, -2, -1 }));
+        Assert.That(lazy.EntriesInRange(0, 2).Select(kv => (int)kv.Key), Is.EqualTo(new[] { 0, 1, 2 }));
+
+        // Negative keys sort after positive ones, so -2..2 would start after it ends
+        Assert.Throws<ArgumentException>(() => lazy.EntriesInRange(-2, 2));
+        Assert.Throws<ArgumentException>(() => lazy.EntriesInRange(2, 1));
+    }
+
+    [Test]
+    public void Test_ForkWithOneReferenceIsRejected()
+    {
+        // Three-bit keys: the root label 1, then a fork with only its left branch, a leaf labelled 0 (key 100)
+        Cell leaf = new CellBuilder().StoreBits("0100").StoreUInt(7, 64).Build();
+        Cell root = new CellBuilder().StoreBits("0101").StoreRef(leaf).Build();
+        LazyHashmap<BigInteger, BigInteger> lazy =
+            LazyHashmap<BigInteger, BigInteger>.FromRoot(root, HashmapTests.Options(3));
+
+        Assert.That(Assert.Catch(() => lazy.Get(4)).Message, Is.EqualTo("Hashmap: invalid hashmap structure"));
+        Assert.That(Assert.Catch(() => lazy.Max()).Message, Is.EqualTo("Hashmap: invalid hashmap structure"));
+        Assert.That(Assert.Catch(() => lazy.Entries.ToList()).Message,
+            Is.EqualTo("Hashmap: invalid hashmap structure"));
+    }
+
+    static HashmapOptions<BigInteger, BigInteger> SignedOptions(int keySize)
+    {
+        return new HashmapOptions<BigInteger, BigInteger>
+        {
+            KeySize = (uint)keySize,
+            Serializers = new HashmapSerializers<BigInteger, BigInteger>
+            {
+                Key = k => new BitsBuilder(keySize).StoreInt(k, keySize).Build(),
+                Value = v => new CellBuilder().StoreInt(v, 64).Build()
+            },
+            Deserializers = new HashmapDeserializers<BigInteger, BigInteger>
+            {
+                Key = k => k.Parse().LoadInt(keySize),
+                Value = v => v.Parse().LoadInt(64)
+            }
+        };
+    }
+
+    static Bits Key(BigInteger key, int keySize)
+    {
+        return new BitsBuilder(keySize).StoreUInt(key, keySize).Build();
+    }
+}
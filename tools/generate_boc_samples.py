@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+BoC sample generator for the TonSdk.Core tests
+
+Builds bags of cells laid out as the TON node writes them, from a reference implementation of cell levels,
+hashes and depths: a Merkle proof with a pruned branch and a Merkle update, serialized plain, with the has_idx
+index, with cache bits and with stored hashes. The real wallet v3r2 code BoC is written alongside them.
+
+Usage:
+    python generate_boc_samples.py            # check TonSdk.Core/test/Golden against the samples; exit 1 on a difference
+    python generate_boc_samples.py --update   # rewrite the sample files
+"""
+
+import argparse
+import hashlib
+import os
+import sys
+from typing import Dict, List, Optional
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+GOLDEN_DIR = os.path.join(SCRIPT_DIR, '..', 'TonSdk.Core', 'test', 'Golden')
+
+BOC_CONSTRUCTOR = 0xB5EE9C72
+ORDINARY, PRUNED_BRANCH, MERKLE_PROOF, MERKLE_UPDATE = -1, 1, 3, 4
+
+# Code of the v3r2 wallet as deployed on mainnet, code hash 84dafa449f98a6987789ba232358072bc0f76dc4524002a5d0918b9a75d2d599
+WALLET_V3R2_CODE = bytes.fromhex(
+    'B5EE9C724101010100710000DEFF0020DD2082014C97BA218201339CBAB19F71B0ED44D0D31FD31F31D70BFFE304E0A4F2608308D718'
+    '20D31FD31FD31FF82313BBF263ED44D0D31FD31FD3FFD15132BAF2A15144BAF2A204F901541055F910F2A3F8009320D74A96D307D402'
+    'FB00E8D101A4C8CB1FCB1FCBFFC9ED5410BD6DAD')
+
+
+def crc32c(data: bytes) -> int:
+    crc = 0xFFFFFFFF
+    for byte in data:
+        crc ^= byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ (0x82F63B78 if crc & 1 else 0)
+    return crc ^ 0xFFFFFFFF
+
+
+def is_significant(mask: int, level: int) -> bool:
+    return level == 0 or (mask >> (level - 1)) & 1 == 1
+
+
+def hashes_count(mask: int) -> int:
+    return bin(mask).count('1') + 1
+
+
+class Cell:
+    """Cell with its level mask, and its hashes and depths at every significant level, as the TON node computes
+    them: a pruned branch carries the lower ones in its data, Merkle cells look one level into their references."""
+
+    def __init__(self, bits: str, refs: Optional[List['Cell']] = None, kind: int = ORDINARY):
+        assert len(bits) <= 1023 and len(refs or []) <= 4
+        self.bits = bits
+        self.refs = refs or []
+        self.kind = kind
+        self.exotic = kind != ORDINARY
+
+        if kind == PRUNED_BRANCH:
+            self.mask = int(bits[8:16], 2)
+        elif kind in (MERKLE_PROOF, MERKLE_UPDATE):
+            self.mask = self.refs_mask() >> 1
+        else:
+            self.mask = self.refs_mask()
+
+        self.hashes: List[bytes] = []
+        self.depths: List[int] = []
+        level = self.mask.bit_length()
+        for level_i in range(level + 1):
+            if not is_significant(self.mask, level_i):
+                continue
+            if kind == PRUNED_BRANCH and level_i < level:
+                # hashes and depths of the pruned cell, stored in the data after the type and the mask
+                index = len(self.hashes)
+                count = hashes_count(self.mask) - 1
+                self.hashes.append(self.data_bytes()[2 + 32 * index:2 + 32 * (index + 1)])
+                depth_at = 2 + 32 * count + 2 * index
+                self.depths.append(int.from_bytes(self.data_bytes()[depth_at:depth_at + 2], 'big'))
+                continue
+
+            child_level = level_i + 1 if kind in (MERKLE_PROOF, MERKLE_UPDATE) else level_i
+            d1 = len(self.refs) + (8 if self.exotic else 0) + 32 * (self.mask & ((1 << level_i) - 1))
+            hasher = hashlib.sha256(bytes([d1, self.d2()]))
+            hasher.update(self.data_bytes() if not self.hashes or kind == PRUNED_BRANCH else self.hashes[-1])
+            for ref in self.refs:
+                hasher.update(ref.depth(child_level).to_bytes(2, 'big'))
+            for ref in self.refs:
+                hasher.update(ref.hash(child_level))
+            self.hashes.append(hasher.digest())
+            self.depths.append(max((ref.depth(child_level) for ref in self.refs), default=-1) + 1)
+
+    def refs_mask(self) -> int:
+        mask = 0
+        for ref in self.refs:
+            mask |= ref.mask
+        return mask
+
+    def index(self, level: int) -> int:
+        return hashes_count(self.mask & ((1 << level) - 1)) - 1
+
+    def hash(self, level: int = 3) -> bytes:
+        return self.hashes[self.index(level)]
+
+    def depth(self, level: int = 3) -> int:
+        return self.depths[self.index(level)]
+
+    def d2(self) -> int:
+        return (len(self.bits) + 7) // 8 + len(self.bits) // 8
+
+    def data_bytes(self) -> bytes:
+        bits = self.bits
+        if len(bits) % 8:
+            bits += '1' + '0' * (7 - len(bits) % 8)
+        return int(bits, 2).to_bytes(len(bits) // 8, 'big') if bits else b''
+
+
+def bits_of(data: bytes) -> str:
+    return ''.join(f'{byte:08b}' for byte in data)
+
+
+def pruned(cell: Cell) -> Cell:
+    """Pruned branch standing for a level 0 cell"""
+    assert cell.mask == 0
+    return Cell(bits_of(bytes([PRUNED_BRANCH, 1]) + cell.hash(0) + cell.depth(0).to_bytes(2, 'big')),
+                kind=PRUNED_BRANCH)
+
+
+def merkle_proof(virtual: Cell) -> Cell:
+    return Cell(bits_of(bytes([MERKLE_PROOF]) + virtual.hash(0) + virtual.depth(0).to_bytes(2, 'big')), [virtual],
+                MERKLE_PROOF)
+
+
+def merkle_update(old: Cell, new: Cell) -> Cell:
+    data = bytes([MERKLE_UPDATE]) + old.hash(0) + new.hash(0)
+    data += old.depth(0).to_bytes(2, 'big') + new.depth(0).to_bytes(2, 'big')
+    return Cell(bits_of(data), [old, new], MERKLE_UPDATE)
+
+
+class Random:
+    """Small LCG, so the samples don't depend on the Python version"""
+
+    def __init__(self, seed: int):
+        self.state = seed
+
+    def next(self, bound: int) -> int:
+        self.state = (self.state * 6364136223846793005 + 1442695040888963407) % (1 << 64)
+        return (self.state >> 33) % bound
+
+    def bits(self, length: int) -> str:
+        return ''.join('1' if self.next(2) else '0' for _ in range(length))
+
+
+def tree(random: Random, cells: int, shared: Cell) -> Cell:
+    """Ordinary tree of about `cells` cells with odd bit lengths; `shared` is referenced from several places"""
+    if cells <= 1:
+        return Cell(random.bits(random.next(1024)))
+    arity = 1 + random.next(3)
+    children = [tree(random, (cells - 1) // arity, shared) for _ in range(arity)]
+    if random.next(4) == 0:
+        children.append(shared)
+    return Cell(random.bits(random.next(300)), children)
+
+
+def serialize(roots: List[Cell], has_idx: bool = False, cache_bits: bool = False, with_hashes: bool = False,
+              crc: bool = True) -> bytes:
+    """BoC of the cells reachable from roots; equal cells are stored once and every cell comes before its refs"""
+    order: List[Cell] = []
+    positions: Dict[bytes, int] = {}
+
+    def visit(cell: Cell):
+        key = cell.hash()
+        if key in positions:
+            return
+        positions[key] = -1
+        order.append(cell)
+        for ref in cell.refs:
+            visit(ref)
+
+    for root in roots:
+        visit(root)
+
+    # order is pre-order, so a cell can come after one of its refs when that ref is shared; sort by depth instead
+    order.sort(key=lambda c: -c.depth())
+    for i, cell in enumerate(order):
+        positions[cell.hash()] = i
+
+    size = max(1, (len(order).bit_length() + 7) // 8)
+    cells = []
+    for cell in order:
+        d1 = len(cell.refs) + (8 if cell.exotic else 0) + (16 if with_hashes else 0) + 32 * cell.mask
+        body = bytes([d1, cell.d2()])
+        if with_hashes:
+            body += b''.join(cell.hashes) + b''.join(depth.to_bytes(2, 'big') for depth in cell.depths)
+        body += cell.data_bytes()
+        body += b''.join(positions[ref.hash()].to_bytes(size, 'big') for ref in cell.refs)
+        cells.append(body)
+
+    total = sum(len(c) for c in cells)
+    offset_bytes = max(1, ((total << 1 if cache_bits else total).bit_length() + 7) // 8)
+    flags = (0x80 if has_idx else 0) | (0x40 if crc else 0) | (0x20 if cache_bits else 0) | size
+    out = BOC_CONSTRUCTOR.to_bytes(4, 'big') + bytes([flags, offset_bytes])
+    out += len(order).to_bytes(size, 'big') + len(roots).to_bytes(size, 'big') + (0).to_bytes(size, 'big')
+    out += total.to_bytes(offset_bytes, 'big')
+    out += b''.join(positions[root.hash()].to_bytes(size, 'big') for root in roots)
+    if has_idx:
+        end = 0
+        for i, body in enumerate(cells):
+            end += len(body)
+            # with cache bits every entry is doubled and its low bit marks cells worth caching: here the shared ones
+            entry = (end << 1) | (i % 3 == 0) if cache_bits else end
+            out += entry.to_bytes(offset_bytes, 'big')
+    out += b''.join(cells)
+    if crc:
+        out += crc32c(out).to_bytes(4, 'little')
+    return out
+
+
+def build_samples() -> Dict[str, bytes]:
+    random = Random(1)
+    shared = Cell(random.bits(77))
+    hidden = tree(random, 40, shared)
+    kept = tree(random, 300, shared)
+
+    full = Cell(random.bits(123), [hidden, kept])
+    virtual = Cell(full.bits, [pruned(hidden), kept])
+    assert virtual.hash(0) == full.hash(0) and virtual.depth(0) == full.depth(0), 'pruning must keep the level 0 hash'
+    proof = merkle_proof(virtual)
+
+    changed = Cell(random.bits(123), [pruned(hidden), Cell(random.bits(64))])
+    update = merkle_update(virtual, changed)
+
+    return {
+        'proof.boc': serialize([proof]),
+        'proof_idx.boc': serialize([proof], has_idx=True),
+        'proof_idx_cache_bits.boc': serialize([proof], has_idx=True, cache_bits=True),
+        'proof_hashes.boc': serialize([proof], has_idx=True, with_hashes=True),
+        'update_two_roots_hashes.boc': serialize([update, proof], with_hashes=True, crc=False),
+        'wallet_v3r2_code.boc': WALLET_V3R2_CODE,
+    }
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description='Generate the BoC samples of the TonSdk.Core tests')
+    parser.add_argument('--update', action='store_true', help='Rewrite the sample files instead of checking them')
+    args = parser.parse_args(argv)
+
+    assert crc32c(WALLET_V3R2_CODE[:-4]) == int.from_bytes(WALLET_V3R2_CODE[-4:], 'little')
+
+    stale = []
+    for name, content in build_samples().items():
+        path = os.path.normpath(os.path.join(GOLDEN_DIR, name))
+        current = open(path, 'rb').read() if os.path.exists(path) else None
+        if current == content:
+            continue
+        if args.update:
+            os.makedirs(GOLDEN_DIR, exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(content)
+            print(f'Wrote {path}')
+        else:
+            stale.append(path)
+
+    for path in stale:
+        print(f'{path} differs from the generated sample; run with --update to rewrite it', file=sys.stderr)
+    sys.exit(1 if stale else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -2,22 +2,53 @@
 """
 TL Schema to C# Code Generator
 Parses lite_api.tl and generates type-safe C# code
+
+Usage:
+    python generate_schema.py                        # fetch lite_api.tl from the TON repository
+    python generate_schema.py --schema lite_api.tl   # offline, from one or more local files
+    python generate_schema.py --root liteServer.getAccountState --output-dir Protocol
+                                                     # only what getAccountState needs, one file per namespace
+    python generate_schema.py --schema lite_api.tl --update-golden
+                                                     # also rewrite the golden corpus, suite and benchmarks
+
+Alongside the schema it builds the golden corpus (TonSdk.Adnl/test/Golden) from the Python reference codec in
+tl_codec.py, the NUnit suite that checks the generated codecs against it and the matching benchmarks, and
+compares them with the checked-in files: any difference is reported and the exit status is 1. Pass
+--update-golden to rewrite them instead, or --no-golden to skip them.
 """
 
+import argparse
+import hashlib
+import json
+import os
+import random
 import re
+import struct
+import sys
+import time
 import zlib
 from typing import List, Dict, Tuple, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 import urllib.request
 
+import tl_codec
+
 LITE_API_URL = "https://raw.githubusercontent.com/ton-blockchain/ton/master/tl/generate/scheme/lite_api.tl"
 
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_OUTPUT = os.path.join(SCRIPT_DIR, '..', 'TonSdk.Adnl', 'src', 'LiteClient', 'Protocol', 'Schema.Generated.cs')
+DEFAULT_CACHE_DIR = os.path.join(SCRIPT_DIR, '.schema_cache')
+GOLDEN_CORPUS_PATH = os.path.join(SCRIPT_DIR, '..', 'TonSdk.Adnl', 'test', 'Golden', 'lite_api.golden')
+GOLDEN_TESTS_PATH = os.path.join(SCRIPT_DIR, '..', 'TonSdk.Adnl', 'test', 'GoldenVectorTests.Generated.cs')
+GOLDEN_BENCHMARKS_PATH = os.path.join(SCRIPT_DIR, '..', 'TonSdk.Adnl', 'benchmarks', 'GoldenCorpusBenchmarks.Generated.cs')
+
 @dataclass
 class TLField:
     name: str
     type: str
     is_optional: bool = False
     condition: Optional[str] = None  # e.g., "mode.0" for conditional fields
+    tl_type: str = ''  # TL type as written in the schema, e.g. "int256" or "vector int"
 
 @dataclass
 class TLType:
@@ -44,8 +75,8 @@ def parse_type(type_str: str, field_name: str = '') -> Tuple[str, bool]:
         'bytes': 'byte[]',
         'Bool': 'bool',
         'true': 'bool',
-        'int256': 'byte[]',  # 32 bytes
-        'int128': 'byte[]',  # 16 bytes
+        'int256': 'TLInt256',  # unmanaged 32-byte value
+        'int128': 'TLInt128',  # unmanaged 16-byte value
         '#': 'uint',
     }
     
@@ -79,7 +110,7 @@ def parse_field(field_str: str) -> Optional[TLField]:
         if type_str.startswith('(') and type_str.endswith(')'):
             type_str = type_str[1:-1]
         cs_type, _ = parse_type(type_str, name)
-        return TLField(name=name, type=cs_type, is_optional=True, condition=condition)
+        return TLField(name=name, type=cs_type, is_optional=True, condition=condition, tl_type=type_str)
     
     # Handle regular fields: name:type or name:(type)
     field_match = re.match(r'(\w+):(.+)', field_str)
@@ -90,7 +121,7 @@ def parse_field(field_str: str) -> Optional[TLField]:
         if type_str.startswith('(') and type_str.endswith(')'):
             type_str = type_str[1:-1]
         cs_type, is_optional = parse_type(type_str, name)
-        return TLField(name=name, type=cs_type, is_optional=is_optional)
+        return TLField(name=name, type=cs_type, is_optional=is_optional, tl_type=type_str)
     
     return None
 
@@ -203,12 +234,12 @@ def generate_field_declaration(field: TLField) -> str:
     # Provide default values for all types (no nullable)
     if cs_type == 'byte[]':
         return f"public {cs_type} {prop_name} {{ get; set; }} = Array.Empty<byte>();"
-    elif cs_type.endswith('[]') and not cs_type.startswith('byte'):
+    elif cs_type.endswith('[]'):
         inner = cs_type[:-2]
         return f"public {cs_type} {prop_name} {{ get; set; }} = Array.Empty<{inner}>();"
     elif cs_type == 'string':
         return f'public {cs_type} {prop_name} {{ get; set; }} = string.Empty;'
-    elif cs_type in ['int', 'uint', 'long', 'double']:
+    elif cs_type in ['int', 'uint', 'long', 'double', 'TLInt256', 'TLInt128']:
         return f'public {cs_type} {prop_name} {{ get; set; }}'  # Value types default to 0
     elif cs_type == 'bool':
         return f'public {cs_type} {prop_name} {{ get; set; }}'  # Defaults to false
@@ -216,8 +247,11 @@ def generate_field_declaration(field: TLField) -> str:
         # Custom types (classes) - nullable disable means they can be null
         return f'public {cs_type} {prop_name} {{ get; set; }}'
 
-def generate_struct_or_class(tl_type: TLType, is_struct: bool = False, union_types: dict = None) -> str:
-    """Generate C# struct or class for a TL type"""
+def generate_struct_or_class(tl_type: TLType, is_struct: bool = False, union_types: dict = None,
+                             span_codecs: bool = False, fixed_sizes: Dict[str, int] = None,
+                             min_sizes: Dict[str, int] = None, boxed: bool = False) -> str:
+    """Generate C# struct or class for a TL type.
+    With boxed, the type is also referenced by its result type and gets ReadBoxedFrom/WriteBoxedTo."""
     class_name = to_pascal_case(tl_type.name)
     keyword = 'struct' if is_struct else 'class'
     readonly = 'readonly ' if is_struct else ''
@@ -274,117 +308,497 @@ def generate_struct_or_class(tl_type: TLType, is_struct: bool = False, union_typ
             lines.append(f'        {prop_name} = {param_name};')
         lines.append('    }')
     
-    # Generate WriteTo method
     if tl_type.fields:
+        lines.extend(generate_serialized_size(tl_type, base_class, fixed_sizes or {}))
+        lines.extend(generate_write_to(tl_type, base_class))
+        lines.extend(generate_read_from(tl_type, class_name, is_struct, min_sizes=min_sizes))
+        if span_codecs:
+            lines.extend(generate_write_to(tl_type, base_class, span=True))
+            lines.extend(generate_read_from(tl_type, class_name, is_struct, span=True, min_sizes=min_sizes))
+    
+    if boxed and not is_struct and not base_class:
+        lines.extend(generate_boxed_codecs(class_name, tl_type.result_type, span_codecs, union=False))
+    
+    lines.append('}')
+    return '\n'.join(lines)
+
+def element_tl_type(tl_type: str) -> str:
+    """TL element type of a vector, e.g. 'vector int256' -> 'int256'"""
+    match = re.match(r'vector\s+(.+)', tl_type.strip(), re.IGNORECASE)
+    return match.group(1).strip() if match else tl_type
+
+def is_boxed_reference(tl_type: str) -> bool:
+    """A reference to a capitalised result type (e.g. liteServer.BlockLink) is boxed: the value is preceded by
+    its constructor id. Lowercase references (liteServer.blockLink) are bare."""
+    name = tl_type.strip()
+    return '.' in name and ' ' not in name and name.rsplit('.', 1)[1][:1].isupper()
+
+PRIMITIVE_SIZES = {'int': 4, 'uint': 4, 'bool': 4, 'long': 8, 'double': 8, 'TLInt256': 32, 'TLInt128': 16}
+
+def get_size_terms(cs_type: str, prop_name: str, tl_type: str, fixed_sizes: Dict[str, int]) -> Tuple[int, List[str]]:
+    """Serialized size of a field as (fixed byte count, statements adding the variable part to `size`).
+    Mirrors get_write_method, so GetSerializedSize always matches what WriteTo produces."""
+    if cs_type in PRIMITIVE_SIZES:
+        return PRIMITIVE_SIZES[cs_type], []
+    if cs_type == 'byte[]':
+        return 0, [f'size += TLWriteBuffer.GetBufferSize({prop_name}.Length);']
+    if cs_type == 'string':
+        return 0, [f'size += TLWriteBuffer.GetStringSize({prop_name});']
+    if cs_type.endswith('[]'):
+        element_type = cs_type[:-2]
+        element_fixed, element_dynamic = get_size_terms(element_type, 'item', element_tl_type(tl_type), fixed_sizes)
+        if not element_dynamic:
+            return 4, [f'size += {prop_name}.Length * {element_fixed};']
+        element_expr = element_dynamic[0][len('size += '):-1]
+        if element_fixed:
+            element_expr = f'{element_fixed} + {element_expr}'
+        return 4, [f'foreach (var item in {prop_name})', f'    size += {element_expr};']
+    boxed = 4 if is_boxed_reference(tl_type) else 0
+    if cs_type in fixed_sizes:
+        return boxed + fixed_sizes[cs_type], []
+    return boxed, [f'size += {prop_name}.GetSerializedSize();']
+
+def compute_fixed_sizes(types: List[TLType], union_types: dict) -> Dict[str, int]:
+    """Map C# type name -> serialized size for types whose encoding never varies in length"""
+    fixed_sizes: Dict[str, int] = {}
+    changed = True
+    while changed:
+        changed = False
+        for tl_type in types:
+            class_name = to_pascal_case(tl_type.name)
+            if class_name in fixed_sizes or not tl_type.fields or tl_type.result_type in union_types:
+                continue
+            total = 0
+            for field in tl_type.fields:
+                fixed, dynamic = get_size_terms(field.type, to_pascal_case(field.name), field.tl_type, fixed_sizes)
+                if dynamic or field.condition:
+                    break
+                total += fixed
+            else:
+                fixed_sizes[class_name] = total
+                changed = True
+    return fixed_sizes
+
+def min_field_size(cs_type: str, tl_type: str, min_sizes: Dict[str, int]) -> Optional[int]:
+    """Smallest serialized size of a value; None while a referenced type is still unresolved"""
+    if cs_type in PRIMITIVE_SIZES:
+        return PRIMITIVE_SIZES[cs_type]
+    if cs_type in ('byte[]', 'string'):
+        return 4  # empty bytes: length byte padded to 4
+    if cs_type.endswith('[]'):
+        return 4  # empty string / vector count
+    if cs_type not in min_sizes:
+        return None
+    return min_sizes[cs_type] + (4 if is_boxed_reference(tl_type) else 0)
+
+def compute_min_sizes(types: List[TLType], union_types: dict) -> Dict[str, int]:
+    """Map C# type name -> smallest possible bare serialized size, used to bound vector counts before allocating.
+    A union base maps to its smallest implementation; min_field_size adds the constructor of boxed references."""
+    min_sizes: Dict[str, int] = {}
+    changed = True
+    while changed:
+        changed = False
+        for tl_type in types:
+            class_name = to_pascal_case(tl_type.name)
+            if class_name in min_sizes:
+                continue
+            sizes = [0 if f.condition else min_field_size(f.type, f.tl_type, min_sizes) for f in tl_type.fields]
+            if None not in sizes:
+                min_sizes[class_name] = sum(sizes)
+                changed = True
+        for result_type, implementations in union_types.items():
+            base = to_pascal_case(result_type)
+            impl_sizes = [min_sizes.get(to_pascal_case(t.name)) for t in implementations]
+            if base not in min_sizes and None not in impl_sizes:
+                min_sizes[base] = min(impl_sizes)
+                changed = True
+    return min_sizes
+
+def generate_boxed_codecs(class_name: str, result_type: str, span_codecs: bool, union: bool) -> List[str]:
+    """Generate WriteBoxedTo/ReadBoxedFrom for a type referenced as a boxed result type: the constructor id
+    goes before the fields. A union base's ReadFrom already dispatches on the constructor."""
+    lines = []
+    for span in ([False, True] if span_codecs else [False]):
+        writer_param, reader_param, writer_arg, reader_arg = codec_signature(span)
+        lines.append('')
+        lines.append(f'    public void WriteBoxedTo({writer_param})')
+        lines.append('    {')
+        lines.append('        writer.WriteUInt32(Constructor);')
+        lines.append(f'        WriteTo({writer_arg});')
+        lines.append('    }')
         lines.append('')
-        # Use override if inheriting from abstract base
-        write_modifier = 'override' if base_class else ''
-        write_modifier_str = f'public {write_modifier} void WriteTo(TLWriteBuffer writer)'.strip()
-        lines.append(f'    {write_modifier_str}')
+        lines.append(f'    public static {class_name} ReadBoxedFrom({reader_param})')
         lines.append('    {')
+        if union:
+            lines.append(f'        return ReadFrom({reader_arg});')
+        else:
+            lines.append('        uint constructor = reader.ReadUInt32();')
+            lines.append('        if (constructor != Constructor)')
+            lines.append(f'            throw new Exception($"Unknown constructor 0x{{constructor:X8}} for {result_type}");')
+            lines.append(f'        return ReadFrom({reader_arg});')
+        lines.append('    }')
+    return lines
+
+def generate_serialized_size(tl_type: TLType, base_class: Optional[str], fixed_sizes: Dict[str, int],
+                             extra_size: int = 0) -> List[str]:
+    """Generate GetSerializedSize(), the exact number of bytes WriteTo will produce"""
+    modifier = 'override ' if base_class else ''
+    fixed_total = extra_size
+    body = []
+    for field in tl_type.fields:
+        prop_name = to_pascal_case(field.name)
+        fixed, dynamic = get_size_terms(field.type, prop_name, field.tl_type, fixed_sizes)
+        condition_match = re.match(r'(\w+)\.(\d+)', field.condition) if field.condition else None
+        if field.is_optional and condition_match:
+            mode_field, bit = condition_match.groups()
+            body.append(f'if (({to_pascal_case(mode_field)} & (1u << {bit})) != 0)')
+            body.append('{')
+            if fixed:
+                body.append(f'    size += {fixed};')
+            body.extend('    ' + statement for statement in dynamic)
+            body.append('}')
+        else:
+            fixed_total += fixed
+            body.extend(dynamic)
+
+    if not body:
+        return ['', f'    public {modifier}int GetSerializedSize() => {fixed_total};']
+
+    lines = ['', f'    public {modifier}int GetSerializedSize()', '    {', f'        int size = {fixed_total};']
+    lines.extend('        ' + statement for statement in body)
+    lines.append('        return size;')
+    lines.append('    }')
+    return lines
+
+def codec_signature(span: bool) -> Tuple[str, str, str, str]:
+    """Return (writer parameter, reader parameter, writer argument, reader argument) for a codec flavour"""
+    if span:
+        return 'ref TLSpanWriter writer', 'ref TLSpanReader reader', 'ref writer', 'ref reader'
+    return 'TLWriteBuffer writer', 'TLReadBuffer reader', 'writer', 'reader'
+
+def generate_write_to(tl_type: TLType, base_class: Optional[str], span: bool = False,
+                      prologue: List[str] = None) -> List[str]:
+    """Generate the WriteTo method of a type, against TLWriteBuffer or TLSpanWriter"""
+    writer_param, _, _, _ = codec_signature(span)
+    lines = ['']
+    # Use override if inheriting from abstract base
+    write_modifier = 'override' if base_class else ''
+    write_modifier_str = f'public {write_modifier} void WriteTo({writer_param})'.strip()
+    lines.append(f'    {write_modifier_str}')
+    lines.append('    {')
+    for statement in prologue or []:
+        lines.append(f'        {statement}')
+    for field in tl_type.fields:
+        prop_name = to_pascal_case(field.name)
+        write_method = get_write_method(field.type, prop_name, field.tl_type, span)
+        if field.is_optional and field.condition:
+            # Handle conditional writes (e.g., mode.0?field means write if bit 0 of mode is set)
+            condition_match = re.match(r'(\w+)\.(\d+)', field.condition)
+            if condition_match:
+                mode_field, bit = condition_match.groups()
+                mode_prop = to_pascal_case(mode_field)
+                lines.append(f'        if (({mode_prop} & (1u << {bit})) != 0)')
+                lines.append(f'        {{')
+                lines.append(f'            {write_method}')
+                lines.append(f'        }}')
+            else:
+                lines.append(f'        {write_method}')
+        else:
+            lines.append(f'        {write_method}')
+    lines.append('    }')
+    return lines
+
+def generate_read_from(tl_type: TLType, class_name: str, is_struct: bool, span: bool = False,
+                       min_sizes: Dict[str, int] = None) -> List[str]:
+    """Generate the static ReadFrom method of a type, against TLReadBuffer or TLSpanReader"""
+    reader_param = codec_signature(span)[1]
+    lines = ['']
+    lines.append(f'    public static {class_name} ReadFrom({reader_param})')
+    lines.append('    {')
+    if is_struct:
+        lines.append('        return new ' + class_name + '(')
+        read_statements = []
         for field in tl_type.fields:
-            prop_name = to_pascal_case(field.name)
-            write_method = get_write_method(field.type, prop_name, field.name)
-            if field.is_optional and field.condition:
-                # Handle conditional writes (e.g., mode.0?field means write if bit 0 of mode is set)
-                condition_match = re.match(r'(\w+)\.(\d+)', field.condition)
-                if condition_match:
+            read_method = get_read_method(field.type, field.tl_type, span)
+            read_statements.append(f'            {read_method}')
+        lines.append(',\n'.join(read_statements))
+        lines.append('        );')
+    else:
+        # Conditional fields depend on the mode read before them, and vectors need a loop,
+        # so either one switches from an object initializer to statements
+        has_conditional = any(f.is_optional and f.condition for f in tl_type.fields)
+        has_loops = any(len(get_read_statements(f, '', span, min_sizes or {})) > 1 for f in tl_type.fields)
+        if has_conditional or has_loops:
+            lines.append(f'        var result = new {class_name}();')
+            for field in tl_type.fields:
+                prop_name = to_pascal_case(field.name)
+                statements = get_read_statements(field, f'result.{prop_name}', span, min_sizes or {})
+                condition_match = re.match(r'(\w+)\.(\d+)', field.condition) if field.condition else None
+                if field.is_optional and condition_match:
                     mode_field, bit = condition_match.groups()
                     mode_prop = to_pascal_case(mode_field)
-                    lines.append(f'        if (({mode_prop} & (1u << {bit})) != 0)')
-                    lines.append(f'        {{')
-                    lines.append(f'            {write_method}')
-                    lines.append(f'        }}')
+                    lines.append(f'        if ((result.{mode_prop} & (1u << {bit})) != 0)')
+                    if len(statements) > 1:
+                        lines.append('        {')
+                        lines.extend(f'            {statement}' for statement in statements)
+                        lines.append('        }')
+                    else:
+                        lines.append(f'            {statements[0]}')
                 else:
-                    lines.append(f'        {write_method}')
-            else:
-                lines.append(f'        {write_method}')
-        lines.append('    }')
-    
-    # Generate ReadFrom method
-    if tl_type.fields:
+                    lines.extend(f'        {statement}' for statement in statements)
+            lines.append('        return result;')
+        else:
+            lines.append(f'        return new {class_name}')
+            lines.append('        {')
+            for field in tl_type.fields:
+                prop_name = to_pascal_case(field.name)
+                read_method = get_read_method(field.type, field.tl_type, span)
+                lines.append(f'            {prop_name} = {read_method},')
+            lines.append('        };')
+    lines.append('    }')
+    return lines
+
+def generate_request_class(func: TLType, span_codecs: bool, fixed_sizes: Dict[str, int]) -> str:
+    """Generate a typed request for a TL function: its fields plus a WriteTo that emits the constructor first.
+    Bare `mode.N?true` flags carry no payload, so they become bool views over the mode bit."""
+    class_name = request_class_name(func)
+    flags = [f for f in func.fields if f.tl_type == 'true' and f.condition]
+    payload = TLType(name=func.name, fields=[f for f in func.fields if f not in flags],
+                     result_type=func.result_type, is_function=True, constructor=func.constructor)
+
+    lines = []
+    lines.append('/// <summary>')
+    lines.append(f'/// {func.name} = {func.result_type}')
+    lines.append('/// </summary>')
+    lines.append(f'public class {class_name} : ILiteServerRequest')
+    lines.append('{')
+    lines.append(f'    public const uint Constructor = 0x{func.constructor:08X};')
+    if payload.fields:
+        lines.append('')
+    for field in payload.fields:
+        lines.append(f'    {generate_field_declaration(field)}')
+    for flag in flags:
+        mode_field, bit = flag.condition.split('.')
+        mode_prop = to_pascal_case(mode_field)
         lines.append('')
-        lines.append(f'    public static {class_name} ReadFrom(TLReadBuffer reader)')
+        lines.append(f'    public bool {to_pascal_case(flag.name)}')
         lines.append('    {')
-        if is_struct:
-            lines.append('        return new ' + class_name + '(')
-            read_statements = []
-            for field in tl_type.fields:
-                read_method = get_read_method(field.type, field.name)
-                read_statements.append(f'            {read_method}')
-            lines.append(',\n'.join(read_statements))
-            lines.append('        );')
+        lines.append(f'        get => ({mode_prop} & (1u << {bit})) != 0;')
+        lines.append(f'        set => {mode_prop} = value ? {mode_prop} | (1u << {bit}) : {mode_prop} & ~(1u << {bit});')
+        lines.append('    }')
+
+    lines.extend(generate_serialized_size(payload, None, fixed_sizes, extra_size=4))
+    lines.extend(generate_write_to(payload, None, prologue=['writer.WriteUInt32(Constructor);']))
+    if span_codecs:
+        lines.extend(generate_write_to(payload, None, span=True, prologue=['writer.WriteUInt32(Constructor);']))
+    lines.append('}')
+    return '\n'.join(lines)
+
+VIEW_SCALARS = {
+    'int': (4, 'ReadInt32'),
+    'uint': (4, 'ReadUInt32'),
+    'long': (8, 'ReadInt64'),
+    'bool': (4, 'ReadBool'),
+    'TLInt256': (32, 'ReadInt256'),
+    'TLInt128': (16, 'ReadInt128'),
+}
+
+def view_field_kind(field: TLField, fixed_sizes: Dict[str, int]) -> Optional[Tuple[str, int]]:
+    """Classify a field for view generation as (kind, fixed width); None when a view cannot skip over it.
+    Kinds: scalar (including int256/int128), buffer (length-prefixed bytes) and object (fixed-size type)."""
+    if field.type in VIEW_SCALARS:
+        return 'scalar', VIEW_SCALARS[field.type][0]
+    if field.type == 'byte[]':
+        return 'buffer', 0
+    if field.type in fixed_sizes and not is_boxed_reference(field.tl_type):
+        return 'object', fixed_sizes[field.type]
+    return None
+
+def view_class_name(tl_type: TLType) -> str:
+    return f'{to_pascal_case(tl_type.name)}View'
+
+def generate_view(tl_type: TLType, fixed_sizes: Dict[str, int]) -> Optional[str]:
+    """Generate a zero-copy view: a readonly struct over the serialized buffer that records field offsets once.
+    Scalars and nested fixed-size types are decoded on access, bytes fields are returned as slices.
+    Returns None for types a view cannot walk without decoding (vectors, strings, variable-size objects)."""
+    kinds = [view_field_kind(f, fixed_sizes) for f in tl_type.fields]
+    if any(kind is None for kind in kinds) or not any(kind[0] == 'buffer' for kind in kinds):
+        return None
+
+    class_name = to_pascal_case(tl_type.name)
+    view_name = view_class_name(tl_type)
+    mode_fields = {re.match(r'(\w+)\.', f.condition).group(1) for f in tl_type.fields if f.is_optional and f.condition}
+
+    stored = []       # instance fields holding offsets/lengths that are only known after parsing
+    walk = []         # constructor statements
+    accessors = []
+    materialize = []
+    static_offset: Optional[int] = 0
+
+    for field, (kind, width) in zip(tl_type.fields, kinds):
+        prop_name = to_pascal_case(field.name)
+        offset_name = f'{to_camel_case(field.name)}Offset'
+        length_name = f'{to_camel_case(field.name)}Length'
+        condition = None
+        if field.is_optional and field.condition:
+            mode_field, bit = re.match(r'(\w+)\.(\d+)', field.condition).groups()
+            condition = f'({mode_field} & (1u << {bit})) != 0'
+            static_offset = None
+
+        if kind == 'buffer':
+            stored += [offset_name, length_name]
+            statement = f'{offset_name} = reader.SkipBuffer(out {length_name});'
+            walk += [f'if ({condition})', f'    {statement}'] if condition else [statement]
+            accessors.append(f'public ReadOnlyMemory<byte> {prop_name} => buffer.Slice({offset_name}, {length_name});')
+            materialize.append(f'{prop_name} = {prop_name}.ToArray(),')
+            static_offset = None
+            continue
+
+        if static_offset is not None:
+            offset = str(static_offset)
+            if field.name in mode_fields:
+                walk.append(f'uint {field.name} = reader.ReadUInt32();')
+            else:
+                walk.append(f'reader.Skip({width});')
+            static_offset += width
         else:
-            # For classes with conditional fields, need to read mode first
-            has_conditional = any(f.is_optional and f.condition for f in tl_type.fields)
-            if has_conditional:
-                lines.append(f'        var result = new {class_name}();')
-                for field in tl_type.fields:
-                    prop_name = to_pascal_case(field.name)
-                    read_method = get_read_method(field.type, field.name)
-                    if field.is_optional and field.condition:
-                        condition_match = re.match(r'(\w+)\.(\d+)', field.condition)
-                        if condition_match:
-                            mode_field, bit = condition_match.groups()
-                            mode_prop = to_pascal_case(mode_field)
-                            lines.append(f'        if ((result.{mode_prop} & (1u << {bit})) != 0)')
-                            lines.append(f'            result.{prop_name} = {read_method};')
-                        else:
-                            lines.append(f'        result.{prop_name} = {read_method};')
-                    else:
-                        lines.append(f'        result.{prop_name} = {read_method};')
-                lines.append('        return result;')
+            offset = offset_name
+            stored.append(offset_name)
+            if field.name in mode_fields:
+                skip = [f'{offset_name} = reader.Position;', f'uint {field.name} = reader.ReadUInt32();']
             else:
-                # Check if we have any array fields that need special handling
-                has_arrays = any(f.type.endswith('[]') and f.type != 'byte[]' for f in tl_type.fields)
-                
-                if has_arrays:
-                    # Generate imperative style for better array reading
-                    lines.append(f'        var result = new {class_name}();')
-                    for field in tl_type.fields:
-                        prop_name = to_pascal_case(field.name)
-                        if field.type.endswith('[]') and field.type != 'byte[]':
-                            element_type = field.type[:-2]
-                            lines.append(f'        uint {prop_name.lower()}Count = reader.ReadUInt32();')
-                            lines.append(f'        result.{prop_name} = new {element_type}[{prop_name.lower()}Count];')
-                            lines.append(f'        for (int i = 0; i < {prop_name.lower()}Count; i++)')
-                            lines.append(f'        {{')
-                            lines.append(f'            result.{prop_name}[i] = {element_type}.ReadFrom(reader);')
-                            lines.append(f'        }}')
-                        else:
-                            read_method = get_read_method(field.type, field.name)
-                            lines.append(f'        result.{prop_name} = {read_method};')
-                    lines.append('        return result;')
-                else:
-                    lines.append(f'        return new {class_name}')
-                    lines.append('        {')
-                    for field in tl_type.fields:
-                        prop_name = to_pascal_case(field.name)
-                        read_method = get_read_method(field.type, field.name)
-                        lines.append(f'            {prop_name} = {read_method},')
-                    lines.append('        };')
-        lines.append('    }')
-    
+                skip = [f'{offset_name} = reader.Position;', f'reader.Skip({width});']
+            if condition:
+                walk.append(f'{offset_name} = -1;')
+                walk += [f'if ({condition})', '{'] + ['    ' + st for st in skip] + ['}']
+            else:
+                walk += skip
+
+        absent = f'{offset_name} < 0 ? default : ' if condition else ''
+        if kind == 'scalar':
+            accessors.append(f'public {field.type} {prop_name} => {absent}At({offset}).{VIEW_SCALARS[field.type][1]}();')
+            materialize.append(f'{prop_name} = {prop_name},')
+        else:
+            accessors.append(f'public {field.type} {prop_name}')
+            accessors.append('{')
+            accessors.append('    get')
+            accessors.append('    {')
+            if condition:
+                accessors.append(f'        if ({offset_name} < 0) return default;')
+            accessors.append(f'        TLSpanReader reader = At({offset});')
+            accessors.append(f'        return {field.type}.ReadFrom(ref reader);')
+            accessors.append('    }')
+            accessors.append('}')
+            materialize.append(f'{prop_name} = {prop_name},')
+
+    lines = []
+    lines.append('/// <summary>')
+    lines.append(f'/// View over {tl_type.name} = {tl_type.result_type}')
+    lines.append(f'/// bytes fields are slices of the underlying buffer; Materialize() returns an owning {class_name}')
+    lines.append('/// </summary>')
+    lines.append(f'public readonly struct {view_name}')
+    lines.append('{')
+    lines.append('    readonly ReadOnlyMemory<byte> buffer;')
+    for name in stored:
+        lines.append(f'    readonly int {name};')
+    lines.append('')
+    lines.append(f'    public {view_name}(ReadOnlyMemory<byte> buffer)')
+    lines.append('    {')
+    lines.append('        this.buffer = buffer;')
+    lines.append('        TLSpanReader reader = new(buffer.Span);')
+    lines.extend('        ' + statement for statement in walk)
+    lines.append('    }')
+    lines.append('')
+    lines.append('    /// <summary>')
+    lines.append('    /// The serialized bytes this view was parsed from')
+    lines.append('    /// </summary>')
+    lines.append('    public ReadOnlyMemory<byte> Buffer => buffer;')
+    for accessor in accessors:
+        if not accessor.startswith((' ', '{', '}')):
+            lines.append('')
+        lines.append('    ' + accessor)
+    lines.append('')
+    lines.append('    TLSpanReader At(int offset) => new(buffer.Span.Slice(offset));')
+    lines.append('')
+    lines.append(f'    public {class_name} Materialize()')
+    lines.append('    {')
+    lines.append(f'        return new {class_name}')
+    lines.append('        {')
+    lines.extend('            ' + statement for statement in materialize)
+    lines.append('        };')
+    lines.append('    }')
+    lines.append('}')
+    return '\n'.join(lines)
+
+def generate_registry(registered: List[TLType]) -> str:
+    """Generate the constructor registry: switch-based dispatch from a constructor id to its decoder.
+    The C# compiler lowers these switches to jump tables / binary search, so lookup never allocates."""
+    seen: Dict[int, str] = {}
+    for tl_type in registered:
+        if tl_type.constructor in seen:
+            raise ValueError(f'Constructor 0x{tl_type.constructor:08X} is shared by '
+                             f'{seen[tl_type.constructor]} and {tl_type.name}')
+        seen[tl_type.constructor] = tl_type.name
+
+    lines = []
+    lines.append('/// <summary>')
+    lines.append(f'/// Constructor registry for all {len(registered)} generated types')
+    lines.append('/// </summary>')
+    lines.append('public static partial class TLSerializer')
+    lines.append('{')
+    lines.append('    static readonly uint[] knownConstructors =')
+    lines.append('    {')
+    for tl_type in registered:
+        lines.append(f'        0x{tl_type.constructor:08X}, // {tl_type.name}')
+    lines.append('    };')
+    lines.append('')
+    lines.append('    public static IReadOnlyList<uint> KnownConstructors => knownConstructors;')
+    lines.append('')
+    lines.append('    /// <summary>')
+    lines.append('    /// Generated type for a constructor id, or null when the id is unknown')
+    lines.append('    /// </summary>')
+    lines.append('    public static Type ResolveType(uint constructor)')
+    lines.append('    {')
+    lines.append('        switch (constructor)')
+    lines.append('        {')
+    for tl_type in registered:
+        lines.append(f'            case 0x{tl_type.constructor:08X}: return typeof({to_pascal_case(tl_type.name)});')
+    lines.append('            default: return null;')
+    lines.append('        }')
+    lines.append('    }')
+    lines.append('')
+    lines.append('    /// <summary>')
+    lines.append('    /// Decode the fields of the type identified by an already consumed constructor id')
+    lines.append('    /// </summary>')
+    lines.append('    static object ReadBoxed(uint constructor, ref TLSpanReader reader)')
+    lines.append('    {')
+    lines.append('        switch (constructor)')
+    lines.append('        {')
+    for tl_type in registered:
+        lines.append(f'            case 0x{tl_type.constructor:08X}: return {to_pascal_case(tl_type.name)}.ReadFrom(ref reader);')
+    lines.append('            default: throw new Exception($"Unknown constructor 0x{constructor:X8}");')
+    lines.append('        }')
+    lines.append('    }')
     lines.append('}')
     return '\n'.join(lines)
 
-def get_write_method(cs_type: str, prop_name: str, field_name: str = '') -> str:
-    """Get the appropriate TLWriteBuffer.Write* method call"""
+def request_class_name(func: TLType) -> str:
+    return f'{to_pascal_case(func.name)}Request'
+
+def get_write_method(cs_type: str, prop_name: str, tl_type: str = '', span: bool = False) -> str:
+    """Get the appropriate TLWriteBuffer/TLSpanWriter Write* method call"""
+    writer_arg = codec_signature(span)[2]
     type_map = {
         'int': f'writer.WriteInt32({prop_name});',
         'uint': f'writer.WriteUInt32({prop_name});',
         'long': f'writer.WriteInt64({prop_name});',
         'bool': f'writer.WriteBool({prop_name});',
         'string': f'writer.WriteString({prop_name});',
+        'TLInt256': f'writer.WriteInt256({prop_name});',
+        'TLInt128': f'writer.WriteInt128({prop_name});',
+        'byte[]': f'writer.WriteBuffer({prop_name});',
     }
     
-    # Special handling for int256 byte arrays (32 bytes)
-    if cs_type == 'byte[]':
-        field_lower = field_name.lower()
-        if 'hash' in field_lower or 'account' in field_lower or ('id' in field_lower and '_id' not in field_lower):
-            return f'writer.WriteBytes({prop_name}, 32);'
-        return f'writer.WriteBuffer({prop_name});'
-    
     # Handle nullable types
     if cs_type.endswith('?'):
         base_type = cs_type[:-1]
@@ -394,26 +808,28 @@ def get_write_method(cs_type: str, prop_name: str, field_name: str = '') -> str:
     if cs_type in type_map:
         return type_map[cs_type]
     
-    # Handle arrays (TL vectors)
+    # Blittable vectors are written as one block
+    bulk_writes = {'int[]': 'WriteInt32Vector', 'long[]': 'WriteInt64Vector', 'TLInt256[]': 'WriteInt256Vector'}
+    if cs_type in bulk_writes:
+        return f'writer.{bulk_writes[cs_type]}({prop_name});'
+    
+    # Handle arrays (TL vectors) - write vector length then each element
     if cs_type.endswith('[]') and cs_type != 'byte[]':
         element_type = cs_type[:-2]
-        # Check if it's a primitive or custom type
-        if element_type in ['int', 'uint', 'long', 'bool', 'string']:
-            # TODO: Implement primitive array writing
-            return f'// TODO: Write primitive array {prop_name}'
-        else:
-            # Custom types - write vector length then each element
-            return f'''writer.WriteUInt32((uint){prop_name}.Length);
+        element_write = get_write_method(element_type, 'item', element_tl_type(tl_type), span)
+        return f'''writer.WriteUInt32((uint){prop_name}.Length);
             foreach (var item in {prop_name})
             {{
-                item.WriteTo(writer);
+                {element_write}
             }}'''
     
-    # Handle custom types (they have WriteTo methods)
-    return f'{prop_name}.WriteTo(writer);'
+    # Handle custom types (they have WriteTo methods; boxed references also write their constructor)
+    if is_boxed_reference(tl_type):
+        return f'{prop_name}.WriteBoxedTo({writer_arg});'
+    return f'{prop_name}.WriteTo({writer_arg});'
 
-def get_read_method(cs_type: str, field_name: str = '') -> str:
-    """Get the appropriate TLReadBuffer.Read* method call"""
+def get_read_method(cs_type: str, tl_type: str = '', span: bool = False) -> str:
+    """Get the appropriate TLReadBuffer/TLSpanReader Read* method call"""
     type_map = {
         'int': 'reader.ReadInt32()',
         'uint': 'reader.ReadUInt32()',
@@ -421,15 +837,10 @@ def get_read_method(cs_type: str, field_name: str = '') -> str:
         'bool': 'reader.ReadBool()',
         'string': 'reader.ReadString()',
         'byte[]': 'reader.ReadBuffer()',
+        'TLInt256': 'reader.ReadInt256()',
+        'TLInt128': 'reader.ReadInt128()',
     }
     
-    # Special handling for int256 and int128 (identified by field names)
-    if cs_type == 'byte[]':
-        field_lower = field_name.lower()
-        if 'hash' in field_lower or 'account' in field_lower or 'id' in field_lower and '_id' not in field_lower:
-            return 'reader.ReadInt256()'  # 32 bytes
-        return 'reader.ReadBuffer()'
-    
     # Handle nullable types
     if cs_type.endswith('?'):
         base_type = cs_type[:-1]
@@ -439,15 +850,39 @@ def get_read_method(cs_type: str, field_name: str = '') -> str:
     if cs_type in type_map:
         return type_map[cs_type]
     
-    # Handle arrays (TL vectors)
+    # Blittable vectors are read as one block
+    bulk_reads = {'int[]': 'ReadInt32Vector', 'long[]': 'ReadInt64Vector', 'TLInt256[]': 'ReadInt256Vector'}
+    if cs_type in bulk_reads:
+        return f'reader.{bulk_reads[cs_type]}()'
+    
+    # Other vectors need a loop; see get_read_statements
     if cs_type.endswith('[]') and cs_type != 'byte[]':
-        element_type = cs_type[:-2]
-        # For now, return empty array - proper reading needs to be in conditional ReadFrom
-        # This will be handled in the ReadFrom method generation
-        return f'Array.Empty<{element_type}>()'
+        raise ValueError(f'{cs_type} cannot be read as an expression')
     
     # Handle custom types
-    return f'{cs_type}.ReadFrom(reader)'
+    if is_boxed_reference(tl_type):
+        return f'{cs_type}.ReadBoxedFrom({codec_signature(span)[3]})'
+    return f'{cs_type}.ReadFrom({codec_signature(span)[3]})'
+
+def get_read_statements(field: TLField, target: str, span: bool, min_sizes: Dict[str, int]) -> List[str]:
+    """Statements that read a field into `target`. Element-wise vectors check their count against the
+    remaining bytes (count * smallest element size) before allocating the array."""
+    cs_type = field.type
+    if not cs_type.endswith('[]') or cs_type in ('byte[]', 'int[]', 'long[]', 'TLInt256[]'):
+        return [f'{target} = {get_read_method(cs_type, field.tl_type, span)};']
+
+    element_type = cs_type[:-2]
+    element_tl = element_tl_type(field.tl_type)
+    min_size = min_field_size(element_type, element_tl, min_sizes) or 4
+    count = f'{to_camel_case(field.name)}Count'
+    return [
+        f'int {count} = reader.ReadVectorCount({min_size});',
+        f'{target} = new {element_type}[{count}];',
+        f'for (int i = 0; i < {count}; i++)',
+        '{',
+        f'    {target}[i] = {get_read_method(element_type, element_tl, span)};',
+        '}',
+    ]
 
 def parse_tl_file(content: str) -> Tuple[List[TLType], List[TLType]]:
     """Parse entire TL file into types and functions"""
@@ -455,6 +890,7 @@ def parse_tl_file(content: str) -> Tuple[List[TLType], List[TLType]]:
     types = []
     functions = []
     is_functions_section = False
+    pending = ''
     
     for line in lines:
         line = line.strip()
@@ -465,6 +901,12 @@ def parse_tl_file(content: str) -> Tuple[List[TLType], List[TLType]]:
         if line.startswith('//') or not line or line.startswith('---'):
             continue
         
+        # A definition may span several lines; it ends at the terminating ';'
+        pending = f'{pending} {line}' if pending else line
+        if not re.sub(r'//.*', '', pending).rstrip().endswith(';'):
+            continue
+        line, pending = pending, ''
+        
         tl_type = parse_tl_line(line, is_function=is_functions_section)
         if tl_type:
             if is_functions_section:
@@ -474,8 +916,103 @@ def parse_tl_file(content: str) -> Tuple[List[TLType], List[TLType]]:
     
     return types, functions
 
-def generate_csharp_code(types: List[TLType], functions: List[TLType]) -> str:
-    """Generate complete C# schema file"""
+TL_BUILTINS = {'int', 'long', 'double', 'string', 'bytes', 'Bool', 'true', 'int128', 'int256', '#', 'Object', 'Function'}
+# Types the hand-written runtime refers to directly (TLSerializer turns liteServer.error into an exception)
+RUNTIME_TYPES = ['liteServer.error']
+BANNER = '    // ============================================================================'
+
+def tl_namespace(name: str) -> str:
+    """TL namespace of a constructor or type name, e.g. 'liteServer' for liteServer.accountState"""
+    return name.split('.', 1)[0] if '.' in name else ''
+
+def select_reachable(types: List[TLType], functions: List[TLType],
+                     roots: List[str]) -> Tuple[List[TLType], List[TLType]]:
+    """Types reachable from the arguments and results of the root functions, and the roots themselves.
+    A boxed reference reaches every constructor of its result type. Both lists keep schema order."""
+    by_name = {t.name: t for t in types}
+    by_result: Dict[str, List[TLType]] = {}
+    for t in types:
+        by_result.setdefault(t.result_type, []).append(t)
+    function_by_name = {f.name: f for f in functions}
+    missing = [root for root in roots if root not in function_by_name]
+    if missing:
+        raise ValueError(f'Unknown root function(s): {", ".join(missing)}')
+
+    pending = [name for name in RUNTIME_TYPES if name in by_name]
+    for root in roots:
+        pending.append(function_by_name[root].result_type)
+        pending.extend(f.tl_type for f in function_by_name[root].fields)
+
+    reached = set()
+    while pending:
+        reference = tl_codec.strip_parens(pending.pop())
+        element = tl_codec.vector_element(reference)
+        if element is not None:
+            pending.append(element)
+            continue
+        if reference in TL_BUILTINS:
+            continue
+        for t in [by_name[reference]] if reference in by_name else by_result.get(reference, []):
+            if t.name not in reached:
+                reached.add(t.name)
+                pending.extend(f.tl_type for f in t.fields)
+
+    return [t for t in types if t.name in reached], [f for f in functions if f.name in roots]
+
+def select_emitted(types: List[TLType], functions: List[TLType],
+                   roots: Optional[List[str]] = None) -> Tuple[List[TLType], List[TLType]]:
+    """The types and functions the generator emits: every tonNode.*/liteServer.* type and every function,
+    or with roots only the root functions and what they reach"""
+    if roots:
+        return select_reachable(types, functions, roots)
+    return [t for t in types if t.name.startswith(('tonNode.', 'liteServer.'))], functions
+
+def generate_union_base(result_type: str, implementations: List[TLType], span_codecs: bool) -> str:
+    """Generate the abstract base class of a union type, whose ReadFrom dispatches on the constructor"""
+    abstract_class_name = to_pascal_case(result_type)
+    lines = []
+    lines.append(f'/// <summary>')
+    lines.append(f'/// Base class for {result_type}')
+    lines.append(f'/// Implementations: {", ".join(to_pascal_case(t.name) for t in implementations)}')
+    lines.append(f'/// </summary>')
+    lines.append(f'public abstract class {abstract_class_name}')
+    lines.append('{')
+    lines.append('    public abstract uint Constructor { get; }')
+    lines.append('    public abstract int GetSerializedSize();')
+    lines.append('    public abstract void WriteTo(TLWriteBuffer writer);')
+    for span in ([False, True] if span_codecs else [False]):
+        _, reader_param, _, reader_arg = codec_signature(span)
+        lines.append('')
+        if span:
+            lines.append('    public abstract void WriteTo(ref TLSpanWriter writer);')
+            lines.append('')
+        lines.append(f'    public static {abstract_class_name} ReadFrom({reader_param})')
+        lines.append('    {')
+        lines.append('        uint constructor = reader.ReadUInt32();')
+        lines.append('        switch (constructor)')
+        lines.append('        {')
+        for impl in implementations:
+            lines.append(f'            case 0x{impl.constructor:08X}:')
+            lines.append(f'                return {to_pascal_case(impl.name)}.ReadFrom({reader_arg});')
+        lines.append('            default:')
+        lines.append(f'                throw new Exception($"Unknown constructor 0x{{constructor:X8}} for {result_type}");')
+        lines.append('        }')
+        lines.append('    }')
+    lines.extend(generate_boxed_codecs(abstract_class_name, result_type, span_codecs, union=True))
+    lines.append('}')
+    return '\n'.join(lines)
+
+@dataclass
+class SchemaBlock:
+    """One emitted declaration: its section banner, the TL namespace it is filed under, and its code"""
+    banner: str
+    namespace: str
+    code: str
+
+def generate_schema_blocks(types: List[TLType], functions: List[TLType], span_codecs: bool, views: bool,
+                           roots: Optional[List[str]] = None) -> Tuple[List[str], List[SchemaBlock], List[TLType]]:
+    """Generate every declaration of the schema, in file order.
+    Returns (header comment lines, blocks, functions for the Functions table)."""
     # Find union types (multiple types with same result_type)
     result_type_map = {}
     for t in types:
@@ -485,131 +1022,704 @@ def generate_csharp_code(types: List[TLType], functions: List[TLType]) -> str:
             result_type_map[t.result_type].append(t)
     
     union_types = {rt: impls for rt, impls in result_type_map.items() if len(impls) > 1}
+    boxed_results = {element_tl_type(f.tl_type) for t in types + functions for f in t.fields
+                     if is_boxed_reference(element_tl_type(f.tl_type))}
+    fixed_sizes = compute_fixed_sizes(types, union_types)
+    min_sizes = compute_min_sizes(types, union_types)
+    emitted_types, emitted_functions = select_emitted(types, functions, roots)
+    emitted_names = {t.name for t in emitted_types}
     
+    header = []
+    if union_types:
+        header.append(f'// Union types: {", ".join(union_types.keys())}')
+    if span_codecs:
+        header.append('// Span codecs: ReadFrom(ref TLSpanReader) / WriteTo(ref TLSpanWriter)')
+    
+    blocks: List[SchemaBlock] = []
+    
+    # Generate abstract base classes for union types
+    # Only generate if ALL implementations are actually being generated
+    for result_type, implementations in union_types.items():
+        if all(t.name in emitted_names for t in implementations):
+            blocks.append(SchemaBlock('Abstract base classes for union types', tl_namespace(result_type),
+                                      generate_union_base(result_type, implementations, span_codecs)))
+    
+    # Generate basic types (as structs)
+    basic_types = [t for t in emitted_types if t.name.startswith('tonNode.')]
+    for tl_type in basic_types:
+        blocks.append(SchemaBlock('Basic Types (tonNode.*)', 'tonNode',
+                                  generate_struct_or_class(tl_type, is_struct=True, union_types=union_types,
+                                                           span_codecs=span_codecs, fixed_sizes=fixed_sizes,
+                                                           min_sizes=min_sizes,
+                                                           boxed=tl_type.result_type in boxed_results)))
+    
+    # Generate all other types (as classes), grouped by TL namespace
+    class_types = [t for t in emitted_types if not t.name.startswith('tonNode.') and not t.is_function]
+    namespace_order = list(dict.fromkeys(tl_namespace(t.name) for t in class_types))
+    class_types.sort(key=lambda t: namespace_order.index(tl_namespace(t.name)))
+    for tl_type in class_types:
+        namespace = tl_namespace(tl_type.name)
+        banner = 'Lite Server Types (liteServer.*)' if namespace == 'liteServer' else f'Types ({namespace}.*)'
+        blocks.append(SchemaBlock(banner, namespace,
+                                  generate_struct_or_class(tl_type, is_struct=False, union_types=union_types,
+                                                           span_codecs=span_codecs, fixed_sizes=fixed_sizes,
+                                                           min_sizes=min_sizes,
+                                                           boxed=tl_type.result_type in boxed_results)))
+    
+    # Generate zero-copy views for function results that carry large bytes payloads
+    if views and span_codecs:
+        result_types = {f.result_type for f in emitted_functions}
+        for tl_type in class_types:
+            if tl_type.result_type in result_types and tl_type.result_type not in union_types:
+                source = generate_view(tl_type, fixed_sizes)
+                if source:
+                    blocks.append(SchemaBlock('Views (zero-copy readers over serialized responses)',
+                                              tl_namespace(tl_type.name), source))
+    
+    # Generate typed requests for functions (envelopes like liteServer.query return Object)
+    for func in emitted_functions:
+        if func.result_type != 'Object':
+            blocks.append(SchemaBlock(f'Requests ({tl_namespace(func.name)}.* functions)', tl_namespace(func.name),
+                                      generate_request_class(func, span_codecs, fixed_sizes)))
+    
+    # Generate the constructor registry over every generated type (decoding needs the span codecs)
+    if span_codecs and (basic_types or class_types):
+        blocks.append(SchemaBlock('Constructor Registry', '', generate_registry(basic_types + class_types)))
+    
+    return header, blocks, emitted_functions
+
+def generate_functions_table(functions: List[TLType]) -> List[str]:
+    """Constructor id constants of the given functions"""
+    lines = []
+    lines.append(BANNER)
+    lines.append('    // Function Constructors')
+    lines.append(BANNER)
+    lines.append('')
+    lines.append('    public static partial class Functions')
+    lines.append('    {')
+    for func in functions:
+        const_name = to_pascal_case(func.name.replace('liteServer.', ''))
+        lines.append(f'        public const uint {const_name} = 0x{func.constructor:08X};')
+    lines.append('    }')
+    return lines
+
+def render_schema_file(header: List[str], blocks: List[SchemaBlock], functions: List[TLType],
+                       span_codecs: bool, scope: str = '') -> str:
+    """Assemble one C# file from generated blocks, with a banner wherever the section changes"""
     lines = []
     lines.append('// Auto-generated from lite_api.tl')
     lines.append('// DO NOT EDIT MANUALLY')
     lines.append('// This is the protocol layer - raw TL types matching lite_api.tl exactly')
     lines.append('// For user-facing APIs, create domain models and map in LiteClient')
-    if union_types:
-        lines.append(f'// Union types: {", ".join(union_types.keys())}')
+    if scope:
+        lines.append(f'// {scope}')
+    lines.extend(header)
     lines.append('')
     lines.append('#nullable disable')
     lines.append('')
     lines.append('using System;')
+    if span_codecs:
+        lines.append('using System.Collections.Generic;')
     lines.append('using TonSdk.Adnl.TL;')
     lines.append('')
     lines.append('namespace TonSdk.Adnl.LiteClient.Protocol')
     lines.append('{')
     
-    # Generate abstract base classes for union types
-    # Only generate if ALL implementations are actually being generated (tonNode.* or liteServer.*)
-    if union_types:
-        relevant_union_types = {}
-        for result_type, implementations in union_types.items():
-            # Check if all implementations are being generated
-            all_generated = all(t.name.startswith('tonNode.') or t.name.startswith('liteServer.') 
-                              for t in implementations)
-            if all_generated:
-                relevant_union_types[result_type] = implementations
-        
-        if relevant_union_types:
-            lines.append('    // ============================================================================')
-            lines.append('    // Abstract base classes for union types')
-            lines.append('    // ============================================================================')
-            lines.append('')
-            for result_type, implementations in relevant_union_types.items():
-                abstract_class_name = to_pascal_case(result_type)
-                lines.append(f'    /// <summary>')
-                lines.append(f'    /// Base class for {result_type}')
-                lines.append(f'    /// Implementations: {", ".join(to_pascal_case(t.name) for t in implementations)}')
-                lines.append(f'    /// </summary>')
-                lines.append(f'    public abstract class {abstract_class_name}')
-                lines.append('    {')
-                lines.append('        public abstract uint Constructor { get; }')
-                lines.append('        public abstract void WriteTo(TLWriteBuffer writer);')
-                lines.append('')
-                lines.append('        public static ' + abstract_class_name + ' ReadFrom(TLReadBuffer reader)')
-                lines.append('        {')
-                lines.append('            uint constructor = reader.ReadUInt32();')
-                lines.append('            switch (constructor)')
-                lines.append('            {')
-                for impl in implementations:
-                    impl_class = to_pascal_case(impl.name)
-                    lines.append(f'                case 0x{impl.constructor:08X}:')
-                    lines.append(f'                    return {impl_class}.ReadFrom(reader);')
-                lines.append('                default:')
-                lines.append(f'                    throw new Exception($"Unknown constructor 0x{{constructor:X8}} for {result_type}");')
-                lines.append('            }')
-                lines.append('        }')
-                lines.append('    }')
-                lines.append('')
-    
-    # Generate basic types (as structs)
-    basic_types = [t for t in types if t.name.startswith('tonNode.')]
-    if basic_types:
-        lines.append('    // ============================================================================')
-        lines.append('    // Basic Types (tonNode.*)')
-        lines.append('    // ============================================================================')
-        lines.append('')
-        for tl_type in basic_types:
-            for line in generate_struct_or_class(tl_type, is_struct=True, union_types=union_types).split('\n'):
-                lines.append('    ' + line if line else '')
+    banner = None
+    for block in blocks:
+        if block.banner != banner:
+            banner = block.banner
+            lines.append(BANNER)
+            lines.append(f'    // {banner}')
+            lines.append(BANNER)
             lines.append('')
-    
-    # Generate liteServer types (as classes)
-    lite_types = [t for t in types if t.name.startswith('liteServer.') and not t.is_function]
-    if lite_types:
-        lines.append('    // ============================================================================')
-        lines.append('    // Lite Server Types (liteServer.*)')
-        lines.append('    // ============================================================================')
+        for line in block.code.split('\n'):
+            lines.append('    ' + line if line else '')
         lines.append('')
-        for tl_type in lite_types:
-            for line in generate_struct_or_class(tl_type, is_struct=False, union_types=union_types).split('\n'):
-                lines.append('    ' + line if line else '')
-            lines.append('')
     
-    # Generate function constructors
     if functions:
-        lines.append('    // ============================================================================')
-        lines.append('    // Function Constructors')
-        lines.append('    // ============================================================================')
-        lines.append('')
-        lines.append('    public static class Functions')
-        lines.append('    {')
-        for func in functions:
-            const_name = to_pascal_case(func.name.replace('liteServer.', ''))
-            lines.append(f'        public const uint {const_name} = 0x{func.constructor:08X};')
-        lines.append('    }')
+        lines.extend(generate_functions_table(functions))
+    elif lines[-1] == '':
+        lines.pop()
     
     lines.append('}')
     return '\n'.join(lines)
 
-def main():
-    print("Fetching lite_api.tl from TON repository...")
-    with urllib.request.urlopen(LITE_API_URL) as response:
-        content = response.read().decode('utf-8')
-    
+def generate_csharp_code(types: List[TLType], functions: List[TLType], span_codecs: bool = False,
+                         views: bool = False, roots: Optional[List[str]] = None) -> str:
+    """Generate complete C# schema file.
+    With span_codecs, every type also gets ReadFrom/WriteTo overloads over TLSpanReader/TLSpanWriter.
+    With views (requires span_codecs), large function results also get a zero-copy *View struct.
+    With roots, only the root functions and the types they reach are emitted (see select_reachable)."""
+    header, blocks, emitted_functions = generate_schema_blocks(types, functions, span_codecs, views, roots)
+    return render_schema_file(header, blocks, emitted_functions, span_codecs)
+
+def generate_csharp_files(types: List[TLType], functions: List[TLType], span_codecs: bool = False,
+                          views: bool = False, roots: Optional[List[str]] = None) -> Dict[str, str]:
+    """Like generate_csharp_code, split into one partial file per TL namespace (Schema.<Namespace>.Generated.cs)
+    plus Schema.Registry.Generated.cs for the constructor registry. Returns file name -> code."""
+    header, blocks, emitted_functions = generate_schema_blocks(types, functions, span_codecs, views, roots)
+    namespaces = list(dict.fromkeys(block.namespace for block in blocks if block.namespace))
+    namespaces += [ns for ns in dict.fromkeys(tl_namespace(f.name) for f in emitted_functions) if ns not in namespaces]
+
+    files = {}
+    for namespace in namespaces:
+        file_blocks = [block for block in blocks if block.namespace == namespace]
+        file_functions = [f for f in emitted_functions if tl_namespace(f.name) == namespace]
+        files[f'Schema.{to_pascal_case(namespace)}.Generated.cs'] = render_schema_file(
+            header, file_blocks, file_functions, span_codecs, scope=f'Namespace: {namespace}.*')
+    shared = [block for block in blocks if not block.namespace]
+    if shared:
+        files['Schema.Registry.Generated.cs'] = render_schema_file(header, shared, [], span_codecs,
+                                                                    scope='Constructor registry')
+    return files
+
+# ============================================================================
+# Golden vectors: corpus from the Python reference codec, plus the C# suites that consume it
+# ============================================================================
+
+GOLDEN_CORPUS_NAME = os.path.basename(GOLDEN_CORPUS_PATH)
+# (shape, mode) per sample: sample 0 sets every mode bit, sample 1 none, the rest draw mode bits at random.
+# Samples 0 and 1 are small enough to be emitted as C# literals.
+GOLDEN_SAMPLES = [(tl_codec.SMALL, 0xFFFFFFFF), (tl_codec.SMALL, 0), (tl_codec.MEDIUM, None), (tl_codec.LARGE, None)]
+GOLDEN_LITERAL_SAMPLES = 2
+
+@dataclass
+class GoldenEntry:
+    tl_type: TLType
+    is_request: bool
+    samples: List[Tuple[dict, bytes]]
+
+def golden_constructors(types: List[TLType], functions: List[TLType],
+                        roots: Optional[List[str]] = None) -> List[Tuple[TLType, bool]]:
+    """The constructors generate_csharp_code emits codecs for, as (type, is_request)"""
+    emitted_types, emitted_functions = select_emitted(types, functions, roots)
+    decodable = [(t, False) for t in emitted_types if t.fields]
+    requests = [(f, True) for f in emitted_functions if f.result_type != 'Object']
+    return decodable + requests
+
+def build_golden_corpus(types: List[TLType], functions: List[TLType], seed: int,
+                        roots: Optional[List[str]] = None) -> List[GoldenEntry]:
+    """Seeded random samples of every generated constructor, encoded by the reference codec.
+    Each constructor has its own random stream, so adding a type to the schema leaves the others unchanged."""
+    codec = tl_codec.TLCodec(types, functions)
+    corpus = []
+    for tl_type, is_request in golden_constructors(types, functions, roots):
+        samples = []
+        for index, (shape, mode) in enumerate(GOLDEN_SAMPLES):
+            rng = random.Random(f'{seed}:{tl_type.name}:{index}')
+            value = codec.random_value(tl_type.name, rng, shape, mode)
+            data = codec.encode(tl_type.name, value)
+            if codec.decode(data) != value:
+                raise ValueError(f'Reference codec does not round-trip {tl_type.name} sample {index}')
+            samples.append((value, data))
+        corpus.append(GoldenEntry(tl_type, is_request, samples))
+    return corpus
+
+def encode_golden_corpus(corpus: List[GoldenEntry]) -> bytes:
+    """Corpus file: sample count, then (constructor name: string, boxed value: bytes) per sample, in TL encoding"""
+    records = [(entry.tl_type.name, data) for entry in corpus for _, data in entry.samples]
+    out = bytearray(struct.pack('<I', len(records)))
+    for name, data in records:
+        out += tl_codec.encode_bytes(name.encode('utf-8'))
+        out += tl_codec.encode_bytes(data)
+    return bytes(out)
+
+def csharp_hex(data: bytes) -> str:
+    return f'Convert.FromHexString("{data.hex().upper()}")' if data else 'Array.Empty<byte>()'
+
+def csharp_literal(tl_type: str, value, indent: str, constructors: Dict[str, TLType],
+                   class_name: Optional[str] = None) -> str:
+    """C# expression that builds `value` (a reference codec value of TL type `tl_type`)"""
+    tl_type = tl_codec.strip_parens(tl_type)
+    if tl_type == 'int':
+        return str(value)
+    if tl_type == '#':
+        return f'{value}u'
+    if tl_type == 'long':
+        return 'long.MinValue' if value == -2 ** 63 else f'{value}L'
+    if tl_type == 'double':
+        return f'{value!r}d'
+    if tl_type in ('Bool', 'true'):
+        return 'true' if value else 'false'
+    if tl_type == 'bytes':
+        return csharp_hex(value)
+    if tl_type == 'string':
+        return json.dumps(value)
+    if tl_type in ('int256', 'int128'):
+        return f'new {parse_type(tl_type)[0]}(Convert.FromHexString("{value.hex().upper()}"))'
+    element = tl_codec.vector_element(tl_type)
+    if element is not None:
+        element_type = parse_type(element)[0]
+        if not value:
+            return f'Array.Empty<{element_type}>()'
+        items = [csharp_literal(element, item, indent + '    ', constructors) for item in value]
+        body = ''.join(f'{indent}    {item},\n' for item in items)
+        return f'new {element_type}[]\n{indent}{{\n{body}{indent}}}'
+
+    tl_object = constructors[value['@type']]
+    class_name = class_name or to_pascal_case(tl_object.name)
+    present = [f for f in tl_object.fields
+               if f.name in value and f.tl_type != 'true']  # flags are implied by the mode bits
+    if tl_object.name.startswith('tonNode.'):
+        args = [csharp_literal(f.tl_type, value[f.name], indent + '    ', constructors) for f in present]
+        body = ',\n'.join(f'{indent}    {arg}' for arg in args)
+        return f'new {class_name}(\n{body})'
+    if not present:
+        return f'new {class_name}()'
+    body = ''.join(f'{indent}    {to_pascal_case(f.name)} = '
+                   f'{csharp_literal(f.tl_type, value[f.name], indent + "    ", constructors)},\n'
+                   for f in present)
+    return f'new {class_name}\n{indent}{{\n{body}{indent}}}'
+
+def generate_golden_corpus_loader(indent: str = '    ') -> List[str]:
+    """C# that reads the corpus file next to the test/benchmark assembly into name -> samples"""
+    lines = [
+        'static Dictionary<string, byte[][]> LoadCorpus()',
+        '{',
+        f'    byte[] data = File.ReadAllBytes(Path.Combine(AppContext.BaseDirectory, "Golden", "{GOLDEN_CORPUS_NAME}"));',
+        '    TLSpanReader reader = new(data);',
+        '    Dictionary<string, List<byte[]>> samples = new();',
+        '    uint count = reader.ReadUInt32();',
+        '    for (uint i = 0; i < count; i++)',
+        '    {',
+        '        string name = reader.ReadString();',
+        '        if (!samples.TryGetValue(name, out List<byte[]>? list)) samples[name] = list = new List<byte[]>();',
+        '        list.Add(reader.ReadBuffer());',
+        '    }',
+        '',
+        '    Dictionary<string, byte[][]> corpus = new();',
+        '    foreach (KeyValuePair<string, List<byte[]>> entry in samples) corpus[entry.Key] = entry.Value.ToArray();',
+        '    return corpus;',
+        '}',
+    ]
+    return [indent + line if line else '' for line in lines]
+
+def generate_golden_tests(corpus: List[GoldenEntry], constructors: Dict[str, TLType], seed: int) -> str:
+    """NUnit suite: every sample is decoded and re-encoded through both codec flavours, and the first
+    GOLDEN_LITERAL_SAMPLES samples are built from C# literals and must encode to the golden bytes."""
+    lines = []
+    lines.append(f'// Auto-generated by tools/generate_schema.py from lite_api.tl (golden seed {seed})')
+    lines.append('// DO NOT EDIT MANUALLY')
+    lines.append('')
+    lines.append('using NUnit.Framework;')
+    lines.append('using TonSdk.Adnl.LiteClient.Protocol;')
+    lines.append('using TonSdk.Adnl.TL;')
+    lines.append('')
+    lines.append('namespace TonSdk.Adnl.Tests;')
+    lines.append('')
+    lines.append('/// <summary>')
+    lines.append(f'///     Golden vectors written by the Python reference codec (tools/tl_codec.py) into Golden/{GOLDEN_CORPUS_NAME}.')
+    lines.append('/// </summary>')
+    lines.append('public class GoldenVectorTests')
+    lines.append('{')
+    lines.append('    static readonly Dictionary<string, byte[][]> corpus = LoadCorpus();')
+    lines.append('')
+    lines.append('    delegate void SpanWrite(ref TLSpanWriter writer);')
+
+    for entry in corpus:
+        tl_type = entry.tl_type
+        class_name = request_class_name(tl_type) if entry.is_request else to_pascal_case(tl_type.name)
+        constructor = f'0x{tl_type.constructor:08X}u'
+        if not entry.is_request:
+            lines.append('')
+            for index in range(len(entry.samples)):
+                lines.append(f'    [TestCase({index})]')
+            lines.append(f'    public void Test_{class_name}_RoundTrip(int sample)')
+            lines.append('    {')
+            lines.append(f'        byte[] golden = corpus["{tl_type.name}"][sample];')
+            lines.append('')
+            if tl_type.name == 'liteServer.error':
+                # TLSerializer surfaces errors as exceptions, so decode the fields directly
+                lines.append('        Assert.Throws<LiteServerException>(() => TLSerializer.Read<object>(golden));')
+                lines.append('        TLSpanReader reader = new(golden);')
+                lines.append(f'        Assert.That(reader.ReadUInt32(), Is.EqualTo({constructor}));')
+                lines.append(f'        {class_name} value = {class_name}.ReadFrom(ref reader);')
+            else:
+                lines.append(f'        {class_name} value = TLSerializer.Read<{class_name}>(golden);')
+            lines.append(f'        AssertEncodes(golden, {constructor}, value.GetSerializedSize(), value.WriteTo,')
+            lines.append('            (ref TLSpanWriter writer) => value.WriteTo(ref writer));')
+            lines.append('')
+            lines.append(f'        {class_name} buffered = {class_name}.ReadFrom(Unbox(golden, {constructor}));')
+            lines.append(f'        AssertEncodes(golden, {constructor}, buffered.GetSerializedSize(), buffered.WriteTo,')
+            lines.append('            (ref TLSpanWriter writer) => buffered.WriteTo(ref writer));')
+            lines.append('    }')
+
+        for index in range(GOLDEN_LITERAL_SAMPLES):
+            value, _ = entry.samples[index]
+            literal = csharp_literal(tl_type.name, value, '        ', constructors, class_name)
+            lines.append('')
+            lines.append('    [Test]')
+            lines.append(f'    public void Test_{class_name}_Literal{index}()')
+            lines.append('    {')
+            lines.append(f'        {class_name} value = {literal};')
+            lines.append('')
+            lines.append(f'        AssertEncodes(corpus["{tl_type.name}"][{index}], {"null" if entry.is_request else constructor}, '
+                         'value.GetSerializedSize(), value.WriteTo,')
+            lines.append('            (ref TLSpanWriter writer) => value.WriteTo(ref writer));')
+            lines.append('    }')
+
+    lines.append('')
+    lines.append('    /// <summary>')
+    lines.append('    /// Check that both writers reproduce the golden bytes. Requests write their own constructor (null).')
+    lines.append('    /// </summary>')
+    lines.append('    static void AssertEncodes(byte[] golden, uint? constructor, int size, Action<TLWriteBuffer> write,')
+    lines.append('        SpanWrite spanWrite)')
+    lines.append('    {')
+    lines.append('        int header = constructor.HasValue ? 4 : 0;')
+    lines.append('        Assert.That(header + size, Is.EqualTo(golden.Length), "GetSerializedSize");')
+    lines.append('')
+    lines.append('        TLWriteBuffer buffer = new(golden.Length);')
+    lines.append('        if (constructor.HasValue) buffer.WriteUInt32(constructor.Value);')
+    lines.append('        write(buffer);')
+    lines.append('        Assert.That(buffer.Build(), Is.EqualTo(golden), "TLWriteBuffer");')
+    lines.append('')
+    lines.append('        byte[] destination = new byte[golden.Length];')
+    lines.append('        TLSpanWriter writer = new(destination);')
+    lines.append('        if (constructor.HasValue) writer.WriteUInt32(constructor.Value);')
+    lines.append('        spanWrite(ref writer);')
+    lines.append('        Assert.That(destination, Is.EqualTo(golden), "TLSpanWriter");')
+    lines.append('    }')
+    lines.append('')
+    lines.append('    static TLReadBuffer Unbox(byte[] golden, uint constructor)')
+    lines.append('    {')
+    lines.append('        TLReadBuffer reader = new(golden);')
+    lines.append('        Assert.That(reader.ReadUInt32(), Is.EqualTo(constructor));')
+    lines.append('        return reader;')
+    lines.append('    }')
+    lines.append('')
+    lines.extend(generate_golden_corpus_loader())
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+def generate_golden_benchmarks(corpus: List[GoldenEntry], seed: int) -> str:
+    """BenchmarkDotNet suite: decode and encode all samples of one type per operation, so the throughput
+    column (ThroughputColumn) can report MB/s next to the allocations from MemoryDiagnoser."""
+    decodable = [entry for entry in corpus if not entry.is_request]
+    lines = []
+    lines.append(f'// Auto-generated by tools/generate_schema.py from lite_api.tl (golden seed {seed})')
+    lines.append('// DO NOT EDIT MANUALLY')
+    lines.append('')
+    lines.append('using System;')
+    lines.append('using System.Collections.Generic;')
+    lines.append('using System.IO;')
+    lines.append('using System.Linq;')
+    lines.append('using BenchmarkDotNet.Attributes;')
+    lines.append('using TonSdk.Adnl.LiteClient.Protocol;')
+    lines.append('using TonSdk.Adnl.TL;')
+    lines.append('')
+    lines.append('namespace TonSdk.Adnl.Benchmarks;')
+    lines.append('')
+    lines.append('/// <summary>')
+    lines.append(f'///     Per-type codec throughput over the golden corpus (TonSdk.Adnl/test/Golden/{GOLDEN_CORPUS_NAME}).')
+    lines.append('/// </summary>')
+    lines.append('[MemoryDiagnoser]')
+    lines.append('[Config(typeof(GoldenCorpusConfig))]')
+    lines.append('public class GoldenCorpusBenchmarks')
+    lines.append('{')
+    lines.append('    static readonly Dictionary<string, byte[][]> corpus = LoadCorpus();')
+    lines.append('')
+    lines.append('    delegate int SampleWriter(object value, Span<byte> destination);')
+    lines.append('')
+    lines.append('    byte[][] samples = null!;')
+    lines.append('    object[] values = null!;')
+    lines.append('    SampleWriter write = null!;')
+    lines.append('    byte[] scratch = null!;')
+    lines.append('')
+    lines.append('    [ParamsSource(nameof(Types))] public string Type = null!;')
+    lines.append('')
+    lines.append('    public static IEnumerable<string> Types => new[]')
+    lines.append('    {')
+    for entry in decodable:
+        lines.append(f'        "{entry.tl_type.name}",')
+    lines.append('    };')
+    lines.append('')
+    lines.append('    /// <summary>')
+    lines.append('    /// Serialized bytes one Read/Write operation processes for a type')
+    lines.append('    /// </summary>')
+    lines.append('    public static long BytesPerOperation(string type)')
+    lines.append('    {')
+    lines.append('        return corpus[type].Sum(sample => (long)sample.Length);')
+    lines.append('    }')
+    lines.append('')
+    lines.append('    [GlobalSetup]')
+    lines.append('    public void Setup()')
+    lines.append('    {')
+    lines.append('        samples = corpus[Type];')
+    lines.append('        values = samples.Select(sample => TLSerializer.Read<object>(sample)).ToArray();')
+    lines.append('        scratch = new byte[samples.Max(sample => sample.Length)];')
+    lines.append('        write = Type switch')
+    lines.append('        {')
+    for entry in decodable:
+        class_name = to_pascal_case(entry.tl_type.name)
+        lines.append(f'            "{entry.tl_type.name}" => (value, destination) =>')
+        lines.append('            {')
+        lines.append('                TLSpanWriter writer = new(destination);')
+        lines.append(f'                writer.WriteUInt32(0x{entry.tl_type.constructor:08X});')
+        lines.append(f'                (({class_name})value).WriteTo(ref writer);')
+        lines.append('                return writer.Written;')
+        lines.append('            },')
+    lines.append('            _ => throw new ArgumentException($"No golden samples for {Type}")')
+    lines.append('        };')
+    lines.append('    }')
+    lines.append('')
+    lines.append('    [Benchmark]')
+    lines.append('    public int Read()')
+    lines.append('    {')
+    lines.append('        int read = 0;')
+    lines.append('        foreach (byte[] sample in samples)')
+    lines.append('        {')
+    lines.append('            TLSpanReader reader = new(sample);')
+    lines.append('            TLSerializer.ReadObject(ref reader);')
+    lines.append('            read += reader.Position;')
+    lines.append('        }')
+    lines.append('        return read;')
+    lines.append('    }')
+    lines.append('')
+    lines.append('    [Benchmark]')
+    lines.append('    public int Write()')
+    lines.append('    {')
+    lines.append('        int written = 0;')
+    lines.append('        foreach (object value in values) written += write(value, scratch);')
+    lines.append('        return written;')
+    lines.append('    }')
+    lines.append('')
+    lines.extend(generate_golden_corpus_loader())
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+def generator_fingerprint() -> str:
+    """Hash of this script, so cache entries are invalidated whenever the generator changes"""
+    with open(os.path.abspath(__file__), 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+class SchemaCache:
+    """On-disk cache of parsed schemas and emitted code, keyed by content hash"""
+
+    def __init__(self, cache_dir: Optional[str]):
+        self.cache_dir = cache_dir
+        self.fingerprint = generator_fingerprint()
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, kind: str, key: str) -> str:
+        return os.path.join(self.cache_dir, f'{kind}-{key}.json')
+
+    def _key(self, *parts: str) -> str:
+        h = hashlib.sha256(self.fingerprint.encode('utf-8'))
+        for part in parts:
+            h.update(b'\0')
+            h.update(part.encode('utf-8'))
+        return h.hexdigest()[:32]
+
+    def _load(self, kind: str, key: str):
+        if not self.cache_dir:
+            return None
+        try:
+            with open(self._path(kind, key), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _store(self, kind: str, key: str, value) -> None:
+        if not self.cache_dir:
+            return
+        tmp_path = self._path(kind, key) + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(value, f)
+        os.replace(tmp_path, self._path(kind, key))
+
+    def parse(self, content: str) -> Tuple[List[TLType], List[TLType], bool]:
+        """Parse schema content, returning (types, functions, cache_hit)"""
+        key = self._key('parse', content)
+        cached = self._load('parse', key)
+        if cached is not None:
+            types = [tl_type_from_dict(d) for d in cached['types']]
+            functions = [tl_type_from_dict(d) for d in cached['functions']]
+            return types, functions, True
+
+        types, functions = parse_tl_file(content)
+        self._store('parse', key, {
+            'types': [asdict(t) for t in types],
+            'functions': [asdict(f) for f in functions],
+        })
+        return types, functions, False
+
+    def emit(self, name: str, contents: List[str], types: List[TLType], functions: List[TLType],
+             generate) -> Tuple[str, bool]:
+        """Emit code for the parsed schema sources, returning (code, cache_hit)"""
+        key = self._key('emit', name, *contents)
+        cached = self._load('emit', key)
+        if cached is not None:
+            return cached['code'], True
+
+        code = generate(types, functions)
+        self._store('emit', key, {'code': code})
+        return code, False
+
+def tl_type_from_dict(d: dict) -> TLType:
+    """Rebuild a TLType from its cached dictionary form"""
+    fields = [TLField(**f) for f in d['fields']]
+    return TLType(name=d['name'], fields=fields, result_type=d['result_type'],
+                  is_function=d['is_function'], constructor=d['constructor'])
+
+def file_holds(path: str, content) -> bool:
+    """Whether path exists and holds exactly content (str, or bytes for binary files)"""
+    data = content.encode('utf-8') if isinstance(content, str) else content
+    try:
+        with open(path, 'rb') as f:
+            return f.read() == data
+    except OSError:
+        return False
+
+def write_if_changed(path: str, content) -> bool:
+    """Write content (str, or bytes for binary files) to path unless the file already holds exactly that content.
+    Leaving unchanged files untouched keeps their timestamps, so incremental builds skip them."""
+    if file_holds(path, content):
+        return False
+
+    data = content.encode('utf-8') if isinstance(content, str) else content
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(data)
+    return True
+
+def load_schema_sources(schema_paths: List[str]) -> List[Tuple[str, str]]:
+    """Read the given local schema files, or fetch lite_api.tl when none are given"""
+    if not schema_paths:
+        print("Fetching lite_api.tl from TON repository...")
+        with urllib.request.urlopen(LITE_API_URL) as response:
+            return [(LITE_API_URL, response.read().decode('utf-8'))]
+
+    sources = []
+    for path in schema_paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            sources.append((path, f.read()))
+    return sources
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Generate C# TL schema types from lite_api.tl')
+    parser.add_argument('--schema', action='append', default=[], metavar='PATH',
+                        help='Local TL schema file (repeatable). When omitted, lite_api.tl is downloaded.')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, metavar='PATH',
+                        help='Generated C# file (default: %(default)s)')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, metavar='DIR',
+                        help='Directory for the parse/emit cache (default: %(default)s)')
+    parser.add_argument('--no-cache', action='store_true', help='Disable the parse/emit cache')
+    parser.add_argument('--span-codecs', action=argparse.BooleanOptionalAction, default=True,
+                        help='Also emit allocation-free ReadFrom/WriteTo over TLSpanReader/TLSpanWriter '
+                             '(default: on)')
+    parser.add_argument('--views', action=argparse.BooleanOptionalAction, default=True,
+                        help='Emit zero-copy *View structs for responses with bytes payloads; '
+                             'requires --span-codecs (default: on)')
+    parser.add_argument('--root', action='append', default=[], metavar='FUNC', dest='roots',
+                        help='Emit only this function and the types reachable from its arguments and result '
+                             '(repeatable, e.g. --root liteServer.getAccountState). Default: the whole schema.')
+    parser.add_argument('--output-dir', metavar='DIR',
+                        help='Write one partial file per TL namespace (Schema.<Namespace>.Generated.cs) and '
+                             'Schema.Registry.Generated.cs into DIR instead of the single --output file')
+    parser.add_argument('--golden', action=argparse.BooleanOptionalAction, default=True,
+                        help='Build the golden corpus from the Python reference codec, with the NUnit suite and '
+                             'benchmarks that consume it, and check the checked-in files against it; exits with '
+                             'status 1 on any difference (default: on)')
+    parser.add_argument('--update-golden', action='store_true',
+                        help='Rewrite the golden corpus, suite and benchmarks instead of checking them')
+    parser.add_argument('--golden-seed', type=int, default=1, metavar='N',
+                        help='Seed of the golden corpus (default: %(default)s)')
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    cache = SchemaCache(None if args.no_cache else args.cache_dir)
+    timings: Dict[str, Tuple[float, str]] = {}
+
+    stale_golden: List[str] = []
+    sources = load_schema_sources(args.schema)
+
     print("Parsing TL schema...")
-    types, functions = parse_tl_file(content)
-    
+    started = time.perf_counter()
+    types: List[TLType] = []
+    functions: List[TLType] = []
+    hits = 0
+    for _, content in sources:
+        file_types, file_functions, hit = cache.parse(content)
+        types.extend(file_types)
+        functions.extend(file_functions)
+        hits += hit
+    timings['parse'] = (time.perf_counter() - started, f'{hits}/{len(sources)} cached')
+
     print(f"Found {len(types)} types and {len(functions)} functions")
-    
+
+    try:
+        emitted_types, emitted_functions = select_emitted(types, functions, args.roots)
+    except ValueError as e:
+        raise SystemExit(f"error: {e}")
+    print(f"Emitting {len(emitted_types)} of {len(types)} types ({len(types) - len(emitted_types)} pruned), "
+          f"{len(emitted_functions)} of {len(functions)} functions")
+
     print("Generating C# code...")
-    csharp_code = generate_csharp_code(types, functions)
-    
-    output_path = "../TonSdk.Adnl/src/LiteClient/Protocol/Schema.Generated.cs"
-    print(f"Writing to {output_path}...")
-    with open(output_path, 'w') as f:
-        f.write(csharp_code)
-    
-    print("✅ Done! Generated Schema.Generated.cs")
+    started = time.perf_counter()
+    emit_key = f'schema:span={args.span_codecs}:views={args.views}:roots={",".join(args.roots)}:split={bool(args.output_dir)}'
+    if args.output_dir:
+        generate = lambda t, f: generate_csharp_files(t, f, span_codecs=args.span_codecs, views=args.views,
+                                                      roots=args.roots)
+    else:
+        generate = lambda t, f: generate_csharp_code(t, f, span_codecs=args.span_codecs, views=args.views,
+                                                     roots=args.roots)
+    csharp_code, hit = cache.emit(emit_key, [c for _, c in sources], types, functions, generate)
+    timings['emit'] = (time.perf_counter() - started, 'cached' if hit else 'generated')
+
+    if args.output_dir:
+        outputs = {os.path.normpath(os.path.join(args.output_dir, name)): code for name, code in csharp_code.items()}
+        if os.path.exists(os.path.join(args.output_dir, os.path.basename(DEFAULT_OUTPUT))):
+            print(f"⚠️  {args.output_dir} also holds {os.path.basename(DEFAULT_OUTPUT)}; "
+                  f"remove it or the types will be defined twice")
+    else:
+        outputs = {os.path.normpath(args.output): csharp_code}
+    started = time.perf_counter()
+    written = [path for path, code in outputs.items() if write_if_changed(path, code)]
+    timings['write'] = (time.perf_counter() - started, f'{len(written)}/{len(outputs)} written')
+
+    for path in outputs:
+        if path in written:
+            print(f"✅ Done! Wrote {path}")
+        else:
+            print(f"✅ Done! {path} is up to date")
+
+    if args.golden:
+        started = time.perf_counter()
+        corpus = build_golden_corpus(types, functions, args.golden_seed, args.roots)
+        constructors = {t.name: t for t in types + functions}
+        outputs = {
+            GOLDEN_CORPUS_PATH: encode_golden_corpus(corpus),
+            GOLDEN_TESTS_PATH: generate_golden_tests(corpus, constructors, args.golden_seed),
+            GOLDEN_BENCHMARKS_PATH: generate_golden_benchmarks(corpus, args.golden_seed),
+        }
+        samples = sum(len(entry.samples) for entry in corpus)
+        if args.update_golden:
+            changed = sum(write_if_changed(os.path.normpath(path), content) for path, content in outputs.items())
+            timings['golden'] = (time.perf_counter() - started, f'{samples} samples, {changed}/{len(outputs)} written')
+        else:
+            stale_golden = [os.path.normpath(path) for path, content in outputs.items()
+                            if not file_holds(os.path.normpath(path), content)]
+            timings['golden'] = (time.perf_counter() - started,
+                                 f'{samples} samples, {len(stale_golden)}/{len(outputs)} differ')
+
+    print("\nTiming:")
+    for phase, (elapsed, note) in timings.items():
+        print(f"  {phase:<6} {elapsed * 1000:8.2f} ms  ({note})")
+
     print("\nFunction constructors:")
     for func in functions[:5]:
         print(f"  {func.name} = 0x{func.constructor:08X}")
     if len(functions) > 5:
         print(f"  ... and {len(functions) - 5} more")
 
+    if stale_golden:
+        for path in stale_golden:
+            print(f"❌ {path} differs from the generated golden output", file=sys.stderr)
+        print("Run with --update-golden to rewrite the golden files", file=sys.stderr)
+        sys.exit(1)
+
 if __name__ == '__main__':
     main()
-
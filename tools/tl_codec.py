@@ -0,0 +1,267 @@
+"""
+Reference TL binary codec in pure Python
+
+Encodes and decodes values of the types parsed by generate_schema.py, straight from the TL wire format
+(little-endian integers, 4-byte aligned bytes, boxed values prefixed by their constructor id). It shares
+nothing with the emitted C#, so it can produce golden vectors the generated codecs are checked against.
+
+Values are plain Python objects:
+    int / long / #       int
+    double               float
+    Bool, mode.N?true    bool
+    int128 / int256      bytes of length 16 / 32
+    bytes / string       bytes / str
+    vector t             list
+    constructors         dict of field name -> value, with the TL constructor name under '@type'
+"""
+
+import random
+import string
+import struct
+from typing import Dict, List, Optional, Tuple
+
+BOOL_TRUE = 0x997275B5
+BOOL_FALSE = 0xBC799737
+
+FIXED_WIDTHS = {'int128': 16, 'int256': 32}
+SCALAR_FORMATS = {'int': '<i', '#': '<I', 'long': '<q', 'double': '<d'}
+
+
+class TLCodecError(Exception):
+    pass
+
+
+class SampleShape:
+    """Bounds for random values: the largest bytes/string payload and vector length to generate"""
+
+    def __init__(self, max_bytes: int, max_items: int):
+        self.max_bytes = max_bytes
+        self.max_items = max_items
+
+
+SMALL = SampleShape(max_bytes=8, max_items=2)
+MEDIUM = SampleShape(max_bytes=300, max_items=3)
+LARGE = SampleShape(max_bytes=4096, max_items=8)
+
+
+def strip_parens(tl_type: str) -> str:
+    tl_type = tl_type.strip()
+    if tl_type.startswith('(') and tl_type.endswith(')'):
+        tl_type = tl_type[1:-1].strip()
+    return tl_type
+
+
+def vector_element(tl_type: str) -> Optional[str]:
+    """Element type of 'vector t', or None for anything else"""
+    parts = tl_type.split(None, 1)
+    if len(parts) == 2 and parts[0].lower() == 'vector':
+        return strip_parens(parts[1])
+    return None
+
+
+def is_boxed(tl_type: str) -> bool:
+    """Capitalised names (Bool, liteServer.BlockLink) denote boxed types"""
+    return tl_type.rsplit('.', 1)[-1][:1].isupper()
+
+
+def encode_bytes(data: bytes) -> bytes:
+    """TL bytes: 1-byte length (or 0xFE + 3-byte length from 254 bytes on), payload, zero padding to 4"""
+    if len(data) < 254:
+        header = bytes([len(data)])
+    elif len(data) < 1 << 24:
+        header = bytes([254]) + len(data).to_bytes(3, 'little')
+    else:
+        raise TLCodecError(f'bytes of length {len(data)} cannot be encoded')
+    padding = -(len(header) + len(data)) % 4
+    return header + data + bytes(padding)
+
+
+def decode_bytes(data: bytes, offset: int) -> Tuple[bytes, int]:
+    if offset >= len(data):
+        raise TLCodecError('Unexpected end of data in bytes header')
+    length = data[offset]
+    header = 1
+    if length == 254:
+        length = int.from_bytes(data[offset + 1:offset + 4], 'little')
+        header = 4
+    elif length == 255:
+        raise TLCodecError('Invalid bytes length prefix 0xFF')
+    start = offset + header
+    end = start + length
+    if end > len(data):
+        raise TLCodecError('Unexpected end of data in bytes payload')
+    return data[start:end], end + (-(header + length) % 4)
+
+
+class TLCodec:
+    """Encoder/decoder over the constructors of one parsed schema"""
+
+    def __init__(self, types: List, functions: List):
+        self.constructors = {t.name: t for t in types + functions}
+        self.by_id = {t.constructor: t for t in types + functions}
+        self.implementations: Dict[str, List] = {}
+        for tl_type in types:
+            self.implementations.setdefault(tl_type.result_type, []).append(tl_type)
+
+    # ------------------------------------------------------------------ encoding
+
+    def encode(self, name: str, value: dict) -> bytes:
+        """Boxed encoding of a constructor value: constructor id, then its fields"""
+        tl_type = self.constructors[name]
+        return struct.pack('<I', tl_type.constructor) + self.encode_fields(tl_type, value)
+
+    def encode_fields(self, tl_type, value: dict) -> bytes:
+        out = bytearray()
+        for field in tl_type.fields:
+            if not self.field_present(field, value):
+                continue
+            if field.tl_type == 'true':
+                continue  # the mode bit is the value
+            out += self.encode_value(field.tl_type, value[field.name])
+        return bytes(out)
+
+    def encode_value(self, tl_type: str, value) -> bytes:
+        tl_type = strip_parens(tl_type)
+        if tl_type in SCALAR_FORMATS:
+            return struct.pack(SCALAR_FORMATS[tl_type], value)
+        if tl_type in FIXED_WIDTHS:
+            if len(value) != FIXED_WIDTHS[tl_type]:
+                raise TLCodecError(f'{tl_type} needs {FIXED_WIDTHS[tl_type]} bytes, got {len(value)}')
+            return bytes(value)
+        if tl_type == 'Bool':
+            return struct.pack('<I', BOOL_TRUE if value else BOOL_FALSE)
+        if tl_type == 'bytes':
+            return encode_bytes(bytes(value))
+        if tl_type == 'string':
+            return encode_bytes(value.encode('utf-8'))
+        element = vector_element(tl_type)
+        if element is not None:
+            return struct.pack('<I', len(value)) + b''.join(self.encode_value(element, item) for item in value)
+        if is_boxed(tl_type):
+            return self.encode(value['@type'], value)
+        return self.encode_fields(self.constructors[tl_type], value)
+
+    @staticmethod
+    def field_present(field, value: dict) -> bool:
+        if not field.condition:
+            return True
+        mode_field, bit = field.condition.split('.')
+        return (value[mode_field] >> int(bit)) & 1 == 1
+
+    # ------------------------------------------------------------------ decoding
+
+    def decode(self, data: bytes) -> dict:
+        """Decode one boxed value that must span all of data"""
+        value, offset = self.decode_boxed(data, 0)
+        if offset != len(data):
+            raise TLCodecError(f'{len(data) - offset} trailing bytes after {value["@type"]}')
+        return value
+
+    def decode_boxed(self, data: bytes, offset: int, result_type: Optional[str] = None) -> Tuple[dict, int]:
+        constructor, offset = self.decode_value('#', data, offset)
+        tl_type = self.by_id.get(constructor)
+        if tl_type is None or (result_type and tl_type.result_type != result_type):
+            raise TLCodecError(f'Unknown constructor 0x{constructor:08X}' + (f' for {result_type}' if result_type else ''))
+        return self.decode_fields(tl_type, data, offset)
+
+    def decode_fields(self, tl_type, data: bytes, offset: int) -> Tuple[dict, int]:
+        value = {'@type': tl_type.name}
+        for field in tl_type.fields:
+            present = self.field_present(field, value)
+            if field.tl_type == 'true':
+                value[field.name] = present
+            elif present:
+                value[field.name], offset = self.decode_value(field.tl_type, data, offset)
+        return value, offset
+
+    def decode_value(self, tl_type: str, data: bytes, offset: int):
+        tl_type = strip_parens(tl_type)
+        if tl_type in SCALAR_FORMATS:
+            fmt = SCALAR_FORMATS[tl_type]
+            end = offset + struct.calcsize(fmt)
+            if end > len(data):
+                raise TLCodecError(f'Unexpected end of data in {tl_type}')
+            return struct.unpack_from(fmt, data, offset)[0], end
+        if tl_type in FIXED_WIDTHS:
+            end = offset + FIXED_WIDTHS[tl_type]
+            if end > len(data):
+                raise TLCodecError(f'Unexpected end of data in {tl_type}')
+            return data[offset:end], end
+        if tl_type == 'Bool':
+            constructor, offset = self.decode_value('#', data, offset)
+            if constructor not in (BOOL_TRUE, BOOL_FALSE):
+                raise TLCodecError(f'Invalid Bool 0x{constructor:08X}')
+            return constructor == BOOL_TRUE, offset
+        if tl_type == 'bytes':
+            return decode_bytes(data, offset)
+        if tl_type == 'string':
+            raw, offset = decode_bytes(data, offset)
+            return raw.decode('utf-8'), offset
+        element = vector_element(tl_type)
+        if element is not None:
+            count, offset = self.decode_value('#', data, offset)
+            if count > len(data) - offset:
+                raise TLCodecError(f'Vector length {count} exceeds buffer')
+            items = []
+            for _ in range(count):
+                item, offset = self.decode_value(element, data, offset)
+                items.append(item)
+            return items, offset
+        if is_boxed(tl_type):
+            return self.decode_boxed(data, offset, tl_type)
+        return self.decode_fields(self.constructors[tl_type], data, offset)
+
+    # ------------------------------------------------------------------ random values
+
+    def random_value(self, name: str, rng: random.Random, shape: SampleShape, mode: Optional[int] = None) -> dict:
+        """Random value of a constructor. mode fixes every '#' field that conditions other fields;
+        by default those bits are random, so conditional fields are present about half the time."""
+        return self.random_fields(self.constructors[name], rng, shape, mode)
+
+    def random_fields(self, tl_type, rng: random.Random, shape: SampleShape, mode: Optional[int]) -> dict:
+        mode_fields = {f.condition.split('.')[0] for f in tl_type.fields if f.condition}
+        value = {'@type': tl_type.name}
+        for field in tl_type.fields:
+            if field.name in mode_fields:
+                value[field.name] = rng.getrandbits(32) if mode is None else mode
+            elif field.tl_type == 'true':
+                value[field.name] = self.field_present(field, value)
+            elif self.field_present(field, value):
+                value[field.name] = self.random_typed(field.tl_type, rng, shape, mode)
+        return value
+
+    def random_typed(self, tl_type: str, rng: random.Random, shape: SampleShape, mode: Optional[int]):
+        tl_type = strip_parens(tl_type)
+        if tl_type == 'int':
+            return rng.randint(-2 ** 31, 2 ** 31 - 1)
+        if tl_type == '#':
+            return rng.getrandbits(32)
+        if tl_type == 'long':
+            return rng.randint(-2 ** 63, 2 ** 63 - 1)
+        if tl_type == 'double':
+            return rng.uniform(-1e6, 1e6)
+        if tl_type in FIXED_WIDTHS:
+            return rng.randbytes(FIXED_WIDTHS[tl_type])
+        if tl_type == 'Bool':
+            return rng.random() < 0.5
+        if tl_type == 'bytes':
+            return rng.randbytes(self.random_length(rng, shape))
+        if tl_type == 'string':
+            alphabet = string.ascii_letters + string.digits
+            return ''.join(rng.choice(alphabet) for _ in range(self.random_length(rng, shape)))
+        element = vector_element(tl_type)
+        if element is not None:
+            return [self.random_typed(element, rng, shape, mode) for _ in range(rng.randint(0, shape.max_items))]
+        if is_boxed(tl_type):
+            implementations = self.implementations.get(tl_type)
+            if not implementations:
+                raise TLCodecError(f'No constructor for {tl_type}')
+            return self.random_fields(rng.choice(implementations), rng, shape, mode)
+        return self.random_fields(self.constructors[tl_type], rng, shape, mode)
+
+    @staticmethod
+    def random_length(rng: random.Random, shape: SampleShape) -> int:
+        """Lengths around the 254-byte switch to the long bytes header are over-represented"""
+        if shape.max_bytes >= 260 and rng.random() < 0.25:
+            return rng.choice([253, 254, 255, 256])
+        return rng.randint(0, shape.max_bytes)